@@ -0,0 +1,95 @@
+#-------------------------------------------------------------------------------
+# bench_all_signals.py
+#
+# Benchmark of repeated VerilogDataflowAnalyzer.getSignals/getConsts calls
+# on a generate loop of N iterations: copies of cached views and the iterator
+# API vs. rebuilding scoped names and dicts over all frames on every call
+#
+# Usage: python -m pyverilog.benchmark.bench_all_signals [-n N] [-s S] [-r R]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+import collections
+from optparse import OptionParser
+
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.utils.scope import ScopeLabel
+
+def design(iterations, signals):
+    ret = []
+    ret.append('module TOP(input CLK, input [7:0] din, output [7:0] dout);')
+    ret.append('  localparam P = 3;')
+    ret.append('  genvar i;')
+    ret.append('  generate for (i = 0; i < %d; i = i + 1) begin: g' % iterations)
+    for s in range(signals):
+        ret.append('    wire [7:0] s%d = din + i + %d;' % (s, s))
+    ret.append('  end endgenerate')
+    ret.append('  assign dout = din;')
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+def legacy_getAllSignals(frames):
+    ret = collections.OrderedDict()
+    for dk, dv in frames.dict.items():
+        for name, definitions in dv.getSignals().items():
+            ret[dk + ScopeLabel(name, 'signal')] = definitions
+    return ret
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--iterations", dest="iterations", type="int", default=2000,
+                         help="Number of generate loop iterations, Default=2000")
+    optparser.add_option("-s", "--signals", dest="signals", type="int", default=50,
+                         help="Number of signals per iteration, Default=50")
+    optparser.add_option("-r", "--repeat", dest="repeat", type="int", default=10,
+                         help="Number of calls, Default=10")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.iterations, options.signals))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', nobind=True,
+                                           preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+    frames = analyzer.getFrameTable()
+
+    assert list(legacy_getAllSignals(frames).items()) == list(analyzer.getSignals().items())
+
+    start = time.time()
+    for r in range(options.repeat):
+        n = len(legacy_getAllSignals(frames))
+    rebuild = time.time() - start
+
+    start = time.time()
+    for r in range(options.repeat):
+        n = len(analyzer.getSignals())
+    cached = time.time() - start
+
+    start = time.time()
+    n = 0
+    for name, definitions in analyzer.iterSignals():
+        n += 1
+    iterated = time.time() - start
+
+    print('signals %d  calls %d' % (n, options.repeat))
+    print('rebuild  %8.4f s' % rebuild)
+    print('copy     %8.4f s  speedup %.1fx' % (cached, rebuild / cached))
+    print('iterate  %8.4f s  (one pass)' % iterated)
+
+if __name__ == '__main__':
+    main()
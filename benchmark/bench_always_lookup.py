@@ -0,0 +1,77 @@
+#-------------------------------------------------------------------------------
+# bench_always_lookup.py
+#
+# Micro-benchmark of ModuleInfo.addAlways and the addData calls of the
+# visitors, on a module with large always blocks: the AlwaysData of the
+# current always block kept with it vs. looking it up by the structural hash
+# of the Always node on every call
+#
+# Usage: python -m pyverilog.benchmark.bench_always_lookup [-a A] [-s S] [-n N]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+from optparse import OptionParser
+
+import pyverilog.vparser.ast as vast
+from pyverilog.vparser.parser import VerilogParser
+from pyverilog.dataflow.moduleinfo import ModuleInfo, AlwaysData
+
+def design(always, statements):
+    ret = []
+    ret.append('module TOP(input CLK, input RST, input [31:0] din, output reg [31:0] dout);')
+    ret.append('  reg [31:0] r [0:%d];' % statements)
+    for a in range(always):
+        ret.append('  always @(posedge CLK) begin')
+        ret.append('    if (RST) dout <= 0;')
+        ret.append('    else begin')
+        for s in range(statements):
+            ret.append('      if (din[%d]) r[%d] <= r[%d] + din ^ %d; else r[%d] <= r[%d] - %d;' %
+                       (s % 32, s, (s + a) % statements, a, s, s, s))
+        ret.append('    end')
+        ret.append('  end')
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+class LegacyModuleInfo(ModuleInfo):
+    def getCurrentAlwaysData(self):
+        return self.getAlwaysData(self.last)
+
+def run(cls, definition, nodes, repeat):
+    start = time.time()
+    for i in range(repeat):
+        info = cls(definition.name, definition)
+        for node in nodes:
+            info.addAlways(node, AlwaysData(node))
+            for statement in node.statement.statements:
+                info.addData(statement)
+    return time.time() - start
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-a", "--always", dest="always", type="int", default=50,
+                         help="Number of always blocks, Default=50")
+    optparser.add_option("-s", "--statements", dest="statements", type="int", default=200,
+                         help="Number of statements per always block, Default=200")
+    optparser.add_option("-n", "--repeat", dest="repeat", type="int", default=20,
+                         help="Number of repetitions, Default=20")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    ast = VerilogParser().parse(design(options.always, options.statements))
+    definition = ast.description.definitions[0]
+    nodes = [ item for item in definition.items if isinstance(item, vast.Always) ]
+
+    legacy = run(LegacyModuleInfo, definition, nodes, options.repeat)
+    current = run(ModuleInfo, definition, nodes, options.repeat)
+    print('hash per lookup %8.4f s' % legacy)
+    print('current entry   %8.4f s  speedup %.1fx' % (current, legacy / current))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#-------------------------------------------------------------------------------
+# bench_ast_memory.py
+#
+# Memory benchmark of the AST node representation on a generated netlist:
+# the slotted node classes of vparser/ast.py vs. the same tree built from
+# plain classes with a per-instance __dict__
+#
+# Usage: python -m pyverilog.benchmark.bench_ast_memory [-n N]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import gc
+import resource
+import tracemalloc
+from optparse import OptionParser
+
+import pyverilog.vparser.ast as vast
+from pyverilog.vparser.parser import VerilogParser
+
+def netlist(cells):
+    ret = []
+    ret.append('module TOP(input CLK, input [31:0] din, output [31:0] dout);')
+    ret.append('  wire [31:0] n [0:%d];' % cells)
+    ret.append('  assign n[0] = din;')
+    for i in range(cells):
+        ret.append('  assign n[%d][15:0] = n[%d][15:0] ^ {n[%d][7:0], n[%d][15:8]} + 16\'d%d;' %
+                   (i+1, i, i, i, i))
+        ret.append('  assign n[%d][31:16] = n[%d][%d] ? n[%d][31:16] : ~n[%d][31:16];' %
+                   (i+1, i, i % 16, i, i))
+    ret.append('  assign dout = n[%d];' % cells)
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+def fields(node):
+    for cls in type(node).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if hasattr(node, name): yield name, getattr(node, name)
+
+def clone(obj, factory):
+    if isinstance(obj, tuple):
+        return tuple([ clone(o, factory) for o in obj ])
+    if not isinstance(obj, vast.Node):
+        return obj
+    node = factory(type(obj))
+    for name, value in fields(obj):
+        setattr(node, name, clone(value, factory))
+    return node
+
+_plain = {}
+def plain_factory(cls):
+    if cls not in _plain:
+        _plain[cls] = type(cls.__name__, (object,), {})
+    return _plain[cls]()
+
+def slotted_factory(cls):
+    return cls.__new__(cls)
+
+def count(obj):
+    if isinstance(obj, tuple): return sum([ count(o) for o in obj ])
+    if not isinstance(obj, vast.Node): return 0
+    return 1 + sum([ count(v) for n, v in fields(obj) ])
+
+def measure(ast, factory):
+    gc.collect()
+    tracemalloc.start()
+    tree = clone(ast, factory)
+    size, peak = tracemalloc.get_traced_memory()
+    blocks = sum([ s.count for s in tracemalloc.take_snapshot().statistics('filename') ])
+    tracemalloc.stop()
+    return tree, size, blocks
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--cells", dest="cells", type="int", default=20000,
+                         help="Number of netlist cells, Default=20000")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    ast = VerilogParser().parse(netlist(options.cells))
+    nodes = count(ast)
+    print('nodes %d  maxrss after parse %.1f MB' %
+          (nodes, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0))
+
+    results = {}
+    for label, factory in (('__dict__', plain_factory), ('__slots__', slotted_factory)):
+        tree, size, blocks = measure(ast, factory)
+        results[label] = (size, blocks)
+        print('%-10s %10.1f MB  %9d blocks  %6.1f bytes/node' %
+              (label, size / 1048576.0, blocks, float(size) / nodes))
+        del tree
+
+    dsize, dblocks = results['__dict__']
+    ssize, sblocks = results['__slots__']
+    print('reduction  %9.1f %%   %8.1f %% blocks' %
+          (100.0 * (dsize - ssize) / dsize, 100.0 * (dblocks - sblocks) / dblocks))
+
+if __name__ == '__main__':
+    main()
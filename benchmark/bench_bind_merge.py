@@ -0,0 +1,130 @@
+#-------------------------------------------------------------------------------
+# bench_bind_merge.py
+#
+# Benchmark of VerilogDataflowMerge.getTree of a wide register assigned bit
+# by bit in N always blocks: binds replaced shallowly (Bind.replace) vs.
+# deep-copied at every split and merge step (time and peak allocation)
+#
+# Usage: python -m pyverilog.benchmark.bench_bind_merge [-n N]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import copy
+import tracemalloc
+import shutil
+import tempfile
+from optparse import OptionParser
+
+from pyverilog.dataflow.dataflow import *
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+from pyverilog.dataflow.merge import VerilogDataflowMerge
+
+def design(width):
+    ret = []
+    ret.append('module TOP(input CLK, input RST, input [%d:0] din, output [%d:0] dout);' %
+               (width - 1, width - 1))
+    ret.append('  reg [%d:0] r;' % (width - 1))
+    for b in range(width):
+        ret.append('  always @(posedge CLK) begin')
+        ret.append('    if (RST) r[%d] <= 0;' % b)
+        ret.append('    else if (din[%d]) r[%d] <= ~r[%d];' % ((b + 1) % width, b, b))
+        ret.append('    else r[%d] <= din[%d];' % (b, b))
+        ret.append('  end')
+    ret.append('  assign dout = r;')
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+class LegacyMerge(VerilogDataflowMerge):
+    def getTree(self, termname, ptr=None):
+        bindlist = self.getOptimizedBindlist(self.getResolvedBindlist(termname))
+        return self.getMergedBindTree(termname, bindlist, ptr)
+
+    def getOptimizedBindlist(self, bindlist):
+        if len(bindlist) == 0: return ()
+        new_bindlist = []
+        for bind in bindlist:
+            new_bind = copy.deepcopy(bind)
+            new_bind.tree = self.optimizer.optimize(bind.tree)
+            new_bind.msb = self.optimizer.optimize(bind.msb)
+            new_bind.lsb = self.optimizer.optimize(bind.lsb)
+            new_bind.ptr = self.optimizer.optimize(bind.ptr)
+            new_bindlist.append(new_bind)
+        if len(new_bindlist) == 1: return (new_bindlist[0],)
+        split_positions = self.splitPositions(tuple(new_bindlist))
+        new_bindlist = self.splitBindlist(tuple(new_bindlist), split_positions)
+        return self.mergeBindlist(tuple(new_bindlist))
+
+    def mergeBindlist(self, bindlist):
+        return tuple([ copy.deepcopy(bind) for bind in
+                       VerilogDataflowMerge.mergeBindlist(self, bindlist) ])
+
+    def splitBindlist(self, bindlist, split_positions):
+        if len(bindlist) == 0: return ()
+        return self.splitBindPositions(bindlist[0], split_positions) + self.splitBindlist(bindlist[1:], split_positions)
+
+    def splitBindPositions(self, bind, split_positions):
+        if len(split_positions) == 0: return (copy.deepcopy(bind),)
+        if bind is None: return (copy.deepcopy(bind),)
+        bind_left, bind_right = self.splitBind(bind, split_positions[0])
+        ret = () if bind_right is None else (copy.deepcopy(bind_right),)
+        return ret + self.splitBindPositions(copy.deepcopy(bind_left), split_positions[1:])
+
+def run(cls, analyzer, optimizer, name):
+    merge = cls('TOP', analyzer.getTerms(), analyzer.getBinddict(),
+                optimizer.getResolvedTerms(), optimizer.getResolvedBinddict(),
+                optimizer.getConstlist())
+    start = time.time()
+    tree = merge.getTree(name)
+    elapsed = time.time() - start
+
+    # allocations, measured separately as tracing slows the merge down
+    merge.invalidateTreeCache()
+    merge.optimizer.clearCache()
+    tracemalloc.start()
+    merge.getTree(name)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, tree
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--width", dest="width", type="int", default=512,
+                         help="Register width (always blocks), Default=512")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024) # the former splitBindlist recurses per bind
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.width))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+
+    optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+    optimizer.resolveConstant()
+    name = [ name for name in analyzer.getTerms().keys() if str(name) == 'TOP.r' ][0]
+
+    run(VerilogDataflowMerge, analyzer, optimizer, name) # warm up the DF node table
+    legacy, lpeak, ltree = run(LegacyMerge, analyzer, optimizer, name)
+    shallow, speak, stree = run(VerilogDataflowMerge, analyzer, optimizer, name)
+    assert ltree == stree
+
+    print('width %d  binds %d' % (options.width, len(optimizer.getResolvedBinddict()[name])))
+    print('deepcopy %8.3f s  peak %8.1f KiB' % (legacy, lpeak / 1024.0))
+    print('replace  %8.3f s  peak %8.1f KiB  speedup %.1fx  memory %.2fx less' %
+          (shallow, speak / 1024.0, legacy / shallow, float(lpeak) / speak))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#-------------------------------------------------------------------------------
+# bench_deep_branch.py
+#
+# Stress benchmark of the DFNode tree passes on an if/else-if chain of N
+# DFBranch nodes (a case statement of N items) under the default recursion
+# limit: the passes traverse trees with an explicit stack (traverse.py)
+#
+# Usage: python -m pyverilog.benchmark.bench_deep_branch [-n N] [-s S]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+from optparse import OptionParser
+
+import pyverilog.dataflow.reorder as reorder
+import pyverilog.dataflow.replace as replace
+import pyverilog.controlflow.splitter as splitter
+from pyverilog.dataflow.dataflow import *
+from pyverilog.dataflow.optimizer import VerilogOptimizer
+from pyverilog.dataflow.walker import VerilogDataflowWalker
+from pyverilog.utils.scope import ScopeLabel, ScopeChain
+
+def chain(depth):
+    """ state == 0 ? 0 : state == 1 ? 1 : ... : x """
+    top = ScopeChain([ ScopeLabel('TOP', 'module') ])
+    state = top + ScopeLabel('state', 'signal')
+    dest = top + ScopeLabel('dest', 'signal')
+    terms = {
+        state: Term(state, set(['Input']), DFIntConst('31'), DFIntConst('0')),
+        dest: Term(dest, set(['Reg']), DFIntConst('31'), DFIntConst('0')),
+    }
+    tree = DFUndefined(32)
+    for i in reversed(range(depth)):
+        cond = DFOperator((DFTerminal(state), DFIntConst(str(i))), 'Eq')
+        tree = DFBranch(cond, DFIntConst(str(i % 256)), tree)
+    return terms, dest, tree
+
+def measure(name, func):
+    start = time.time()
+    func()
+    print('%-18s %8.3f s' % (name, time.time() - start))
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--depth", dest="depth", type="int", default=100000,
+                         help="Depth of the DFBranch chain, Default=100000")
+    optparser.add_option("-s", "--split-depth", dest="split_depth", type="int", default=2000,
+                         help="Depth for splitter.split (the result is quadratic), Default=2000")
+    (options, args) = optparser.parse_args()
+
+    print('depth %d  recursion limit %d' % (options.depth, sys.getrecursionlimit()))
+    start = time.time()
+    terms, dest, tree = chain(options.depth)
+    print('%-18s %8.3f s' % ('build', time.time() - start))
+
+    optimizer = VerilogOptimizer(terms, {})
+    walker = VerilogDataflowWalker('TOP', terms, {}, terms, {}, {})
+    measure('replaceUndefined', lambda: replace.replaceUndefined(tree, dest))
+    measure('reorder', lambda: reorder.reorder(tree))
+    measure('optimizeConstant', lambda: optimizer.optimizeConstant(tree))
+    measure('optimize', lambda: optimizer.optimize(tree))
+    measure('getSources', lambda: walker.getSources(tree))
+    measure('walkTree', lambda: walker.walkTree(tree, visited=set()))
+
+    terms, dest, tree = chain(options.split_depth)
+    measure('split (%d)' % options.split_depth, lambda: splitter.split(tree))
+
+if __name__ == '__main__':
+    main()
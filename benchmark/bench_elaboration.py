@@ -0,0 +1,97 @@
+#-------------------------------------------------------------------------------
+# bench_elaboration.py
+#
+# Benchmark of the bind analysis (BindVisitor) of a design replicating one
+# module N times in a generate loop: elaboration cache vs. visiting the
+# module definition again for every instance
+#
+# Usage: python -m pyverilog.benchmark.bench_elaboration [-n 16,64,256,1024]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+from optparse import OptionParser
+
+from pyverilog.vparser.parser import VerilogParser
+from pyverilog.dataflow.modulevisitor import ModuleVisitor
+from pyverilog.dataflow.signalvisitor import SignalVisitor
+from pyverilog.dataflow.bindvisitor import BindVisitor
+
+BANK = """
+module bank #(parameter W = 16, parameter D = 8)
+  (input CLK, input RST, input we, input [2:0] addr, input [W-1:0] din, output reg [W-1:0] dout);
+  reg [W-1:0] mem [0:D-1];
+  reg [W-1:0] t;
+  function [W-1:0] scramble; input [W-1:0] v; begin scramble = {v[W/2-1:0], v[W-1:W/2]}; end endfunction
+  always @* begin
+    t = din;
+    t = t ^ {W{addr[0]}};
+  end
+  always @(posedge CLK) begin
+    if (RST) begin
+      dout <= 0;
+    end else begin
+      if (we) mem[addr] <= scramble(t);
+      case (addr[1:0])
+        2'd0: dout <= mem[addr];
+        2'd1: dout <= mem[addr] + 1;
+        2'd2: dout <= mem[addr] >> 1;
+        default: dout <= ~mem[addr];
+      endcase
+    end
+  end
+endmodule
+"""
+
+def design(instances):
+    ret = [BANK]
+    ret.append('module TOP(input CLK, input RST, input we, input [2:0] addr, input [15:0] din,')
+    ret.append('           output [15:0] dout);')
+    ret.append('  wire [15:0] q [0:%d];' % instances)
+    ret.append('  assign q[0] = din;')
+    ret.append('  genvar i;')
+    ret.append('  generate for (i = 0; i < %d; i = i + 1) begin: lane' % instances)
+    ret.append('    bank #(.W(16)) b (.CLK(CLK), .RST(RST), .we(we), .addr(addr), .din(q[i]), .dout(q[i+1]));')
+    ret.append('  end endgenerate')
+    ret.append('  assign dout = q[%d];' % instances)
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+def run(ast, cached):
+    module_visitor = ModuleVisitor()
+    module_visitor.visit(ast)
+    moduleinfotable = module_visitor.get_moduleinfotable()
+    signal_visitor = SignalVisitor(moduleinfotable, 'TOP')
+    signal_visitor.start_visit()
+    frametable = signal_visitor.getFrameTable()
+
+    start = time.time()
+    bind_visitor = BindVisitor(moduleinfotable, 'TOP', frametable,
+                               elaboration_cache=cached)
+    bind_visitor.start_visit()
+    elapsed = time.time() - start
+    return elapsed, bind_visitor.getDataflows()
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--instances", dest="instances", default="16,64,256,1024",
+                         help="Comma separated instance counts, Default=16,64,256,1024")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    for n in [ int(i) for i in options.instances.split(',') ]:
+        ast = VerilogParser().parse(design(n))
+        visited, vdataflow = run(ast, False)
+        cached, cdataflow = run(ast, True)
+        assert len(vdataflow.getTerms()) == len(cdataflow.getTerms())
+        assert len(vdataflow.getBinddict()) == len(cdataflow.getBinddict())
+        print('instances %5d  visit %8.3f s (%6.2f ms/inst)  cache %8.3f s (%6.2f ms/inst)  speedup %5.1fx' %
+              (n, visited, 1000.0 * visited / n, cached, 1000.0 * cached / n, visited / cached))
+
+if __name__ == '__main__':
+    main()
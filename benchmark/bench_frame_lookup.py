@@ -0,0 +1,118 @@
+#-------------------------------------------------------------------------------
+# bench_frame_lookup.py
+#
+# Micro-benchmark of FrameTable name resolution on a generate loop of N
+# iterations with nested named blocks: symbol and label path indexes vs.
+# walking the frames upward / depth-first for every lookup
+#
+# Usage: python -m pyverilog.benchmark.bench_frame_lookup [-n N] [-d D] [-s S]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.utils.scope import ScopeLabel, ScopeChain
+
+def design(iterations, depth, signals):
+    ret = []
+    ret.append('module TOP(input CLK, input [7:0] din, output [7:0] dout);')
+    for s in range(signals):
+        ret.append('  wire [7:0] s%d = din + %d;' % (s, s))
+    ret.append('  genvar i;')
+    ret.append('  generate for (i = 0; i < %d; i = i + 1) begin: g' % iterations)
+    for d in range(depth):
+        ret.append('    ' + '  ' * d + 'if (1) begin: b%d' % d)
+    ret.append('    ' + '  ' * depth + 'wire [7:0] x = s0 + i;')
+    for d in reversed(range(depth)):
+        ret.append('    ' + '  ' * d + 'end')
+    ret.append('  end endgenerate')
+    ret.append('  assign dout = din;')
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementations, for comparison
+def legacy_searchSignalDefinition(frames, key, name):
+    if frames.dict[key].hasSignal(name):
+        return key, frames.dict[key].getSignal(name)
+    if frames.dict[key].isModule(): return None, None
+    previous = frames.dict[key].getPrevious()
+    return legacy_searchSignalDefinition(frames, previous, name)
+
+def legacy_searchMatchedScopeChain(frames, currentchain, targetchain):
+    return frames.walkMatchedScopeChain(currentchain, targetchain)
+
+def lookups(frames, depth, signals):
+    top = ScopeChain([ ScopeLabel('TOP', 'module') ])
+    leaves = [ key for key in frames.dict.keys() if key[-1].scopename == 'b%d' % (depth - 1) ]
+    names = [ 's%d' % s for s in range(signals) ] + ['x', 'none']
+    targets = []
+    for key in leaves:
+        loop = [ label.scopeloop for label in key if label.scopetype == 'for' ][0]
+        targets.append(ScopeChain([ top[-1], ScopeLabel('for', 'for', loop), ScopeLabel('g', 'any') ] +
+                                  [ ScopeLabel('b%d' % d, 'any') for d in range(depth) ]))
+    return top, leaves, names, targets
+
+def run(frames, top, leaves, names, targets, search, match):
+    start = time.time()
+    for key in leaves:
+        for name in names:
+            search(key, name)
+    for target in targets:
+        match(top, target)
+    return time.time() - start
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--iterations", dest="iterations", type="int", default=500,
+                         help="Number of generate loop iterations, Default=500")
+    optparser.add_option("-d", "--depth", dest="depth", type="int", default=8,
+                         help="Nesting depth of named blocks, Default=8")
+    optparser.add_option("-s", "--signals", dest="signals", type="int", default=20,
+                         help="Number of module level signals, Default=20")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.iterations, options.depth, options.signals))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', nobind=True,
+                                           preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+
+    frames = analyzer.getFrameTable()
+    top, leaves, names, targets = lookups(frames, options.depth, options.signals)
+
+    for key in leaves:
+        for name in names:
+            assert (frames.searchSignalDefinition(key, name) ==
+                    legacy_searchSignalDefinition(frames, key, name))
+    for target in targets:
+        assert (frames.searchMatchedScopeChain(top, target) ==
+                legacy_searchMatchedScopeChain(frames, top, target))
+
+    walk = run(frames, top, leaves, names, targets,
+               lambda k, n: legacy_searchSignalDefinition(frames, k, n),
+               lambda c, t: legacy_searchMatchedScopeChain(frames, c, t))
+    index = run(frames, top, leaves, names, targets,
+                frames.searchSignalDefinition, frames.searchMatchedScopeChain)
+    print('frames %d  lookups %d  references %d' %
+          (len(frames.dict), len(leaves) * len(names), len(targets)))
+    print('frame walk %8.4f s' % walk)
+    print('index      %8.4f s  speedup %.1fx' % (index, walk / index))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#-------------------------------------------------------------------------------
+# bench_hashcons.py
+#
+# Memory and time benchmark of the bind analysis (makeTree) of a wide FSM of
+# N states driving R registers: hash-consed DF nodes shared by structure vs.
+# a new node object for every constructed subtree
+#
+# Usage: python -m pyverilog.benchmark.bench_hashcons [-n 16,32,64] [-r R]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import tracemalloc
+from optparse import OptionParser
+
+from pyverilog.vparser.parser import VerilogParser
+from pyverilog.dataflow.modulevisitor import ModuleVisitor
+from pyverilog.dataflow.signalvisitor import SignalVisitor
+from pyverilog.dataflow.bindvisitor import BindVisitor
+from pyverilog.dataflow.dataflow import DFNode, getDFNodeTable
+
+def design(states, registers):
+    ret = []
+    ret.append('module TOP(input CLK, input RST, input [7:0] din, output [7:0] dout);')
+    ret.append('  reg [15:0] state;')
+    for r in range(registers):
+        ret.append('  reg [7:0] r%d;' % r)
+    ret.append('  always @(posedge CLK) begin')
+    ret.append('    if (RST) begin')
+    ret.append('      state <= 0;')
+    for r in range(registers):
+        ret.append('      r%d <= 0;' % r)
+    ret.append('    end else begin')
+    ret.append('      case (state)')
+    for s in range(states):
+        ret.append('        %d: begin' % s)
+        ret.append('          state <= din[0] ? %d : %d;' % ((s + 1) % states, (s * 7 + 3) % states))
+        for r in range(registers):
+            ret.append('          r%d <= din + r%d + %d;' % (r, (r + 1) % registers, s % 4))
+        ret.append('        end')
+    ret.append('        default: state <= 0;')
+    ret.append('      endcase')
+    ret.append('    end')
+    ret.append('  end')
+    ret.append('  assign dout = r0;')
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+def count(node, visited):
+    """ (tree nodes, distinct node objects) """
+    if not isinstance(node, DFNode): return 0
+    n = 1
+    if id(node) not in visited:
+        visited[id(node)] = node
+    for child in node.children():
+        n += count(child, visited)
+    return n
+
+def analyze(ast):
+    module_visitor = ModuleVisitor()
+    module_visitor.visit(ast)
+    moduleinfotable = module_visitor.get_moduleinfotable()
+    signal_visitor = SignalVisitor(moduleinfotable, 'TOP')
+    signal_visitor.start_visit()
+    frametable = signal_visitor.getFrameTable()
+    bind_visitor = BindVisitor(moduleinfotable, 'TOP', frametable)
+    bind_visitor.start_visit()
+    return bind_visitor.getDataflows()
+
+def run(ast, hashcons):
+    table = getDFNodeTable()
+    if hashcons: table.enable()
+    else: table.disable()
+
+    table.clear()
+    start = time.time()
+    dataflow = analyze(ast)
+    elapsed = time.time() - start
+
+    # retained memory, measured separately as tracing slows the analysis down
+    table.clear()
+    tracemalloc.start()
+    traced = analyze(ast)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced
+
+    visited = {}
+    nodes = 0
+    for bindlist in dataflow.getBinddict().values():
+        for bind in bindlist:
+            nodes += count(bind.tree, visited)
+    table.enable()
+    return elapsed, current, nodes, len(visited), dataflow
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--states", dest="states", default="16,32,64",
+                         help="Comma separated state counts, Default=16,32,64")
+    optparser.add_option("-r", "--registers", dest="registers", type="int", default=8,
+                         help="Number of registers assigned in every state, Default=8")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(64 * 1024)
+    for n in [ int(s) for s in options.states.split(',') ]:
+        ast = VerilogParser().parse(design(n, options.registers))
+        ptime, pmem, pnodes, pobjs, pdataflow = run(ast, False)
+        htime, hmem, hnodes, hobjs, hdataflow = run(ast, True)
+        assert pnodes == hnodes
+        for name, bindlist in pdataflow.getBinddict().items():
+            assert [ b.tree for b in bindlist ] == [ b.tree for b in hdataflow.getBinddict()[name] ]
+        print('states %5d  tree nodes %8d' % (n, pnodes))
+        print('  plain     %8.3f s  %8.1f KiB  %8d objects' % (ptime, pmem / 1024.0, pobjs))
+        print('  hashcons  %8.3f s  %8.1f KiB  %8d objects  time %.2fx  memory %.2fx less' %
+              (htime, hmem / 1024.0, hobjs, ptime / htime, float(pmem) / hmem))
+
+if __name__ == '__main__':
+    main()
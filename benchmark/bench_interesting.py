@@ -0,0 +1,92 @@
+#-------------------------------------------------------------------------------
+# bench_interesting.py
+#
+# Benchmark of ModuleInfo.findInteresting on a synthetic chain of N
+# combinational always blocks ending in a sequential block:
+# always-block dependency graph vs. the former recursive getstatelist
+#
+# Usage: python -m pyverilog.benchmark.bench_interesting [-n 100,1000,4000] [-l 100]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+from optparse import OptionParser
+
+from pyverilog.vparser.parser import VerilogParser
+from pyverilog.dataflow.modulevisitor import ModuleVisitor
+from pyverilog.dataflow.moduleinfo import unique, union
+
+def chain(blocks):
+    ret = []
+    ret.append('module TOP(input CLK, input RST, input [7:0] din, output reg [7:0] dout);')
+    ret.append('  reg st;')
+    for i in range(blocks + 1):
+        ret.append('  reg [7:0] c%d;' % i)
+    ret.append('  always @* c0 = din;')
+    for i in range(1, blocks + 1):
+        ret.append('  always @* if (st & c%d[0]) c%d = c%d + 1; else c%d = c%d;' %
+                   (i-1, i, i-1, i, i-1))
+    ret.append('  always @(posedge CLK) begin')
+    ret.append('    if (RST) begin st <= 0; dout <= 0; end')
+    ret.append('    else begin st <= c%d[7]; dout <= c%d; end' % (blocks, blocks))
+    ret.append('  end')
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+def legacy_getstatelist(info, always):
+    ret = []
+    for al in info.always.values():
+        common = list(filter(lambda x: x in always.getState().keys(),
+                             union(al.getControl().keys(), al.getData().keys())))
+        if not common: continue
+        if al.isComb() and al is not always:
+            ret.extend(legacy_getstatelist(info, al))
+        else:
+            ret.extend(al.getState().keys())
+    return ret
+
+def legacy_findInteresting(info):
+    interesting = []
+    for al in info.always.values():
+        if al.isComb():
+            interesting.extend(filter(lambda x: x in legacy_getstatelist(info, al),
+                                      al.getControl().keys()))
+        else:
+            interesting.extend(filter(lambda x: x in al.getState().keys(),
+                                      al.getControl().keys()))
+    return unique(interesting)
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--blocks", dest="blocks", default="50,100,1000,4000",
+                         help="Comma separated chain lengths, Default=50,100,1000,4000")
+    optparser.add_option("-l", "--legacy", dest="legacy", type="int", default=100,
+                         help="Longest chain run with the former implementation, Default=100")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    for n in [ int(b) for b in options.blocks.split(',') ]:
+        ast = VerilogParser().parse(chain(n))
+        visitor = ModuleVisitor()
+        visitor.visit(ast)
+        info = visitor.get_moduleinfotable().getModule('TOP')
+
+        start = time.time()
+        info.findInteresting()
+        elapsed = time.time() - start
+        line = 'blocks %5d  graph %8.4f s' % (n, elapsed)
+        if n <= options.legacy:
+            start = time.time()
+            legacy = legacy_findInteresting(info)
+            line += '  recursive %8.4f s' % (time.time() - start)
+            assert sorted(legacy) == sorted(info.getInteresting())
+        print(line + '  (%d interesting)' % len(info.getInteresting()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#-------------------------------------------------------------------------------
+# bench_lazy_elaboration.py
+#
+# Benchmark of a targeted query (walking one output of one core) on a design
+# of N cores: lazy elaboration of the instances on the cone of influence vs.
+# elaborating and resolving the whole design first
+#
+# Usage: python -m pyverilog.benchmark.bench_lazy_elaboration [-n N] [-b B]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+from pyverilog.dataflow.walker import VerilogDataflowWalker
+
+CORE = """
+module core #(parameter ID = 0, parameter W = 16, parameter B = 16)
+  (input CLK, input RST, input [W-1:0] din, output [W-1:0] dout);
+  wire [W-1:0] q [0:B];
+  assign q[0] = din ^ ID;
+  genvar i;
+  generate for (i = 0; i < B; i = i + 1) begin: stage
+    reg [W-1:0] r;
+    always @(posedge CLK) begin
+      if (RST) r <= ID;
+      else if (q[i][0]) r <= q[i] + i;
+      else r <= q[i] >> 1;
+    end
+    assign q[i+1] = r;
+  end endgenerate
+  assign dout = q[B];
+endmodule
+"""
+
+def design(cores, stages):
+    ret = [CORE]
+    ret.append('module TOP(input CLK, input RST, input [15:0] din,')
+    ret.append('           %s);' % ', '.join([ 'output [15:0] d%d' % n for n in range(cores) ]))
+    for n in range(cores):
+        ret.append('  core #(.ID(%d), .B(%d)) core%d (.CLK(CLK), .RST(RST), .din(din), .dout(d%d));' %
+                   (n, stages, n, n))
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+def run(filename, lazy, target):
+    start = time.time()
+    analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native', lazy=lazy)
+    analyzer.generate()
+    terms = analyzer.getTerms()
+    binddict = analyzer.getBinddict()
+    optimizer = VerilogDataflowOptimizer(terms, binddict)
+    optimizer.resolveConstant()
+    walker = VerilogDataflowWalker('TOP', terms, binddict,
+                                   optimizer.getResolvedTerms(),
+                                   optimizer.getResolvedBinddict(),
+                                   optimizer.getConstlist(),
+                                   elaborator=analyzer.getElaborator(optimizer),
+                                   optimizer=optimizer)
+    tree = walker.walkBind(target, step=1)
+    elapsed = time.time() - start
+    return elapsed, tree, len(binddict)
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--cores", dest="cores", type="int", default=64,
+                         help="Number of core instances, Default=64")
+    optparser.add_option("-b", "--stages", dest="stages", type="int", default=16,
+                         help="Number of pipeline stages per core, Default=16")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.cores, options.stages))
+        out.close()
+
+        eager, etree, ebinds = run(filename, False, 'TOP.d0')
+        lazy, ltree, lbinds = run(filename, True, 'TOP.d0')
+        assert etree.tocode() == ltree.tocode()
+        print('cores %d  stages %d' % (options.cores, options.stages))
+        print('eager %8.3f s  (%d bound terms)' % (eager, ebinds))
+        print('lazy  %8.3f s  (%d bound terms)  speedup %.1fx' % (lazy, lbinds, eager / lazy))
+    finally:
+        shutil.rmtree(dirname)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#-------------------------------------------------------------------------------
+# bench_merge_cache.py
+#
+# Benchmark of VerilogDataflowMerge.getTree over all signals of a design of N
+# registers assigned byte by byte, looked up P times (as the walker, the
+# control flow analyzer and the graph generator do): merged tree cache vs.
+# merging the bind list again on every lookup
+#
+# Usage: python -m pyverilog.benchmark.bench_merge_cache [-n N] [-p P]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+import pyverilog.utils.signaltype as signaltype
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+from pyverilog.dataflow.merge import VerilogDataflowMerge
+
+def design(registers):
+    ret = []
+    ret.append('module TOP(input CLK, input RST, input [1:0] sel, input [31:0] din, output [31:0] dout);')
+    for r in range(registers):
+        ret.append('  reg [31:0] r%d;' % r)
+    ret.append('  always @(posedge CLK) begin')
+    ret.append('    if (RST) begin')
+    for r in range(registers):
+        ret.append('      r%d <= 0;' % r)
+    ret.append('    end else begin')
+    for r in range(registers):
+        src = 'din' if r == 0 else 'r%d' % (r - 1)
+        for b in range(4):
+            ret.append('      if (sel == %d) r%d[%d:%d] <= %s[%d:%d] + %d;' %
+                       (b, r, b * 8 + 7, b * 8, src, b * 8 + 7, b * 8, r))
+    ret.append('    end')
+    ret.append('  end')
+    ret.append('  assign dout = r%d;' % (registers - 1))
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+class LegacyMerge(VerilogDataflowMerge):
+    def getTree(self, termname, ptr=None):
+        bindlist = self.getOptimizedBindlist(self.getResolvedBindlist(termname))
+        return self.getMergedBindTree(termname, bindlist, ptr)
+
+def lookup(cls, analyzer, optimizer, names, passes):
+    merge = cls('TOP', analyzer.getTerms(), analyzer.getBinddict(),
+                optimizer.getResolvedTerms(), optimizer.getResolvedBinddict(),
+                optimizer.getConstlist())
+    start = time.time()
+    for p in range(passes):
+        trees = [ merge.getTree(name) for name in names ]
+    return time.time() - start, trees, merge
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--registers", dest="registers", type="int", default=100,
+                         help="Number of registers, Default=100")
+    optparser.add_option("-p", "--passes", dest="passes", type="int", default=5,
+                         help="Number of lookups of each signal, Default=5")
+    (options, args) = optparser.parse_args()
+
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.registers))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+
+    optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+    optimizer.resolveConstant()
+    names = [ name for name, term in analyzer.getTerms().items()
+              if name in analyzer.getBinddict() and term.lenmsb is None and
+              not signaltype.isParameter(term.termtype) and
+              not signaltype.isLocalparam(term.termtype) ]
+
+    legacy, ltrees, lmerge = lookup(LegacyMerge, analyzer, optimizer, names, options.passes)
+    cached, ctrees, cmerge = lookup(VerilogDataflowMerge, analyzer, optimizer, names, options.passes)
+    assert ltrees == ctrees
+    stats = cmerge.getTreeCacheStats()
+
+    print('signals %d  passes %d' % (len(names), options.passes))
+    print('re-merge %8.3f s' % legacy)
+    print('cache    %8.3f s  speedup %.1fx  hits %d  misses %d' %
+          (cached, legacy / cached, stats['hits'], stats['misses']))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#-------------------------------------------------------------------------------
+# bench_optimize_cache.py
+#
+# Benchmark of VerilogDataflowWalker.walkTree over all signals of a generated
+# design of N pipeline stages: optimize result cache of VerilogOptimizer vs.
+# optimizing the same msb/lsb/tree objects again on every call
+#
+# Usage: python -m pyverilog.benchmark.bench_optimize_cache [-n N] [-s STEP]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+import pyverilog.utils.signaltype as signaltype
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+from pyverilog.dataflow.walker import VerilogDataflowWalker
+
+def design(stages):
+    ret = []
+    ret.append('module TOP(input CLK, input RST, input [15:0] din, output [15:0] dout);')
+    ret.append('  localparam W = 16;')
+    ret.append('  localparam H = W / 2;')
+    ret.append('  wire [W-1:0] q [0:%d];' % stages)
+    ret.append('  assign q[0] = din;')
+    ret.append('  genvar i;')
+    ret.append('  generate for (i = 0; i < %d; i = i + 1) begin: stage' % stages)
+    ret.append('    reg [W-1:0] r;')
+    ret.append('    reg [1:0] st;')
+    ret.append('    wire [H-1:0] lo = r[H-1:0];')
+    ret.append('    wire [H-1:0] hi = r[W-1:H];')
+    ret.append('    always @(posedge CLK) begin')
+    ret.append('      if (RST) begin r <= 0; st <= 0; end')
+    ret.append('      else case (st)')
+    ret.append('        0: begin r <= q[i] + H; st <= 1; end')
+    ret.append('        1: begin r <= {lo, hi}; st <= q[i][0] ? 2 : 0; end')
+    ret.append('        2: begin r[H-1:0] <= q[i][W-1:H]; st <= 3; end')
+    ret.append('        default: begin r <= r - q[i]; st <= 0; end')
+    ret.append('      endcase')
+    ret.append('    end')
+    ret.append('    assign q[i+1] = r;')
+    ret.append('  end endgenerate')
+    ret.append('  assign dout = q[%d];' % stages)
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+def walk(analyzer, optimizer, names, step, cache_size):
+    walker = VerilogDataflowWalker('TOP', analyzer.getTerms(), analyzer.getBinddict(),
+                                   optimizer.getResolvedTerms(), optimizer.getResolvedBinddict(),
+                                   optimizer.getConstlist())
+    walker.optimizer.cache_size = cache_size
+    start = time.time()
+    # walkBind takes string names, which cannot select a generate loop iteration
+    trees = [ walker.walkTree(walker.getTree(name), visited=set(), step=step) for name in names ]
+    return time.time() - start, trees, walker.optimizer.getCacheStats()
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--stages", dest="stages", type="int", default=20,
+                         help="Number of pipeline stages, Default=20")
+    optparser.add_option("-s", "--step", dest="step", type="int", default=1,
+                         help="Walk step, Default=1")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.stages))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+
+    optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+    optimizer.resolveConstant()
+    names = [ name for name, term in analyzer.getTerms().items()
+              if name in analyzer.getBinddict() and term.lenmsb is None and
+              not signaltype.isParameter(term.termtype) and
+              not signaltype.isLocalparam(term.termtype) ]
+
+    uncached, utrees, ustats = walk(analyzer, optimizer, names, options.step, 0)
+    cached, ctrees, cstats = walk(analyzer, optimizer, names, options.step, 65536)
+    assert utrees == ctrees
+
+    print('signals %d  step %d' % (len(names), options.step))
+    print('no cache %8.3f s' % uncached)
+    print('cache    %8.3f s  speedup %.1fx  hits %d  misses %d  hit rate %.1f%%' %
+          (cached, uncached / cached, cstats['hits'], cstats['misses'], 100.0 * cstats['hitrate']))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#-------------------------------------------------------------------------------
+# bench_parallel_bind.py
+#
+# Benchmark of VerilogDataflowAnalyzer.generate on a design of N cores, each
+# an instance in the top module with its own parameters: instances elaborated
+# in 1, 2, 4, ... bind worker processes (bind_jobs)
+#
+# Usage: python -m pyverilog.benchmark.bench_parallel_bind [-n N] [-b B] [-j 1,2,4]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+
+CORE = """
+module core #(parameter ID = 0, parameter W = 16, parameter B = 16)
+  (input CLK, input RST, input [W-1:0] din, output [W-1:0] dout);
+  wire [W-1:0] q [0:B];
+  assign q[0] = din ^ ID;
+  genvar i;
+  generate for (i = 0; i < B; i = i + 1) begin: stage
+    reg [W-1:0] r;
+    reg [W-1:0] t;
+    always @* begin
+      t = q[i] + i;
+      if (t[0]) t = t >> 1;
+    end
+    always @(posedge CLK) begin
+      if (RST) r <= ID;
+      else if (t[1]) r <= t ^ r;
+      else r <= t;
+    end
+    assign q[i+1] = r;
+  end endgenerate
+  assign dout = q[B];
+endmodule
+"""
+
+def design(cores, stages):
+    ret = [CORE]
+    ret.append('module TOP(input CLK, input RST, input [15:0] din, output [15:0] dout);')
+    ret.append('  wire [15:0] c [0:%d];' % cores)
+    ret.append('  assign c[0] = din;')
+    for n in range(cores):
+        ret.append('  core #(.ID(%d), .B(%d)) core%d (.CLK(CLK), .RST(RST), .din(c[%d]), .dout(c[%d]));' %
+                   (n, stages, n, n, n + 1))
+    ret.append('  assign dout = c[%d];' % cores)
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+def run(filename, jobs):
+    analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native',
+                                       bind_jobs=jobs)
+    start = time.time()
+    analyzer.generate()
+    elapsed = time.time() - start
+    return elapsed, analyzer
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--cores", dest="cores", type="int", default=8,
+                         help="Number of core instances, Default=8")
+    optparser.add_option("-b", "--stages", dest="stages", type="int", default=64,
+                         help="Number of pipeline stages per core, Default=64")
+    optparser.add_option("-j", "--jobs", dest="jobs", default="1,2,4",
+                         help="Comma separated numbers of bind jobs, Default=1,2,4")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.cores, options.stages))
+        out.close()
+
+        serial = None
+        for jobs in [ int(j) for j in options.jobs.split(',') ]:
+            elapsed, analyzer = run(filename, jobs)
+            if serial is None:
+                serial = elapsed
+                terms = analyzer.getTerms()
+                binddict = analyzer.getBinddict()
+            else:
+                assert sorted(map(str, terms)) == sorted(map(str, analyzer.getTerms()))
+                assert ([ (str(k), [ b.tostr() for b in v ]) for k, v in binddict.items() ] ==
+                        [ (str(k), [ b.tostr() for b in v ]) for k, v in analyzer.getBinddict().items() ])
+            print('bind_jobs %2d  generate %8.3f s  speedup %5.2fx' %
+                  (jobs, elapsed, serial / elapsed))
+    finally:
+        shutil.rmtree(dirname)
+
+if __name__ == '__main__':
+    main()
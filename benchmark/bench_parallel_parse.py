@@ -0,0 +1,86 @@
+#-------------------------------------------------------------------------------
+# bench_parallel_parse.py
+#
+# Scaling benchmark of the parallel per-file parse (parse_jobs) of
+# VerilogCodeParser on a synthetic design of many modules and files
+#
+# Usage: python -m pyverilog.benchmark.bench_parallel_parse [-m M] [-f F] [-j 1,2,4,8]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+from pyverilog.vparser.parser import VerilogCodeParser
+
+MODULE = """
+module mod%(id)d #(parameter W = 8)
+  (input CLK, input RST, input [W-1:0] din, output reg [W-1:0] dout);
+  reg [W-1:0] r0, r1, r2;
+  wire [W-1:0] t = (din ^ r0) + (r1 & ~r2);
+  always @(posedge CLK) begin
+    if (RST) begin
+      r0 <= 0; r1 <= 0; r2 <= 0; dout <= 0;
+    end else begin
+      r0 <= din;
+      r1 <= r0 + %(id)d;
+      r2 <= (r1 > r0) ? r1 - r0 : r0 - r1;
+      case (r2[1:0])
+        2'd0: dout <= t;
+        2'd1: dout <= t << 1;
+        2'd2: dout <= t >> 1;
+        default: dout <= ~t;
+      endcase
+    end
+  end
+endmodule
+"""
+
+def generate(dirname, modules, files):
+    filelist = []
+    for f in range(files):
+        filename = os.path.join(dirname, 'part%d.v' % f)
+        out = open(filename, 'w')
+        for i in range(f, modules, files):
+            out.write(MODULE % {'id': i})
+        out.close()
+        filelist.append(filename)
+    return filelist
+
+def run(filelist, jobs):
+    codeparser = VerilogCodeParser(filelist, preprocess_engine='native', parse_jobs=jobs)
+    start = time.time()
+    ast = codeparser.parse()
+    return time.time() - start, len(ast.description.definitions)
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-m", "--modules", dest="modules", type="int", default=400,
+                         help="Number of modules, Default=400")
+    optparser.add_option("-f", "--files", dest="files", type="int", default=100,
+                         help="Number of files, Default=100")
+    optparser.add_option("-j", "--jobs", dest="jobs", default="1,2,4,8",
+                         help="Comma separated worker counts, Default=1,2,4,8")
+    (options, args) = optparser.parse_args()
+
+    dirname = tempfile.mkdtemp()
+    try:
+        filelist = generate(dirname, options.modules, options.files)
+        base = None
+        for jobs in [ int(j) for j in options.jobs.split(',') ]:
+            elapsed, n = run(filelist, jobs)
+            if base is None: base = elapsed
+            print('jobs %2d  %8.3f s  speedup %5.2fx  (%d modules)' %
+                  (jobs, elapsed, base / elapsed, n))
+    finally:
+        shutil.rmtree(dirname)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#-------------------------------------------------------------------------------
+# bench_parameter_resolve.py
+#
+# Benchmark of parameter resolution (VerilogDataflowOptimizer.resolveParameters)
+# on N generate scopes with a localparam chain of depth D each:
+# reference-ordered worklist vs. the former two sorted passes, with the
+# binddict in declaration order and in reverse order
+#
+# Usage: python -m pyverilog.benchmark.bench_parameter_resolve [-n N] [-d D]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+import collections
+from optparse import OptionParser
+
+import pyverilog.utils.signaltype as signaltype
+from pyverilog.dataflow.dataflow import DFEvalValue
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+
+def design(scopes, depth):
+    ret = []
+    ret.append('module TOP(input [7:0] din, output [7:0] dout);')
+    ret.append('  localparam P0 = 1;')
+    ret.append('  genvar i;')
+    ret.append('  generate for (i = 0; i < %d; i = i + 1) begin: g' % scopes)
+    ret.append('    localparam Q0 = P0 + i;')
+    for d in range(1, depth):
+        ret.append('    localparam Q%d = Q%d + %d;' % (d, d - 1, d))
+    ret.append('  end endgenerate')
+    ret.append('  assign dout = din;')
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+class LegacyOptimizer(VerilogDataflowOptimizer):
+    def resolveParameters(self, names=None):
+        evaluations = 0
+        for i in range(2):
+            for bk, bv in sorted(self.binddict.items(), key=lambda x:len(x[0])):
+                termtype = self.getTerm(bk).termtype
+                if signaltype.isParameter(termtype) or signaltype.isLocalparam(termtype):
+                    evaluations += 1
+                    rslt = self.optimizeConstant(bv[0].tree)
+                    if isinstance(rslt, DFEvalValue):
+                        self.constlist[bk] = rslt
+        return {'resolved': len(self.constlist), 'evaluations': evaluations}
+
+def run(cls, terms, binddict):
+    optimizer = cls(terms, binddict)
+    start = time.time()
+    stats = optimizer.resolveParameters()
+    return time.time() - start, stats
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--scopes", dest="scopes", type="int", default=500,
+                         help="Number of generate scopes, Default=500")
+    optparser.add_option("-d", "--depth", dest="depth", type="int", default=8,
+                         help="Depth of the localparam chains, Default=8")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.scopes, options.depth))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+    terms = analyzer.getTerms()
+    binddict = analyzer.getBinddict()
+    reversed_binddict = collections.OrderedDict(reversed(list(binddict.items())))
+
+    for order, bd in (('declaration', binddict), ('reverse', reversed_binddict)):
+        ltime, lstats = run(LegacyOptimizer, terms, bd)
+        wtime, wstats = run(VerilogDataflowOptimizer, terms, bd)
+        print('%-11s order  two passes %8.3f s  %6d resolved  %6d evaluations' %
+              (order, ltime, lstats['resolved'], lstats['evaluations']))
+        print('%-11s order  worklist   %8.3f s  %6d resolved  %6d evaluations  (of %d)' %
+              (order, wtime, wstats['resolved'], wstats['evaluations'], wstats['parameters']))
+
+if __name__ == '__main__':
+    main()
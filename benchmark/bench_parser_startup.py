@@ -0,0 +1,46 @@
+#-------------------------------------------------------------------------------
+# bench_parser_startup.py
+#
+# Cold-start benchmark of VerilogParser construction:
+# pre-generated LALR tables vs. building the tables with yacc()
+#
+# Usage: python -m pyverilog.benchmark.bench_parser_startup [-n N]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import subprocess
+from optparse import OptionParser
+
+SCRIPT = """
+import time
+start = time.time()
+from pyverilog.vparser.parser import VerilogParser
+VerilogParser(%s)
+print(time.time() - start)
+"""
+
+def coldstart(tabmodule_arg, repeat):
+    times = []
+    for i in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', SCRIPT % tabmodule_arg])
+        times.append(float(out.decode('latin-1').strip().splitlines()[-1]))
+    return min(times), sum(times) / len(times)
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--repeat", dest="repeat", type="int", default=5,
+                         help="Number of cold starts per configuration, Default=5")
+    (options, args) = optparser.parse_args()
+
+    for label, arg in (('prebuilt tables', ''), ('yacc() build', 'tabmodule=None')):
+        best, mean = coldstart(arg, options.repeat)
+        print('%-16s best %8.4f s  mean %8.4f s' % (label, best, mean))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#-------------------------------------------------------------------------------
+# bench_resolve_constant.py
+#
+# Memory and time benchmark of VerilogDataflowOptimizer.resolveConstant on a
+# generated design of N pipeline stages: copy-on-write resolved binds and
+# terms vs. deep copies of the whole binddict and terms
+#
+# Usage: python -m pyverilog.benchmark.bench_resolve_constant [-n N] [-w W]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import copy
+import shutil
+import tempfile
+import tracemalloc
+from optparse import OptionParser
+
+import pyverilog.utils.signaltype as signaltype
+from pyverilog.dataflow.dataflow import DFEvalValue
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+
+def design(stages, width):
+    ret = []
+    ret.append('module TOP(input CLK, input RST, input [%d:0] din, output [%d:0] dout);' %
+               (width - 1, width - 1))
+    ret.append('  localparam W = %d;' % width)
+    ret.append('  localparam H = W / 2;')
+    ret.append('  wire [W-1:0] q [0:%d];' % stages)
+    ret.append('  assign q[0] = din;')
+    ret.append('  genvar i;')
+    ret.append('  generate for (i = 0; i < %d; i = i + 1) begin: stage' % stages)
+    ret.append('    localparam K = i * 3 + H;')
+    ret.append('    reg [W-1:0] r;')
+    ret.append('    reg [1:0] st;')
+    ret.append('    always @(posedge CLK) begin')
+    ret.append('      if (RST) begin r <= 0; st <= 0; end')
+    ret.append('      else case (st)')
+    ret.append('        0: begin r <= q[i] + K; st <= 1; end')
+    ret.append('        1: begin r <= {q[i][H-1:0], q[i][W-1:H]}; st <= q[i][0] ? 2 : 0; end')
+    ret.append('        2: begin r <= q[i] ^ r; st <= 3; end')
+    ret.append('        default: begin r <= r - q[i]; st <= 0; end')
+    ret.append('      endcase')
+    ret.append('    end')
+    ret.append('    assign q[i+1] = r;')
+    ret.append('  end endgenerate')
+    ret.append('  assign dout = q[%d];' % stages)
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+class LegacyOptimizer(VerilogDataflowOptimizer):
+    def resolveConstant(self):
+        for i in range(2):
+            for bk, bv in sorted(self.binddict.items(), key=lambda x:len(x[0])):
+                termtype = self.getTerm(bk).termtype
+                if signaltype.isParameter(termtype) or signaltype.isLocalparam(termtype):
+                    rslt = self.optimizeConstant(bv[0].tree)
+                    if isinstance(rslt, DFEvalValue):
+                        self.constlist[bk] = rslt
+
+        self.resolved_binddict = copy.deepcopy(self.binddict)
+        for bk, bv in sorted(self.binddict.items(), key=lambda x:len(x[0])):
+            new_bindlist = []
+            for bind in bv:
+                new_bind = copy.deepcopy(bind)
+                if bk in self.constlist:
+                    new_bind.tree = self.constlist[bk]
+                new_bindlist.append(new_bind)
+            self.resolved_binddict[bk] = new_bindlist
+
+        self.resolved_terms = copy.deepcopy(self.terms)
+        for tk, tv in sorted(self.resolved_terms.items(), key=lambda x:len(x[0])):
+            if tv.msb is not None:
+                self.resolved_terms[tk].msb = self.optimizeConstant(tv.msb)
+            if tv.lsb is not None:
+                self.resolved_terms[tk].lsb = self.optimizeConstant(tv.lsb)
+            if tv.lenmsb is not None:
+                self.resolved_terms[tk].lenmsb = self.optimizeConstant(tv.lenmsb)
+            if tv.lenlsb is not None:
+                self.resolved_terms[tk].lenlsb = self.optimizeConstant(tv.lenlsb)
+
+def run(cls, terms, binddict):
+    tracemalloc.start()
+    start = time.time()
+    optimizer = cls(terms, binddict)
+    optimizer.resolveConstant()
+    elapsed = time.time() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, optimizer
+
+def dump(optimizer):
+    ret = []
+    for k, v in optimizer.getResolvedBinddict().items():
+        ret.append((str(k), [ b.tostr() for b in v ]))
+    for k, v in optimizer.getResolvedTerms().items():
+        ret.append((str(k), v.tostr()))
+    for k, v in optimizer.getConstlist().items():
+        ret.append((str(k), v.tostr()))
+    return ret
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--stages", dest="stages", type="int", default=2000,
+                         help="Number of pipeline stages, Default=2000")
+    optparser.add_option("-w", "--width", dest="width", type="int", default=32,
+                         help="Data width, Default=32")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.stages, options.width))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+    terms = analyzer.getTerms()
+    binddict = analyzer.getBinddict()
+
+    ltime, lpeak, legacy = run(LegacyOptimizer, terms, binddict)
+    ctime, cpeak, cow = run(VerilogDataflowOptimizer, terms, binddict)
+    assert dump(legacy) == dump(cow)
+
+    print('terms %d  bound terms %d' % (len(terms), len(binddict)))
+    print('deepcopy       %8.3f s  peak %8.1f MB' % (ltime, lpeak / 1048576.0))
+    print('copy-on-write  %8.3f s  peak %8.1f MB  speedup %.1fx  memory %.1fx' %
+          (ctime, cpeak / 1048576.0, ltime / ctime, float(lpeak) / cpeak))
+
+if __name__ == '__main__':
+    main()
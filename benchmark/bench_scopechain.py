@@ -0,0 +1,91 @@
+#-------------------------------------------------------------------------------
+# bench_scopechain.py
+#
+# Benchmark of ScopeChain on a deep instance hierarchy: building instance
+# and signal chains, using them as dict keys and printing them, as
+# FrameTable and BindVisitor do. Compares the interned chains with the
+# former deepcopy-on-append implementation.
+#
+# Usage: python -m pyverilog.benchmark.bench_scopechain [-d D] [-f F] [-s S]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import copy
+import time
+from optparse import OptionParser
+
+from pyverilog.utils.scope import ScopeLabel, ScopeChain
+
+# former implementation, for comparison
+class LegacyScopeChain(object):
+    def __init__(self, scopechain=None):
+        self.scopechain = []
+        if scopechain is not None:
+            self.scopechain = scopechain
+    def __add__(self, r):
+        new_chain = copy.deepcopy(self)
+        if isinstance(r, ScopeLabel):
+            new_chain.scopechain.append(r)
+        else:
+            new_chain.scopechain.extend(r.scopechain)
+        return new_chain
+    def tocode(self):
+        return '_'.join([ scope.tocode() for scope in self.scopechain if scope.tocode() ])
+    def __repr__(self):
+        return '.'.join([ scope.__repr__() for scope in self.scopechain ])
+    def __eq__(self, other):
+        return self.scopechain == other.scopechain
+    def __hash__(self):
+        return hash(tuple(self.scopechain))
+
+def run(chaincls, depth, fanout, signals):
+    table = {}
+    start = time.time()
+    level = [ chaincls([ScopeLabel('TOP', 'module')]) ]
+    instances = 0
+    for d in range(depth):
+        nextlevel = []
+        for parent in level:
+            for f in range(fanout):
+                inst = parent + ScopeLabel('inst%d' % f, 'module')
+                nextlevel.append(inst)
+                for s in range(signals):
+                    table[inst + ScopeLabel('sig%d' % s, 'signal')] = s
+        instances += len(nextlevel)
+        level = nextlevel
+    build = time.time() - start
+
+    start = time.time()
+    hits = 0
+    for inst in level:
+        for s in range(signals):
+            key = inst + ScopeLabel('sig%d' % s, 'signal')
+            if key in table: hits += 1
+            repr(key)
+            key.tocode()
+    lookup = time.time() - start
+    return instances, len(table), build, lookup
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-d", "--depth", dest="depth", type="int", default=6,
+                         help="Hierarchy depth, Default=6")
+    optparser.add_option("-f", "--fanout", dest="fanout", type="int", default=4,
+                         help="Instances per module, Default=4")
+    optparser.add_option("-s", "--signals", dest="signals", type="int", default=8,
+                         help="Signals per instance, Default=8")
+    (options, args) = optparser.parse_args()
+
+    for label, chaincls in (('deepcopy', LegacyScopeChain), ('interned', ScopeChain)):
+        instances, keys, build, lookup = run(chaincls, options.depth,
+                                             options.fanout, options.signals)
+        print('%-9s %6d instances %7d keys  build %8.4f s  lookup+print %8.4f s' %
+              (label, instances, keys, build, lookup))
+
+if __name__ == '__main__':
+    main()
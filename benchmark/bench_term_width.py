@@ -0,0 +1,105 @@
+#-------------------------------------------------------------------------------
+# bench_term_width.py
+#
+# Benchmark of the term width lookups (VerilogOptimizer.getWidth and the bind
+# sort keys of VerilogDataflowMerge) of a design of N registers with
+# parameterized widths: term width table vs. constant folding of msb/lsb on
+# every lookup
+#
+# Usage: python -m pyverilog.benchmark.bench_term_width [-n N] [-p P]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+import pyverilog.utils.signaltype as signaltype
+from pyverilog.dataflow.dataflow import *
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogOptimizer, VerilogDataflowOptimizer
+from pyverilog.dataflow.merge import VerilogDataflowMerge
+
+def design(registers):
+    ret = []
+    ret.append('module TOP(input CLK, input [63:0] din, output [63:0] dout);')
+    ret.append('  parameter W = 64;')
+    ret.append('  localparam H = W / 2;')
+    ret.append('  localparam Q = H / 2;')
+    for r in range(registers):
+        ret.append('  reg [W-1:0] r%d;' % r)
+        src = 'din' if r == 0 else 'r%d' % (r - 1)
+        ret.append('  always @(posedge CLK) begin')
+        ret.append('    r%d[H+Q-1:H] <= %s[Q-1:0];' % (r, src))
+        ret.append('    r%d[W-1:H+Q] <= %s[H-1:Q];' % (r, src))
+        ret.append('    r%d[Q-1:0] <= %s[H+Q-1:H];' % (r, src))
+        ret.append('    r%d[H-1:Q] <= %s[W-1:H+Q];' % (r, src))
+        ret.append('  end')
+    ret.append('  assign dout = r%d;' % (registers - 1))
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+class LegacyOptimizer(VerilogOptimizer):
+    def getTermWidth(self, name):
+        return self.makeTermWidth(self.getTerm(name))
+
+class LegacyMerge(VerilogDataflowMerge):
+    def __init__(self, *args, **kwargs):
+        VerilogDataflowMerge.__init__(self, *args, **kwargs)
+        self.optimizer = LegacyOptimizer(self.terms, self.constlist)
+
+def lookup(cls, analyzer, optimizer, names, passes):
+    merge = cls('TOP', analyzer.getTerms(), analyzer.getBinddict(),
+                optimizer.getResolvedTerms(), optimizer.getResolvedBinddict(),
+                optimizer.getConstlist(), optimizer=optimizer)
+    terminals = [ DFTerminal(name) for name in names ]
+    start = time.time()
+    for p in range(passes):
+        merge.invalidateTreeCache()
+        trees = [ merge.getTree(name) for name in names ]
+        widths = [ merge.optimizer.getWidth(terminal) for terminal in terminals ]
+    return time.time() - start, trees, widths
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--registers", dest="registers", type="int", default=200,
+                         help="Number of registers, Default=200")
+    optparser.add_option("-p", "--passes", dest="passes", type="int", default=5,
+                         help="Number of lookups of each signal, Default=5")
+    (options, args) = optparser.parse_args()
+
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.registers))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+
+    optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+    optimizer.resolveConstant()
+    names = [ name for name, term in analyzer.getTerms().items()
+              if name in analyzer.getBinddict() and term.lenmsb is None and
+              not signaltype.isParameter(term.termtype) and
+              not signaltype.isLocalparam(term.termtype) ]
+
+    legacy, ltrees, lwidths = lookup(LegacyMerge, analyzer, optimizer, names, options.passes)
+    table, ttrees, twidths = lookup(VerilogDataflowMerge, analyzer, optimizer, names, options.passes)
+    assert ltrees == ttrees and lwidths == twidths
+
+    print('signals %d  passes %d' % (len(names), options.passes))
+    print('fold     %8.3f s' % legacy)
+    print('table    %8.3f s  speedup %.1fx' % (table, legacy / table))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#-------------------------------------------------------------------------------
+# bench_walk_cache.py
+#
+# Benchmark of VerilogDataflowWalker.walkBind of M outputs sharing the fan-in
+# cone of a combinational datapath of N stages: walk result cache vs.
+# expanding the cone again for every target
+#
+# Usage: python -m pyverilog.benchmark.bench_walk_cache [-n N] [-m M] [-s STEP]
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+from optparse import OptionParser
+
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+from pyverilog.dataflow.walker import VerilogDataflowWalker
+
+def design(stages, outputs):
+    ret = []
+    ret.append('module TOP(input CLK, input RST, input [15:0] a, input [15:0] b,')
+    ret.append('           %s);' % ', '.join([ 'output reg [15:0] o%d' % i for i in range(outputs) ]))
+    ret.append('  reg [15:0] acc;')
+    ret.append('  wire [15:0] d0 = a + acc;')
+    for i in range(1, stages + 1):
+        ret.append('  wire [15:0] d%d = ((d%d ^ b) + a) - %d;' % (i, i-1, i))
+    ret.append('  always @(posedge CLK) begin')
+    ret.append('    if (RST) acc <= 0; else acc <= d%d;' % stages)
+    for i in range(outputs):
+        ret.append('    o%d <= d%d + %d;' % (i, stages, i))
+    ret.append('  end')
+    ret.append('endmodule')
+    return '\n'.join(ret) + '\n'
+
+# former implementation, for comparison
+class LegacyWalker(VerilogDataflowWalker):
+    def walkTerminal(self, termname, visited, nptr, nextstep, delay):
+        return self.walkTree(self.getTree(termname, nptr),
+                             visited|set([termname,]), nextstep, delay)
+
+def walk(cls, analyzer, optimizer, names, step):
+    walker = cls('TOP', analyzer.getTerms(), analyzer.getBinddict(),
+                 optimizer.getResolvedTerms(), optimizer.getResolvedBinddict(),
+                 optimizer.getConstlist())
+    start = time.time()
+    trees = [ walker.walkBind(name, step=step) for name in names ]
+    return time.time() - start, trees, walker
+
+def main():
+    optparser = OptionParser()
+    optparser.add_option("-n", "--stages", dest="stages", type="int", default=200,
+                         help="Number of datapath stages, Default=200")
+    optparser.add_option("-m", "--outputs", dest="outputs", type="int", default=200,
+                         help="Number of outputs, Default=200")
+    optparser.add_option("-s", "--step", dest="step", type="int", default=2,
+                         help="Walk step, Default=2")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(16 * 1024)
+    dirname = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(dirname, 'top.v')
+        out = open(filename, 'w')
+        out.write(design(options.stages, options.outputs))
+        out.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+    finally:
+        shutil.rmtree(dirname)
+
+    optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+    optimizer.resolveConstant()
+    names = [ 'TOP.o%d' % i for i in range(options.outputs) ]
+
+    legacy, ltrees, lwalker = walk(LegacyWalker, analyzer, optimizer, names, options.step)
+    cached, ctrees, cwalker = walk(VerilogDataflowWalker, analyzer, optimizer, names, options.step)
+    assert ltrees == ctrees
+    stats = cwalker.getWalkCacheStats()
+
+    print('outputs %d  stages %d  step %d' % (options.outputs, options.stages, options.step))
+    print('re-walk  %8.3f s' % legacy)
+    print('cache    %8.3f s  speedup %.1fx  hits %d  misses %d' %
+          (cached, legacy / cached, stats['hits'], stats['misses']))
+
+if __name__ == '__main__':
+    main()
@@ -18,9 +18,10 @@ from pyverilog.controlflow.controlflow_analyzer import VerilogControlflowAnalyze
 
 class VerilogActiveConditionAnalyzer(VerilogControlflowAnalyzer):
     def __init__(self, topmodule, terms, binddict, 
-                 resolved_terms, resolved_binddict, constlist):
+                 resolved_terms, resolved_binddict, constlist, optimizer=None):
         VerilogControlflowAnalyzer.__init__(self, topmodule, terms, binddict, 
-                                            resolved_terms, resolved_binddict, constlist)
+                                            resolved_terms, resolved_binddict, constlist,
+                                            optimizer=optimizer)
         self.fsm_loops, self.fsms = self.getLoops()
 
     ############################################################################
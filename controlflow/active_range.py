@@ -20,9 +20,10 @@ from pyverilog.controlflow.controlflow_analyzer import VerilogControlflowAnalyze
 
 class VerilogActiveAnalyzer(VerilogControlflowAnalyzer):
     def __init__(self, topmodule, terms, binddict, 
-                 resolved_terms, resolved_binddict, constlist):
+                 resolved_terms, resolved_binddict, constlist, elaborator=None, optimizer=None):
         VerilogControlflowAnalyzer.__init__(self, topmodule, terms, binddict, 
-                                            resolved_terms, resolved_binddict, constlist)
+                                            resolved_terms, resolved_binddict, constlist,
+                                            elaborator=elaborator, optimizer=optimizer)
 
     ############################################################################
     def getActiveConditions(self, termname, op='>', conditionvalue=0):
@@ -26,11 +26,14 @@ import pyverilog.controlflow.transition as transition
 class VerilogControlflowAnalyzer(VerilogSubset):
     def __init__(self, topmodule, terms, binddict,
                  resolved_terms, resolved_binddict, 
-                 constlist, fsm_vars=('fsm', 'state', 'count', 'cnt', 'step', 'mode') ):
+                 constlist, fsm_vars=('fsm', 'state', 'count', 'cnt', 'step', 'mode'),
+                 elaborator=None, optimizer=None):
         VerilogSubset.__init__(self, topmodule, terms, binddict,
-                               resolved_terms, resolved_binddict, constlist)
+                               resolved_terms, resolved_binddict, constlist,
+                               elaborator=elaborator, optimizer=optimizer)
         self.treewalker = VerilogDataflowWalker(topmodule, terms, binddict, 
-                                                resolved_terms, resolved_binddict, constlist)
+                                                resolved_terms, resolved_binddict, constlist,
+                                                elaborator=elaborator, optimizer=self.optimizer)
         self.fsm_vars = fsm_vars
 
     ############################################################################
@@ -92,12 +95,9 @@ class VerilogControlflowAnalyzer(VerilogSubset):
 
     def getWidth(self, termname):
         term = self.getTerm(termname)
-        msb = self.optimizer.optimizeConstant(term.msb)
-        lsb = self.optimizer.optimizeConstant(term.lsb)
-        width = DFIntConst('32')
-        if msb is not None and lsb is not None:
-            return abs(self.optimizer.optimizeConstant(DFOperator((msb, lsb), 'Minus')).value) + 1
-        return self.optimizer.optimizeConstant(width).value
+        width = self.optimizer.getTermWidth(term.name).width
+        if width is not None: return width
+        return 32
 
     def makeTree(self, termname):
         tree = self.getTree(termname)
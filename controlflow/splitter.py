@@ -17,25 +17,31 @@ from pyverilog.dataflow.dataflow import *
 ################################################################################
 def split(tree):
     funcdict = {} # key:condition list, value:function
-    if isinstance(tree, DFBranch):
-        truefuncs = split(tree.truenode)
-        truecond = tree.condnode
-        if len(truefuncs) > 0:
-            for cond, func in truefuncs.items():
-                funcdict[(truecond,) + cond] = func
-        else:
-            if tree.truenode is not None:
-                funcdict[(truecond,)] = tree.truenode
-        falsefuncs = split(tree.falsenode)
-        falsecond = DFOperator((tree.condnode,), 'Ulnot')
-        if len(falsefuncs) > 0:
-            for cond, func in falsefuncs.items():
-                funcdict[(falsecond,) + cond] = func
-        else:
-            if tree.falsenode is not None:
-                funcdict[(falsecond,)] = tree.falsenode
+    # explicit stack of ('split', DFBranch, conditions above) and
+    # ('add', function, conditions) in the order of the result
+    stack = [('split', tree, ())]
+    while stack:
+        task, node, conds = stack.pop()
+        if task == 'add':
+            funcdict[conds] = node
+            continue
+        if not isinstance(node, DFBranch): continue
+        truecond = node.condnode
+        falsecond = DFOperator((node.condnode,), 'Ulnot')
+        tasks = []
+        for cond, child in ((truecond, node.truenode), (falsecond, node.falsenode)):
+            if isBranching(child):
+                tasks.append(('split', child, conds + (cond,)))
+            elif child is not None:
+                tasks.append(('add', child, conds + (cond,)))
+        stack.extend(reversed(tasks))
     return funcdict
 
+def isBranching(tree):
+    """ True if split(tree) is not empty """
+    return (isinstance(tree, DFBranch) and
+            (tree.truenode is not None or tree.falsenode is not None))
+
 ################################################################################
 def remove_reset_condition(funcdict):
     new_funcdict = {}
@@ -12,6 +12,8 @@ from __future__ import print_function
 import sys
 import os
 import re
+import collections
+import multiprocessing
 
 from pyverilog.vparser.ast import *
 import pyverilog.utils.util as util
@@ -25,17 +27,25 @@ import pyverilog.dataflow.reorder as reorder
 import pyverilog.dataflow.replace as replace
 from pyverilog.dataflow.moduleinfo import *
 from pyverilog.dataflow.frames import *
+from pyverilog.dataflow.elaboration import ElaborationCache
 
 class BindVisitor(NodeVisitor):
-    def __init__(self, moduleinfotable, top, frames, blackboxed=[], noreorder=False, debug=False):
+    def __init__(self, moduleinfotable, top, frames, blackboxed=[], noreorder=False, debug=False,
+                 elaboration_cache=True, elaborated=None, lazy=False):
         self.moduleinfotable = moduleinfotable
         self.top = top
         self.frames = frames
         self.labels = Labels()
         self.dataflow = DataFlow()
-        self.optimizer = VerilogOptimizer({}, {})
+        self.optimizer = VerilogOptimizer(VersionedDict(), VersionedDict())
 
         self.noreorder = noreorder
+        self.elaborations = ElaborationCache() if elaboration_cache else None
+        self.elaborated = dict(elaborated) if elaborated is not None else {}
+        # lazy mode: instance scope -> (scope, module name), elaborated by
+        # elaborateTerm
+        self.lazy = lazy
+        self.pending = collections.OrderedDict()
 
         # set the top frame of top module
         self.frames.setCurrent(ScopeChain())
@@ -175,6 +185,18 @@ class BindVisitor(NodeVisitor):
         if self.debug:
             print("Analyzing instance " + nodename + " of type " + node.module)
 
+        current = self.enterInstance(node, nodename, arrayindex)
+        if self.lazy:
+            scope = self.frames.getCurrent()
+            self.deferInstance(scope, node.module)
+            self.skipLabels(scope)
+        else:
+            self.elaborateInstance(node.module, self.frames.getCurrent())
+        self.frames.setCurrent(current)
+
+    def enterInstance(self, node, nodename, arrayindex=None):
+        """ stacks the instance frame and binds its parameters and ports;
+            returns the previous frame """
         if nodename == '':
             raise verror.FormatError("Module %s requires an instance name" % node.module)
 
@@ -205,9 +227,91 @@ class BindVisitor(NodeVisitor):
 
         new_current = self.frames.getCurrent()
         self.copyFrameInfo(new_current)
+        return current
+
+    def elaborateInstance(self, modulename, scope):
+        key = None
+        if self.elaborations is not None:
+            params = [ (paramname, self.getInstanceParameter(scope, paramname))
+                       for paramname in self.moduleinfotable.getParamNames(modulename) ]
+            key = self.elaborations.getKey(modulename, params, self.blackboxed)
+
+        # elaborated by a worker process (see elaborate_instances)
+        if scope in self.elaborated:
+            elaboration = self.elaborated.pop(scope)
+            elaboration.replay(self, scope)
+            if key is not None: self.elaborations.add(key, elaboration)
+            return
+
+        if key is not None and self.elaborations.has(key):
+            self.elaborations.get(key).replay(self, scope)
+            return
+
+        recording = None
+        if key is not None:
+            recording = self.elaborations.begin(self, key, scope)
+        self.visit(self.moduleinfotable.getDefinition(modulename))
+        if recording is not None:
+            self.elaborations.end(self, recording)
+
+    def deferInstance(self, scope, modulename):
+        self.record('deferInstance', scope, modulename)
+        # the scope is kept with the module name: a term name from a string
+        # (util.toTermname) matches it, but its labels have no scope type
+        self.pending[scope] = (scope, modulename)
+
+    def skipLabels(self, scope):
+        # labels used in the deferred instance by SignalVisitor
+        for name, count in self.frames.getNextLabelCounts(scope).items():
+            delta = count - self.labels.getCount(name)
+            if delta > 0: self.labels.inc(name, delta)
+
+    def elaborateTerm(self, name):
+        """ lazy mode: elaborates the pending instances enclosing name;
+            returns the elaborated instance scopes """
+        ret = []
+        if not self.pending: return ret
+        for i in range(2, len(name) + 1):
+            scope = name[:i]
+            if scope in self.pending:
+                self.elaboratePending(scope)
+                ret.append(scope)
+        return ret
+
+    def elaborateAll(self):
+        """ lazy mode: elaborates all the pending instances """
+        ret = []
+        while self.pending:
+            scope = next(iter(self.pending))
+            self.elaboratePending(scope)
+            ret.append(scope)
+        return ret
+
+    def elaboratePending(self, scope):
+        scope, modulename = self.pending.pop(scope)
+        current = self.frames.getCurrent()
+        default_nettype = self.default_nettype
 
-        self.visit(self.moduleinfotable.getDefinition(node.module))
+        # label counters of the frames made by SignalVisitor in this instance;
+        # the others (function calls, ...) go on
+        labelcounts = self.frames.getLabelCounts(scope)
+        nextlabelcounts = self.frames.getNextLabelCounts(scope)
+        counts = self.labels.getCounts()
+        self.labels = Labels()
+        for name in nextlabelcounts.keys():
+            self.labels.inc(name, labelcounts.get(name, 0))
+        for name, count in counts.items():
+            if name not in nextlabelcounts: self.labels.inc(name, count)
+
+        self.frames.setCurrent(scope)
+        self.elaborateInstance(modulename, scope)
         self.frames.setCurrent(current)
+        self.default_nettype = default_nettype
+
+    def getInstanceParameter(self, scope, paramname):
+        name = scope + ScopeLabel(paramname, 'signal')
+        if not self.hasConstant(name): return None
+        return self.getConstant(name)
 
     def _visit_Instance_primitive(self, node, arrayindex=None):
         primitive_type = primitives[node.module]
@@ -577,7 +681,7 @@ class BindVisitor(NodeVisitor):
         scopelabel = ScopeLabel(label, scopetype, loop)
         nextscope = current + scopelabel
         if not self.frames.hasFrame(nextscope):
-            current = self.frames.addFrame(scopelabel,
+            current = self.addFrame(scopelabel,
                                            frametype=frametype,
                                            alwaysinfo=alwaysinfo, condition=condition,
                                            module=module, functioncall=functioncall, taskcall=taskcall,
@@ -588,6 +692,21 @@ class BindVisitor(NodeVisitor):
         self.copyFrameInfo(new_current)
         return current
 
+    def addFrame(self, scopelabel, **kwargs):
+        self.record('restoreFrame', self.frames.getCurrent() + scopelabel, kwargs)
+        return self.frames.addFrame(scopelabel, **kwargs)
+
+    def restoreFrame(self, scopechain, kwargs):
+        if self.frames.hasFrame(scopechain): return
+        current = self.frames.getCurrent()
+        self.frames.setCurrent(scopechain[:-1])
+        self.addFrame(scopechain[-1], **kwargs)
+        self.frames.setCurrent(current)
+
+    def record(self, method, *args):
+        if self.dataflow.journal is not None:
+            self.dataflow.journal.append(('visitor', method, args))
+
     def copyFrameInfo(self, current):
         for name, definitions in self.frames.getConsts(current).items():
             if len(definitions) > 1:
@@ -622,7 +741,7 @@ class BindVisitor(NodeVisitor):
                     self.setConstant(name, value)
 
     def copyAllFrameInfo(self):
-        for name, definitions in self.frames.getAllConsts().items():
+        for name, definitions in self.frames.iterAllConsts():
             if len(definitions) > 1:
                 raise verror.FormatError("Multiple definitions for Constant")
             for definition in definitions:
@@ -630,16 +749,16 @@ class BindVisitor(NodeVisitor):
                 term = Term(name, set([termtype]))
                 self.dataflow.addTerm(name, term)
 
-        for name, definitions in self.frames.getAllSignals().items():
+        for name, definitions in self.frames.iterAllSignals():
             for definition in definitions:
                 termtype = definition.__class__.__name__
                 self.dataflow.addTerm(name, Term(name, set([termtype])))
 
-        for name, definition in self.frames.getAllFunctions().items():
+        for name, definition in self.frames.iterAllFunctions():
             self.dataflow.addFunction(name, definition.getDefinition())
             self.dataflow.addFunctionPorts(name, definition.getIOPorts())
 
-        for name, definition in self.frames.getAllTasks().items():
+        for name, definition in self.frames.iterAllTasks():
             self.dataflow.addTask(name, definition.getDefinition())
             self.dataflow.addTaskPorts(name, definition.getIOPorts())
 
@@ -668,9 +787,11 @@ class BindVisitor(NodeVisitor):
                 self.frames.setBlockingAssign(name, bind, scope_copy_to)
 
     def setConstant(self, name, value):
+        self.record('setConstant', name, value)
         self.optimizer.setConstant(name, value)
 
     def resetConstant(self, name):
+        self.record('resetConstant', name)
         self.optimizer.resetConstant(name)
 
     def getConstant(self, name):
@@ -680,6 +801,7 @@ class BindVisitor(NodeVisitor):
         return self.optimizer.hasConstant(name)
 
     def setConstantTerm(self, name, term):
+        self.record('setConstantTerm', name, term)
         self.optimizer.setTerm(name, term)
 
     def getTerm(self, name):
@@ -1060,7 +1182,7 @@ class BindVisitor(NodeVisitor):
             save_current = self.frames.getCurrent()
             self.frames.setCurrent(scope)
 
-            current = self.frames.addFrame(
+            current = self.addFrame(
                 ScopeLabel(label, 'functioncall'),
                 functioncall=True, generate=self.frames.isGenerate(),
                 always=self.frames.isAlways())
@@ -1098,7 +1220,7 @@ class BindVisitor(NodeVisitor):
             task = self.searchTask(node.name.name, scope)
             label = self.labels.get( self.frames.getLabelKey('taskcall') )
 
-            current = self.frames.addFrame(
+            current = self.addFrame(
                 ScopeLabel(label, 'taskcall'),
                 taskcall=True, generate=self.frames.isGenerate(),
                 always=self.frames.isAlways())
@@ -1534,3 +1656,69 @@ class BindVisitor(NodeVisitor):
                 base.condnode,
                 base.truenode,
                 self.appendBranchTree(base.falsenode, pos[1:], tree))
+
+#-------------------------------------------------------------------------------
+def elaborate_instances(moduleinfotable, top, frames, constlist, blackboxed=[],
+                        noreorder=False, elaboration_cache=True, jobs=1):
+    """ Elaborates the instances in the top module in worker processes;
+        returns a dict of instance scope -> Elaboration, which BindVisitor
+        replays in its own traversal order instead of visiting them """
+    topscope = ScopeChain([ ScopeLabel(top, 'module') ])
+    cache = ElaborationCache()
+    keys = set()
+    scopes = []
+    for scope in frames.getChildInstances(topscope):
+        node, nodename, arrayindex = frames.getInstance(scope)
+        if node.module in blackboxed: continue
+        if elaboration_cache:
+            # instances with the same parameters are replayed from the first one
+            params = [ (paramname, constlist.get(scope + ScopeLabel(paramname, 'signal')))
+                       for paramname in moduleinfotable.getParamNames(node.module) ]
+            key = cache.getKey(node.module, params, blackboxed)
+            if key in keys: continue
+            if key is not None: keys.add(key)
+        scopes.append(scope)
+
+    if jobs <= 1 or len(scopes) <= 1: return {}
+    pool = multiprocessing.Pool(min(jobs, len(scopes)),
+                                initializer=_init_bind_worker,
+                                initargs=(moduleinfotable, top, frames, constlist,
+                                          blackboxed, noreorder, elaboration_cache))
+    try:
+        ret = pool.map(_bind_worker, scopes, chunksize=1)
+    finally:
+        pool.terminate()
+    return dict(ret)
+
+# BindVisitor of a bind worker process
+_worker_visitor = None
+
+def _init_bind_worker(moduleinfotable, top, frames, constlist,
+                      blackboxed, noreorder, elaboration_cache):
+    global _worker_visitor
+    _worker_visitor = BindVisitor(moduleinfotable, top, frames, blackboxed=blackboxed,
+                                  noreorder=noreorder, elaboration_cache=elaboration_cache)
+    # constants of the top module, as resolved by SignalVisitor
+    for name, value in constlist.items():
+        if any([ label.scopetype == 'module' for label in name.scopechain[1:] ]): continue
+        _worker_visitor.setConstant(name, value)
+
+def _bind_worker(scope):
+    visitor = _worker_visitor
+    node, nodename, arrayindex = visitor.frames.getInstance(scope)
+    for i in range(2, len(scope)):
+        if visitor.frames.hasFrame(scope[:i]): visitor.copyFrameInfo(scope[:i])
+
+    # same label counters as the serial traversal at this instance
+    visitor.labels = Labels()
+    for name, count in visitor.frames.getLabelCounts(scope).items():
+        visitor.labels.inc(name, count)
+    visitor.renamecnt = 0
+
+    visitor.frames.setCurrent(scope[:-1])
+    visitor.enterInstance(node, nodename, arrayindex)
+    recorder = ElaborationCache()
+    recording = recorder.begin(visitor, scope, scope)
+    visitor.elaborateInstance(node.module, scope)
+    recorder.end(visitor, recording)
+    return scope, recorder.get(scope)
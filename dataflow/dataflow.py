@@ -13,6 +13,7 @@ import sys
 import os
 import re
 import copy
+import weakref
 
 ################################################################################
 dfnodelist = ('DFIntConst', 'DFFloatConst', 'DFStringConst',
@@ -42,7 +43,92 @@ import pyverilog.utils.signaltype as signaltype
 import pyverilog.utils.op2mark as op2mark
 
 ################################################################################
-class DFNode(object):
+_atomtypes = (type(None), bool, int, float, str)
+
+def _freeze(args):
+    """ args with the list arguments (e.g. nextnodes) as tuples: a node shared
+        by equal arguments must not keep a list the caller may modify later """
+    for v in args:
+        if type(v) is list: break
+    else:
+        return args
+    return tuple([ tuple(v) if type(v) is list else v for v in args ])
+
+def _nodekey(value):
+    t = type(value)
+    if t in _atomtypes: return (t, value)
+    if t is tuple or t is list:
+        return (t,) + tuple([ (type(v), v) if type(v) in _atomtypes else
+                              _nodekey(v) if type(v) is tuple or type(v) is list else id(v)
+                              for v in value ])
+    # child nodes and scope chains: the node keeps them alive, so ids are unique
+    return id(value)
+
+class DFNodeTable(object):
+    """ Unique table of hash-consed DF nodes. Constructing a node of the same
+        class with the same arguments (nodes and names by identity, numbers
+        and strings by value) returns the existing node while it is alive,
+        so equal subtrees built bottom-up are one object. List arguments are
+        stored as tuples. DF nodes are never modified after construction.
+        disable() turns it off: every construction makes a new node. """
+    def __init__(self):
+        self.table = weakref.WeakValueDictionary()
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+    def make(self, cls, args, kwargs):
+        if not self.enabled:
+            return type.__call__(cls, *args, **kwargs)
+        args = _freeze(args)
+        if kwargs: kwargs = dict(zip(kwargs.keys(), _freeze(tuple(kwargs.values()))))
+        key = (cls, _nodekey(args))
+        if kwargs: key += (_nodekey(tuple(sorted(kwargs.items()))),)
+        node = self.table.get(key)
+        if node is not None:
+            self.hits += 1
+            return node
+        self.misses += 1
+        node = type.__call__(cls, *args, **kwargs)
+        self.table[key] = node
+        return node
+
+    def enable(self):
+        self.enabled = True
+    def disable(self):
+        self.enabled = False
+    def isEnabled(self):
+        return self.enabled
+
+    def clear(self):
+        self.table.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def getStats(self):
+        return {'nodes': len(self.table), 'hits': self.hits, 'misses': self.misses}
+
+dfnodetable = DFNodeTable()
+
+def getDFNodeTable():
+    return dfnodetable
+
+class DFNodeMeta(type):
+    def __call__(cls, *args, **kwargs):
+        return dfnodetable.make(cls, args, kwargs)
+
+def sameNodes(nodes, others):
+    """ True if the two node lists are the same objects: as DF nodes are never
+        modified, a transform returns a node with unchanged children as it is """
+    if len(nodes) != len(others): return False
+    for n, o in zip(nodes, others):
+        if n is not o: return False
+    return True
+
+# base class with DFNodeMeta (Python 2 and 3)
+_DFNodeBase = DFNodeMeta('_DFNodeBase', (object,), {})
+
+class DFNode(_DFNodeBase):
     attr_names = ()
     def __init__(self): pass
     def __repr__(self): pass
@@ -52,13 +138,25 @@ class DFNode(object):
     def children(self):
         nodelist = []
         return tuple(nodelist)
+    def childslots(self):
+        """ child nodes in construction order, including None """
+        return ()
+    def replaceChildren(self, children):
+        """ same node with children (childslots order): self if unchanged """
+        return self
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return False
     def __ne__(self, other):
         return not self.__eq__(other)
     def __hash__(self):
         return id(self)
+    # immutable: copies share the node
+    def __copy__(self):
+        return self
+    def __deepcopy__(self, memo):
+        return self
 
 class DFTerminal(DFNode):
     attr_names = ('name',)
@@ -86,6 +184,7 @@ class DFTerminal(DFNode):
         nodelist = []
         return tuple(nodelist)
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.name == other.name
     def __hash__(self):
@@ -108,6 +207,7 @@ class DFConstant(DFNode):
     def eval(self):
         return None
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.value == other.value
     def __hash__(self):
@@ -209,7 +309,13 @@ class DFOperator(DFNotTerminal):
         nodelist = []
         if self.nextnodes is not None: nodelist.extend(self.nextnodes)
         return tuple(nodelist)
+    def childslots(self):
+        return self.nextnodes
+    def replaceChildren(self, children):
+        if sameNodes(children, self.nextnodes): return self
+        return DFOperator(tuple(children), self.operator)
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.operator == other.operator and self.nextnodes == other.nextnodes
     def __hash__(self):
@@ -246,7 +352,13 @@ class DFPartselect(DFNotTerminal):
         if self.msb is not None: nodelist.append(self.msb)
         if self.lsb is not None: nodelist.append(self.lsb)
         return tuple(nodelist)
+    def childslots(self):
+        return (self.var, self.msb, self.lsb)
+    def replaceChildren(self, children):
+        if sameNodes(children, self.childslots()): return self
+        return DFPartselect(*children)
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.var == other.var and self.msb == other.msb and self.lsb == other.lsb
     def __hash__(self):
@@ -274,7 +386,13 @@ class DFPointer(DFNotTerminal):
         if self.var is not None: nodelist.append(self.var)
         if self.ptr is not None: nodelist.append(self.ptr)
         return tuple(nodelist)
+    def childslots(self):
+        return (self.var, self.ptr)
+    def replaceChildren(self, children):
+        if sameNodes(children, self.childslots()): return self
+        return DFPointer(*children)
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.var == other.var and self.ptr == other.ptr
     def __hash__(self):
@@ -302,7 +420,13 @@ class DFConcat(DFNotTerminal):
         nodelist = []
         if self.nextnodes is not None: nodelist.extend(self.nextnodes)
         return tuple(nodelist)
+    def childslots(self):
+        return self.nextnodes
+    def replaceChildren(self, children):
+        if sameNodes(children, self.nextnodes): return self
+        return DFConcat(tuple(children))
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.nextnodes == other.nextnodes
     def __hash__(self):
@@ -365,7 +489,13 @@ class DFBranch(DFNotTerminal):
         if self.condnode is not None: nodelist.append(self.condnode)
         if self.falsenode is not None: nodelist.append(self.falsenode)
         return tuple(nodelist)
+    def childslots(self):
+        return (self.condnode, self.truenode, self.falsenode)
+    def replaceChildren(self, children):
+        if sameNodes(children, self.childslots()): return self
+        return DFBranch(*children)
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.condnode == other.condnode and self.truenode == other.truenode and self.falsenode == other.falsenode
     def __hash__(self):
@@ -407,6 +537,7 @@ class DFEvalValue(DFNode):
     def eval(self):
         return self.value
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.value == other.value and self.width == other.width and self.isfloat == other.isfloat and self.isstring == other.isstring
     def __hash__(self):
@@ -432,6 +563,7 @@ class DFUndefined(DFNode):
         nodelist = []
         return tuple(nodelist)
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.width == other.width
     def __hash__(self):
@@ -457,6 +589,7 @@ class DFHighImpedance(DFNode):
         nodelist = []
         return tuple(nodelist)
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.width == other.width
     def __hash__(self):
@@ -480,7 +613,13 @@ class DFDelay(DFNotTerminal):
         nodelist = []
         if self.nextnode is not None: nodelist.append(self.nextnode)
         return tuple(nodelist)
+    def childslots(self):
+        return (self.nextnode,)
+    def replaceChildren(self, children):
+        if children[0] is self.nextnode: return self
+        return DFDelay(children[0])
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         return self.nextnodes == other.nextnodes
     def __hash__(self):
@@ -511,7 +650,13 @@ class DFSyscall(DFNotTerminal):
         nodelist = []
         if self.nextnodes is not None: nodelist.extend(self.nextnodes)
         return tuple(nodelist)
+    def childslots(self):
+        return self.nextnodes
+    def replaceChildren(self, children):
+        if sameNodes(children, self.nextnodes): return self
+        return DFSyscall(self.syscall, tuple(children))
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         if self.syscall != other.syscall: return False
         return self.nextnodes == other.nextnodes
@@ -604,6 +749,16 @@ class Bind(object):
     def __hash__(self):
         return hash((self.tree, self.dest, self.msb, self.lsb, self.ptr, self.alwaysinfo, self.parameterinfo))
 
+    def replace(self, **fields):
+        """ new Bind with fields (tree, msb, lsb, ptr) replaced; the others,
+            e.g. dest and alwaysinfo, are shared with self, not copied """
+        for name in fields:
+            if name not in ('tree', 'msb', 'lsb', 'ptr'):
+                raise verror.DefinitionError('Bind has no replaceable field: %s' % name)
+        ret = copy.copy(self)
+        ret.__dict__.update(fields)
+        return ret
+
     def isCombination(self):
         if self.alwaysinfo is None: return True
         if self.alwaysinfo.isCombination(): return True
@@ -720,9 +875,41 @@ class Bind(object):
         return self.alwaysinfo.getSenslist()
 
 ################################################################################
+class VersionedDict(dict):
+    """ dict with a version number, incremented on every change: the term
+        and constant tables are shared by several optimizers, which find
+        the changes made by any of them (VerilogOptimizer.getVersion) """
+    version = 0 # class default: unpickling sets the items before __dict__
+    def touch(self):
+        """ a value (e.g. a Term) was modified in place """
+        self.version += 1
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self.version += 1
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.version += 1
+    def clear(self):
+        dict.clear(self)
+        self.version += 1
+    def pop(self, *args):
+        self.version += 1
+        return dict.pop(self, *args)
+    def popitem(self):
+        self.version += 1
+        return dict.popitem(self)
+    def setdefault(self, key, default=None):
+        if key not in self: self.version += 1
+        return dict.setdefault(self, key, default)
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self.version += 1
+    def copy(self):
+        return VersionedDict(self)
+
 class DataFlow(object):
     def __init__(self):
-        self.terms = {}
+        self.terms = VersionedDict()
         self.binddict = {}
 
         self.functions = {}
@@ -730,20 +917,27 @@ class DataFlow(object):
         self.tasks = {}
         self.task_ports = {}
         self.temporal_value = {}
+        self.journal = None # (target, method, args) list while elaborating
 
     ############################################################################
     def addTerm(self, name, term):
+        if self.journal is not None: self.journal.append(('dataflow', 'addTerm', (name, term)))
         if not name in self.terms:
             self.terms[name] = term
         else:
             self.setTerm(name, term)
 
     def setTerm(self, name, term):
-        self.terms[name].termtype |= term.termtype
-        if self.terms[name].msb is None: self.terms[name].msb = term.msb
-        if self.terms[name].lsb is None: self.terms[name].lsb = term.lsb
-        if self.terms[name].lenmsb is None: self.terms[name].lenmsb = term.lenmsb
-        if self.terms[name].lenlsb is None: self.terms[name].lenlsb = term.lenlsb
+        # a new Term: the current one may be shared, e.g. by the resolved
+        # terms of VerilogDataflowOptimizer (lazy elaboration)
+        current = self.terms[name]
+        new_term = copy.copy(current)
+        new_term.termtype = current.termtype | term.termtype
+        if current.msb is None: new_term.msb = term.msb
+        if current.lsb is None: new_term.lsb = term.lsb
+        if current.lenmsb is None: new_term.lenmsb = term.lenmsb
+        if current.lenlsb is None: new_term.lenlsb = term.lenlsb
+        self.terms[name] = new_term
 
     def hasTerm(self, name):
         return name in self.terms
@@ -757,6 +951,7 @@ class DataFlow(object):
 
     ############################################################################
     def addBind(self, name, bind):
+        if self.journal is not None: self.journal.append(('dataflow', 'addBind', (name, bind)))
         if name is None:
             raise verror.DefinitionError('Bind name is empty')
         if not name in self.binddict:
@@ -771,7 +966,11 @@ class DataFlow(object):
         c_i = 0
         for c in currentbindlist:
             if c.msb == bind.msb and c.lsb == bind.lsb and c.ptr == bind.ptr:
-                self.binddict[name][c_i].tree = bind.tree
+                # a new Bind and list: the current ones may be shared, e.g. by
+                # the resolved binds of VerilogDataflowOptimizer
+                new_bindlist = list(currentbindlist)
+                new_bindlist[c_i] = c.replace(tree=bind.tree)
+                self.binddict[name] = new_bindlist
                 return
             c_i += 1
         self.binddict[name] = currentbindlist + [bind,]
@@ -785,6 +984,7 @@ class DataFlow(object):
 
     ############################################################################
     def addFunction(self, name, definition):
+        if self.journal is not None: self.journal.append(('dataflow', 'addFunction', (name, definition)))
         self.functions[name] = definition
     def hasFunction(self, name):
         return name in self.functions
@@ -792,6 +992,7 @@ class DataFlow(object):
         if name in self.functions: return self.functions[name]
         return None
     def addFunctionPorts(self, name, ports):
+        if self.journal is not None: self.journal.append(('dataflow', 'addFunctionPorts', (name, ports)))
         self.function_ports[name] = ports
     def getFunctionPorts(self, name):
         if name in self.function_ports: return self.function_ports[name]
@@ -799,6 +1000,7 @@ class DataFlow(object):
 
     ############################################################################
     def addTask(self, name, definition):
+        if self.journal is not None: self.journal.append(('dataflow', 'addTask', (name, definition)))
         self.tasks[name] = definition
     def hasTask(self, name):
         return name in self.tasks
@@ -806,6 +1008,7 @@ class DataFlow(object):
         if name in self.tasks: return self.tasks[name]
         return None
     def addTaskPorts(self, name, ports):
+        if self.journal is not None: self.journal.append(('dataflow', 'addTaskPorts', (name, ports)))
         self.task_ports[name] = ports
     def getTaskPorts(self, name):
         if name in self.task_ports: return self.task_ports[name]
@@ -11,28 +11,49 @@ from __future__ import print_function
 import sys
 import os
 
+import pyverilog.utils.util as util
 from pyverilog.vparser.parser import VerilogCodeParser
 from pyverilog.dataflow.modulevisitor import ModuleVisitor
 from pyverilog.dataflow.signalvisitor import SignalVisitor
-from pyverilog.dataflow.bindvisitor import BindVisitor
+from pyverilog.dataflow.bindvisitor import BindVisitor, elaborate_instances
+from pyverilog.utils.scope import ScopeChain
 
-# Increasing the maximum recursion size for deeper traversal
+# Increasing the maximum recursion size for deeper traversal of the AST.
+# The AST visitors are recursive, and so is the walker (walkTree) once per
+# expanded terminal and per DFPartselect/DFPointer var; the nesting of
+# DFBranch/DFOperator/DFConcat nodes uses an explicit stack (traverse.py)
 sys.setrecursionlimit(16 * 1024)
 
 class VerilogDataflowAnalyzer(VerilogCodeParser):
     def __init__(self, filelist, topmodule='TOP', noreorder=False, nobind=False,
                  preprocess_include=None,
-                 preprocess_define=None):
+                 preprocess_define=None,
+                 preprocess_engine='iverilog',
+                 parse_cache=None,
+                 incremental=False,
+                 parse_jobs=1,
+                 elaboration_cache=True,
+                 bind_jobs=1,
+                 lazy=False):
         self.topmodule = topmodule
         self.terms = {}
         self.binddict = {}
         self.frametable = None
+        self.bind_visitor = None
         files = filelist if isinstance(filelist, tuple) or isinstance(filelist, list) else [ filelist ]
         VerilogCodeParser.__init__(self, files,
                                    preprocess_include=preprocess_include,
-                                   preprocess_define=preprocess_define)
+                                   preprocess_define=preprocess_define,
+                                   preprocess_engine=preprocess_engine,
+                                   parse_cache=parse_cache,
+                                   incremental=incremental,
+                                   parse_jobs=parse_jobs)
         self.noreorder = noreorder
         self.nobind = nobind
+        self.elaboration_cache = elaboration_cache
+        self.bind_jobs = bind_jobs
+        # lazy mode: instances are elaborated on demand by elaborate()
+        self.lazy = lazy
         
     def generate(self):
         ast = self.parse()
@@ -50,11 +71,24 @@ class VerilogDataflowAnalyzer(VerilogCodeParser):
             self.frametable = frametable
             return
 
+        # instances in the top module are elaborated in bind_jobs processes
+        elaborated = None
+        if not self.lazy:
+            elaborated = elaborate_instances(moduleinfotable, self.topmodule, frametable,
+                                             signal_visitor.getConstlist(),
+                                             noreorder=self.noreorder,
+                                             elaboration_cache=self.elaboration_cache,
+                                             jobs=self.bind_jobs)
+
         bind_visitor = BindVisitor(moduleinfotable, self.topmodule, frametable,
-                                   noreorder=self.noreorder)
+                                   noreorder=self.noreorder,
+                                   elaboration_cache=self.elaboration_cache,
+                                   elaborated=elaborated,
+                                   lazy=self.lazy)
 
         bind_visitor.start_visit()
         dataflow = bind_visitor.getDataflows()
+        if self.lazy: self.bind_visitor = bind_visitor
 
         self.frametable = bind_visitor.getFrameTable()
         self.terms = dataflow.getTerms()
@@ -63,6 +97,31 @@ class VerilogDataflowAnalyzer(VerilogCodeParser):
     def getFrameTable(self):
         return self.frametable
 
+    #-------------------------------------------------------------------------
+    def elaborate(self, termname, optimizer=None):
+        """ Lazy mode: elaborates the instances enclosing termname. The new
+            binds and terms are resolved by optimizer (a VerilogDataflowOptimizer
+            after resolveConstant), if given. Returns the elaborated scopes. """
+        if self.bind_visitor is None: return []
+        if not isinstance(termname, ScopeChain): termname = util.toTermname(termname)
+        scopes = self.bind_visitor.elaborateTerm(termname)
+        if scopes and optimizer is not None: optimizer.resolveScopes(scopes)
+        return scopes
+
+    def elaborateAll(self, optimizer=None):
+        if self.bind_visitor is None: return []
+        scopes = self.bind_visitor.elaborateAll()
+        if scopes and optimizer is not None: optimizer.resolveScopes(scopes)
+        return scopes
+
+    def getElaborator(self, optimizer=None):
+        """ Lazy mode: on-demand elaboration hook (elaborator) of
+            VerilogDataflowMerge and its subclasses (VerilogDataflowWalker,
+            VerilogSubset, VerilogControlflowAnalyzer, VerilogCodeGenerator)
+            and of VerilogGraphGenerator """
+        if self.bind_visitor is None: return None
+        return lambda termname: self.elaborate(termname, optimizer)
+
     #-------------------------------------------------------------------------
     def getInstances(self):
         if self.frametable is None: return ()
@@ -76,6 +135,14 @@ class VerilogDataflowAnalyzer(VerilogCodeParser):
         if self.frametable is None: return ()
         return self.frametable.getAllConsts()
 
+    def iterSignals(self):
+        if self.frametable is None: return iter(())
+        return self.frametable.iterAllSignals()
+
+    def iterConsts(self):
+        if self.frametable is None: return iter(())
+        return self.frametable.iterAllConsts()
+
     def getTerms(self):
         return self.terms
 
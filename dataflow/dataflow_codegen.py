@@ -19,9 +19,11 @@ from pyverilog.dataflow.subset import VerilogSubset
 class VerilogCodeGenerator(VerilogSubset):
     def __init__(self, topmodule, terms, binddict, 
                  resolved_terms, resolved_binddict, constlist,
-                 modulename='Subset', enable_name='HT_enable', num_indent=2, flat=True):
+                 modulename='Subset', enable_name='HT_enable', num_indent=2, flat=True,
+                 elaborator=None, optimizer=None):
         VerilogSubset.__init__(self, topmodule, terms, binddict, 
-                               resolved_terms, resolved_binddict, constlist)
+                               resolved_terms, resolved_binddict, constlist,
+                               elaborator=elaborator, optimizer=optimizer)
         self.modulename = modulename
         self.enable_name = enable_name
         self.num_indent = num_indent
@@ -0,0 +1,211 @@
+#-------------------------------------------------------------------------------
+# elaboration.py
+#
+# Elaboration cache of module instances: the terms, binds, constants and
+# frames produced by visiting one instance are journaled and stamped out
+# under the scope of every other instance with the same parameters
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import re
+
+from pyverilog.utils.scope import ScopeLabel, ScopeChain
+from pyverilog.dataflow.dataflow import DFNode, DFEvalValue, Term, Bind
+from pyverilog.dataflow.visit import AlwaysInfo
+
+_rename = re.compile(r'^_rn(\d+)_(.*)$')
+_atoms = (type(None), str, int, float, bool)
+
+class Relocator(object):
+    """ Copies journaled objects from the scope of one instance to another.
+        Generated labels (always/if/generate/... frames) and renamed
+        variables are renumbered by labelmap and renamemap. DFNode trees
+        are never modified in place, so the ids in shared (subtrees with no
+        name in the scope) are reused instead of copied. """
+    copied = (DFNode, Term, Bind, AlwaysInfo)
+
+    def __init__(self, scope, newscope, labelmap=None, renamemap=None, shared=()):
+        self.scope = scope
+        self.newscope = newscope
+        self.labelmap = labelmap if labelmap is not None else {}
+        self.renamemap = renamemap if renamemap is not None else {}
+        self.shared = shared
+        self.chains = {}
+        self.memo = {}
+
+    def relabel(self, label):
+        if label.scopetype == 'signal':
+            m = _rename.match(label.scopename)
+            if m is None or int(m.group(1)) not in self.renamemap: return label
+            scopename = '_rn%d_%s' % (self.renamemap[int(m.group(1))], m.group(2))
+        else:
+            scopename = self.labelmap.get(label.scopename)
+            if scopename is None: return label
+        return ScopeLabel(scopename, label.scopetype, label.scopeloop)
+
+    def relocate(self, chain):
+        ret = self.chains.get(id(chain))
+        if ret is not None: return ret
+        length = len(self.scope)
+        ret = chain
+        if len(chain) >= length and chain[:length] == self.scope:
+            ret = self.newscope
+            for label in chain.scopechain[length:]:
+                ret = ret + self.relabel(label)
+        self.chains[id(chain)] = ret
+        return ret
+
+    def copy(self, obj):
+        cls = type(obj)
+        if cls in _atoms: return obj
+        if cls is ScopeChain: return self.relocate(obj)
+        key = id(obj)
+        if key in self.shared: return obj
+        ret = self.memo.get(key)
+        if ret is not None: return ret
+        if cls is tuple:
+            ret = tuple([ self.copy(o) for o in obj ])
+        elif cls is list:
+            ret = [ self.copy(o) for o in obj ]
+        elif cls is set or cls is frozenset:
+            ret = cls([ self.copy(o) for o in obj ])
+        elif isinstance(obj, dict):
+            ret = cls([ (self.copy(k), self.copy(v)) for k, v in obj.items() ])
+        elif isinstance(obj, self.copied):
+            ret = cls.__new__(cls)
+            self.memo[key] = ret
+            attrs = ret.__dict__
+            for name, value in obj.__dict__.items():
+                attrs[name] = self.copy(value)
+        else: # AST nodes and others are shared
+            ret = obj
+        self.memo[key] = ret
+        return ret
+
+    def inscope(self, chain):
+        length = len(self.scope)
+        return len(chain) >= length and chain[:length] == self.scope
+
+    def findShared(self, obj, shared, memo):
+        """ True if obj has no name in the scope; such DFNodes go to shared """
+        cls = type(obj)
+        if cls in _atoms: return True
+        if cls is ScopeChain: return not self.inscope(obj)
+        key = id(obj)
+        if key in memo: return memo[key]
+        memo[key] = False
+        if cls is tuple or cls is list or cls is set or cls is frozenset:
+            ret = all([ self.findShared(o, shared, memo) for o in obj ])
+        elif isinstance(obj, dict):
+            ret = all([ self.findShared(k, shared, memo) and self.findShared(v, shared, memo)
+                        for k, v in obj.items() ])
+        elif isinstance(obj, self.copied):
+            ret = all([ self.findShared(v, shared, memo) for v in obj.__dict__.values() ])
+            if not isinstance(obj, DFNode): ret = False
+            elif ret: shared.add(key)
+        else:
+            ret = True
+        memo[key] = ret
+        return ret
+
+class Elaboration(object):
+    """ journal of one instance visit and the counters it consumed """
+    def __init__(self, scope, events, labelstart, labelcount,
+                 renamestart, renamecount, default_nettype):
+        self.scope = scope
+        self.events = events
+        self.labelstart = labelstart
+        self.labelcount = labelcount
+        self.renamestart = renamestart
+        self.renamecount = renamecount
+        self.default_nettype = default_nettype
+        self.shared = set()
+        Relocator(scope, scope).findShared(events, self.shared, {})
+
+    def __getstate__(self):
+        # ids in shared are not valid in another process
+        state = self.__dict__.copy()
+        del state['shared']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.shared = set()
+        Relocator(self.scope, self.scope).findShared(self.events, self.shared, {})
+
+    def replay(self, visitor, scope):
+        labelmap = {}
+        for name, count in self.labelcount.items():
+            now = visitor.labels.getCount(name)
+            start = self.labelstart.get(name, 0)
+            for i in range(count):
+                labelmap[name + str(start + i)] = name + str(now + i)
+                # else branch of an if statement
+                labelmap[name + str(start + i) + '_ELSE'] = name + str(now + i) + '_ELSE'
+            visitor.labels.inc(name, count)
+        renamemap = {}
+        for i in range(self.renamecount):
+            renamemap[self.renamestart + i] = visitor.renamecnt + i
+        visitor.renamecnt += self.renamecount
+
+        relocator = Relocator(self.scope, scope, labelmap, renamemap, self.shared)
+        for target, method, args in self.events:
+            obj = visitor.dataflow if target == 'dataflow' else visitor
+            getattr(obj, method)(*relocator.copy(args))
+        visitor.default_nettype = self.default_nettype
+
+class Recording(object):
+    def __init__(self, key, scope, start, labelstart, renamestart, owner):
+        self.key = key
+        self.scope = scope
+        self.start = start
+        self.labelstart = labelstart
+        self.renamestart = renamestart
+        self.owner = owner
+
+class ElaborationCache(object):
+    """ Elaborations of module instances keyed by (module name, resolved
+        parameter values, blackboxed modules) """
+    def __init__(self):
+        self.dict = {}
+
+    def getKey(self, modulename, params, blackboxed):
+        values = []
+        for name, value in params:
+            if not isinstance(value, DFEvalValue): return None
+            values.append((name, value.value, value.width, value.isfloat, value.isstring))
+        return (modulename, tuple(values), tuple(sorted(blackboxed)))
+
+    def has(self, key):
+        return key in self.dict
+
+    def get(self, key):
+        return self.dict[key]
+
+    def add(self, key, elaboration):
+        self.dict[key] = elaboration
+
+    def begin(self, visitor, key, scope):
+        owner = visitor.dataflow.journal is None
+        if owner: visitor.dataflow.journal = []
+        return Recording(key, scope, len(visitor.dataflow.journal),
+                         visitor.labels.getCounts(), visitor.renamecnt, owner)
+
+    def end(self, visitor, recording):
+        events = visitor.dataflow.journal[recording.start:]
+        if recording.owner: visitor.dataflow.journal = None
+        labelcount = {}
+        for name, count in visitor.labels.getCounts().items():
+            delta = count - recording.labelstart.get(name, 0)
+            if delta > 0: labelcount[name] = delta
+        # snapshot: later changes to the journaled objects are not replayed
+        events = Relocator(recording.scope, recording.scope).copy(events)
+        self.dict[recording.key] = Elaboration(
+            recording.scope, events, recording.labelstart, labelcount,
+            recording.renamestart, visitor.renamecnt - recording.renamestart,
+            visitor.default_nettype)
@@ -21,7 +21,7 @@ class Frame(object):
                  alwaysinfo=None, condition=None,
                  module=False, functioncall=False, taskcall=False,
                  generate=False, always=False, initial=False, loop=None, loop_iter=None,
-                 modulename=None):
+                 modulename=None, modulescope=None, labelpath=()):
         self.name = name
         self.previous = previous
         self.next = []
@@ -46,6 +46,13 @@ class Frame(object):
         self.nonblockingassign = collections.OrderedDict()
 
         self.modulename = modulename
+        self.modulescope = modulescope
+        self.labelpath = labelpath
+        self.scopednames = {}
+        # instance node and the label counters before and after its definition is visited
+        self.instance = None
+        self.labelcounts = None
+        self.nextlabelcounts = None
 
     def getName(self):
         return self.name
@@ -128,6 +135,30 @@ class Frame(object):
 
     def getModuleName(self):
         return self.modulename
+    def getModuleScope(self):
+        return self.modulescope
+    def getLabelPath(self):
+        return self.labelpath
+
+    def setInstance(self, instance, labelcounts):
+        self.instance = instance
+        self.labelcounts = labelcounts
+    def getInstance(self):
+        return self.instance
+    def getLabelCounts(self):
+        return self.labelcounts
+    def setNextLabelCounts(self, labelcounts):
+        self.nextlabelcounts = labelcounts
+    def getNextLabelCounts(self):
+        return self.nextlabelcounts
+
+    def getScopedName(self, name, scopetype):
+        key = (name, scopetype)
+        ret = self.scopednames.get(key)
+        if ret is None:
+            ret = self.name + ScopeLabel(name, scopetype)
+            self.scopednames[key] = ret
+        return ret
 
     ############################################################################
     def setBlockingAssign(self, dst, bind):
@@ -163,6 +194,41 @@ class Frame(object):
     def getNonblockingAssigns(self):
         return self.nonblockingassign
 
+################################################################################
+class SymbolIndex(object):
+    """ names defined in the frames: (frame scope, name), and the frame found
+        by a search from a frame: (scope, name) -> defining frame or None,
+        dropped for a name when the name is defined again """
+    def __init__(self):
+        self.defined = set()
+        self.found = {}
+        self.searched = {} # name -> scopes searched for the name
+
+    def add(self, scope, name):
+        self.defined.add((scope, name))
+        for key in self.searched.pop(name, ()):
+            del self.found[(key, name)]
+
+    def search(self, frames, key, name):
+        """ nearest frame from key up to its module frame that defines name
+            (frames: scope -> Frame) """
+        try:
+            return self.found[(key, name)]
+        except KeyError:
+            pass
+        modulescope = frames[key].getModuleScope()
+        found = None
+        scope = key
+        while scope is not None and len(scope) >= len(modulescope):
+            if (scope, name) in self.defined:
+                found = scope
+                break
+            scope = scope.parent
+        self.found[(key, name)] = found
+        if name not in self.searched: self.searched[name] = []
+        self.searched[name].append(key)
+        return found
+
 ################################################################################
 class FrameTable(object):
     def __init__(self, moduleinfotable=None):
@@ -176,6 +242,14 @@ class FrameTable(object):
         self.for_iter = None
         self.moduleinfotable = moduleinfotable
 
+        # names defined in the frames (SymbolIndex)
+        self.signalindex = SymbolIndex()
+        self.constindex = SymbolIndex()
+        # label path from the root -> first frame reached by the path
+        self.labelindex = {}
+        # cached getAll* views, dropped when a definition is added
+        self.views = {}
+
     def toScopeChain(self, scopename):
         if scopename is None: return self.current
         return self.current + scopename
@@ -192,14 +266,25 @@ class FrameTable(object):
             raise verror.DefinitionError('Already Exists: %s' % str(scopechain))
         ret = self.current
         previous = self.current
+        modulescope = None
+        labelpath = ()
         if len(previous) > 0:
-            self.dict[previous].setNext(scopechain)
+            previous_frame = self.dict[previous]
+            previous_frame.setNext(scopechain)
+            modulescope = previous_frame.getModuleScope()
+            labelpath = previous_frame.getLabelPath()
+        if module: modulescope = scopechain
+        labelkey = self.toLabelKey(scopechain[-1])
+        if labelkey is not None: labelpath = labelpath + (labelkey,)
         self.dict[scopechain] = Frame(scopechain, previous, frametype=frametype,
                                       alwaysinfo=alwaysinfo, condition=condition,
                                       module=module, functioncall=functioncall,
                                       taskcall=taskcall, generate=generate,
                                       always=always, initial=initial, loop=loop, loop_iter=loop_iter,
-                                      modulename=modulename)
+                                      modulename=modulename,
+                                      modulescope=modulescope, labelpath=labelpath)
+        if labelkey is not None and labelpath not in self.labelindex:
+            self.labelindex[labelpath] = scopechain
         self.current = scopechain
         return ret
 
@@ -275,6 +360,21 @@ class FrameTable(object):
     def getModuleName(self):
         return self.dict[self.current].getModuleName()
 
+    def setInstance(self, instance, labelcounts):
+        self.dict[self.current].setInstance(instance, labelcounts)
+
+    def getInstance(self, scope):
+        return self.dict[scope].getInstance()
+
+    def getLabelCounts(self, scope):
+        return self.dict[scope].getLabelCounts()
+
+    def setNextLabelCounts(self, labelcounts):
+        self.dict[self.current].setNextLabelCounts(labelcounts)
+
+    def getNextLabelCounts(self, scope):
+        return self.dict[scope].getNextLabelCounts()
+
     def getLabelKey(self, name):
         ret = ''
         if self.isModule(): ret += 'md_'
@@ -293,25 +393,74 @@ class FrameTable(object):
         if self.task_def and isinstance(var, Input):
             self.dict[self.current].addTaskPort(var)
             return
-        self.dict[self.current].addSignal(var)
+        frame = self.dict[self.current]
+        defined = frame.hasSignal(var.name)
+        frame.addSignal(var)
+        self.views.clear()
+        if not defined and frame.hasSignal(var.name):
+            self.indexSymbol(self.signalindex, frame, var.name)
             
     def addConst(self, var):
-        self.dict[self.current].addConst(var)
+        frame = self.dict[self.current]
+        defined = frame.hasConstant(var.name)
+        frame.addConst(var)
+        self.views.clear()
+        if not defined and frame.hasConstant(var.name):
+            self.indexSymbol(self.constindex, frame, var.name)
     def addGenvar(self, var):
         self.dict[self.current].addGenvar(var)
 
     def addFunction(self, var):
         self.dict[self.current].addFunction(var)
+        self.views.clear()
     def addTask(self, var):
         self.dict[self.current].addTask(var)
+        self.views.clear()
 
     ############################################################################
     def updateSignal(self, signal):
-        self.dict[self.current].updateSignal(signal)
+        frame = self.dict[self.current]
+        newnames = [ name for name in signal if not frame.hasSignal(name) ]
+        frame.updateSignal(signal)
+        self.views.clear()
+        for name in newnames:
+            self.indexSymbol(self.signalindex, frame, name)
     def updateConst(self, const):
-        self.dict[self.current].updateConst(const)
+        frame = self.dict[self.current]
+        newnames = [ name for name in const if not frame.hasConstant(name) ]
+        frame.updateConst(const)
+        self.views.clear()
+        for name in newnames:
+            self.indexSymbol(self.constindex, frame, name)
 
     ############################################################################
+    def indexSymbol(self, index, frame, name):
+        index.add(frame.getName(), name)
+
+    def searchSymbol(self, index, key, name):
+        """ nearest frame from key up to its module frame that defines name """
+        return index.search(self.dict, key, name)
+
+    def toLabelKey(self, label):
+        """ key of a frame label in a hierarchical reference, None if skipped """
+        if label.isPrintable(): return (label.scopename, label.scopeloop)
+        if label.scopetype == 'for': return (None, label.scopeloop)
+        return None
+
+    def toTargetKey(self, label):
+        if label.scopetype == 'for': return (None, label.scopeloop)
+        return (label.scopename, label.scopeloop)
+
+    ############################################################################
+    def getChildInstances(self, scope):
+        """ instance frames directly instantiated by the module of scope """
+        ret = []
+        for dk, dv in self.dict.items():
+            if not dv.isModule() or len(dv.getPrevious()) == 0: continue
+            if self.dict[dv.getPrevious()].getModuleScope() == scope:
+                ret.append(dk)
+        return tuple(ret)
+
     def getAllInstances(self):
         ret = []
         for dk in self.dict.keys():
@@ -320,49 +469,68 @@ class FrameTable(object):
         return tuple(ret)
         
     def getAllSignals(self):
-        ret = collections.OrderedDict()
-        for dk, dv in self.dict.items():
-            ret.update(
-                map_key((lambda x: dk+ScopeLabel(x,'signal')), dv.getSignals()))
-        return ret
-
+        return collections.OrderedDict(self._getAllView('signal'))
     def getAllConsts(self):
-        ret = collections.OrderedDict()
-        for dk, dv in self.dict.items():
-            ret.update(
-                map_key((lambda x: dk+ScopeLabel(x,'signal')), dv.getConsts()))
-        return ret
-
+        return collections.OrderedDict(self._getAllView('const'))
     def getAllFunctions(self):
-        ret = collections.OrderedDict()
-        for dk, dv in self.dict.items():
-            ret.update(
-                map_key((lambda x: dk+ScopeLabel(x,'function')), dv.getFunctions()))
-        return ret
-
+        return collections.OrderedDict(self._getAllView('function'))
     def getAllTasks(self):
-        ret = collections.OrderedDict()
-        for dk, dv in self.dict.items():
-            ret.update(
-                map_key((lambda x: dk+ScopeLabel(x,'task')), dv.getTasks()))
-        return ret
+        return collections.OrderedDict(self._getAllView('task'))
+
+    def _getAllView(self, kind):
+        """ cached OrderedDict of all the definitions of a kind, kept until a
+            definition is added; getAll* return a copy of it, iterAll* iterate
+            over it """
+        view = self.views.get(kind)
+        if view is None:
+            view = collections.OrderedDict(self.iterDefinitions(self.dict.values(), kind))
+            self.views[kind] = view
+        return view
+
+    def iterAllSignals(self):
+        return self.iterAll('signal')
+    def iterAllConsts(self):
+        return self.iterAll('const')
+    def iterAllFunctions(self):
+        return self.iterAll('function')
+    def iterAllTasks(self):
+        return self.iterAll('task')
+
+    def iterAll(self, kind):
+        # a new definition replaces the view: the iteration is not affected
+        return iter(self._getAllView(kind).items())
 
     ############################################################################
     def getSignals(self, scope):
-        return map_key(
-            (lambda x: scope+ScopeLabel(x,'signal')), self.dict[scope].getSignals())
-
+        return collections.OrderedDict(self.iterSignals(scope))
     def getConsts(self, scope):
-        return map_key(
-            (lambda x: scope+ScopeLabel(x,'signal')), self.dict[scope].getConsts())
-
+        return collections.OrderedDict(self.iterConsts(scope))
     def getFunctions(self, scope):
-        return map_key(
-            (lambda x: scope+ScopeLabel(x,'function')), self.dict[scope].getFunctions())
-
+        return collections.OrderedDict(self.iterFunctions(scope))
     def getTasks(self, scope):
-        return map_key(
-            (lambda x: scope+ScopeLabel(x,'task')), self.dict[scope].getTasks())
+        return collections.OrderedDict(self.iterTasks(scope))
+
+    def iterSignals(self, scope):
+        return self.iterDefinitions((self.dict[scope],), 'signal')
+    def iterConsts(self, scope):
+        return self.iterDefinitions((self.dict[scope],), 'const')
+    def iterFunctions(self, scope):
+        return self.iterDefinitions((self.dict[scope],), 'function')
+    def iterTasks(self, scope):
+        return self.iterDefinitions((self.dict[scope],), 'task')
+
+    def iterDefinitions(self, frames, kind):
+        for frame in frames:
+            if kind == 'signal':
+                definitions, scopetype = frame.getSignals(), 'signal'
+            elif kind == 'const':
+                definitions, scopetype = frame.getConsts(), 'signal'
+            elif kind == 'function':
+                definitions, scopetype = frame.getFunctions(), 'function'
+            else:
+                definitions, scopetype = frame.getTasks(), 'task'
+            for name, definition in definitions.items():
+                yield frame.getScopedName(name, scopetype), definition
 
     ################################################################################
     def getGenerateConditions(self):
@@ -425,11 +593,9 @@ class FrameTable(object):
         return previous_frame.getNonblockingAssigns()
 
     def searchConstantDefinition(self, key, name):
-        if self.dict[key].hasConstant(name):
-            return key, self.dict[key].getConstant(name)
-        if self.dict[key].isModule(): return None, None
-        previous = self.dict[key].getPrevious()
-        return self.searchConstantDefinition(previous, name)
+        found = self.searchSymbol(self.constindex, key, name)
+        if found is None: return None, None
+        return found, self.dict[found].getConstant(name)
 
     def getConstantDefinition(self, key, name):
         if self.dict[key].hasConstant(name):
@@ -437,13 +603,20 @@ class FrameTable(object):
         return None
 
     def searchSignalDefinition(self, key, name):
-        if self.dict[key].hasSignal(name):
-            return key, self.dict[key].getSignal(name)
-        if self.dict[key].isModule(): return None, None
-        previous = self.dict[key].getPrevious()
-        return self.searchSignalDefinition(previous, name)
+        found = self.searchSymbol(self.signalindex, key, name)
+        if found is None: return None, None
+        return found, self.dict[found].getSignal(name)
 
     def searchMatchedScopeChain(self, currentchain, targetchain):
+        labelpath = self.dict[currentchain].getLabelPath()[:-1]
+        labelpath += tuple([ self.toTargetKey(t) for t in targetchain ])
+        found = self.labelindex.get(labelpath)
+        if found is None:
+            return self.walkMatchedScopeChain(currentchain, targetchain)
+        skiplength = len(currentchain) - 1
+        return found[skiplength:-1] + targetchain[-1:]
+
+    def walkMatchedScopeChain(self, currentchain, targetchain):
         skiplength = len(currentchain) - 1
         printable = currentchain[skiplength].isPrintable()
 
@@ -453,7 +626,7 @@ class FrameTable(object):
             if len(targetchain) == 1:
                 return ScopeChain( [targetchain[0]] )
             for nextframe in self.dict[currentchain].getNext():
-                rslt = self.searchMatchedScopeChain(nextframe, targetchain[1:])
+                rslt = self.walkMatchedScopeChain(nextframe, targetchain[1:])
                 if rslt is not None:
                     return ScopeChain( [currentchain[skiplength]] ) + rslt
             return None
@@ -465,15 +638,14 @@ class FrameTable(object):
             if len(targetchain) == 1:
                 return ScopeChain( [targetchain[0]] )
             for nextframe in self.dict[currentchain].getNext():
-                rslt = self.searchMatchedScopeChain(nextframe, targetchain[1:])
+                rslt = self.walkMatchedScopeChain(nextframe, targetchain[1:])
                 if rslt is not None:
                     return ScopeChain( [currentchain[skiplength]] ) + rslt
                     
             return None
 
         for nextframe in self.dict[currentchain].getNext():
-            rslt = self.searchMatchedScopeChain(nextframe, targetchain)
+            rslt = self.walkMatchedScopeChain(nextframe, targetchain)
             if rslt is not None:
                 return ScopeChain( [currentchain[skiplength]] ) + rslt
         return None
-
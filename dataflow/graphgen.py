@@ -17,7 +17,6 @@ import pygraphviz as pgv
 import pyverilog.utils.util as util
 import pyverilog.utils.verror as verror
 from pyverilog.dataflow.dataflow import *
-from pyverilog.dataflow.optimizer import VerilogOptimizer
 from pyverilog.dataflow.walker import VerilogDataflowWalker
 import pyverilog.dataflow.reorder as reorder
 import pyverilog.dataflow.replace as replace
@@ -35,7 +34,7 @@ class VerilogGraphGenerator(object):
 
     def __init__(self, topmodule,
                  terms, binddict, resolved_terms, resolved_binddict, constlist, 
-                 filename, withcolor=False):
+                 filename, withcolor=False, elaborator=None, optimizer=None):
         self.topmodule = topmodule
         self.terms = terms
         self.binddict = binddict
@@ -49,8 +48,9 @@ class VerilogGraphGenerator(object):
         self.identical = False
         self.treewalker = VerilogDataflowWalker(self.topmodule, self.terms, 
                                                 self.binddict, self.resolved_terms,
-                                                self.resolved_binddict, constlist)
-        self.optimizer = VerilogOptimizer(terms, constlist)
+                                                self.resolved_binddict, constlist,
+                                                elaborator=elaborator, optimizer=optimizer)
+        self.optimizer = self.treewalker.optimizer
 
     def generate(self, signalname, identical=False, walk=True, step=1, reorder=False, delay=False):
         termname = util.toTermname(signalname)
@@ -10,10 +10,12 @@ from __future__ import absolute_import
 from __future__ import print_function
 import sys
 import os
+import collections
 
 import pyverilog.utils.verror as verror
 import pyverilog.utils.signaltype as signaltype
 import pyverilog.dataflow.reorder as reorder
+import pyverilog.dataflow.traverse as traverse
 from pyverilog.dataflow.dataflow import *
 from pyverilog.dataflow.visit import *
 from pyverilog.dataflow.optimizer import VerilogOptimizer
@@ -21,32 +23,66 @@ from pyverilog.dataflow.moduleinfo import *
 from pyverilog.dataflow.frames import *
 
 class VerilogDataflowMerge(object):
-    def __init__(self, topmodule, terms, binddict, resolved_terms, resolved_binddict, constlist):
+    def __init__(self, topmodule, terms, binddict, resolved_terms, resolved_binddict, constlist,
+                 elaborator=None, optimizer=None):
         self.topmodule = topmodule
         self.terms = terms
         self.binddict = binddict
         self.resolved_terms = resolved_terms
         self.resolved_binddict = resolved_binddict
         self.constlist = constlist
-        self.optimizer = VerilogOptimizer(terms, constlist)
+        # the VerilogDataflowOptimizer which resolved the terms and binds:
+        # its term width table is built once in resolveConstant
+        self.optimizer = (optimizer if optimizer is not None
+                          else VerilogOptimizer(terms, constlist))
+        # lazy mode: elaborates the instance of a term before it is looked up
+        # (VerilogDataflowAnalyzer.getElaborator)
+        self.elaborator = elaborator
+        # merged trees: termname -> MergedTrees
+        self.tree_cache = {}
+        self.tree_cache_hits = 0
+        self.tree_cache_misses = 0
 
     ############################################################################
+    def invalidateTreeCache(self, termnames=None):
+        """ Drops the merged trees of termnames (all trees if None); to be
+            called when a bind is changed in place """
+        if termnames is None:
+            self.tree_cache = {}
+            return
+        for termname in termnames:
+            if termname in self.tree_cache: del self.tree_cache[termname]
+
+    def getTreeCacheStats(self):
+        return {'hits': self.tree_cache_hits, 'misses': self.tree_cache_misses,
+                'size': len(self.tree_cache)}
+
+    ############################################################################
+    def elaborate(self, termname):
+        if self.elaborator is not None: self.elaborator(termname)
+
     def getTerm(self, termname):
         if isinstance(termname, str):
             for scope in self.terms.keys():
-                if termname == str(scope): return self.terms[scope]
+                if termname == str(scope):
+                    self.elaborate(scope)
+                    return self.terms[scope]
         if not termname in self.terms: return None
+        self.elaborate(termname)
         return self.terms[termname]
 
     def getBindlist(self, termname):
+        self.elaborate(termname)
         if not termname in self.binddict: return ()
         return self.binddict[termname]
 
     def getResolvedTerm(self, termname):
+        self.elaborate(termname)
         if not termname in self.resolved_terms: return None
         return self.resolved_terms[termname]
 
     def getResolvedBindlist(self, termname):
+        self.elaborate(termname)
         if not termname in self.resolved_binddict: return ()
         return self.resolved_binddict[termname]
 
@@ -98,8 +134,32 @@ class VerilogDataflowMerge(object):
 
     ############################################################################
     def getTree(self, termname, ptr=None):
+        """ merged tree of the binds of termname (of ptr for an array):
+            the binds are merged once, until they or the constants are changed """
         bindlist = self.getResolvedBindlist(termname)
-        bindlist = self.getOptimizedBindlist(bindlist)
+        version = self.optimizer.getVersion()
+        if version is None:
+            return self.getMergedBindTree(termname, self.getOptimizedBindlist(bindlist), ptr)
+        entry = self.tree_cache.get(termname)
+        if entry is None or not entry.isValid(bindlist, version):
+            entry = MergedTrees(bindlist, version, self.getOptimizedBindlist(bindlist))
+            self.tree_cache[termname] = entry
+        if ptr in entry.trees:
+            self.tree_cache_hits += 1
+            return entry.trees[ptr]
+        self.tree_cache_misses += 1
+        tree = self.getMergedBindTree(termname, entry.bindlist, ptr)
+        entry.trees[ptr] = tree
+        return tree
+
+    def getTrees(self, termnames, ptr=None):
+        """ merged trees of termnames: termname -> tree """
+        ret = collections.OrderedDict()
+        for termname in termnames:
+            ret[termname] = self.getTree(termname, ptr)
+        return ret
+
+    def getMergedBindTree(self, termname, bindlist, ptr=None):
         if bindlist is None: return None
         if len(bindlist) == 0: return None
 
@@ -155,44 +215,16 @@ class VerilogDataflowMerge(object):
 
     ############################################################################
     def getSources(self, tree):
-        if tree is None: return set()
-        if isinstance(tree, DFConstant): return set()
-        if isinstance(tree, DFUndefined): return set()
-        if isinstance(tree, DFEvalValue): return set()
-        if isinstance(tree, DFTerminal):
-            return set( [tree.name,] )
-        if isinstance(tree, DFBranch):
-            ret = set()
-            ret |= self.getSources(tree.condnode)
-            ret |= self.getSources(tree.truenode)
-            ret |= self.getSources(tree.falsenode)
-            return ret
-        if isinstance(tree, DFOperator):
-            nextnodes = []
-            for n in tree.nextnodes:
-                nextnodes.extend(self.getSources(n))
-            return set(nextnodes)
-        if isinstance(tree, DFPartselect):
-            ret = set()
-            ret |= self.getSources(tree.var)
-            ret |= self.getSources(tree.msb)
-            ret |= self.getSources(tree.lsb)
-            return ret
-        if isinstance(tree, DFPointer):
-            ret = set()
-            ret |= self.getSources(tree.var)
-            ret |= self.getSources(tree.ptr)
-            return ret
-        if isinstance(tree, DFConcat):
-            nextnodes = []
-            for n in tree.nextnodes:
-                nextnodes.extend(self.getSources(n))
-            return set(nextnodes)
-        if isinstance(tree, DFDelay):
-            ret = set()
-            ret |= self.getSources(tree.nextnode)
-            return ret
-        raise verror.DefinitionError('Undefined Node Type: %s : %s' % (str(type(tree)), str(tree)))
+        ret = set()
+        for node in traverse.iterate(tree):
+            if isinstance(node, DFTerminal):
+                ret.add(node.name)
+                continue
+            if isinstance(node, (DFConstant, DFUndefined, DFEvalValue, DFBranch, DFOperator,
+                                 DFPartselect, DFPointer, DFConcat, DFDelay)):
+                continue
+            raise verror.DefinitionError('Undefined Node Type: %s : %s' % (str(type(node)), str(node)))
+        return ret
 
     ################################################################################
     def getBindSources(self, termname):
@@ -266,8 +298,7 @@ class VerilogDataflowMerge(object):
         def bindkey(x):
             lsb = 0 if x.lsb is None else x.lsb.value
             ptr = 0 if not isinstance(x.ptr, DFEvalValue) else x.ptr.value
-            term = self.getTerm(x.dest)
-            length = abs(self.optimizer.optimize(term.msb).value - self.optimizer.optimize(term.lsb).value) + 1
+            length = self.optimizer.getTermWidthValue(x.dest)
             return ptr * length + lsb
         for bind in sorted(optimized_bindlist, key=bindkey):
             lsb = 0 if bind.lsb is None else bind.lsb.value
@@ -289,12 +320,7 @@ class VerilogDataflowMerge(object):
             msb = self.optimizer.optimize(bind.msb)
             lsb = self.optimizer.optimize(bind.lsb)
             ptr = self.optimizer.optimize(bind.ptr)
-            new_bind = copy.deepcopy(bind)
-            new_bind.tree = tree
-            new_bind.msb = msb
-            new_bind.lsb = lsb
-            new_bind.ptr = ptr
-            new_bindlist.append(new_bind)
+            new_bindlist.append(bind.replace(tree=tree, msb=msb, lsb=lsb, ptr=ptr))
         if len(new_bindlist) == 1: return (new_bindlist[0],)
         split_positions = self.splitPositions(tuple(new_bindlist))
         new_bindlist = self.splitBindlist(tuple(new_bindlist), split_positions)
@@ -307,31 +333,24 @@ class VerilogDataflowMerge(object):
         def bindkey(x):
             lsb = 0 if x.lsb is None else x.lsb.value
             ptr = 0 if not isinstance(x.ptr, DFEvalValue) else x.ptr.value
-            term = self.getTerm(x.dest)
-            length = abs(self.optimizer.optimize(term.msb).value - self.optimizer.optimize(term.lsb).value) + 1
+            length = self.optimizer.getTermWidthValue(x.dest)
             return ptr * length + lsb
 
+        # binds are not modified: a merged bind is a new Bind
         for bind in sorted(bindlist, key=bindkey):
             if last_bind is None:
-                merged_bindlist.append(copy.deepcopy(bind))
-                last_bind = copy.deepcopy(bind)
+                merged_bindlist.append(bind)
             elif isinstance(last_bind.ptr, DFEvalValue) and isinstance(bind.ptr, DFEvalValue) and last_bind.ptr.value != bind.ptr.value:
-                merged_bindlist.append(copy.deepcopy(bind))
-                last_bind = copy.deepcopy(bind)
+                merged_bindlist.append(bind)
             elif last_bind.lsb is None or bind.lsb is None or last_bind is None or bind.msb is None:
-                merged_bindlist.append(copy.deepcopy(bind))
-                last_bind = copy.deepcopy(bind)
+                merged_bindlist.append(bind)
             elif last_bind.lsb.value == bind.lsb.value and last_bind.msb.value == bind.msb.value:
                 new_tree = self.mergeTree(last_bind.tree, bind.tree)
                 new_tree = self.optimizer.optimize(new_tree)
-                merged_bindlist.pop()
-                new_bind = copy.deepcopy(bind)
-                new_bind.tree = new_tree
-                merged_bindlist.append(new_bind)
-                last_bind = copy.deepcopy(new_bind)
+                merged_bindlist[-1] = bind.replace(tree=new_tree)
             else:
-                merged_bindlist.append(copy.deepcopy(bind))
-                last_bind = copy.deepcopy(bind)
+                merged_bindlist.append(bind)
+            last_bind = merged_bindlist[-1]
         return tuple(merged_bindlist)
 
     def mergeTree(self, first, second):
@@ -340,8 +359,7 @@ class VerilogDataflowMerge(object):
             cond_snd = self.optimizer.optimize(second.condnode)
             if cond_fst == cond_snd:
                 return DFBranch(cond_fst, self.mergeTree(first.truenode, second.truenode), self.mergeTree(first.falsenode, second.falsenode))
-            appended = copy.deepcopy(first)
-            return DFBranch(cond_snd, self.appendTail(appended, second.truenode), self.appendTail(appended, second.falsenode))
+            return DFBranch(cond_snd, self.appendTail(first, second.truenode), self.appendTail(first, second.falsenode))
 
         if first is not None and second is None:
             return first
@@ -355,12 +373,10 @@ class VerilogDataflowMerge(object):
 
         if isinstance(first, DFBranch) and not isinstance(second, DFBranch):
             cond_fst = self.optimizer.optimize(first.condnode)
-            appended = copy.deepcopy(second)
-            return DFBranch(cond_fst, self.appendTail(appended, first.truenode), self.appendTail(appended, first.falsenode))
+            return DFBranch(cond_fst, self.appendTail(second, first.truenode), self.appendTail(second, first.falsenode))
         if not isinstance(first, DFBranch) and isinstance(second, DFBranch):
             cond_snd = self.optimizer.optimize(second.condnode)
-            appended = copy.deepcopy(first)
-            return DFBranch(cond_snd, self.appendTail(appended, second.truenode), self.appendTail(appended, second.falsenode))
+            return DFBranch(cond_snd, self.appendTail(first, second.truenode), self.appendTail(first, second.falsenode))
 
         if not isinstance(first, DFBranch) and not isinstance(second, DFBranch):
             return second
@@ -368,22 +384,26 @@ class VerilogDataflowMerge(object):
         raise verror.FormatError('Can not merge trees.')
 
     def appendTail(self, appended, target):
-        if target is None:
-            return copy.deepcopy(appended)
-        if isinstance(target, DFBranch):
-            return DFBranch(target.condnode, self.appendTail(appended, target.truenode), self.appendTail(appended, target.falsenode))
-        return target
+        # DF nodes are immutable: appended is shared by the tails
+        def func(node):
+            if node is None: return appended
+            return node
+        return traverse.mapLeaves(target, func)
 
     def splitBindlist(self, bindlist, split_positions):
-        if len(bindlist) == 0: return ()
-        return self.splitBindPositions(bindlist[0], split_positions) + self.splitBindlist(bindlist[1:], split_positions)
+        ret = []
+        for bind in bindlist:
+            ret.extend(self.splitBindPositions(bind, split_positions))
+        return tuple(ret)
 
     def splitBindPositions(self, bind, split_positions):
-        if len(split_positions) == 0: return (copy.deepcopy(bind),)
-        if bind is None: return (copy.deepcopy(bind),)
-        bind_left, bind_right = self.splitBind(bind, split_positions[0])
-        ret = () if bind_right is None else (bind_right,)
-        return ret + self.splitBindPositions(bind_left, split_positions[1:])
+        ret = []
+        for splitpos in split_positions:
+            if bind is None: break
+            bind, bind_right = self.splitBind(bind, splitpos)
+            if bind_right is not None: ret.append(bind_right)
+        ret.append(bind)
+        return tuple(ret)
 
     def splitBind(self, bind, splitpos):
         tree = bind.tree
@@ -393,15 +413,15 @@ class VerilogDataflowMerge(object):
         if ptr is not None and msb is None or lsb is None:
             termtype = self.getTermtype(bind.dest)
             if signaltype.isRegArray(termtype) or signaltype.isWireArray(termtype):
-                msb = self.optimizer.optimizeConstant(copy.deepcopy(term.msb))
-                lsb = self.optimizer.optimizeConstant(copy.deepcopy(term.lsb))
+                msb = self.optimizer.optimizeConstant(term.msb)
+                lsb = self.optimizer.optimizeConstant(term.lsb)
             else:
-                msb = copy.deepcopy(ptr)
-                lsb = copy.deepcopy(ptr)
+                msb = ptr
+                lsb = ptr
         if ptr is None and msb is None or lsb is None:
             term = self.getTerm(bind.dest)
-            msb = self.optimizer.optimizeConstant(copy.deepcopy(term.msb))
-            lsb = self.optimizer.optimizeConstant(copy.deepcopy(term.lsb))
+            msb = self.optimizer.optimizeConstant(term.msb)
+            lsb = self.optimizer.optimizeConstant(term.lsb)
         if splitpos > lsb.value and splitpos <= msb.value: # split
             right_lsb = lsb.value
             right_msb = splitpos - 1
@@ -409,18 +429,12 @@ class VerilogDataflowMerge(object):
             left_lsb = splitpos
             left_msb = msb.value
             left_width = msb.value - splitpos + 1
-            right_tree = reorder.reorder(DFPartselect(copy.deepcopy(tree), DFEvalValue(right_width-1), DFEvalValue(0)))
-            left_tree = reorder.reorder(DFPartselect(copy.deepcopy(tree), DFEvalValue(msb.value), DFEvalValue(msb.value-left_width+1)))
+            right_tree = reorder.reorder(DFPartselect(tree, DFEvalValue(right_width-1), DFEvalValue(0)))
+            left_tree = reorder.reorder(DFPartselect(tree, DFEvalValue(msb.value), DFEvalValue(msb.value-left_width+1)))
             right_tree = self.optimizer.optimize(right_tree)
             left_tree = self.optimizer.optimize(left_tree)
-            left_bind = copy.deepcopy(bind)
-            left_bind.tree = left_tree
-            left_bind.msb = DFEvalValue(left_msb)
-            left_bind.lsb = DFEvalValue(left_lsb)
-            right_bind = copy.deepcopy(bind)
-            right_bind.tree = right_tree
-            right_bind.msb = DFEvalValue(right_msb)
-            right_bind.lsb = DFEvalValue(right_lsb)
+            left_bind = bind.replace(tree=left_tree, msb=DFEvalValue(left_msb), lsb=DFEvalValue(left_lsb))
+            right_bind = bind.replace(tree=right_tree, msb=DFEvalValue(right_msb), lsb=DFEvalValue(right_lsb))
             return left_bind, right_bind
         return bind, None
 
@@ -491,3 +505,24 @@ class VerilogDataflowMerge(object):
         if search_lsb < minval: unmatched_range.append( (search_lsb, minval - 1, search_ptr) )
         if maxval < search_msb: unmatched_range.append( (maxval + 1, search_msb, search_ptr) )
         return tuple(unmatched_range)
+
+################################################################################
+class MergedTrees(object):
+    """ optimized and merged binds of a term and their trees by pointer """
+    def __init__(self, bindlist, version, optimized_bindlist):
+        self.state = self.getState(bindlist)
+        self.version = version
+        self.bindlist = optimized_bindlist
+        self.trees = {}
+
+    def getState(self, bindlist):
+        return tuple([ (bind, bind.tree, bind.msb, bind.lsb, bind.ptr) for bind in bindlist ])
+
+    def isValid(self, bindlist, version):
+        if self.version != version: return False
+        if len(self.state) != len(bindlist): return False
+        for state, bind in zip(self.state, bindlist):
+            if (state[0] is not bind or state[1] is not bind.tree or state[2] is not bind.msb or
+                state[3] is not bind.lsb or state[4] is not bind.ptr):
+                return False
+        return True
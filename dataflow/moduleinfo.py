@@ -155,9 +155,44 @@ class ModuleInfo(DefinitionInfo):
         self.statelist = {}
         self.interesting = []
         self.last = None
+        # AlwaysData of last: addData/addState/addControl do not hash the
+        # always node again
+        self.lastdata = None
         self.instances = []
         self.instancelists = []
         self.arraylimiters = {}
+        # signal name -> always blocks reading it as data/control, writing it
+        self.datareaders = {}
+        self.controlreaders = {}
+        self.statewriters = {}
+        # AlwaysData -> (table attribute, name) of its entries in the tables
+        self.indexed = {}
+        # expression -> names of its identifiers
+        self.idnames = {}
+        if definition is not None: self.indexIdentifiers()
+
+    def indexIdentifiers(self):
+        """ Pre-pass over the definition collecting the identifier names of
+            every substitution and if/case condition at once """
+        stack = [self.definition]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Substitution):
+                self.getIdentifierNames(node.left)
+                self.getIdentifierNames(node.right)
+                continue
+            if isinstance(node, IfStatement):
+                self.getIdentifierNames(node.cond)
+            elif isinstance(node, CaseStatement):
+                self.getIdentifierNames(node.comp)
+            stack.extend(node.children())
+
+    def getIdentifierNames(self, var):
+        names = self.idnames.get(var)
+        if names is None:
+            names = tuple([ str(node) for node in var.iterIdentifiers() ])
+            self.idnames[var] = names
+        return names
 
     def addlimiters(self, node, lsb, msb):
         self.arraylimiters[node]=(lsb, msb)
@@ -178,16 +213,22 @@ class ModuleInfo(DefinitionInfo):
         return self.instancelists
 
     def addAlways(self, node, alwaysdata):
+        if node in self.always: self._unindex(self.always[node])
         self.always[node]=alwaysdata
+        self._index(alwaysdata)
         self.last = node
+        self.lastdata = alwaysdata
         return
 
     def addAlwaysData(self, node, alwaysdata):
         if(node in self.always.keys()):
+            self._unindex(self.always[node])
             self.always[node]=alwaysdata
+            self._index(alwaysdata)
         else:
             raise verror.DefinitionError('Already defined Always:')
         self.last = node
+        self.lastdata = alwaysdata
         return 
     
     def getAlways(self):
@@ -200,11 +241,13 @@ class ModuleInfo(DefinitionInfo):
         if(self.last is None):
             raise verror.DefinitionError('Already not defined')
         else:
-            return self.getAlwaysData(self.last)
+            return self.lastdata
     
     def addData(self, var):
         alwaysdata=self.getCurrentAlwaysData()
-        for name in map(str,var.getIdentifiers([])):
+        for name in self.getIdentifierNames(var):
+            if name not in alwaysdata.data:
+                self._indexName('datareaders', name, alwaysdata)
             alwaysdata.addData(name)
 
     def getData(self):
@@ -212,9 +255,11 @@ class ModuleInfo(DefinitionInfo):
     
     def addState(self, var):
         alwaysdata=self.getCurrentAlwaysData()
-        for node in var.getIdentifiers([]):
-            self.statelist[str(node)]=alwaysdata
-            alwaysdata.addState(str(node))
+        for name in self.getIdentifierNames(var):
+            self.statelist[name]=alwaysdata
+            if name not in alwaysdata.state:
+                self._indexName('statewriters', name, alwaysdata)
+            alwaysdata.addState(name)
 
     def getState(self):
         return self.getCurrentAlwaysData().getState()
@@ -227,35 +272,146 @@ class ModuleInfo(DefinitionInfo):
 
     def addControl(self, var):
         alwaysdata=self.getCurrentAlwaysData()
-        for name in map(str,var.getIdentifiers([])):
+        for name in self.getIdentifierNames(var):
+            if name not in alwaysdata.control:
+                self._indexName('controlreaders', name, alwaysdata)
             alwaysdata.addControl(name)
 
     def getControl(self):
         return self.getCurrentAlwaysData().getControl()
 
+    def getDataReaders(self, name):
+        return tuple(self.datareaders.get(name, ()))
+
+    def getControlReaders(self, name):
+        return tuple(self.controlreaders.get(name, ()))
+
+    def getReaders(self, name):
+        ret = list(self.datareaders.get(name, ()))
+        visited = set(ret)
+        for al in self.controlreaders.get(name, ()):
+            if al not in visited: ret.append(al)
+        return tuple(ret)
+
+    def getStateWriters(self, name):
+        return tuple(self.statewriters.get(name, ()))
+
+    def _indexName(self, attr, name, alwaysdata):
+        getattr(self, attr).setdefault(name, []).append(alwaysdata)
+        self.indexed.setdefault(alwaysdata, []).append((attr, name))
+
+    def _index(self, alwaysdata):
+        """ indexes the names already in alwaysdata """
+        self._unindex(alwaysdata)
+        for name in alwaysdata.data.keys():
+            self._indexName('datareaders', name, alwaysdata)
+        for name in alwaysdata.control.keys():
+            self._indexName('controlreaders', name, alwaysdata)
+        for name in alwaysdata.state.keys():
+            self._indexName('statewriters', name, alwaysdata)
+
+    def _unindex(self, alwaysdata):
+        for attr, name in self.indexed.pop(alwaysdata, ()):
+            table = getattr(self, attr)
+            entries = [ al for al in table[name] if al is not alwaysdata ]
+            if entries: table[name] = entries
+            else: del table[name]
+
     def findInteresting(self):
+        statesets = self.getstatesets()
         for al in self.always.values():
             if al.isComb():
                 #Combinational block
-                self.interesting.extend(filter(lambda x: x in self.getstatelist(al),al.getControl().keys()))
+                states = statesets[al]
+                self.interesting.extend([ x for x in al.getControl().keys() if x in states ])
             else:
-                self.interesting.extend(filter(lambda x: x in al.getState().keys(),al.getControl().keys()))
-        
+                states = al.getState()
+                self.interesting.extend([ x for x in al.getControl().keys() if x in states ])
+
         self.interesting=unique(self.interesting)
 
     def getstatelist(self, always):
-        ret = []
-        for al in self.always.values():
-            if al.isComb() and al is not always:
-                common = list(filter(lambda x: x in always.getState().keys(), union(al.getControl().keys(), al.getData().keys())))
-                if common:
-                    ret.extend(self.getstatelist(al))
+        return list(self.getstatesets()[always])
+
+    def getstatesets(self):
+        """ Returns {AlwaysData: set of state names} for every always block.
+            A block B depends on A when B reads (data or control) a state of
+            A. The set of A holds the states of every dependent block that
+            is sequential or A itself, and the sets of its combinational
+            dependents. Sets are computed once per SCC of the dependency
+            graph restricted to combinational dependents, in reverse
+            topological order, so cyclic combinational logic terminates. """
+        blocks = list(self.always.values())
+        index = dict([ (al, i) for i, al in enumerate(blocks) ])
+
+        # own[i]: states reached directly; succ[i]: combinational dependents
+        own = [ set() for al in blocks ]
+        succ = [ set() for al in blocks ]
+        for i, al in enumerate(blocks):
+            readers = set()
+            for name in al.getState().keys():
+                readers.update([ index[b] for b in self.getReaders(name) ])
+            for j in readers:
+                if blocks[j].isComb() and i != j:
+                    succ[i].add(j)
+                else:
+                    own[i].update(blocks[j].getState().keys())
+
+        ret = {}
+        for scc in self._sccs(succ):
+            members = set(scc)
+            sets = [ ret[blocks[j]] for i in scc for j in succ[i] if j not in members ]
+            states = set()
+            for i in scc: states.update(own[i])
+            if not states and len(set(map(id, sets))) == 1:
+                # share the set of the only dependent (e.g. a chain)
+                states = sets[0]
             else:
-                common = list(filter(lambda x: x in always.getState().keys(), union(al.getControl().keys(), al.getData().keys())))
-                if common:
-                    ret.extend(al.getState().keys())
+                for st in sets: states.update(st)
+            for i in scc: ret[blocks[i]] = states
         return ret
-    
+
+    def _sccs(self, succ):
+        """ Tarjan's algorithm without recursion; yields the SCCs of the
+            graph succ (list of successor sets) in reverse topological order """
+        counter = 0
+        lowlink = {}
+        number = {}
+        stack = []
+        onstack = set()
+        for root in range(len(succ)):
+            if root in number: continue
+            work = [ (root, iter(succ[root])) ]
+            number[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            onstack.add(root)
+            while work:
+                v, it = work[-1]
+                for w in it:
+                    if w not in number:
+                        number[w] = lowlink[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        onstack.add(w)
+                        work.append( (w, iter(succ[w])) )
+                        break
+                    if w in onstack:
+                        lowlink[v] = min(lowlink[v], number[w])
+                else:
+                    work.pop()
+                    if work:
+                        u = work[-1][0]
+                        lowlink[u] = min(lowlink[u], lowlink[v])
+                    if lowlink[v] == number[v]:
+                        scc = []
+                        while True:
+                            w = stack.pop()
+                            onstack.discard(w)
+                            scc.append(w)
+                            if w == v: break
+                        yield scc
+
     def getInteresting(self):
         return self.interesting
     
@@ -437,6 +593,30 @@ class ModuleInfoTable(object):
         else:
             return self.dict[name].getControl()
     
+    def getDataReaders(self, varname, name=''):
+        if(name==''):
+            return self.dict[self.current].getDataReaders(varname)
+        else:
+            return self.dict[name].getDataReaders(varname)
+
+    def getControlReaders(self, varname, name=''):
+        if(name==''):
+            return self.dict[self.current].getControlReaders(varname)
+        else:
+            return self.dict[name].getControlReaders(varname)
+
+    def getReaders(self, varname, name=''):
+        if(name==''):
+            return self.dict[self.current].getReaders(varname)
+        else:
+            return self.dict[name].getReaders(varname)
+
+    def getStateWriters(self, varname, name=''):
+        if(name==''):
+            return self.dict[self.current].getStateWriters(varname)
+        else:
+            return self.dict[name].getStateWriters(varname)
+
     def getAlwaysfromState(self, varname, name=''):
         if(name==''):
             return self.dict[self.current].getAlwaysfromState(varname)
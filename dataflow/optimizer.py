@@ -11,28 +11,53 @@ from __future__ import print_function
 import sys
 import os
 import math
+import collections
 
 import pyverilog.utils.verror as verror
 import pyverilog.utils.signaltype as signaltype
+import pyverilog.dataflow.traverse as traverse
 from pyverilog.dataflow.dataflow import *
 
+# resolved range of a term as ints: None if not constant (length: arrays only)
+TermWidth = collections.namedtuple('TermWidth', ('msb', 'lsb', 'width', 'length'))
+
+def getTableVersion(table):
+    """ changes of a VersionedDict; None for a plain dict, whose changes in
+        place are not seen """
+    if isinstance(table, VersionedDict): return table.version
+    return None
+
 class VerilogOptimizer(object):
     default_width = 32
     compare_ops = ('LessThan', 'GreaterThan', 'LassEq', 'GreaterEq', 'Eq', 'NotEq', 'Eql', 'NotEql')
 
-    def __init__(self, terms, constlist=None, default_width=32, level=2):
+    def __init__(self, terms, constlist=None, default_width=32, level=2, cache_size=65536):
         self.terms = terms
-        self.constlist = constlist if constlist is not None else {}
+        self.constlist = constlist if constlist is not None else VersionedDict()
         self.default_width=default_width
         self.level = level
+        # optimize results: id(tree) -> (tree, version, result), least
+        # recently used first; the entry keeps the tree alive, so its id is
+        # not reused while it is cached
+        self.cache = collections.OrderedDict()
+        self.cache_size = cache_size
+        self.version = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        # term widths: termname -> TermWidth, valid for widths_version
+        self.widths = {}
+        self.widths_version = None
 
     ############################################################################
     def setConstant(self, name, value):
         self.constlist[name] = value
+        self.version += 1
 
     def resetConstant(self, name):
         if name in self.constlist:
             del self.constlist[name]
+            self.version += 1
 
     def getConstant(self, name):
         if not name in self.constlist:
@@ -47,6 +72,7 @@ class VerilogOptimizer(object):
 
     def setTerm(self, name, term):
         self.terms[name] = term
+        self.version += 1
 
     def getTerm(self, name):
         return self.terms[name]
@@ -56,23 +82,107 @@ class VerilogOptimizer(object):
 
     ############################################################################
     def optimize(self, tree):
+        if tree is None: return None
+        if self.cache_size == 0: return self._optimize(tree)
+        version = self.getVersion()
+        if version is None: return self._optimize(tree)
+        # DF nodes are hash-consed: a subtree is found again by its identity
+        key = id(tree)
+        entry = self.cache.get(key)
+        if entry is not None and entry[0] is tree and entry[1] == version:
+            self.cache_hits += 1
+            # most recently used: evicted last
+            del self.cache[key]
+            self.cache[key] = entry
+            return entry[2]
+        self.cache_misses += 1
+        t = self._optimize(tree)
+        if entry is not None: del self.cache[key]
+        elif self.cache_size is not None and len(self.cache) >= self.cache_size:
+            self.cache.popitem(last=False)
+            self.cache_evictions += 1
+        self.cache[key] = (tree, version, t)
+        return t
+
+    def _optimize(self, tree):
         t = tree
         for i in range(self.level):
             t = self.optimizeConstant(t)
             t = self.optimizeHierarchy(t)
         return t
 
+    def getVersion(self):
+        """ version of the constant and term tables: the dicts may be shared
+            with other owners (VersionedDict counts their changes too).
+            None if a table is a plain dict: nothing is cached then """
+        constversion = getTableVersion(self.constlist)
+        termversion = getTableVersion(self.terms)
+        if constversion is None or termversion is None: return None
+        return (self.version, constversion, termversion)
+
+    def clearCache(self):
+        self.cache.clear()
+
+    def getCacheStats(self):
+        lookups = self.cache_hits + self.cache_misses
+        return {'hits': self.cache_hits, 'misses': self.cache_misses,
+                'evictions': self.cache_evictions, 'size': len(self.cache),
+                'hitrate': float(self.cache_hits) / lookups if lookups else 0.0}
+
+    ############################################################################
+    def getTermWidths(self):
+        """ term width table: termname -> TermWidth, emptied when the
+            constants or the terms are changed (a new table each time for
+            plain dicts) """
+        version = self.getVersion()
+        if version is None: return {}
+        if self.widths_version != version:
+            self.widths = {}
+            self.widths_version = version
+        return self.widths
+
+    def getTermWidth(self, name):
+        widths = self.getTermWidths()
+        ret = widths.get(name)
+        if ret is None:
+            ret = self.makeTermWidth(self.getTerm(name))
+            # a missing width may be set in the term later (DataFlow.setTerm)
+            if ret.width is not None: widths[name] = ret
+        return ret
+
+    def makeTermWidth(self, term):
+        def value(node):
+            node = self.optimizeConstant(node)
+            if not isinstance(node, DFEvalValue): return None
+            return node.value
+        msb = value(term.msb)
+        lsb = value(term.lsb)
+        width = None if msb is None or lsb is None else abs(msb - lsb) + 1
+        length = None
+        if term.lenmsb is not None and term.lenlsb is not None:
+            lenmsb = value(term.lenmsb)
+            lenlsb = value(term.lenlsb)
+            if lenmsb is not None and lenlsb is not None: length = abs(lenmsb - lenlsb) + 1
+        return TermWidth(msb, lsb, width, length)
+
+    def getTermWidthValue(self, name):
+        width = self.getTermWidth(name).width
+        if width is None:
+            raise verror.FormatError('Width of %s is not constant' % str(name))
+        return width
+
     ############################################################################
     def optimizeConstant(self, tree):
+        return traverse.rewrite(tree, self._optimizeConstant, self._optimizeConstantLeaf)
+
+    def _optimizeConstantLeaf(self, tree):
+        """ result of a leaf, or None to optimize the children first """
         if tree is None: return None
-        if isinstance(tree, DFBranch):
-            condnode = self.optimizeConstant(tree.condnode)
-            truenode = self.optimizeConstant(tree.truenode)
-            falsenode = self.optimizeConstant(tree.falsenode)
-            if isinstance(condnode, DFEvalValue):
-                if self.isCondTrue(condnode): return truenode
-                return falsenode
-            return DFBranch(condnode, truenode, falsenode)
+        if isinstance(tree, (DFBranch, DFOperator, DFConcat, DFPartselect, DFSyscall)):
+            return None
+        if isinstance(tree, DFPointer):
+            if not isinstance(tree.var, DFTerminal): return tree
+            return None
 
         if isinstance(tree, DFEvalValue):
             return tree
@@ -101,13 +211,6 @@ class VerilogOptimizer(object):
                 return DFUndefined()
             return DFEvalValue(tree.eval(), self.default_width)
 
-        if isinstance(tree, DFOperator):
-            nextnodes_rslts, all_const = self.evalNextnodes(tree.nextnodes)
-            if all_const:
-                evalop = self.evalOperator(tree.operator, nextnodes_rslts)
-                if evalop is not None: return evalop
-            return DFOperator(tuple(nextnodes_rslts), tree.operator)
-
         if isinstance(tree, DFTerminal):
             #print("From constant solver - " + str(tree.name))
             if not self.hasConstant(tree.name): 
@@ -125,27 +228,42 @@ class VerilogOptimizer(object):
                     constwidth = msb_val.value - lsb_val.value + 1
             return DFEvalValue(const.value, constwidth)
 
+        raise verror.DefinitionError('Can not optimize the tree: %s %s' %
+                                     (str(type(tree)), str(tree)))
+
+    def _optimizeConstant(self, tree, children):
+        """ tree with the optimized children """
+        if isinstance(tree, DFBranch):
+            condnode, truenode, falsenode = children
+            if isinstance(condnode, DFEvalValue):
+                if self.isCondTrue(condnode): return truenode
+                return falsenode
+            return DFBranch(condnode, truenode, falsenode)
+
+        if isinstance(tree, DFOperator):
+            nextnodes_rslts = tuple(children)
+            if self.isAllConst(nextnodes_rslts):
+                evalop = self.evalOperator(tree.operator, nextnodes_rslts)
+                if evalop is not None: return evalop
+            return DFOperator(nextnodes_rslts, tree.operator)
+
         if isinstance(tree, DFConcat):
-            nextnodes_rslts, all_const = self.evalNextnodes(tree.nextnodes)
-            if all_const:
+            nextnodes_rslts = tuple(children)
+            if self.isAllConst(nextnodes_rslts):
                 evalcc = self.evalConcat(nextnodes_rslts)
                 if evalcc is not None: return evalcc
-            return DFConcat(tuple(nextnodes_rslts))
+            return DFConcat(nextnodes_rslts)
 
         if isinstance(tree, DFPartselect):
-            var = self.optimizeConstant(tree.var)
-            msb = self.optimizeConstant(tree.msb)
-            lsb = self.optimizeConstant(tree.lsb)
+            var, msb, lsb = children
             if isinstance(var, DFEvalValue) and isinstance(msb, DFEvalValue) and isinstance(msb, DFEvalValue):
                 evalcc = self.evalPartselect(var, msb, lsb)
                 return evalcc
             return DFPartselect(var, msb, lsb)
 
         if isinstance(tree, DFPointer):
-            if not isinstance(tree.var, DFTerminal): return tree
             term = self.getTerm(tree.var.name)
-            var = self.optimizeConstant(tree.var)
-            ptr = self.optimizeConstant(tree.ptr)
+            var, ptr = children
             if signaltype.isRegArray(term.termtype) or signaltype.isWireArray(term.termtype):
                 return DFPointer(var, ptr)
             if isinstance(var, DFEvalValue) and isinstance(ptr, DFEvalValue):
@@ -154,12 +272,17 @@ class VerilogOptimizer(object):
             return DFPointer(var, ptr)
         
         if isinstance(tree, DFSyscall):
-            return DFSyscall(tree.syscall, tuple([ self.optimizeConstant(n) for n in tree.nextnodes ]))
+            return DFSyscall(tree.syscall, tuple(children))
         
         raise verror.DefinitionError('Can not optimize the tree: %s %s' %
                                      (str(type(tree)), str(tree)))
 
     ############################################################################
+    def isAllConst(self, nodes):
+        for n in nodes:
+            if not isinstance(n, DFEvalValue): return False
+        return True
+
     def evalNextnodes(self, nextnodes):
         ret = []
         all_const = True
@@ -293,14 +416,7 @@ class VerilogOptimizer(object):
             if node.width is not None: return node.width
             return self.default_width
         if isinstance(node, DFTerminal):
-            term = self.getTerm(node.name)
-            #print("From getwidth before optimization : " + term.msb.tostr())
-            msb = self.optimizeConstant(term.msb)
-            #print("From getwidth after optimization: " + msb.tostr())
-            msb=msb.value
-            lsb = self.optimizeConstant(term.lsb).value
-            width = abs(msb - lsb) + 1
-            return width
+            return self.getTermWidthValue(node.name)
 
         if isinstance(node, DFBranch):
             truewidth = self.getWidth(node.truenode)
@@ -330,10 +446,7 @@ class VerilogOptimizer(object):
             if not isinstance(node.var, DFTerminal): return 1
             term = self.getTerm(node.var.name)
             if signaltype.isRegArray(term.termtype) or signaltype.isWireArray(term.termtype):
-                msb = self.optimizeConstant(term.msb).value
-                lsb = self.optimizeConstant(term.lsb).value
-                width = abs(msb - lsb) + 1
-                return width
+                return self.getTermWidthValue(node.var.name)
             return 1
         if isinstance(tree, DFSyscall):
             return self.default_width
@@ -368,6 +481,10 @@ class VerilogOptimizer(object):
 
     ############################################################################
     def optimizeHierarchy(self, tree):
+        return traverse.rewrite(tree, self._optimizeHierarchy, self._optimizeHierarchyLeaf)
+
+    def _optimizeHierarchyLeaf(self, tree):
+        """ result of a leaf, or None to optimize the children first """
         if tree is None: return None
         if isinstance(tree, DFIntConst):
             return tree
@@ -383,50 +500,49 @@ class VerilogOptimizer(object):
             return tree
         if isinstance(tree, DFTerminal):
             return tree
+        if isinstance(tree, (DFBranch, DFOperator, DFPartselect, DFPointer, DFConcat, DFSyscall)):
+            return None
+        raise FormatError('Can not merge due to unrecognized type of tree')
+
+    def _optimizeHierarchy(self, tree, children):
+        """ tree with the optimized children """
         if isinstance(tree, DFBranch):
-            condnode = self.optimizeHierarchy(tree.condnode)
-            truenode = self.optimizeHierarchy(tree.truenode)
-            falsenode = self.optimizeHierarchy(tree.falsenode)
+            condnode, truenode, falsenode = children
             if isinstance(condnode, DFEvalValue):
                 if self.isCondTrue(condnode): return truenode
                 return falsenode
             if truenode == falsenode: return truenode
             return DFBranch(condnode, truenode, falsenode)
         if isinstance(tree, DFOperator):
-            nextnodes = []
-            for n in tree.nextnodes:
-                nextnodes.append(self.optimizeHierarchy(n))
-            ret = DFOperator(tuple(nextnodes), tree.operator)
+            ret = DFOperator(tuple(children), tree.operator)
             ret = self.replaceOperator(ret)
             ret = self.mergeIdenticalNodes(ret)
             ret = self.mergeStaticNodes(ret)
             ret = self.mergeLandLor(ret)
             return ret
         if isinstance(tree, DFPartselect):
-            msb = self.optimizeHierarchy(tree.msb)
-            lsb = self.optimizeHierarchy(tree.lsb)
-            var = self.optimizeHierarchy(tree.var)
+            var, msb, lsb = children
             if isinstance(var, DFConcat) and isinstance(msb, DFEvalValue) and isinstance(lsb, DFEvalValue):
                 return self.takePart(var.nextnodes, msb, lsb)
             if isinstance(msb, DFEvalValue) and isinstance(lsb, DFEvalValue) and lsb.value==0 and self.getWidth(var)==(msb.value+1):
                 return var
             return DFPartselect(var, msb, lsb)
         if isinstance(tree, DFPointer):
-            ptr = self.optimizeHierarchy(tree.ptr)
-            var = self.optimizeHierarchy(tree.var)
+            var, ptr = children
             if isinstance(var, DFConcat) and isinstance(ptr, DFEvalValue):
                 return self.takePoint(var.nextnodes, ptr)
             return DFPointer(var, ptr)
         if isinstance(tree, DFConcat):
             nextnodes = []
-            for n in tree.nextnodes:
+            for n, rslt in zip(tree.nextnodes, children):
+                # a nested concat is flattened as it is
                 if isinstance(n, DFConcat):
                     nextnodes.extend(n.nextnodes)
                     continue
-                nextnodes.append(self.optimizeHierarchy(n))
+                nextnodes.append(rslt)
             return self.mergeConcat(DFConcat(tuple(nextnodes)))
         if isinstance(tree, DFSyscall):
-            return DFSyscall(tree.syscall, tuple([ self.optimizeHierarchy(n) for n in tree.nextnodes ]))
+            return DFSyscall(tree.syscall, tuple(children))
 
         raise FormatError('Can not merge due to unrecognized type of tree')
 
@@ -914,10 +1030,11 @@ class VerilogOptimizer(object):
 #-------------------------------------------------------------------------------
 class VerilogDataflowOptimizer(VerilogOptimizer):
     def __init__(self, terms, binddict):
-        VerilogOptimizer.__init__(self, terms, {})
+        VerilogOptimizer.__init__(self, terms, VersionedDict())
         self.binddict = binddict
         self.resolved_terms = {}
         self.resolved_binddict = {}
+        self.parameter_stats = {}
 
     def getResolvedTerms(self):
         return self.resolved_terms
@@ -929,42 +1046,150 @@ class VerilogDataflowOptimizer(VerilogOptimizer):
         return self.terms[name]
 
     def resolveConstant(self):
-        # 2-pass
-        for bk, bv in sorted(self.binddict.items(), key=lambda x:len(x[0])):
-            termtype = self.getTerm(bk).termtype
-            if signaltype.isParameter(termtype) or signaltype.isLocalparam(termtype):
-                rslt = self.optimizeConstant(bv[0].tree)
-                if isinstance(rslt, DFEvalValue):
-                    self.constlist[bk] = rslt
+        self.resolveParameters(sorted(self.binddict.keys(), key=len))
+
+        self.resolved_binddict = {}
+        for bk in self.binddict.keys():
+            self.resolved_binddict[bk] = self.resolveBindlist(bk)
 
-        for bk, bv in sorted(self.binddict.items(), key=lambda x:len(x[0])):
+        self.resolved_terms = {}
+        for tk in self.terms.keys():
+            self.resolved_terms[tk] = self.resolveTerm(tk)
+        self.resolveWidths(self.resolved_terms.keys())
+
+    def resolveWidths(self, names):
+        """ fills the term width table (getTermWidth) from the resolved terms;
+            VerilogDataflowMerge and its subclasses share it when this
+            optimizer is passed to them (optimizer=) """
+        widths = self.getTermWidths()
+        for tk in names:
+            width = self.makeTermWidth(self.resolved_terms[tk])
+            if width.width is not None: widths[tk] = width
+
+    def resolveScopes(self, scopes):
+        """ resolves the binds and terms in the instance scopes elaborated
+            after resolveConstant (lazy elaboration) """
+        scopes = set(scopes)
+        lengths = set([ len(scope) for scope in scopes ])
+        def inscope(name):
+            for length in lengths:
+                if len(name) > length and name[:length] in scopes: return True
+            return False
+
+        bindnames = [ bk for bk in self.binddict.keys() if inscope(bk) ]
+        self.resolveParameters(sorted(bindnames, key=len))
+        for bk in bindnames:
+            self.resolved_binddict[bk] = self.resolveBindlist(bk)
+        termnames = [ tk for tk in self.terms.keys() if inscope(tk) ]
+        for tk in termnames:
+            self.resolved_terms[tk] = self.resolveTerm(tk)
+        self.resolveWidths(termnames)
+
+    def resolveParameters(self, names=None):
+        """ Resolves the parameters and localparams among the bind names in
+            the order of their references, so that each one is evaluated once
+            after everything it refers to (also in the widths of the referred
+            terms). Parameters on a reference cycle are evaluated again until
+            none of them changes. Returns the statistics (getParameterStats). """
+        if names is None: names = sorted(self.binddict.keys(), key=len)
+        params = []
+        for bk in names:
             termtype = self.getTerm(bk).termtype
             if signaltype.isParameter(termtype) or signaltype.isLocalparam(termtype):
-                rslt = self.optimizeConstant(bv[0].tree)
-                if isinstance(rslt, DFEvalValue):
-                    self.constlist[bk] = rslt
-
-        self.resolved_binddict = copy.deepcopy(self.binddict)
-        for bk, bv in sorted(self.binddict.items(), key=lambda x:len(x[0])):
-            new_bindlist = []
-            for bind in bv:
-                new_bind = copy.deepcopy(bind)
-                if bk in self.constlist:
-                    new_bind.tree = self.constlist[bk]
-                new_bindlist.append(new_bind)
-            self.resolved_binddict[bk] = new_bindlist
-
-        self.resolved_terms = copy.deepcopy(self.terms)
-        for tk, tv in sorted(self.resolved_terms.items(), key=lambda x:len(x[0])):
-            if tv.msb is not None: 
-                rslt = self.optimizeConstant(tv.msb)
-                self.resolved_terms[tk].msb = rslt
-            if tv.lsb is not None: 
-                rslt = self.optimizeConstant(tv.lsb)
-                self.resolved_terms[tk].lsb = rslt
-            if tv.lenmsb is not None: 
-                rslt = self.optimizeConstant(tv.lenmsb)
-                self.resolved_terms[tk].lenmsb = rslt
-            if tv.lenlsb is not None: 
-                rslt = self.optimizeConstant(tv.lenlsb)
-                self.resolved_terms[tk].lenlsb = rslt
+                params.append(bk)
+        paramset = set(params)
+
+        # reference graph: parameter -> parameters which refer to it
+        referrers = dict([ (bk, []) for bk in params ])
+        indegree = {}
+        for bk in params:
+            references = self.getReferences(bk, paramset)
+            indegree[bk] = len(references)
+            for ref in references:
+                referrers[ref].append(bk)
+
+        evaluations = 0
+        resolved = 0
+        worklist = collections.deque([ bk for bk in params if indegree[bk] == 0 ])
+        while worklist:
+            bk = worklist.popleft()
+            evaluations += 1
+            if self.resolveParameter(bk): resolved += 1
+            for referrer in referrers[bk]:
+                indegree[referrer] -= 1
+                if indegree[referrer] == 0: worklist.append(referrer)
+
+        # parameters on (or after) a reference cycle
+        cyclic = [ bk for bk in params if indegree[bk] > 0 ]
+        done = set()
+        for i in range(len(cyclic) + 1):
+            changed = False
+            for bk in cyclic:
+                evaluations += 1
+                last = self.constlist.get(bk)
+                if self.resolveParameter(bk):
+                    done.add(bk)
+                    if last is None or last != self.constlist[bk]: changed = True
+            if not changed: break
+        resolved += len(done)
+
+        self.parameter_stats = {'parameters': len(params),
+                                'resolved': resolved,
+                                'unresolved': len(params) - resolved,
+                                'cyclic': len(cyclic),
+                                'evaluations': evaluations}
+        return self.parameter_stats
+
+    def resolveParameter(self, name):
+        rslt = self.optimizeConstant(self.binddict[name][0].tree)
+        if not isinstance(rslt, DFEvalValue): return False
+        self.setConstant(name, rslt)
+        return True
+
+    def getReferences(self, name, paramset):
+        """ parameters in paramset referred in the bind tree of name or in the
+            width of its term """
+        ret = set()
+        term = self.getTerm(name)
+        stack = [self.binddict[name][0].tree, term.msb, term.lsb]
+        while stack:
+            node = stack.pop()
+            if node is None: continue
+            if isinstance(node, DFTerminal):
+                if node.name in paramset and node.name != name: ret.add(node.name)
+                continue
+            stack.extend(node.children())
+        return ret
+
+    def getParameterStats(self):
+        """ parameters: parameters and localparams, resolved: evaluated to
+            constants, cyclic: parameters on or after a reference cycle,
+            evaluations: optimizeConstant calls on parameter trees """
+        return self.parameter_stats
+
+    def resolveBindlist(self, name):
+        # copy-on-write: binds are shared with binddict unless the tree is resolved
+        if name not in self.constlist: return list(self.binddict[name])
+        new_bindlist = []
+        for bind in self.binddict[name]:
+            new_bind = copy.copy(bind)
+            new_bind.tree = self.constlist[name]
+            new_bindlist.append(new_bind)
+        return new_bindlist
+
+    def resolveTerm(self, name):
+        # copy-on-write: the term is shared with terms unless a width is resolved
+        term = self.terms[name]
+        msb = self.optimizeConstant(term.msb)
+        lsb = self.optimizeConstant(term.lsb)
+        lenmsb = self.optimizeConstant(term.lenmsb)
+        lenlsb = self.optimizeConstant(term.lenlsb)
+        if (msb is term.msb and lsb is term.lsb and
+            lenmsb is term.lenmsb and lenlsb is term.lenlsb):
+            return term
+        new_term = copy.copy(term)
+        new_term.msb = msb
+        new_term.lsb = lsb
+        new_term.lenmsb = lenmsb
+        new_term.lenlsb = lenlsb
+        return new_term
@@ -12,115 +12,101 @@ import sys
 import os
 import copy
 
+import pyverilog.dataflow.traverse as traverse
 from pyverilog.dataflow.dataflow import *
 
 def reorder(tree):
-    if tree is None: return None
-    if isinstance(tree, DFConstant): return tree
-    if isinstance(tree, DFTerminal): return tree
-    if isinstance(tree, DFEvalValue): return tree
-    if isinstance(tree, DFUndefined): return tree
-    if isinstance(tree, DFHighImpedance): return tree
-
+    def enter(node):
+        if node is None: return None
+        if isinstance(node, DFConstant): return node
+        if isinstance(node, DFTerminal): return node
+        if isinstance(node, DFEvalValue): return node
+        if isinstance(node, DFUndefined): return node
+        if isinstance(node, DFHighImpedance): return node
+        if isinstance(node, (DFBranch, DFOperator, DFConcat, DFPartselect, DFPointer, DFDelay)):
+            return None
+        raise DefinitionError('Undefined DFNode type: %s %s' % (str(type(node)), str(node)))
+    return traverse.rewrite(tree, _reorder, enter)
+
+def _reorder(tree, children):
+    """ tree with the reordered children """
     if isinstance(tree, DFBranch):
-        truenode = reorder(tree.truenode)
-        falsenode = reorder(tree.falsenode)
-        condnode = reorder(tree.condnode)
+        condnode, truenode, falsenode = children
         if isinstance(condnode, DFBranch):
             return insertBranch(condnode, truenode, falsenode)
-        return DFBranch(condnode, truenode, falsenode)
+        return tree.replaceChildren(children)
 
     if isinstance(tree, DFOperator):
-        resolvednodes = []
-        for n in tree.nextnodes:
-            resolvednodes.append(reorder(n))
-        for r in resolvednodes:
+        for r in children:
             if isinstance(r, DFBranch):
-                return insertOpList(resolvednodes, tree.operator)
-        return DFOperator(tuple(resolvednodes), tree.operator)
+                return insertOpList(children, tree.operator)
+        return tree.replaceChildren(children)
 
     if isinstance(tree, DFConcat):
-        resolvednodes = []
-        for n in tree.nextnodes:
-            resolvednodes.append(reorder(n))
-        for r in resolvednodes:
+        for r in children:
             if isinstance(r, DFBranch):
-                return insertConcat(resolvednodes)
-        return DFConcat(tuple(resolvednodes))
+                return insertConcat(children)
+        return tree.replaceChildren(children)
 
     if isinstance(tree, DFPartselect):
-        resolved_msb = reorder(tree.msb)
-        resolved_lsb = reorder(tree.lsb)
-        resolved_var = reorder(tree.var)
+        resolved_var, resolved_msb, resolved_lsb = children
         if isinstance(resolved_msb, DFBranch) or isinstance(resolved_lsb, DFBranch):
             raise FormatError('MSB and LSB should not be DFBranch')
         if isinstance(resolved_var, DFBranch):
             return insertPartselect(resolved_var, resolved_msb, resolved_lsb)
-        return DFPartselect(resolved_var, resolved_msb, resolved_lsb)
+        return tree.replaceChildren(children)
 
     if isinstance(tree, DFPointer):
-        resolved_ptr = reorder(tree.ptr)
-        resolved_var = reorder(tree.var)
+        resolved_var, resolved_ptr = children
         if isinstance(resolved_ptr, DFBranch):
             #raise FormatError('PTR should not be DFBranch')n
-            return DFBranch(resolved_ptr.condnode, 
-                            reorder(DFPointer(resolved_var, resolved_ptr.truenode)), 
-                            reorder(DFPointer(resolved_var, resolved_ptr.falsenode)))
+            return traverse.mapLeaves(resolved_ptr,
+                                      lambda n: _reorder(DFPointer(resolved_var, n), (resolved_var, n)))
         if isinstance(resolved_var, DFBranch):
             return insertPointer(resolved_var, resolved_ptr)
-        return DFPointer(resolved_var, resolved_ptr)
+        return tree.replaceChildren(children)
 
     if isinstance(tree, DFDelay):
-        return DFDelay(reorder(tree.nextnode))
-
-    raise DefinitionError('Undefined DFNode type: %s %s' % (str(type(tree)), str(tree)))
+        return tree.replaceChildren(children)
 
 ############################################################################
 def insertBranch(base, truenode, falsenode):
-    if isinstance(base, DFBranch):
-        return DFBranch(base.condnode, insertBranch(base.truenode, truenode, falsenode), insertBranch(base.falsenode, truenode, falsenode))
-    return DFBranch(base, truenode, falsenode)
+    return traverse.mapLeaves(base, lambda n: DFBranch(n, truenode, falsenode))
 
 def insertUnaryOp(base, op):
-    if isinstance(base, DFBranch):
-        return DFBranch(base.condnode, insertUnaryOp(base.truenode, op), insertUnaryOp(base.falsenode, op))
-    return DFOperator((base,), op)
+    return traverse.mapLeaves(base, lambda n: DFOperator((n,), op))
 
 def insertOp(left, right, op):
     if isinstance(left, DFBranch):
-        return DFBranch(left.condnode, insertOp(left.truenode, right, op), insertOp(left.falsenode, right, op))
+        return traverse.mapLeaves(left, lambda n: insertOp(n, right, op))
     elif isinstance(right, DFBranch):
-        return DFBranch(right.condnode, insertOp(left, right.truenode, op), insertOp(left, right.falsenode, op))
+        return traverse.mapLeaves(right, lambda n: insertOp(left, n, op))
     return DFOperator((left, right), op)
 
 def insertOpList(nextnodes, op):
-    donenodes = []
-    restnodes = list(nextnodes)
-    for n in nextnodes:
-        restnodes.pop(0)
+    for i, n in enumerate(nextnodes):
         if isinstance(n, DFBranch):
-            return DFBranch(n.condnode, insertOpList(tuple(donenodes + [n.truenode,] + restnodes), op), insertOpList(tuple(donenodes + [n.falsenode,] + restnodes), op))
-        donenodes.append(n)
-    return DFOperator(nextnodes, op)
+            donenodes = tuple(nextnodes[:i])
+            restnodes = tuple(nextnodes[i+1:])
+            return traverse.mapLeaves(n, lambda m: insertOpList(donenodes + (m,) + restnodes, op))
+    return DFOperator(tuple(nextnodes), op)
 
 def insertConcat(nextnodes):
-    donenodes = []
-    restnodes = list(nextnodes)
-    for n in nextnodes:
-        restnodes.pop(0)
+    for i, n in enumerate(nextnodes):
         if isinstance(n, DFBranch):
-            return DFBranch(n.condnode, insertConcat(tuple(donenodes + [n.truenode,] + restnodes)), insertConcat(tuple(donenodes + [n.falsenode,] + restnodes)))
-        donenodes.append(n)
-    return DFConcat(nextnodes)
+            donenodes = tuple(nextnodes[:i])
+            restnodes = tuple(nextnodes[i+1:])
+            return traverse.mapLeaves(n, lambda m: insertConcat(donenodes + (m,) + restnodes))
+    return DFConcat(tuple(nextnodes))
 
 def insertPartselect(var, msb, lsb):
-    if isinstance(var, DFBranch):
-        return DFBranch(var.condnode, insertPartselect(var.truenode, msb, lsb), insertPartselect(var.falsenode, msb, lsb))
-    if var is None: return None
-    return DFPartselect(var, msb, lsb)
+    def func(n):
+        if n is None: return None
+        return DFPartselect(n, msb, lsb)
+    return traverse.mapLeaves(var, func)
 
 def insertPointer(var, ptr):
-    if isinstance(var, DFBranch):
-        return DFBranch(var.condnode, insertPointer(var.truenode, ptr), insertPointer(var.falsenode, ptr))
-    if var is None: return None
-    return DFPointer(var, ptr)
+    def func(n):
+        if n is None: return None
+        return DFPointer(n, ptr)
+    return traverse.mapLeaves(var, func)
@@ -28,7 +28,7 @@ class SignalVisitor(NodeVisitor):
         self.top = top
         self.frames = FrameTable(moduleinfotable)
         self.labels = Labels()
-        self.optimizer = VerilogOptimizer({}, {})
+        self.optimizer = VerilogOptimizer(VersionedDict(), VersionedDict())
 
         # set the top frame of top module
         self.stackInstanceFrame(top, top)
@@ -45,6 +45,9 @@ class SignalVisitor(NodeVisitor):
     def getBlackboxed(self):
         return self.blackboxed
 
+    def getConstlist(self):
+        return self.optimizer.getConstlist()
+
     ################################################################################
     def start_visit(self):
         return self.visit(self.moduleinfotable.getDefinition(self.top))
@@ -147,9 +150,9 @@ class SignalVisitor(NodeVisitor):
         self.moduleinfotable.addlimiters(node, lsb, msb)
         for i in range(lsb, msb+1):
             nodename = node.name + '_' + str(i)
-            self._visit_Instance_body(node, nodename)
+            self._visit_Instance_body(node, nodename, arrayindex=i)
 
-    def _visit_Instance_body(self, node, nodename):
+    def _visit_Instance_body(self, node, nodename, arrayindex=None):
         if node.module in primitives: return self._visit_Instance_primitive(node)
 
         if nodename == '':
@@ -183,7 +186,9 @@ class SignalVisitor(NodeVisitor):
             self.setInstanceConstantTerms()
             topmodule=self.moduleinfotable.getCurrent()
             self.moduleinfotable.setCurrent(node.module)
+            self.frames.setInstance((node, nodename, arrayindex), self.labels.getCounts())
             self.visit(self.moduleinfotable.getDefinition(node.module))
+            self.frames.setNextLabelCounts(self.labels.getCounts())
             self.frames.setCurrent(current)
             self.moduleinfotable.setCurrent(topmodule)
 
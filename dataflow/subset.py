@@ -19,9 +19,10 @@ from pyverilog.dataflow.merge import VerilogDataflowMerge
 
 class VerilogSubset(VerilogDataflowMerge):
     def __init__(self, topmodule, terms, binddict,
-                 resolved_terms, resolved_binddict, constlist):
+                 resolved_terms, resolved_binddict, constlist, elaborator=None, optimizer=None):
         VerilogDataflowMerge.__init__(self, topmodule, terms, binddict,
-                                      resolved_terms, resolved_binddict, constlist)
+                                      resolved_terms, resolved_binddict, constlist,
+                                      elaborator=elaborator, optimizer=optimizer)
         self.clock_name = 'CLK'
         self.clock_edge = 'posedge'
         self.reset_name = 'RST_X'
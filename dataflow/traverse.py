@@ -0,0 +1,84 @@
+#-------------------------------------------------------------------------------
+# traverse.py
+#
+# Traversal of DFNode trees with an explicit stack: the depth of a tree
+# (e.g. a long if/else-if chain of DFBranch) is not bounded by the native
+# stack or the recursion limit
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+
+from pyverilog.dataflow.dataflow import DFBranch
+
+def rewrite(tree, visit, enter=None):
+    """ Rewrites tree bottom-up (post-order).
+        enter(node) is called on the way down. A result other than None is
+        the result of node, whose children are not visited then.
+        visit(node, children) is called with the results of the children
+        (node.childslots() order) and returns the result of node.
+        A None child is a leaf whose result is enter(None) (None without
+        enter). A node shared in the tree is rewritten once. """
+    results = {}
+    noneresult = enter(None) if enter is not None else None
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if node is None: continue
+        key = id(node)
+        if key in results: continue
+        if not expanded:
+            if enter is not None:
+                ret = enter(node)
+                if ret is not None:
+                    results[key] = ret
+                    continue
+            stack.append((node, True))
+            for child in reversed(node.childslots()):
+                if child is not None and id(child) not in results:
+                    stack.append((child, False))
+            continue
+        children = [ noneresult if child is None else results[id(child)]
+                     for child in node.childslots() ]
+        results[key] = visit(node, children)
+    if tree is None: return noneresult
+    return results[id(tree)]
+
+def iterate(tree):
+    """ Yields each node of tree once, in pre-order """
+    visited = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node is None or id(node) in visited: continue
+        visited.add(id(node))
+        yield node
+        stack.extend(reversed(node.childslots()))
+
+def mapLeaves(tree, func):
+    """ Replaces each non-DFBranch node under the true/false nodes of the
+        DFBranch tree (or tree itself) with func(node); the conditions are
+        kept as they are """
+    if not isinstance(tree, DFBranch): return func(tree)
+    results = {}
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        key = id(node)
+        if key in results: continue
+        if not expanded:
+            stack.append((node, True))
+            for child in (node.falsenode, node.truenode):
+                if isinstance(child, DFBranch) and id(child) not in results:
+                    stack.append((child, False))
+            continue
+        children = []
+        for child in (node.truenode, node.falsenode):
+            if isinstance(child, DFBranch): children.append(results[id(child)])
+            else: children.append(func(child))
+        results[key] = DFBranch(node.condnode, children[0], children[1])
+    return results[id(tree)]
@@ -95,8 +95,8 @@ class Label(object):
         ret = self.name + str(self.cnt)
         self.inc()
         return ret
-    def inc(self):
-        self.cnt += 1
+    def inc(self, num=1):
+        self.cnt += num
 
 class Labels(object):
     def __init__(self):
@@ -104,9 +104,14 @@ class Labels(object):
     def get(self, name):
         if not name in self.labels: self.labels[name] = Label(name)
         return self.labels[name].get()
-    def inc(self, name):
+    def inc(self, name, num=1):
         if not name in self.labels: self.labels[name] = Label(name)
-        self.labels[name].inc()
+        self.labels[name].inc(num)
+    def getCount(self, name):
+        if not name in self.labels: return 0
+        return self.labels[name].cnt
+    def getCounts(self):
+        return dict([ (name, label.cnt) for name, label in self.labels.items() ])
 
 ################################################################################
 class VariableTable(object):
@@ -15,6 +15,7 @@ import pyverilog.utils.util as util
 import pyverilog.utils.verror as verror
 import pyverilog.utils.signaltype as signaltype
 import pyverilog.dataflow.replace as replace
+import pyverilog.dataflow.traverse as traverse
 from pyverilog.dataflow.dataflow import *
 from pyverilog.dataflow.visit import *
 from pyverilog.dataflow.merge import VerilogDataflowMerge
@@ -22,9 +23,69 @@ from pyverilog.dataflow.moduleinfo import *
 from pyverilog.dataflow.frames import *
 
 class VerilogDataflowWalker(VerilogDataflowMerge):
-    def __init__(self, topmodule, terms, binddict, resolved_terms, resolved_binddict, constlist):
+    def __init__(self, topmodule, terms, binddict, resolved_terms, resolved_binddict, constlist,
+                 elaborator=None, optimizer=None):
         VerilogDataflowMerge.__init__(self, topmodule, terms, binddict,
-                                      resolved_terms, resolved_binddict, constlist)
+                                      resolved_terms, resolved_binddict, constlist,
+                                      elaborator=elaborator, optimizer=optimizer)
+        # expanded terminals: (termname, ptr, step, delay) -> WalkResult,
+        # dropped when the version of the optimizer is changed
+        self.walk_cache = {}
+        self.walk_cache_version = None
+        self.walk_frames = []
+        self.walk_cache_hits = 0
+        self.walk_cache_misses = 0
+
+    ############################################################################
+    def invalidateWalkCache(self, termnames=None):
+        """ Drops the walk results which expanded any of termnames (all
+            results if None); to be called when their binds are changed """
+        self.invalidateTreeCache(termnames)
+        if termnames is None:
+            self.walk_cache = {}
+            return
+        termnames = set(termnames)
+        for key, result in list(self.walk_cache.items()):
+            if not termnames.isdisjoint(result.expanded):
+                del self.walk_cache[key]
+
+    def getWalkCacheStats(self):
+        return {'hits': self.walk_cache_hits, 'misses': self.walk_cache_misses,
+                'size': len(self.walk_cache)}
+
+    def walkTerminal(self, termname, visited, nptr, nextstep, delay):
+        """ expands termname, reusing the result of the same expansion if it
+            did not depend on visited differently: a cached result is used
+            only if the terminals it cut are in visited and the terminals it
+            expanded are not (WalkResult.isValid) """
+        version = self.optimizer.getVersion()
+        if version is None:
+            return self.walkTree(self.getTree(termname, nptr),
+                                 visited|set([termname,]), nextstep, delay)
+        if self.walk_cache_version != version:
+            self.walk_cache = {}
+            self.walk_cache_version = version
+        key = (termname, nptr, nextstep, delay)
+        result = self.walk_cache.get(key)
+        if result is not None and result.isValid(visited, version):
+            self.walk_cache_hits += 1
+            if self.walk_frames: self.walk_frames[-1].merge(result)
+            return result.tree
+
+        self.walk_cache_misses += 1
+        frame = WalkResult(version)
+        self.walk_frames.append(frame)
+        try:
+            tree = self.walkTree(self.getTree(termname, nptr),
+                                 visited|set([termname,]), nextstep, delay)
+        finally:
+            self.walk_frames.pop()
+        frame.tree = tree
+        frame.cut.discard(termname)
+        frame.expanded.add(termname)
+        self.walk_cache[key] = frame
+        if self.walk_frames: self.walk_frames[-1].merge(frame)
+        return tree
 
     ############################################################################
     def walkBind(self, name, step=0):
@@ -35,7 +96,9 @@ class VerilogDataflowWalker(VerilogDataflowMerge):
         return replace.replaceUndefined(walked_tree, termname)
 
     ############################################################################
-    def walkTree(self, tree, visited=set([]), step=0, delay=False, msb=None, lsb=None, ptr=None):
+    def walkTree(self, tree, visited=None, step=0, delay=False, msb=None, lsb=None, ptr=None):
+        if visited is None: visited = set()
+
         if tree is None:
             return DFUndefined(32)
 
@@ -54,7 +117,9 @@ class VerilogDataflowWalker(VerilogDataflowMerge):
         if isinstance(tree, DFTerminal):
             scope = util.getScope(tree.name)
             termname = tree.name
-            if termname in visited: return tree
+            if termname in visited:
+                if self.walk_frames: self.walk_frames[-1].cut.add(termname)
+                return tree
 
             termtype = self.getTermtype(termname)
             if util.isTopmodule(scope) and signaltype.isInput(termtype):
@@ -77,27 +142,27 @@ class VerilogDataflowWalker(VerilogDataflowMerge):
                     not signaltype.isRename(termtype)):
                     nextstep -= 1
 
-            return self.walkTree(self.getTree(termname, nptr),
-                                 visited|set([termname,]), nextstep, delay)
-
-        if isinstance(tree, DFBranch):
-            condnode = self.walkTree(tree.condnode, visited, step, delay)
-            truenode = self.walkTree(tree.truenode, visited, step, delay)
-            falsenode = self.walkTree(tree.falsenode, visited, step, delay)
-            return DFBranch(condnode, truenode, falsenode)
+            # recursive: one level per expanded terminal on the path
+            return self.walkTerminal(termname, visited, nptr, nextstep, delay)
 
-        if isinstance(tree, DFOperator):
-            nextnodes = []
-            for n in tree.nextnodes:
-                nextnodes.append(self.walkTree(n, visited, step, delay))
-            return DFOperator(tuple(nextnodes), tree.operator)
+        if isinstance(tree, (DFBranch, DFOperator, DFConcat)):
+            # deep DFBranch chains: an explicit stack instead of recursion
+            def enter(node):
+                if isinstance(node, (DFBranch, DFOperator, DFConcat)): return None
+                return self.walkTree(node, visited, step, delay)
+            def visit(node, children):
+                return node.replaceChildren(children)
+            return traverse.rewrite(tree, visit, enter)
 
         if isinstance(tree, DFPartselect):
             msb = self.walkTree(tree.msb, visited, step, delay)
             lsb = self.walkTree(tree.lsb, visited, step, delay)
             var = self.walkTree(tree.var, visited, step, delay, msb=msb, lsb=lsb)
             if isinstance(var, DFPartselect):
-                child_lsb = self.getTerm(str(tree.var)).lsb.eval()
+                if isinstance(tree.var, DFTerminal):
+                    child_lsb = self.optimizer.getTermWidth(tree.var.name).lsb
+                else:
+                    child_lsb = self.getTerm(str(tree.var)).lsb.eval()
                 return DFPartselect(var.var, DFIntConst(str(msb.eval() + var.lsb.eval() - child_lsb)),
                                     DFIntConst(str(lsb.eval() + var.lsb.eval() - child_lsb)))
             return DFPartselect(var, msb, lsb)
@@ -113,11 +178,25 @@ class VerilogDataflowWalker(VerilogDataflowMerge):
                     return var
             return DFPointer(var, ptr)
 
-        if isinstance(tree, DFConcat):
-            nextnodes = []
-            for n in tree.nextnodes:
-                nextnodes.append(self.walkTree(n, visited, step, delay))
-            return DFConcat(tuple(nextnodes))
-
         raise verror.DefinitionError(
             'Undefined Node Type: %s : %s' % (str(type(tree)), str(tree)))
+
+class WalkResult(object):
+    """ expanded tree of a terminal. cut: terminals left unexpanded because
+        they were in visited (on the path above), expanded: terminals
+        expanded in the tree. The tree is the same for another visited set
+        which contains cut and none of expanded, until the version of the
+        optimizer (constants and terms) is changed. """
+    def __init__(self, version=None):
+        self.tree = None
+        self.cut = set()
+        self.expanded = set()
+        self.version = version
+
+    def isValid(self, visited, version):
+        if self.version != version: return False
+        return self.cut.issubset(visited) and self.expanded.isdisjoint(visited)
+
+    def merge(self, result):
+        self.cut.update(result.cut)
+        self.expanded.update(result.expanded)
@@ -0,0 +1,128 @@
+#-------------------------------------------------------------------------------
+# test_ast.py
+#
+# Behavior tests of the structural hash and equality of the AST nodes,
+# also after a child is modified in place
+#
+# Usage: python -m pytest tests/test_ast.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import copy
+import pickle
+import unittest
+
+import pyverilog.vparser.ast as vast
+from pyverilog.vparser.parser import VerilogParser
+from pyverilog.dataflow.moduleinfo import ModuleInfo, AlwaysData
+
+source = '''\
+module top(input CLK, input [7:0] a, input [7:0] b, output reg [7:0] y, output [7:0] z);
+  assign z = a + b;
+  always @(posedge CLK) begin
+    y <= a - b;
+  end
+endmodule
+'''
+
+def parse(text=source):
+    return VerilogParser().parse(text)
+
+def items(ast, cls):
+    return [ item for item in ast.description.definitions[0].items if isinstance(item, cls) ]
+
+class NodeHashTest(unittest.TestCase):
+    def test_equal(self):
+        first, second = parse(), parse()
+        self.assertTrue(first is not second)
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(first, first)
+
+    def test_mutate_child(self):
+        first, second = parse(), parse()
+        hash(first)
+        assign = items(first, vast.Assign)[0]
+        assign.right.var.left.name = 'b'
+        self.assertNotEqual(first, second)
+        expected = parse(source.replace('a + b', 'b + b'))
+        self.assertEqual(first, expected)
+        self.assertEqual(hash(first), hash(expected))
+        assign.right.var.left.name = 'a'
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+
+    def test_replace_child(self):
+        first, second = parse(), parse()
+        hash(first)
+        assign = items(first, vast.Assign)[0]
+        assign.right.var = vast.Minus(vast.Identifier('a'), vast.Identifier('b'))
+        self.assertNotEqual(first, second)
+        expected = parse(source.replace('a + b', 'a - b'))
+        self.assertEqual(first, expected)
+        self.assertEqual(hash(first), hash(expected))
+
+    def test_append_child(self):
+        first, second = parse(), parse()
+        hash(first)
+        definition = first.description.definitions[0]
+        newitems = list(definition.items)
+        newitems.append(vast.Assign(vast.Lvalue(vast.Identifier('z')),
+                                    vast.Rvalue(vast.Identifier('a'))))
+        definition.items = newitems
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(second, first)
+        expected = parse(source.replace('endmodule', '  assign z = a;\nendmodule'))
+        self.assertEqual(first, expected)
+        self.assertEqual(hash(first), hash(expected))
+
+    def test_append_list_in_place(self):
+        first, second = parse(), parse()
+        hash(first)
+        block = items(first, vast.Always)[0].statement
+        block.statements = list(block.statements)
+        hash(first)
+        block.statements.append(vast.NonblockingSubstitution(
+            vast.Lvalue(vast.Identifier('y')), vast.Rvalue(vast.Identifier('a'))))
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(second, first)
+        expected = parse(source.replace('y <= a - b;', 'y <= a - b;\n    y <= a;'))
+        self.assertEqual(first, expected)
+        self.assertEqual(hash(first), hash(expected))
+        block.statements.pop()
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+
+    def test_dict_key(self):
+        ast = parse()
+        always = items(ast, vast.Always)[0]
+        table = {always: 1}
+        self.assertEqual(table[items(parse(), vast.Always)[0]], 1)
+        always.statement.statements[0].right.var.left.name = 'b'
+        self.assertFalse(items(parse(), vast.Always)[0] in table)
+
+    def test_copy_and_pickle(self):
+        ast = parse()
+        hash(ast)
+        self.assertEqual(copy.deepcopy(ast), ast)
+        self.assertEqual(hash(copy.deepcopy(ast)), hash(ast))
+        self.assertEqual(pickle.loads(pickle.dumps(ast)), ast)
+        self.assertEqual(hash(pickle.loads(pickle.dumps(ast))), hash(ast))
+
+    def test_current_always_data(self):
+        ast = parse()
+        definition = ast.description.definitions[0]
+        always = items(ast, vast.Always)[0]
+        info = ModuleInfo(definition.name, definition)
+        data = AlwaysData(always)
+        info.addAlways(always, data)
+        self.assertTrue(info.getCurrentAlwaysData() is data)
+        self.assertTrue(info.getAlwaysData(items(parse(), vast.Always)[0]) is data)
+        info.addData(always.statement.statements[0].right)
+        self.assertEqual(data.getData(), {'a': 1, 'b': 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#-------------------------------------------------------------------------------
+# test_dataflow.py
+#
+# Behavior tests of the hash-consed DF nodes (DFNodeTable): identity reuse,
+# list arguments, weak references to unused nodes, pickling, and
+# construction with the table disabled; and of the version number of
+# VersionedDict
+#
+# Usage: python -m pytest tests/test_dataflow.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import gc
+import copy
+import pickle
+import unittest
+
+from pyverilog.dataflow.dataflow import *
+from pyverilog.utils.scope import ScopeLabel, ScopeChain
+
+def name(signal):
+    return ScopeChain([ScopeLabel('TOP', 'module'), ScopeLabel(signal, 'signal')])
+
+def tree():
+    a, b = DFTerminal(name('a')), DFTerminal(name('b'))
+    plus = DFOperator((a, b), 'Plus')
+    return DFBranch(DFOperator((a, DFIntConst('0')), 'Eq'), plus, DFConcat((plus, b)))
+
+class HashConsTest(unittest.TestCase):
+    def setUp(self):
+        self.table = getDFNodeTable()
+        self.enabled = self.table.isEnabled()
+        self.table.enable()
+
+    def tearDown(self):
+        if not self.enabled: self.table.disable()
+
+    def test_identity(self):
+        first, second = tree(), tree()
+        self.assertTrue(first is second)
+        self.assertTrue(first.truenode is first.falsenode.nextnodes[0])
+        self.assertTrue(DFIntConst('1') is DFIntConst('1'))
+        self.assertTrue(DFEvalValue(1, 8) is DFEvalValue(1, 8))
+        # numbers and strings by value and type, names and nodes by identity
+        self.assertTrue(DFEvalValue(1, 8) is not DFEvalValue(1, 16))
+        self.assertTrue(DFEvalValue(1, 8) is not DFEvalValue(1.0, 8))
+        self.assertTrue(DFEvalValue(1, 8) is not DFEvalValue(1, 8, isfloat=True))
+        self.assertTrue(DFOperator((DFIntConst('1'),), 'Unot') is not
+                        DFOperator((DFIntConst('1'),), 'Ulnot'))
+
+    def test_list_argument(self):
+        nodes = [DFTerminal(name('a')), DFIntConst('1')]
+        first = DFOperator(nodes, 'Plus')
+        self.assertEqual(type(first.nextnodes), tuple)
+        nodes.append(DFIntConst('2'))
+        self.assertEqual(len(first.nextnodes), 2)
+        second = DFOperator([DFTerminal(name('a')), DFIntConst('1')], 'Plus')
+        self.assertTrue(first is second)
+        self.assertTrue(DFConcat(list(first.nextnodes)) is DFConcat(first.nextnodes))
+        keyword = DFOperator(nextnodes=[DFIntConst('1')], operator='Unot')
+        self.assertEqual(type(keyword.nextnodes), tuple)
+        self.assertTrue(DFOperator(nextnodes=[DFIntConst('1')], operator='Unot') is keyword)
+
+    def test_weak_reference(self):
+        gc.collect()
+        before = self.table.getStats()['nodes']
+        node = DFOperator((DFTerminal(name('weak')), DFIntConst('12345')), 'Plus')
+        self.assertEqual(self.table.getStats()['nodes'], before + 3)
+        del node
+        gc.collect()
+        self.assertEqual(self.table.getStats()['nodes'], before)
+        misses = self.table.getStats()['misses']
+        DFTerminal(name('weak'))
+        self.assertEqual(self.table.getStats()['misses'], misses + 1)
+
+    def test_pickle(self):
+        original = tree()
+        loaded = pickle.loads(pickle.dumps(original))
+        self.assertEqual(loaded, original)
+        self.assertEqual(loaded.tostr(), original.tostr())
+        # the sharing in the tree is kept
+        self.assertTrue(loaded.truenode is loaded.falsenode.nextnodes[0])
+        self.assertTrue(copy.deepcopy(original) is original)
+
+    def test_disabled(self):
+        self.table.disable()
+        try:
+            first, second = tree(), tree()
+            self.assertTrue(first is not second)
+            self.assertEqual(first, second)
+            nodes = [DFIntConst('1')]
+            self.assertTrue(DFConcat(nodes).nextnodes is nodes)
+        finally:
+            self.table.enable()
+        self.assertTrue(tree() is tree())
+
+class VersionedDictTest(unittest.TestCase):
+    def assertChanged(self, table, method, *args, **kwargs):
+        version = table.version
+        getattr(table, method)(*args, **kwargs)
+        self.assertTrue(table.version > version, method)
+
+    def test_changes(self):
+        table = VersionedDict([('a', 1)])
+        self.assertChanged(table, '__setitem__', 'b', 2)
+        self.assertChanged(table, '__setitem__', 'b', 3)
+        self.assertChanged(table, '__delitem__', 'b')
+        self.assertChanged(table, 'update', {'c': 3}, d=4)
+        self.assertChanged(table, 'setdefault', 'e', 5)
+        self.assertChanged(table, 'pop', 'e')
+        self.assertChanged(table, 'popitem')
+        self.assertChanged(table, 'touch')
+        self.assertChanged(table, 'clear')
+        self.assertEqual(table, {})
+
+    def test_no_change(self):
+        table = VersionedDict([('a', 1)])
+        version = table.version
+        self.assertEqual(table.setdefault('a', 2), 1)
+        self.assertEqual(table.get('a'), 1)
+        self.assertTrue('a' in table)
+        self.assertEqual(table.version, version)
+
+    def test_copy(self):
+        table = VersionedDict([('a', 1)])
+        table['b'] = 2
+        copied = table.copy()
+        self.assertEqual(type(copied), VersionedDict)
+        self.assertEqual(copied, table)
+        version = table.version
+        copied['c'] = 3
+        self.assertEqual(table.version, version)
+        self.assertTrue('c' not in table)
+
+    def test_pickle(self):
+        table = VersionedDict([('a', 1)])
+        table['b'] = 2
+        table.touch()
+        loaded = pickle.loads(pickle.dumps(table))
+        self.assertEqual(type(loaded), VersionedDict)
+        self.assertEqual(loaded, table)
+        self.assertEqual(loaded.version, table.version)
+        self.assertChanged(loaded, '__setitem__', 'c', 3)
+
+if __name__ == '__main__':
+    unittest.main()
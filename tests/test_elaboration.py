@@ -0,0 +1,338 @@
+#-------------------------------------------------------------------------------
+# test_elaboration.py
+#
+# Behavior tests of the elaboration of module instances: the dataflow of
+# the elaboration cache (journal replay with label relocation) compared
+# with an uncached run, and of the parallel bind workers (bind_jobs)
+# compared with the serial elaboration, and of the lazy elaboration
+# (lazy=True) compared with the eager one
+#
+# Usage: python -m pytest tests/test_elaboration.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import re
+import shutil
+import tempfile
+import multiprocessing
+import unittest
+
+import pyverilog.dataflow.bindvisitor as bindvisitor
+import pyverilog.dataflow.dataflow_analyzer as dataflow_analyzer
+import pyverilog.utils.verror as verror
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+from pyverilog.dataflow.walker import VerilogDataflowWalker
+from pyverilog.dataflow.elaboration import ElaborationCache
+
+# u1 refers to an undefined signal
+broken = '''\
+module sub(input CLK, input [3:0] a, output [3:0] y);
+  assign y = a + undefined_signal;
+endmodule
+module ok(input CLK, input [3:0] a, output [3:0] y);
+  assign y = a;
+endmodule
+module TOP(input CLK, input [3:0] din, output [3:0] d0, output [3:0] d1);
+  ok u0 (.CLK(CLK), .a(din), .y(d0));
+  sub u1 (.CLK(CLK), .a(din), .y(d1));
+endmodule
+'''
+
+# m0 and m1 are replicated instances, m2 and m3 override other parameters;
+# mid has a generate-for loop, leaf an always @* with renamed (_rn) signals
+design = '''\
+module leaf #(parameter W = 4) (input CLK, input [W-1:0] a, output reg [W-1:0] q);
+  function [W-1:0] inc; input [W-1:0] v; begin inc = v + 1; end endfunction
+  reg [W-1:0] t;
+  always @* begin
+    t = a;
+    t = t ^ {W{1'b1}};
+  end
+  always @(posedge CLK) begin: seq
+    if (a[0]) q <= inc(t); else q <= t;
+  end
+endmodule
+
+module mid #(parameter N = 2, parameter W = 4) (input CLK, input [W-1:0] din, output [W-1:0] dout);
+  wire [W-1:0] chain [0:N];
+  assign chain[0] = din;
+  genvar i;
+  generate for (i = 0; i < N; i = i + 1) begin: g
+    leaf #(.W(W)) u (.CLK(CLK), .a(chain[i]), .q(chain[i+1]));
+    if (i == 0) begin: first
+      reg [W-1:0] r;
+      always @(posedge CLK) r <= chain[i] + i;
+    end
+  end endgenerate
+  assign dout = chain[N] + g[0].first.r;
+endmodule
+
+module TOP(input CLK, input [7:0] din, output [7:0] d0, output [7:0] d1, output [7:0] d2, output [3:0] d3);
+  wire [7:0] x;
+  mid #(.N(2), .W(8)) m0 (.CLK(CLK), .din(din), .dout(d0));
+  mid #(.N(2), .W(8)) m1 (.CLK(CLK), .din(d0), .dout(d1));
+  mid #(3, 8) m2 (.CLK(CLK), .din(d1), .dout(d2));
+  mid m3 (.CLK(CLK), .din(din[3:0]), .dout(d3));
+  leaf #(8) l0 [1:0] (.CLK(CLK), .a(din), .q(x));
+endmodule
+'''
+
+numbered = re.compile(r'(_rn|md_\w+?|al_\w+?|ge_\w+?)\d+')
+# lazy mode numbers renamed signals and function calls in elaboration order
+renumbered = re.compile(r'(_rn|functioncall)\d+')
+
+def alwaysinfo(bind):
+    info = bind.alwaysinfo
+    if info is None: return None
+    return (info.clock_name, info.clock_edge, info.clock_bit,
+            info.reset_name, info.reset_edge, info.reset_bit, info.isCombination())
+
+def dump_constlist(analyzer):
+    optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+    optimizer.resolveConstant()
+    return optimizer.getConstlist()
+
+def dump(analyzer):
+    """ terms, binds, frames, signals and resolved constants as sorted lines """
+    terms = analyzer.getTerms()
+    binddict = analyzer.getBinddict()
+    ret = []
+    for name, term in terms.items():
+        ret.append('T %s %s' % (name, term.tostr()))
+    for name, bindlist in binddict.items():
+        for bind in bindlist:
+            ret.append('B %s %s %s' % (name, bind.tostr(), alwaysinfo(bind)))
+    for scope in analyzer.getFrameTable().dict.keys():
+        ret.append('F %s' % scope)
+    for name, definitions in analyzer.getSignals().items():
+        ret.append('S %s %d' % (name, len(definitions)))
+    for scope, modulename in analyzer.getInstances():
+        ret.append('I %s %s' % (scope, modulename))
+    for name, value in dump_constlist(analyzer).items():
+        ret.append('C %s %s' % (name, value.tostr()))
+    return sorted(ret)
+
+class DesignTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filename = self.write('top.v', design)
+
+    def write(self, name, text):
+        path = os.path.join(self.dirname, name)
+        f = open(path, 'w')
+        f.write(text)
+        f.close()
+        return path
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def analyze(self, filename=None, **kwargs):
+        if filename is None: filename = self.filename
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP',
+                                           preprocess_engine='native', **kwargs)
+        analyzer.generate()
+        return analyzer
+
+class ElaborationCacheTest(DesignTestCase):
+    def setUp(self):
+        DesignTestCase.setUp(self)
+        self.replays = 0
+        self.get = ElaborationCache.get
+        test = self
+        def get(cache, key):
+            test.replays += 1
+            return test.get(cache, key)
+        ElaborationCache.get = get
+
+    def tearDown(self):
+        ElaborationCache.get = self.get
+        DesignTestCase.tearDown(self)
+
+    def test_same_as_uncached(self):
+        uncached = dump(self.analyze(elaboration_cache=False))
+        self.assertEqual(self.replays, 0)
+        cached = dump(self.analyze(elaboration_cache=True))
+        self.assertTrue(self.replays > 0)
+        self.assertEqual(cached, uncached)
+
+    def test_replicated_instances(self):
+        analyzer = self.analyze(elaboration_cache=True)
+        names = [ str(name) for name in analyzer.getTerms().keys() ]
+        def instance(prefix):
+            # generated labels and renamed signals are numbered per instance
+            return sorted([ numbered.sub(r'\1', name[len(prefix):]) for name in names
+                            if name.startswith(prefix) ])
+        self.assertTrue(len(instance('TOP.m0.')) > 0)
+        self.assertEqual(instance('TOP.m1.'), instance('TOP.m0.'))
+        self.assertEqual(instance('TOP.l0_1.'), instance('TOP.l0_0.'))
+        # other parameters: three loop iterations in m2
+        self.assertNotEqual(instance('TOP.m2.'), instance('TOP.m0.'))
+        self.assertTrue(any([ 'ge_for[2].g.u.q' in name for name in instance('TOP.m2.') ]))
+        self.assertFalse(any([ 'ge_for[2]' in name for name in instance('TOP.m0.') ]))
+
+    def test_parameters(self):
+        analyzer = self.analyze(elaboration_cache=True)
+        widths = {}
+        for name, value in dump_constlist(analyzer).items():
+            name = str(name)
+            if name.endswith('.u.W'): widths.setdefault(name.split('.')[1], set()).add(value.value)
+        self.assertEqual(widths, {'m0': set([8]), 'm1': set([8]), 'm2': set([8]), 'm3': set([4])})
+
+    def test_renamed_signals(self):
+        uncached = self.analyze(elaboration_cache=False)
+        cached = self.analyze(elaboration_cache=True)
+        renamed = [ str(name) for name in cached.getTerms().keys() if '_rn' in str(name) ]
+        self.assertTrue(len(renamed) > 0)
+        self.assertEqual(sorted(renamed),
+                         sorted([ str(name) for name in uncached.getTerms().keys()
+                                  if '_rn' in str(name) ]))
+        # a replayed instance has its own renamed signals
+        self.assertTrue(any([ name.startswith('TOP.m1.') for name in renamed ]))
+
+class ParallelBindTest(DesignTestCase):
+    def setUp(self):
+        DesignTestCase.setUp(self)
+        self.elaborated = []
+        self.elaborate_instances = dataflow_analyzer.elaborate_instances
+        test = self
+        def elaborate_instances(*args, **kwargs):
+            ret = test.elaborate_instances(*args, **kwargs)
+            test.elaborated.append(len(ret))
+            return ret
+        dataflow_analyzer.elaborate_instances = elaborate_instances
+
+    def tearDown(self):
+        dataflow_analyzer.elaborate_instances = self.elaborate_instances
+        DesignTestCase.tearDown(self)
+
+    def test_same_as_serial(self):
+        serial = dump(self.analyze(bind_jobs=1))
+        self.assertEqual(self.elaborated, [0])
+        parallel = dump(self.analyze(bind_jobs=2))
+        self.assertTrue(self.elaborated[1] > 1)
+        self.assertEqual(parallel, serial)
+
+    def test_same_as_serial_uncached(self):
+        serial = dump(self.analyze(bind_jobs=1, elaboration_cache=False))
+        parallel = dump(self.analyze(bind_jobs=2, elaboration_cache=False))
+        self.assertEqual(parallel, serial)
+
+    def test_spawn(self):
+        # with spawn, the instance payload (module info, frames, constants)
+        # and the elaborations are pickled between the processes
+        serial = dump(self.analyze(bind_jobs=1))
+        fork = bindvisitor.multiprocessing
+        bindvisitor.multiprocessing = multiprocessing.get_context('spawn')
+        try:
+            parallel = dump(self.analyze(bind_jobs=2))
+        finally:
+            bindvisitor.multiprocessing = fork
+        self.assertTrue(self.elaborated[1] > 1)
+        self.assertEqual(parallel, serial)
+
+    def test_worker_error(self):
+        filename = self.write('broken.v', broken)
+        for jobs in (1, 2):
+            try:
+                self.analyze(filename, bind_jobs=jobs)
+            except verror.DefinitionError as e:
+                self.assertTrue('undefined_signal' in str(e), str(e))
+            else:
+                self.fail('DefinitionError not raised (bind_jobs=%d)' % jobs)
+
+class LazyElaborationTest(DesignTestCase):
+    def resolve(self, analyzer):
+        optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+        optimizer.resolveConstant()
+        return optimizer
+
+    def dump(self, analyzer, optimizer):
+        ret = []
+        for name, term in analyzer.getTerms().items():
+            ret.append('T %s %s' % (name, term.tostr()))
+        for name, bindlist in analyzer.getBinddict().items():
+            for bind in bindlist: ret.append('B %s %s' % (name, bind.tostr()))
+        for name, term in optimizer.getResolvedTerms().items():
+            ret.append('RT %s %s' % (name, term.tostr()))
+        for name, bindlist in optimizer.getResolvedBinddict().items():
+            for bind in bindlist: ret.append('RB %s %s' % (name, bind.tostr()))
+        for name, value in optimizer.getConstlist().items():
+            ret.append('C %s %s' % (name, value.tostr()))
+        return ret
+
+    def instances(self, names):
+        return set([ '.'.join(str(name).split('.')[:2]) for name in names ])
+
+    def pending(self, analyzer):
+        return set([ str(scope) for scope in analyzer.bind_visitor.pending ])
+
+    def test_elaborate_all_same_as_eager(self):
+        eager = self.analyze()
+        eager_dump = self.dump(eager, self.resolve(eager))
+        lazy = self.analyze(lazy=True)
+        optimizer = self.resolve(lazy)
+        self.assertTrue(len(lazy.getBinddict()) < len(eager.getBinddict()))
+        scopes = lazy.elaborateAll(optimizer)
+        self.assertTrue(len(scopes) > 0)
+        self.assertEqual(self.pending(lazy), set())
+        lazy_dump = self.dump(lazy, optimizer)
+        # the same up to the numbering of renamed signals and function calls
+        self.assertNotEqual(sorted(lazy_dump), sorted(eager_dump))
+        self.assertEqual(sorted([ renumbered.sub(r'\1', line) for line in lazy_dump ]),
+                         sorted([ renumbered.sub(r'\1', line) for line in eager_dump ]))
+
+    def test_elaborate_term(self):
+        analyzer = self.analyze(lazy=True)
+        optimizer = self.resolve(analyzer)
+        others = set(['TOP.m1', 'TOP.m2', 'TOP.m3', 'TOP.l0_0', 'TOP.l0_1'])
+        self.assertEqual(self.pending(analyzer), others | set(['TOP.m0']))
+        before = set(analyzer.getBinddict().keys())
+
+        scopes = analyzer.elaborate('TOP.m0.dout', optimizer)
+        self.assertEqual([ str(scope) for scope in scopes ], ['TOP.m0'])
+        added = [ name for name in analyzer.getBinddict().keys() if name not in before ]
+        self.assertTrue(len(added) > 0)
+        self.assertEqual(self.instances(added), set(['TOP.m0']))
+        for name in added:
+            self.assertTrue(name in optimizer.getResolvedBinddict())
+        # the two leaf instances in m0 are deferred, the others are untouched
+        pending = self.pending(analyzer)
+        inner = [ scope for scope in pending if scope.startswith('TOP.m0.') ]
+        self.assertEqual(len(inner), 2)
+        self.assertEqual(pending - set(inner), others)
+        self.assertEqual(analyzer.elaborate('TOP.m0.dout', optimizer), [])
+
+    def test_walk(self):
+        eager = self.analyze()
+        optimizer = self.resolve(eager)
+        walker = VerilogDataflowWalker('TOP', eager.getTerms(), eager.getBinddict(),
+                                       optimizer.getResolvedTerms(),
+                                       optimizer.getResolvedBinddict(),
+                                       optimizer.getConstlist(), optimizer=optimizer)
+        expected = walker.walkBind('TOP.d0', step=1).tocode()
+
+        analyzer = self.analyze(lazy=True)
+        optimizer = self.resolve(analyzer)
+        walker = VerilogDataflowWalker('TOP', analyzer.getTerms(), analyzer.getBinddict(),
+                                       optimizer.getResolvedTerms(),
+                                       optimizer.getResolvedBinddict(),
+                                       optimizer.getConstlist(),
+                                       elaborator=analyzer.getElaborator(optimizer),
+                                       optimizer=optimizer)
+        self.assertEqual(walker.walkBind('TOP.d0', step=1).tocode(), expected)
+        # m0 and the leaf instance driving its output are elaborated, the
+        # other leaf instance in m0 and the other instances are not
+        pending = self.pending(analyzer)
+        inner = [ scope for scope in pending if scope.startswith('TOP.m0.') ]
+        self.assertEqual(len(inner), 1)
+        self.assertEqual(pending - set(inner),
+                         set(['TOP.m1', 'TOP.m2', 'TOP.m3', 'TOP.l0_0', 'TOP.l0_1']))
+
+if __name__ == '__main__':
+    unittest.main()
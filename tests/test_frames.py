@@ -0,0 +1,109 @@
+#-------------------------------------------------------------------------------
+# test_frames.py
+#
+# Behavior tests of the FrameTable symbol index: searchSignalDefinition and
+# searchConstantDefinition compared with walking the frames upward, also
+# when a name is defined after it was searched
+#
+# Usage: python -m pytest tests/test_frames.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+import pyverilog.vparser.ast as vast
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+
+design = '''\
+module sub(input [7:0] din, output [7:0] dout);
+  parameter W = 8;
+  wire [7:0] x = din;
+  assign dout = x;
+endmodule
+
+module TOP(input CLK, input [7:0] din, output [7:0] dout);
+  localparam N = 3;
+  wire [7:0] x = din;
+  wire [7:0] y = x + 1;
+  genvar i;
+  generate for (i = 0; i < N; i = i + 1) begin: g
+    wire [7:0] y = x + i;
+    if (i == 1) begin: b
+      wire [7:0] x = y;
+      localparam N = 4;
+    end
+  end endgenerate
+  sub u(.din(y), .dout(dout));
+endmodule
+'''
+
+names = ('x', 'y', 'din', 'dout', 'W', 'N', 'i', 'none')
+
+def walk(frames, key, name, constant=False):
+    """ former search: up the frames to the module frame """
+    while True:
+        frame = frames.dict[key]
+        if constant and frame.hasConstant(name): return key
+        if not constant and frame.hasSignal(name): return key
+        if frame.isModule(): return None
+        key = frame.getPrevious()
+
+class SymbolIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        filename = os.path.join(self.dirname, 'top.v')
+        f = open(filename, 'w')
+        f.write(design)
+        f.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+        self.frames = analyzer.getFrameTable()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def find(self, name):
+        return [ key for key in self.frames.dict.keys() if str(key).endswith(name) ]
+
+    def test_same_as_frame_walk(self):
+        for key in self.frames.dict.keys():
+            for name in names:
+                found, signal = self.frames.searchSignalDefinition(key, name)
+                self.assertEqual(found, walk(self.frames, key, name), (key, name))
+                if found is not None: self.assertEqual(signal[0].name, name)
+                found, const = self.frames.searchConstantDefinition(key, name)
+                self.assertEqual(found, walk(self.frames, key, name, True), (key, name))
+
+    def test_nearest(self):
+        block = [ key for key in self.find('.b') if '[1]' in str(key) ][0]
+        loop = [ key for key in self.find('.g') if '[1]' in str(key) ][0]
+        self.assertEqual(str(self.frames.searchSignalDefinition(block, 'x')[0]), str(block))
+        self.assertEqual(self.frames.searchSignalDefinition(block, 'y')[0], loop)
+        self.assertEqual(str(self.frames.searchConstantDefinition(block, 'N')[0]), str(block))
+        # not found beyond the module frame
+        instance = self.find('TOP.u')[0]
+        self.assertEqual(self.frames.searchSignalDefinition(instance, 'y'), (None, None))
+        self.assertEqual(str(self.frames.searchSignalDefinition(instance, 'x')[0]), 'TOP.u')
+
+    def test_defined_after_search(self):
+        loop = [ key for key in self.find('.g') if '[0]' in str(key) ][0]
+        top = self.find('TOP')[0]
+        self.assertEqual(self.frames.searchSignalDefinition(loop, 'z'), (None, None))
+        self.assertEqual(self.frames.searchSignalDefinition(top, 'z'), (None, None))
+        self.frames.setCurrent(top)
+        self.frames.addSignal(vast.Wire('z'))
+        self.assertEqual(self.frames.searchSignalDefinition(loop, 'z')[0], top)
+        self.assertEqual(self.frames.searchSignalDefinition(top, 'z')[0], top)
+        self.frames.setCurrent(loop)
+        self.frames.addSignal(vast.Wire('z'))
+        self.assertEqual(self.frames.searchSignalDefinition(loop, 'z')[0], loop)
+        self.assertEqual(self.frames.searchSignalDefinition(top, 'z')[0], top)
+
+if __name__ == '__main__':
+    unittest.main()
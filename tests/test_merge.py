@@ -0,0 +1,181 @@
+#-------------------------------------------------------------------------------
+# test_merge.py
+#
+# Behavior tests of the merged tree cache of VerilogDataflowMerge (getTree):
+# results compared with a new merge object, hits on repeated lookups, and
+# invalidation by changed binds and constants and by invalidateTreeCache;
+# and of the bind split and merge, which leave the given binds unchanged
+#
+# Usage: python -m pytest tests/test_merge.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+import pyverilog.utils.util as util
+from pyverilog.dataflow.dataflow import *
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+from pyverilog.dataflow.merge import VerilogDataflowMerge
+
+design = '''\
+module TOP(input CLK, input RST, input [7:0] x, input [7:0] y,
+           output reg [7:0] r, output [7:0] w);
+  parameter P = 2;
+  always @(posedge CLK) begin
+    if (RST) begin
+      r <= 0;
+    end else begin
+      r[3:0] <= x[3:0] + P;
+      if (y[0]) r[7:4] <= y[7:4];
+    end
+  end
+  assign w = r + x;
+endmodule
+'''
+
+signals = ('r', 'w', 'x', 'P')
+
+class DesignTest(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        filename = os.path.join(self.dirname, 'top.v')
+        f = open(filename, 'w')
+        f.write(design)
+        f.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+        optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+        optimizer.resolveConstant()
+        self.resolved_binddict = optimizer.getResolvedBinddict()
+        self.constlist = optimizer.getConstlist()
+        self.args = ('TOP', analyzer.getTerms(), analyzer.getBinddict(),
+                     optimizer.getResolvedTerms(), self.resolved_binddict, self.constlist)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def name(self, signal):
+        return util.toTermname('TOP.' + signal)
+
+class MergedTreeCacheTest(DesignTest):
+    def uncached(self, signal):
+        tree = VerilogDataflowMerge(*self.args).getTree(self.name(signal))
+        return None if tree is None else tree.tostr()
+
+    def tree(self, merge, signal):
+        tree = merge.getTree(self.name(signal))
+        return None if tree is None else tree.tostr()
+
+    def test_same_as_uncached(self):
+        merge = VerilogDataflowMerge(*self.args)
+        for i in range(3):
+            for signal in signals:
+                self.assertEqual(self.tree(merge, signal), self.uncached(signal), signal)
+        stats = merge.getTreeCacheStats()
+        self.assertEqual(stats['misses'], len(signals))
+        self.assertEqual(stats['hits'], 2 * len(signals))
+        self.assertEqual(stats['size'], len(signals))
+        self.assertTrue(merge.getTree(self.name('r')) is merge.getTree(self.name('r')))
+
+    def test_bind_changed(self):
+        merge = VerilogDataflowMerge(*self.args)
+        before = self.tree(merge, 'w')
+        # a new bind list
+        bind = self.resolved_binddict[self.name('w')][0]
+        tree = DFOperator((DFTerminal(self.name('r')), DFTerminal(self.name('y'))), 'Minus')
+        self.resolved_binddict[self.name('w')] = [bind.replace(tree=tree)]
+        after = self.tree(merge, 'w')
+        self.assertNotEqual(after, before)
+        self.assertEqual(after, self.uncached('w'))
+        self.assertEqual(merge.getTreeCacheStats()['hits'], 0)
+        # a bind changed in place
+        bind = self.resolved_binddict[self.name('w')][0]
+        bind.tree = DFTerminal(self.name('x'))
+        self.assertEqual(self.tree(merge, 'w'), '(Terminal TOP.x)')
+        self.assertEqual(merge.getTreeCacheStats()['hits'], 0)
+
+    def test_constant_changed(self):
+        merge = VerilogDataflowMerge(*self.args)
+        before = self.tree(merge, 'r')
+        self.assertTrue(before.endswith("'d2)))"), before)
+        self.constlist[self.name('P')] = DFEvalValue(3, 32)
+        after = self.tree(merge, 'r')
+        self.assertTrue(after.endswith("'d3)))"), after)
+        self.assertEqual(after, self.uncached('r'))
+        self.assertEqual(merge.getTreeCacheStats()['hits'], 0)
+
+    def test_invalidate(self):
+        merge = VerilogDataflowMerge(*self.args)
+        for signal in signals:
+            merge.getTree(self.name(signal))
+        merge.invalidateTreeCache([self.name('r'), self.name('none')])
+        self.assertEqual(merge.getTreeCacheStats()['size'], len(signals) - 1)
+        merge.getTree(self.name('r'))
+        merge.getTree(self.name('w'))
+        stats = merge.getTreeCacheStats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, len(signals) + 1))
+        merge.invalidateTreeCache()
+        self.assertEqual(merge.getTreeCacheStats()['size'], 0)
+        self.assertEqual(self.tree(merge, 'r'), self.uncached('r'))
+
+def state(bindlist):
+    return [ (bind, bind.tree, bind.msb, bind.lsb, bind.ptr) for bind in bindlist ]
+
+def ranges(bindlist):
+    return [ (bind.msb.value, bind.lsb.value) for bind in bindlist ]
+
+class BindSplitTest(DesignTest):
+    def assertSameState(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            for x, y in zip(a, b):
+                self.assertTrue(x is y)
+
+    def test_optimized_bindlist(self):
+        merge = VerilogDataflowMerge(*self.args)
+        bindlist = self.resolved_binddict[self.name('r')]
+        self.assertEqual(len(bindlist), 3)
+        before = state(bindlist)
+        optimized = merge.getOptimizedBindlist(bindlist)
+        self.assertSameState(state(bindlist), before)
+        self.assertEqual(ranges(optimized), [(3, 0), (7, 4)])
+        for bind in optimized:
+            self.assertTrue(bind not in bindlist)
+        # the same result again from the unchanged binds
+        self.assertEqual([ bind.tostr() for bind in merge.getOptimizedBindlist(bindlist) ],
+                         [ bind.tostr() for bind in optimized ])
+
+    def test_split_bind(self):
+        merge = VerilogDataflowMerge(*self.args)
+        bind = [ bind for bind in self.resolved_binddict[self.name('r')] if bind.msb is None ][0]
+        before = state([bind])
+        left, right = merge.splitBind(bind, 4)
+        self.assertSameState(state([bind]), before)
+        self.assertEqual(ranges([left, right]), [(7, 4), (3, 0)])
+        self.assertEqual(left.dest, bind.dest)
+        self.assertEqual(right.alwaysinfo, bind.alwaysinfo)
+        self.assertTrue(merge.splitBind(left, 2) == (left, None))
+
+    def test_append_tail(self):
+        merge = VerilogDataflowMerge(*self.args)
+        cond = DFTerminal(self.name('y'))
+        target = DFBranch(cond, DFTerminal(self.name('x')), None)
+        appended = DFIntConst('1')
+        ret = merge.appendTail(appended, target)
+        self.assertTrue(ret.falsenode is appended)
+        self.assertTrue(ret.truenode is target.truenode)
+        self.assertTrue(target.falsenode is None)
+        nested = DFBranch(cond, target, None)
+        ret = merge.appendTail(appended, nested)
+        self.assertTrue(ret.falsenode is appended)
+        self.assertTrue(ret.truenode.falsenode is appended)
+
+if __name__ == '__main__':
+    unittest.main()
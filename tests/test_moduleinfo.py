@@ -0,0 +1,107 @@
+#-------------------------------------------------------------------------------
+# test_moduleinfo.py
+#
+# Behavior tests of the signal to always block index of ModuleInfo
+# (getDataReaders, getControlReaders, getStateWriters) compared with a scan
+# of the always blocks, also after an always block is replaced
+#
+# Usage: python -m pytest tests/test_moduleinfo.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import unittest
+
+import pyverilog.vparser.ast as vast
+from pyverilog.vparser.parser import VerilogParser
+from pyverilog.dataflow.modulevisitor import ModuleVisitor
+from pyverilog.dataflow.moduleinfo import AlwaysData
+
+source = '''\
+module TOP(input CLK, input RST, input [7:0] a, input [7:0] b, output reg [7:0] y);
+  reg [1:0] st;
+  reg [7:0] c;
+  always @(posedge CLK) begin
+    if (RST) st <= 0;
+    else case (st)
+      0: if (a == b) st <= 1;
+      1: st <= 2;
+      default: st <= 0;
+    endcase
+  end
+  always @(*) begin
+    if (st == 1) c = a + b;
+    else c = a - b;
+  end
+  always @(posedge CLK) begin
+    y <= c + a;
+  end
+endmodule
+'''
+
+def scan(info, name):
+    """ always blocks by a scan: (data readers, control readers, state writers) """
+    blocks = info.getAlways().values()
+    return (set([ al for al in blocks if name in al.getData() ]),
+            set([ al for al in blocks if name in al.getControl() ]),
+            set([ al for al in blocks if name in al.getState() ]))
+
+def indexed(info, name):
+    return (set(info.getDataReaders(name)), set(info.getControlReaders(name)),
+            set(info.getStateWriters(name)))
+
+names = ('CLK', 'RST', 'a', 'b', 'y', 'st', 'c', 'none')
+
+class AlwaysIndexTest(unittest.TestCase):
+    def setUp(self):
+        ast = VerilogParser().parse(source)
+        visitor = ModuleVisitor()
+        visitor.visit(ast)
+        self.info = visitor.get_moduleinfotable().dict['TOP']
+        self.nodes = [ item for item in ast.description.definitions[0].items
+                       if isinstance(item, vast.Always) ]
+
+    def assertSameAsScan(self):
+        for name in names:
+            self.assertEqual(indexed(self.info, name), scan(self.info, name), name)
+
+    def test_same_as_scan(self):
+        self.assertEqual(len(self.info.getAlways()), 3)
+        self.assertSameAsScan()
+        self.assertEqual(len(self.info.getControlReaders('st')), 2)
+        self.assertEqual(len(self.info.getReaders('a')), 3)
+
+    def test_add_always_data(self):
+        node = self.nodes[2]
+        old = self.info.getAlwaysData(node)
+        data = AlwaysData(node)
+        data.addData('b')
+        data.addControl('RST')
+        data.addState('y')
+        self.info.addAlwaysData(node, data)
+        self.assertSameAsScan()
+        self.assertTrue(data in self.info.getDataReaders('b'))
+        self.assertTrue(data in self.info.getControlReaders('RST'))
+        self.assertTrue(old not in self.info.getDataReaders('a'))
+        self.assertEqual(self.info.getDataReaders('c'), ())
+        # names added to the current always data later are indexed too
+        self.info.addData(vast.Identifier('c'))
+        self.assertEqual(self.info.getDataReaders('c'), (data,))
+        self.assertSameAsScan()
+
+    def test_add_always_again(self):
+        node = self.nodes[1]
+        data = AlwaysData(node)
+        self.info.addAlways(node, data)
+        self.info.addControl(vast.Identifier('a'))
+        self.assertSameAsScan()
+        self.assertEqual(len(self.info.getControlReaders('st')), 1)
+        # the same data again is indexed once
+        self.info.addAlways(node, data)
+        self.assertEqual(list(self.info.getControlReaders('a')).count(data), 1)
+        self.assertSameAsScan()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+#-------------------------------------------------------------------------------
+# test_optimizer.py
+#
+# Behavior tests of the VerilogOptimizer.optimize result cache: results
+# compared with an uncached optimizer, least recently used eviction,
+# invalidation by the constant table, and no caching with plain dicts; of
+# the terms and binds shared by VerilogDataflowOptimizer.resolveConstant;
+# and of the parameter resolution in the order of references
+#
+# Usage: python -m pytest tests/test_optimizer.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import gc
+import unittest
+
+from pyverilog.dataflow.dataflow import *
+from pyverilog.dataflow.optimizer import VerilogOptimizer, VerilogDataflowOptimizer
+from pyverilog.utils.scope import ScopeLabel, ScopeChain
+
+def name(signal):
+    return ScopeChain([ScopeLabel('TOP', 'module'), ScopeLabel(signal, 'signal')])
+
+def term(signal):
+    return Term(name(signal), set(['Wire']), DFIntConst('7'), DFIntConst('0'))
+
+def expression(i):
+    # (i + 1) * p + (q & 3)
+    return DFOperator((DFOperator((DFOperator((DFIntConst(str(i)), DFIntConst('1')), 'Plus'),
+                                   DFTerminal(name('p'))), 'Times'),
+                       DFOperator((DFTerminal(name('q')), DFIntConst('3')), 'And')), 'Plus')
+
+class OptimizeCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.terms = VersionedDict([ (name(s), term(s)) for s in ('p', 'q') ])
+        self.constlist = VersionedDict([ (name('p'), DFEvalValue(2, 8)) ])
+
+    def optimizer(self, **kwargs):
+        return VerilogOptimizer(self.terms, self.constlist, **kwargs)
+
+    def uncached(self, tree):
+        return VerilogOptimizer(self.terms, self.constlist, cache_size=0).optimize(tree).tostr()
+
+    def test_same_as_uncached(self):
+        optimizer = self.optimizer()
+        trees = [ expression(i % 3) for i in range(9) ]
+        for tree in trees + trees:
+            self.assertEqual(optimizer.optimize(tree).tostr(), self.uncached(tree))
+        stats = optimizer.getCacheStats()
+        self.assertEqual(stats['misses'], 3)
+        self.assertEqual(stats['hits'], 15)
+
+    def test_least_recently_used(self):
+        optimizer = self.optimizer(cache_size=2)
+        first, second, third = expression(0), expression(1), expression(2)
+        optimizer.optimize(first)
+        optimizer.optimize(second)
+        optimizer.optimize(first)
+        # second is the least recently used
+        optimizer.optimize(third)
+        self.assertEqual(optimizer.getCacheStats()['evictions'], 1)
+        hits = optimizer.getCacheStats()['hits']
+        optimizer.optimize(first)
+        self.assertEqual(optimizer.getCacheStats()['hits'], hits + 1)
+        optimizer.optimize(second)
+        self.assertEqual(optimizer.getCacheStats()['hits'], hits + 1)
+
+    def test_freed_tree(self):
+        # a new tree at the address of a freed one is not found in the cache
+        optimizer = self.optimizer()
+        for i in range(100):
+            tree = expression(i)
+            self.assertEqual(optimizer.optimize(tree).tostr(), self.uncached(tree))
+            del tree
+            gc.collect()
+        self.assertEqual(optimizer.getCacheStats()['hits'], 0)
+
+    def test_constant_changed(self):
+        optimizer = self.optimizer()
+        tree = expression(1)
+        before = optimizer.optimize(tree).tostr()
+        self.constlist[name('q')] = DFEvalValue(1, 8)
+        after = optimizer.optimize(tree).tostr()
+        self.assertNotEqual(after, before)
+        self.assertEqual(after, self.uncached(tree))
+        self.assertEqual(optimizer.getCacheStats()['hits'], 0)
+        self.assertEqual(optimizer.optimize(tree).value, 5)
+
+    def test_plain_dict(self):
+        constlist = dict(self.constlist)
+        optimizer = VerilogOptimizer(dict(self.terms), constlist)
+        tree = expression(1)
+        before = optimizer.optimize(tree).tostr()
+        # changed in place, not through the optimizer
+        constlist[name('p')] = DFEvalValue(3, 8)
+        after = optimizer.optimize(tree).tostr()
+        self.assertNotEqual(after, before)
+        self.constlist[name('p')] = DFEvalValue(3, 8)
+        self.assertEqual(after, self.uncached(tree))
+        self.assertEqual(optimizer.getCacheStats()['size'], 0)
+        self.assertEqual(optimizer.getTermWidth(name('q')).width, 8)
+        self.assertEqual(optimizer.getTermWidths(), {})
+
+class ResolveConstantTest(unittest.TestCase):
+    def setUp(self):
+        self.dataflow = DataFlow()
+        self.dataflow.addTerm(name('p'), Term(name('p'), set(['Parameter']),
+                                              DFIntConst('31'), DFIntConst('0')))
+        self.dataflow.addBind(name('p'), Bind(DFIntConst('4'), name('p')))
+        self.dataflow.addTerm(name('w'), Term(name('w'), set(['Wire'])))
+        self.dataflow.addBind(name('w'), Bind(DFTerminal(name('x')), name('w')))
+        self.optimizer = VerilogDataflowOptimizer(self.dataflow.getTerms(),
+                                                  self.dataflow.getBinddict())
+        self.optimizer.resolveConstant()
+
+    def test_shared(self):
+        # copy-on-write: unresolved terms and binds are the same objects
+        terms = self.optimizer.getResolvedTerms()
+        binddict = self.optimizer.getResolvedBinddict()
+        self.assertTrue(terms[name('w')] is self.dataflow.getTerm(name('w')))
+        self.assertTrue(binddict[name('w')][0] is self.dataflow.getBindlist(name('w'))[0])
+        self.assertTrue(terms[name('p')] is not self.dataflow.getTerm(name('p')))
+        self.assertEqual(binddict[name('p')][0].tree.value, 4)
+
+    def test_term_added_again(self):
+        # e.g. a port term added again by a lazily elaborated instance
+        resolved = self.optimizer.getResolvedTerms()[name('w')]
+        before = resolved.tostr()
+        self.dataflow.addTerm(name('w'), Term(name('w'), set(['Output']),
+                                              DFIntConst('7'), DFIntConst('0')))
+        self.assertEqual(resolved.tostr(), before)
+        self.assertTrue(self.optimizer.getResolvedTerms()[name('w')] is resolved)
+        term = self.dataflow.getTerm(name('w'))
+        self.assertEqual(term.termtype, set(['Wire', 'Output']))
+        self.assertEqual(term.msb.tostr(), '(IntConst 7)')
+
+    def test_bind_added_again(self):
+        resolved = self.optimizer.getResolvedBinddict()[name('w')]
+        before = [ bind.tostr() for bind in resolved ]
+        self.dataflow.addBind(name('w'), Bind(DFTerminal(name('y')), name('w')))
+        self.assertEqual([ bind.tostr() for bind in resolved ], before)
+        self.assertEqual([ bind.tree.tostr() for bind in self.dataflow.getBindlist(name('w')) ],
+                         ['(Terminal TOP.y)'])
+
+class ResolveParametersTest(unittest.TestCase):
+    def setUp(self):
+        self.dataflow = DataFlow()
+
+    def parameter(self, signal, tree, msb=None, lsb=None):
+        self.dataflow.addTerm(name(signal), Term(name(signal), set(['Parameter']), msb, lsb))
+        self.dataflow.addBind(name(signal), Bind(tree, name(signal)))
+
+    def plus(self, signal, value):
+        return DFOperator((DFTerminal(name(signal)), DFIntConst(str(value))), 'Plus')
+
+    def resolve(self):
+        optimizer = VerilogDataflowOptimizer(self.dataflow.getTerms(),
+                                             self.dataflow.getBinddict())
+        optimizer.resolveConstant()
+        return optimizer
+
+    def test_reverse_order(self):
+        # each parameter refers to the one defined after it
+        size = 50
+        for i in range(size - 1):
+            self.parameter('p%d' % i, self.plus('p%d' % (i + 1), 1))
+        self.parameter('p%d' % (size - 1), DFIntConst('1'))
+        optimizer = self.resolve()
+        for i in range(size):
+            self.assertEqual(optimizer.getConstant(name('p%d' % i)).value, size - i)
+        stats = optimizer.getParameterStats()
+        self.assertEqual(stats['parameters'], size)
+        self.assertEqual(stats['resolved'], size)
+        self.assertEqual(stats['cyclic'], 0)
+        self.assertEqual(stats['evaluations'], size)
+
+    def test_width_reference(self):
+        # b = {a, a} needs the width of a, which refers to w = v + 1
+        self.parameter('b', DFConcat((DFTerminal(name('a')), DFTerminal(name('a')))))
+        self.parameter('a', DFIntConst('3'),
+                       DFOperator((DFTerminal(name('w')), DFIntConst('1')), 'Minus'),
+                       DFIntConst('0'))
+        self.parameter('w', self.plus('v', 1))
+        self.parameter('v', DFIntConst('3'))
+        optimizer = self.resolve()
+        self.assertEqual(optimizer.getConstant(name('b')).value, (3 << 4) | 3)
+        self.assertEqual(optimizer.getResolvedTerms()[name('a')].msb.value, 3)
+        self.assertEqual(optimizer.getParameterStats()['evaluations'], 4)
+
+    def test_cycle(self):
+        self.parameter('a', self.plus('b', 1))
+        self.parameter('b', self.plus('a', 1))
+        self.parameter('c', self.plus('a', 1))
+        self.parameter('d', DFIntConst('2'))
+        self.parameter('e', self.plus('d', 1))
+        optimizer = self.resolve()
+        for signal in ('a', 'b', 'c'):
+            self.assertFalse(optimizer.hasConstant(name(signal)), signal)
+        self.assertEqual(optimizer.getConstant(name('e')).value, 3)
+        stats = optimizer.getParameterStats()
+        self.assertEqual(stats['parameters'], 5)
+        self.assertEqual(stats['resolved'], 2)
+        self.assertEqual(stats['unresolved'], 3)
+        self.assertEqual(stats['cyclic'], 3)
+        # one round over the cycle finds nothing new
+        self.assertEqual(stats['evaluations'], 2 + 3)
+
+if __name__ == '__main__':
+    unittest.main()
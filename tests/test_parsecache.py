@@ -0,0 +1,134 @@
+#-------------------------------------------------------------------------------
+# test_parsecache.py
+#
+# Behavior tests of the on-disk parse cache (ParseCache): cold and warm
+# parses, keys invalidated by the source text and the defines, and broken
+# cache entries
+#
+# Usage: python -m pytest tests/test_parsecache.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyverilog.vparser.parser import VerilogCodeParser
+from pyverilog.vparser.parsecache import ParseCache, parse_key
+
+source = '''\
+`define W 8
+module top(input [`W-1:0] a, output [`W-1:0] y);
+`ifdef INV
+  assign y = ~a;
+`else
+  assign y = a;
+`endif
+endmodule
+'''
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.cachedir = os.path.join(self.dirname, 'cache')
+        self.filename = self.write(source)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def write(self, text):
+        path = os.path.join(self.dirname, 'top.v')
+        f = open(path, 'w')
+        f.write(text)
+        f.close()
+        return path
+
+    def parse(self, cache, define=None):
+        parser = VerilogCodeParser([self.filename], preprocess_engine='native',
+                                   preprocess_define=define, parse_cache=cache)
+        return parser.parse(), parser
+
+    def entries(self):
+        ret = []
+        for dirpath, dirnames, filenames in os.walk(self.cachedir):
+            ret.extend([ os.path.join(dirpath, name) for name in filenames if name.endswith('.ast') ])
+        return ret
+
+    def test_cold_and_warm(self):
+        cache = ParseCache(self.cachedir)
+        cold, parser = self.parse(cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(len(self.entries()), 1)
+        warm, parser = self.parse(cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(warm, cold)
+        uncached, parser = self.parse(None)
+        self.assertEqual(warm, uncached)
+        # a directory name is accepted as well
+        warm, parser = self.parse(self.cachedir)
+        self.assertEqual(warm, cold)
+
+    def test_source_changed(self):
+        cache = ParseCache(self.cachedir)
+        before, parser = self.parse(cache)
+        self.write(source.replace('assign y = a;', 'assign y = a + 1;'))
+        after, parser = self.parse(cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertNotEqual(after, before)
+        self.assertEqual(len(self.entries()), 2)
+        # a change removed by the preprocessor has the same key
+        self.write(source.replace('assign y = ~a;', 'assign y = ~~a;').replace(
+            'assign y = a;', 'assign y = a + 1;'))
+        again, parser = self.parse(cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(again, after)
+
+    def test_define_changed(self):
+        cache = ParseCache(self.cachedir)
+        plain, parser = self.parse(cache)
+        inverted, parser = self.parse(cache, define=['INV'])
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertNotEqual(inverted, plain)
+        inverted_again, parser = self.parse(cache, define=['INV'])
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(inverted_again, inverted)
+
+    def test_key(self):
+        key = parse_key(source, ['inc'], ['A', 'B=1'], 'grammar')
+        self.assertEqual(key, parse_key(source, ['inc'], ['B=1', 'A'], 'grammar'))
+        self.assertNotEqual(key, parse_key(source, ['inc2'], ['A', 'B=1'], 'grammar'))
+        self.assertNotEqual(key, parse_key(source, ['inc'], ['A'], 'grammar'))
+        self.assertNotEqual(key, parse_key(source, ['inc'], ['A', 'B=1'], 'grammar2'))
+        self.assertNotEqual(key, parse_key(source + '\n', ['inc'], ['A', 'B=1'], 'grammar'))
+
+    def test_corrupt_entry(self):
+        cache = ParseCache(self.cachedir)
+        expected, parser = self.parse(cache)
+        path = self.entries()[0]
+        for data in (b'', b'not a cache entry', open(path, 'rb').read()[:20]):
+            f = open(path, 'wb')
+            f.write(data)
+            f.close()
+            cache = ParseCache(self.cachedir)
+            ast, parser = self.parse(cache)
+            self.assertEqual(ast, expected)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            # the entry is written again
+            ast, parser = self.parse(cache)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_clear(self):
+        cache = ParseCache(self.cachedir)
+        self.parse(cache)
+        cache.clear()
+        self.assertEqual(self.entries(), [])
+        self.parse(cache)
+        self.assertEqual(cache.misses, 2)
+        ParseCache(os.path.join(self.dirname, 'missing')).clear()
+
+if __name__ == '__main__':
+    unittest.main()
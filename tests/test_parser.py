@@ -0,0 +1,173 @@
+#-------------------------------------------------------------------------------
+# test_parser.py
+#
+# Behavior tests of the per-file parse of VerilogCodeParser: incremental
+# and parallel parses compared with a parse of the whole file list,
+# ModuleDefs kept for unchanged files and the changed module names
+#
+# Usage: python -m pytest tests/test_parser.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyverilog.vparser.parser import VerilogCodeParser
+from pyverilog.vparser.plyparser import ParseError
+
+files = {
+    'defs.v': '''\
+`define W 8
+module adder(input [`W-1:0] a, input [`W-1:0] b, output [`W-1:0] y);
+  assign y = a + b;
+endmodule
+''',
+    'sub.v': '''\
+module sub(input [7:0] a, input [7:0] b, output [7:0] y);
+  assign y = a - b;
+endmodule
+''',
+    'top.v': '''\
+module top(input [`W-1:0] a, input [`W-1:0] b, output [`W-1:0] s, output [7:0] d);
+  adder u0(.a(a), .b(b), .y(s));
+  sub u1(.a(a), .b(b), .y(d));
+endmodule
+''',
+    }
+
+order = ('defs.v', 'sub.v', 'top.v')
+
+class IncrementalParseTest(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        for name in order:
+            self.write(name, files[name])
+        self.filelist = [ os.path.join(self.dirname, name) for name in order ]
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def write(self, name, text):
+        f = open(os.path.join(self.dirname, name), 'w')
+        f.write(text)
+        f.close()
+
+    def whole(self):
+        parser = VerilogCodeParser(self.filelist, preprocess_engine='native')
+        return parser.parse()
+
+    def modules(self, ast):
+        return dict([ (d.name, d) for d in ast.description.definitions ])
+
+    def test_same_as_whole(self):
+        parser = VerilogCodeParser(self.filelist, preprocess_engine='native', incremental=True)
+        ast = parser.parse()
+        self.assertEqual(ast.description.definitions, self.whole().description.definitions)
+        self.assertEqual(parser.get_changed_modules(), ('adder', 'sub', 'top'))
+
+    def test_reparse(self):
+        parser = VerilogCodeParser(self.filelist, preprocess_engine='native', incremental=True)
+        before = self.modules(parser.parse())
+        again = self.modules(parser.parse())
+        self.assertEqual(parser.get_changed_modules(), ())
+        for name in before:
+            self.assertTrue(again[name] is before[name], name)
+
+        self.write('sub.v', files['sub.v'].replace('a - b', 'b - a'))
+        after = self.modules(parser.parse())
+        self.assertEqual(parser.get_changed_modules(), ('sub',))
+        self.assertTrue(after['adder'] is before['adder'])
+        self.assertTrue(after['top'] is before['top'])
+        self.assertNotEqual(after['sub'], before['sub'])
+        self.assertEqual(after, self.modules(self.whole()))
+
+    def test_macro_changed(self):
+        # a macro changed in an earlier file changes the text of a later one
+        parser = VerilogCodeParser(self.filelist, preprocess_engine='native', incremental=True)
+        before = self.modules(parser.parse())
+        self.write('defs.v', files['defs.v'].replace('`define W 8', '`define W 16'))
+        after = self.modules(parser.parse())
+        self.assertEqual(parser.get_changed_modules(), ('adder', 'top'))
+        self.assertTrue(after['sub'] is before['sub'])
+        self.assertEqual(after, self.modules(self.whole()))
+
+    def test_module_added_and_removed(self):
+        parser = VerilogCodeParser(self.filelist, preprocess_engine='native', incremental=True)
+        parser.parse()
+        self.write('sub.v', files['sub.v'].replace('module sub(', 'module sub2(') +
+                   'module extra;\nendmodule\n')
+        parser.parse()
+        self.assertEqual(parser.get_changed_modules(), ('extra', 'sub', 'sub2'))
+        self.write('sub.v', '// empty\n')
+        ast = parser.parse()
+        self.assertEqual(parser.get_changed_modules(), ('extra', 'sub2'))
+        self.assertEqual(sorted(self.modules(ast).keys()), ['adder', 'top'])
+
+    def test_cache(self):
+        cachedir = os.path.join(self.dirname, 'cache')
+        first = VerilogCodeParser(self.filelist, preprocess_engine='native',
+                                  incremental=True, parse_cache=cachedir)
+        expected = first.parse()
+        self.assertEqual((first.parse_cache.hits, first.parse_cache.misses), (0, 3))
+        second = VerilogCodeParser(self.filelist, preprocess_engine='native',
+                                   incremental=True, parse_cache=cachedir)
+        self.assertEqual(second.parse(), expected)
+        self.assertEqual((second.parse_cache.hits, second.parse_cache.misses), (3, 0))
+
+    def test_requires_native(self):
+        self.assertRaises(ValueError, VerilogCodeParser, self.filelist,
+                          preprocess_engine='iverilog', incremental=True)
+        parser = VerilogCodeParser(self.filelist, preprocess_engine='iverilog')
+        self.assertRaises(ValueError, parser.preprocess_files)
+
+class ParallelParseTest(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filelist = []
+        for name in order:
+            path = os.path.join(self.dirname, name)
+            f = open(path, 'w')
+            f.write(files[name])
+            f.close()
+            self.filelist.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_same_as_serial(self):
+        serial = VerilogCodeParser(self.filelist, preprocess_engine='native')
+        expected = serial.parse()
+        parser = VerilogCodeParser(self.filelist, preprocess_engine='native', parse_jobs=2)
+        ast = parser.parse()
+        self.assertEqual(ast.description.definitions, expected.description.definitions)
+        self.assertEqual(parser.get_directives(), serial.get_directives())
+
+    def test_error_location(self):
+        # a worker reports a syntax error at its location in the original file
+        f = open(self.filelist[1], 'w')
+        f.write(files['sub.v'].replace('a - b;', 'a - ;'))
+        f.close()
+        parser = VerilogCodeParser(self.filelist, preprocess_engine='native', parse_jobs=2)
+        try:
+            parser.parse()
+        except ParseError as e:
+            message = str(e)
+        else:
+            self.fail('ParseError not raised')
+        self.assertTrue('sub.v:2:' in message, message)
+
+    def test_single_file(self):
+        parser = VerilogCodeParser(self.filelist[1:2], preprocess_engine='native', parse_jobs=4)
+        self.assertEqual([ d.name for d in parser.parse().description.definitions ], ['sub'])
+
+    def test_requires_native(self):
+        self.assertRaises(ValueError, VerilogCodeParser, self.filelist,
+                          preprocess_engine='iverilog', parse_jobs=2)
+
+if __name__ == '__main__':
+    unittest.main()
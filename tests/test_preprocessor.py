@@ -0,0 +1,259 @@
+#-------------------------------------------------------------------------------
+# test_preprocessor.py
+#
+# Behavior tests of VerilogNativePreprocessor: output and origin line mapping
+# on nested conditionals, macros with arguments and includes, compared with
+# Icarus Verilog (iverilog -E) when it is installed
+#
+# Usage: python -m pytest tests/test_preprocessor.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import re
+import shutil
+import tempfile
+import subprocess
+import unittest
+
+from pyverilog.vparser.preprocessor import VerilogNativePreprocessor, PreprocessorError
+from pyverilog.vparser.parser import VerilogCodeParser
+from pyverilog.vparser.plyparser import ParseError
+
+def find_iverilog():
+    for d in os.environ.get('PATH', '').split(os.pathsep):
+        path = os.path.join(d, 'iverilog')
+        if os.path.isfile(path) and os.access(path, os.X_OK): return path
+    return None
+
+iverilog = find_iverilog()
+
+# tokens of a preprocessed text: whitespace and `line directives are ignored
+token = re.compile(r'[A-Za-z_][A-Za-z0-9_$]*|\d+|"(?:\\.|[^"\\])*"|\S')
+
+def tokens(text):
+    lines = [ line for line in text.split('\n') if not line.strip().startswith('`line') ]
+    return token.findall('\n'.join(lines))
+
+conditional = '''\
+`define A
+module top;
+`ifdef A
+  `ifdef B
+  wire ab;
+  `elsif A
+    `ifndef C
+  wire a_not_b_not_c;
+    `else
+  wire a_not_b_c;
+    `endif
+  `else
+  wire a_only;
+  `endif
+`elsif B
+  wire b_only;
+`else
+  wire none;
+`endif
+endmodule
+'''
+
+macro = '''\
+`define W 8
+`define ADD(x, y) ((x) + (y))
+`define MUX(s, a, b) ((s) ? (a) : `ADD(a, b))
+`define REG(name, width) reg [width-1:0] name
+module top;
+  `REG(r, `W);
+  wire [`W-1:0] w = `MUX(sel, {a, b}, f(c, d));
+`undef W
+`ifdef W
+  wire undefined;
+`endif
+endmodule
+'''
+
+multiline = '''\
+`define SUM(a, b, c) \\
+  ((a) + \\
+   (b) + \\
+   (c))
+module top;
+  wire [7:0] s = `SUM(x, y, z);
+  wire after_macro;
+`include "inc.vh"
+  wire after_include;
+endmodule
+'''
+
+header = '''\
+`define INC_W 4
+wire [`INC_W-1:0] from_include;
+`include "nested.vh"
+'''
+
+nested = '''\
+wire from_nested;
+'''
+
+class VerilogNativePreprocessorTest(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.incdir = os.path.join(self.dirname, 'include')
+        os.mkdir(self.incdir)
+        self.write('inc.vh', header)
+        self.write(os.path.join('include', 'nested.vh'), nested)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def write(self, name, text):
+        path = os.path.join(self.dirname, name)
+        f = open(path, 'w')
+        f.write(text)
+        f.close()
+        return path
+
+    def preprocess(self, filelist, define=None):
+        pre = VerilogNativePreprocessor(filelist, include=[self.incdir], define=define)
+        text = pre.preprocess()
+        return text, pre
+
+    def lines(self, text):
+        return [ line.strip() for line in text.split('\n') if line.strip() ]
+
+    def iverilog(self, filelist, define=None):
+        output = os.path.join(self.dirname, 'iverilog.out')
+        cmd = [iverilog, '-E', '-o', output, '-I', self.incdir]
+        for d in define or ():
+            cmd.append('-D' + d)
+        subprocess.check_call(cmd + filelist)
+        f = open(output)
+        text = f.read()
+        f.close()
+        return text
+
+    def assertSameAsIverilog(self, filelist, define=None):
+        if iverilog is None: self.skipTest('iverilog is not installed')
+        text, pre = self.preprocess(filelist, define)
+        self.assertEqual(tokens(text), tokens(self.iverilog(filelist, define)))
+
+    def assertLineStructure(self, filelist, text, pre):
+        # one origin per output line, in order within each file
+        self.assertEqual(len(pre.origin), text.count('\n'))
+        last = {}
+        for filename, lineno in pre.origin:
+            self.assertEqual(lineno, last.get(filename, 0) + 1)
+            last[filename] = lineno
+
+    ############################################################################
+    def test_conditional(self):
+        filename = self.write('top.v', conditional)
+        text, pre = self.preprocess([filename])
+        self.assertEqual(self.lines(text), ['module top;', 'wire a_not_b_not_c;', 'endmodule'])
+        self.assertEqual(pre.get_origin(8), (filename, 8))
+        self.assertLineStructure([filename], text, pre)
+
+    def test_conditional_define(self):
+        filename = self.write('top.v', conditional)
+        text, pre = self.preprocess([filename], define=['B', 'C=1'])
+        self.assertEqual(self.lines(text), ['module top;', 'wire ab;', 'endmodule'])
+        text, pre = self.preprocess([filename], define=['C'])
+        self.assertEqual(self.lines(text), ['module top;', 'wire a_not_b_c;', 'endmodule'])
+
+    def test_conditional_iverilog(self):
+        filename = self.write('top.v', conditional)
+        self.assertSameAsIverilog([filename])
+        self.assertSameAsIverilog([filename], define=['B'])
+        self.assertSameAsIverilog([filename], define=['C'])
+
+    def test_unterminated_conditional(self):
+        filename = self.write('top.v', '`ifdef A\nwire a;\n')
+        self.assertRaises(PreprocessorError, self.preprocess, [filename])
+
+    def test_macro(self):
+        filename = self.write('top.v', macro)
+        text, pre = self.preprocess([filename])
+        self.assertEqual(tokens(text), tokens(
+            'module top; reg [8-1:0] r; '
+            'wire [8-1:0] w = ((sel) ? ({a, b}) : (({a, b}) + (f(c, d)))); '
+            'endmodule'))
+        self.assertEqual(pre.get_origin(7), (filename, 7))
+        self.assertLineStructure([filename], text, pre)
+
+    def test_macro_iverilog(self):
+        filename = self.write('top.v', macro)
+        self.assertSameAsIverilog([filename])
+
+    def test_macro_arguments(self):
+        filename = self.write('top.v', '`define ADD(x, y) ((x) + (y))\nwire w = `ADD(a);\n')
+        self.assertRaises(PreprocessorError, self.preprocess, [filename])
+        filename = self.write('top.v', 'wire w = `UNDEFINED;\n')
+        self.assertRaises(PreprocessorError, self.preprocess, [filename])
+
+    def test_multiline_macro_origin(self):
+        filename = self.write('top.v', multiline)
+        text, pre = self.preprocess([filename])
+        lines = text.split('\n')
+        self.assertEqual(tokens(lines[5]), tokens('wire [7:0] s = ((x) + (y) + (z));'))
+        # the continuation lines of the `define are kept as empty lines
+        self.assertEqual(pre.get_origin(6), (filename, 6))
+        self.assertEqual(lines[6].strip(), 'wire after_macro;')
+        self.assertEqual(pre.get_origin(7), (filename, 7))
+        self.assertLineStructure([filename], text, pre)
+
+    def test_include_origin(self):
+        filename = self.write('top.v', multiline)
+        incname = os.path.join(self.dirname, 'inc.vh')
+        nestedname = os.path.join(self.incdir, 'nested.vh')
+        text, pre = self.preprocess([filename])
+        lines = text.split('\n')
+        found = dict([ (line.strip(), pre.get_origin(i+1))
+                       for i, line in enumerate(lines) if line.strip() ])
+        self.assertEqual(found['wire [4-1:0] from_include;'], (incname, 2))
+        self.assertEqual(found['wire from_nested;'], (nestedname, 1))
+        self.assertEqual(found['wire after_include;'], (filename, 9))
+        self.assertEqual(found['endmodule'], (filename, 10))
+        self.assertEqual(pre.dependencies, [filename, incname, nestedname])
+        self.assertLineStructure([filename], text, pre)
+
+    def test_include_iverilog(self):
+        filename = self.write('top.v', multiline)
+        self.assertSameAsIverilog([filename])
+
+    def test_include_not_found(self):
+        filename = self.write('top.v', '`include "missing.vh"\n')
+        self.assertRaises(PreprocessorError, self.preprocess, [filename])
+
+    def test_files(self):
+        first = self.write('first.v', '`define FIRST 1\nmodule first;\nendmodule\n')
+        second = self.write('second.v', 'module second;\nwire [`FIRST:0] w;\nendmodule\n')
+        pre = VerilogNativePreprocessor([first, second])
+        files = pre.preprocess_files()
+        self.assertEqual([ f for f, text, origin in files ], [first, second])
+        self.assertEqual(self.lines(files[1][1]), ['module second;', 'wire [1:0] w;', 'endmodule'])
+        self.assertEqual(files[1][2], [(second, 1), (second, 2), (second, 3)])
+        text, pre = self.preprocess([first, second])
+        self.assertEqual(text, ''.join([ text for f, text, origin in files ]))
+
+    def test_files_iverilog(self):
+        first = self.write('first.v', '`define FIRST 1\nmodule first;\nendmodule\n')
+        second = self.write('second.v', 'module second;\nwire [`FIRST:0] w;\nendmodule\n')
+        self.assertSameAsIverilog([first, second])
+
+    def test_parse_error_origin(self):
+        filename = self.write('top.v', multiline.replace('wire after_include;', 'wire after_include'))
+        parser = VerilogCodeParser([filename], preprocess_include=[self.incdir],
+                                   preprocess_engine='native')
+        try:
+            parser.parse()
+        except ParseError as e:
+            self.assertTrue(str(e).startswith('%s:10:' % filename), str(e))
+        else:
+            self.fail('ParseError not raised')
+
+if __name__ == '__main__':
+    unittest.main()
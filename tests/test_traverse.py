@@ -0,0 +1,164 @@
+#-------------------------------------------------------------------------------
+# test_traverse.py
+#
+# Behavior tests of the DFNode tree traversals with an explicit stack
+# (traverse.rewrite, iterate and mapLeaves) and of the passes on them on a
+# DFBranch chain deeper than the recursion limit
+#
+# Usage: python -m pytest tests/test_traverse.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import unittest
+
+import pyverilog.dataflow.traverse as traverse
+import pyverilog.dataflow.reorder as reorder
+import pyverilog.dataflow.replace as replace
+from pyverilog.dataflow.dataflow import *
+from pyverilog.utils.scope import ScopeLabel, ScopeChain
+
+def name(signal):
+    return ScopeChain([ScopeLabel('TOP', 'module'), ScopeLabel(signal, 'signal')])
+
+def terminal(signal):
+    return DFTerminal(name(signal))
+
+def chain(depth, leaf=None):
+    """ if/else-if chain of depth DFBranch nodes: c0 ? 0 : c1 ? 1 : ... """
+    tree = leaf
+    for i in reversed(range(depth)):
+        tree = DFBranch(terminal('c%d' % i), DFIntConst(str(i)), tree)
+    return tree
+
+def branches(tree):
+    ret = []
+    while isinstance(tree, DFBranch):
+        ret.append(tree)
+        tree = tree.falsenode
+    return ret, tree
+
+class RewriteTest(unittest.TestCase):
+    def test_post_order(self):
+        a, b = terminal('a'), terminal('b')
+        tree = DFOperator((DFOperator((a, b), 'Plus'), DFIntConst('1')), 'Minus')
+        order = []
+        def visit(node, children):
+            order.append(node)
+            return node.replaceChildren(children)
+        self.assertTrue(traverse.rewrite(tree, visit) is tree)
+        self.assertEqual([ node.tostr() for node in order ],
+                         [ a.tostr(), b.tostr(), tree.nextnodes[0].tostr(),
+                           '(IntConst 1)', tree.tostr() ])
+
+    def test_enter(self):
+        a, b = terminal('a'), terminal('b')
+        tree = DFBranch(a, DFOperator((a, b), 'Plus'), None)
+        def enter(node):
+            if node is None: return DFUndefined(8)
+            if isinstance(node, DFTerminal): return DFIntConst(node.name.getSignalName())
+            return None
+        def visit(node, children):
+            return node.replaceChildren(children)
+        result = traverse.rewrite(tree, visit, enter)
+        self.assertEqual(result.tostr(),
+                         '(Branch Cond:(IntConst a) True:(Operator Plus Next:'
+                         '(IntConst a),(IntConst b)) False:8\'dx)')
+        # a pruned node is not visited
+        visited = []
+        def prune(node):
+            if isinstance(node, DFOperator): return node
+            return None
+        def record(node, children):
+            visited.append(node)
+            return node.replaceChildren(children)
+        traverse.rewrite(tree, record, prune)
+        self.assertEqual([ node.tostr() for node in visited ], [ a.tostr(), tree.tostr() ])
+
+    def test_shared_node(self):
+        shared = DFOperator((terminal('a'), terminal('b')), 'Plus')
+        tree = DFConcat((shared, DFOperator((shared,), 'Unot'), shared))
+        count = []
+        def visit(node, children):
+            if node is shared: count.append(node)
+            return DFConcat(tuple(children)) if isinstance(node, DFConcat) else node.replaceChildren(children)
+        result = traverse.rewrite(tree, visit)
+        self.assertEqual(len(count), 1)
+        self.assertTrue(result.nextnodes[0] is result.nextnodes[2])
+        self.assertTrue(result.nextnodes[1].nextnodes[0] is result.nextnodes[0])
+
+    def test_none(self):
+        self.assertEqual(traverse.rewrite(None, None), None)
+        self.assertEqual(traverse.rewrite(None, None, lambda node: 'leaf'), 'leaf')
+
+class IterateTest(unittest.TestCase):
+    def test_pre_order(self):
+        a, b = terminal('a'), terminal('b')
+        inner = DFOperator((a, b), 'Plus')
+        tree = DFBranch(a, inner, None)
+        self.assertEqual([ node for node in traverse.iterate(tree) ], [tree, a, inner, b])
+
+    def test_shared_node(self):
+        shared = DFOperator((terminal('a'), terminal('b')), 'Plus')
+        tree = DFConcat((shared, shared, DFOperator((shared,), 'Unot')))
+        nodes = list(traverse.iterate(tree))
+        self.assertEqual(len(nodes), 5)
+        self.assertEqual(len(set([ id(node) for node in nodes ])), 5)
+
+class MapLeavesTest(unittest.TestCase):
+    def test_branch(self):
+        inner = DFBranch(terminal('d'), terminal('x'), None)
+        tree = DFBranch(terminal('c'), inner, terminal('y'))
+        result = traverse.mapLeaves(tree, lambda n: DFPointer(n, terminal('p')) if n is not None else None)
+        self.assertEqual(result.tostr(),
+                         '(Branch Cond:(Terminal TOP.c) True:(Branch Cond:(Terminal TOP.d) '
+                         'True:(Pointer Var:(Terminal TOP.x) PTR:(Terminal TOP.p))) '
+                         'False:(Pointer Var:(Terminal TOP.y) PTR:(Terminal TOP.p)))')
+        # the conditions are not mapped
+        self.assertTrue(result.condnode is tree.condnode)
+        self.assertTrue(result.truenode.condnode is inner.condnode)
+
+    def test_not_branch(self):
+        leaf = terminal('x')
+        self.assertTrue(traverse.mapLeaves(leaf, lambda n: n) is leaf)
+        self.assertEqual(traverse.mapLeaves(leaf, lambda n: DFIntConst('0')).tostr(), '(IntConst 0)')
+
+class DeepChainTest(unittest.TestCase):
+    depth = 5000
+
+    def setUp(self):
+        self.limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(1000)
+
+    def tearDown(self):
+        sys.setrecursionlimit(self.limit)
+
+    def test_rewrite(self):
+        tree = chain(self.depth, terminal('x'))
+        identity = traverse.rewrite(tree, lambda node, children: node.replaceChildren(children))
+        self.assertTrue(identity is tree)
+        nodes = list(traverse.iterate(tree))
+        self.assertEqual(len(nodes), self.depth * 3 + 1)
+
+    def test_replace_undefined(self):
+        tree = chain(self.depth)
+        result = replace.replaceUndefined(tree, name('dest'))
+        found, leaf = branches(result)
+        self.assertEqual(len(found), self.depth)
+        self.assertEqual(leaf.tostr(), '(Terminal TOP.dest)')
+
+    def test_reorder_pointer(self):
+        # a DFBranch pointer is moved out of the DFPointer
+        tree = DFPointer(terminal('mem'), chain(self.depth, terminal('x')))
+        result = reorder.reorder(tree)
+        found, leaf = branches(result)
+        self.assertEqual(len(found), self.depth)
+        self.assertEqual(leaf.tostr(), '(Pointer Var:(Terminal TOP.mem) PTR:(Terminal TOP.x))')
+        self.assertEqual(found[1].truenode.tostr(),
+                         '(Pointer Var:(Terminal TOP.mem) PTR:(IntConst 1))')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#-------------------------------------------------------------------------------
+# test_walker.py
+#
+# Behavior tests of VerilogDataflowWalker: the walk cache compared with an
+# uncached walk, on combinational loops and registers, for different visited
+# sets and through the default visited argument
+#
+# Usage: python -m pytest tests/test_walker.py
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+import pyverilog.utils.util as util
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+from pyverilog.dataflow.walker import VerilogDataflowWalker
+
+design = '''\
+module TOP(input CLK, input RST, input [7:0] x, input [7:0] y,
+           output [7:0] o, output reg [7:0] r);
+  wire [7:0] a = b & x;
+  wire [7:0] b = c | y;
+  wire [7:0] c = a ^ b;
+  wire [7:0] d = a + c;
+  reg [7:0] s;
+  always @(posedge CLK) begin
+    if (RST) begin
+      r <= 0;
+      s <= 0;
+    end else begin
+      r <= d + s;
+      s <= r - a;
+    end
+  end
+  assign o = r ^ d;
+endmodule
+'''
+
+signals = ('a', 'b', 'c', 'd', 'o', 'r', 's')
+
+# walker without the walk cache
+class UncachedWalker(VerilogDataflowWalker):
+    def walkTerminal(self, termname, visited, nptr, nextstep, delay):
+        return self.walkTree(self.getTree(termname, nptr),
+                             visited|set([termname,]), nextstep, delay)
+
+class WalkCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        filename = os.path.join(self.dirname, 'top.v')
+        f = open(filename, 'w')
+        f.write(design)
+        f.close()
+        analyzer = VerilogDataflowAnalyzer([filename], 'TOP', preprocess_engine='native')
+        analyzer.generate()
+        optimizer = VerilogDataflowOptimizer(analyzer.getTerms(), analyzer.getBinddict())
+        optimizer.resolveConstant()
+        self.args = ('TOP', analyzer.getTerms(), analyzer.getBinddict(),
+                     optimizer.getResolvedTerms(), optimizer.getResolvedBinddict(),
+                     optimizer.getConstlist())
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def name(self, signal):
+        return util.toTermname('TOP.' + signal)
+
+    def test_same_as_uncached(self):
+        walker = VerilogDataflowWalker(*self.args)
+        for step in (0, 1, 2):
+            for signal in signals:
+                expected = UncachedWalker(*self.args).walkBind('TOP.' + signal, step=step)
+                self.assertEqual(walker.walkBind('TOP.' + signal, step=step).tocode(),
+                                 expected.tocode(), (signal, step))
+        self.assertTrue(walker.getWalkCacheStats()['hits'] > 0)
+
+    def test_visited(self):
+        # a cached expansion is not reused for a visited set which cuts it
+        # differently
+        walker = VerilogDataflowWalker(*self.args)
+        for first in signals:
+            for signal in signals:
+                for visited in (set(), set([self.name(first)])):
+                    expected = UncachedWalker(*self.args)
+                    expected = expected.walkTree(expected.getTree(self.name(signal)),
+                                                 visited=set(visited), step=1)
+                    tree = walker.walkTree(walker.getTree(self.name(signal)),
+                                           visited=visited, step=1)
+                    self.assertEqual(tree.tocode(), expected.tocode(), (first, signal))
+
+    def test_default_visited(self):
+        walker = VerilogDataflowWalker(*self.args)
+        tree = walker.getTree(self.name('d'))
+        expected = UncachedWalker(*self.args).walkTree(tree, visited=set()).tocode()
+        self.assertEqual(walker.walkTree(tree).tocode(), expected)
+        self.assertEqual(walker.walkTree(tree).tocode(), expected)
+        walker = VerilogDataflowWalker(*self.args)
+        self.assertEqual(walker.walkTree(tree).tocode(), expected)
+        self.assertEqual(walker.walkTree(tree).tocode(), expected)
+
+    def test_caller_visited(self):
+        walker = VerilogDataflowWalker(*self.args)
+        visited = set([self.name('c')])
+        walker.walkTree(walker.getTree(self.name('d')), visited=visited, step=1)
+        self.assertEqual(visited, set([self.name('c')]))
+
+if __name__ == '__main__':
+    unittest.main()
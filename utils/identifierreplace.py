@@ -25,6 +25,7 @@ def ischild(node, attr):
     if attr in excludes: return False
     attr_names = getattr(node, 'attr_names')
     if attr in attr_names: return False
+    if not hasattr(node, attr): return False # unused slot of a base class
     attr_test = getattr(node, attr)
     if hasattr(attr_test, '__call__'): return False
     return True
@@ -10,7 +10,9 @@ from __future__ import absolute_import
 from __future__ import print_function
 import sys
 import os
-import copy
+import weakref
+
+import pyverilog.utils.verror as verror
 
 scopetype_list_unprint = ('generate', 'always', 'function', #'functioncall',
                           'task', 'taskcall', 'initial', 'for', 'while', 'if')
@@ -21,7 +23,7 @@ class ScopeLabel(object):
     def __init__(self, scopename, scopetype='any', scopeloop=None):
         self.scopename = scopename
         if scopetype not in scopetype_list:
-            raise DefinitionError('No such Scope type')
+            raise verror.DefinitionError('No such Scope type')
         self.scopetype = scopetype
         self.scopeloop = scopeloop
     def __repr__(self):
@@ -50,24 +52,73 @@ class ScopeLabel(object):
         return self.scopetype in (scopetype_list_print + ('any',))
 
 class ScopeChain(object):
-    def __init__(self, scopechain=None):
-        self.scopechain = []
+    """ Immutable scope path. A chain is its parent chain plus the last
+        label, so chains with a common prefix share it. Chains are interned:
+        building the same labels (with the same scope types) again returns
+        the same object while it is alive. Hash, repr and tocode() are
+        computed once per chain. """
+    __slots__ = ('parent', 'label', 'length', '_hash', '_repr', '_code',
+                 '_children', '__weakref__')
+    _empty = None
+
+    def __new__(cls, scopechain=None):
+        chain = ScopeChain._empty
+        if chain is None:
+            chain = object.__new__(cls)
+            chain.parent = None
+            chain.label = None
+            chain.length = 0
+            chain._hash = hash(())
+            chain._repr = ''
+            chain._code = ''
+            chain._children = None
+            ScopeChain._empty = chain
         if scopechain is not None:
-            self.scopechain = scopechain
+            for label in scopechain:
+                chain = chain._child(label)
+        return chain
+
+    def _child(self, label):
+        key = (label.scopename, label.scopetype, label.scopeloop)
+        if self._children is None:
+            self._children = weakref.WeakValueDictionary()
+        chain = self._children.get(key)
+        if chain is not None:
+            return chain
+        chain = object.__new__(ScopeChain)
+        chain.parent = self
+        chain.label = label
+        chain.length = self.length + 1
+        chain._hash = hash((self._hash, label))
+        chain._repr = None
+        chain._code = None
+        chain._children = None
+        self._children[key] = chain
+        return chain
+
     def __add__(self, r):
-        new_chain = copy.deepcopy(self)
         if isinstance(r, ScopeLabel):
-            new_chain.append(r)
-        elif isinstance(r, ScopeChain):
-            new_chain.extend(r.scopechain)
-        else:
-            raise verror.DefinitionError('Can not add %s' % str(r))
-        return new_chain
-    def append(self, r):
-        self.scopechain.append(r)
-    def extend(self, r):
-        self.scopechain.extend(r)
+            return self._child(r)
+        if isinstance(r, ScopeChain):
+            new_chain = self
+            for label in r:
+                new_chain = new_chain._child(label)
+            return new_chain
+        raise verror.DefinitionError('Can not add %s' % str(r))
+
+    @property
+    def scopechain(self):
+        ret = []
+        chain = self
+        while chain.length > 0:
+            ret.append(chain.label)
+            chain = chain.parent
+        ret.reverse()
+        return ret
+
     def tocode(self):
+        if self._code is not None:
+            return self._code
         ret = []
         it = None
         for scope in self.scopechain:
@@ -87,36 +138,54 @@ class ScopeChain(object):
             else:
                 it = None
         ret = ret[:-1]
-        return ''.join(ret)
+        self._code = ''.join(ret)
+        return self._code
     def get_module_list(self):
         return [scope for scope in self.scopechain if scope.scopetype == 'module']
     def __repr__(self):
-        ret = ''
-        for scope in self.scopechain:
-            l = scope.__repr__()
-            ret += l + '.'
-        ret = ret[:-1]
-        return ret
+        if self._repr is None:
+            if self.parent.length == 0:
+                self._repr = self.label.__repr__()
+            else:
+                self._repr = self.parent.__repr__() + '.' + self.label.__repr__()
+        return self._repr
     def __len__(self):
-        return len(self.scopechain)
+        return self.length
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
-        return self.scopechain == other.scopechain
+        if self.length != other.length or self._hash != other._hash: return False
+        while self is not other:
+            if self.label != other.label: return False
+            self = self.parent
+            other = other.parent
+        return True
     def __ne__(self, other):
         return not self.__eq__(other)
     def __hash__(self):
-        return hash(tuple(self.scopechain))
+        return self._hash
     def __getitem__(self, key):
         if isinstance(key, slice):
-            indices = key.indices(len(self))
-            return ScopeChain([self.scopechain[x] for x in range(*indices)])
+            start, stop, step = key.indices(self.length)
+            if start == 0 and step == 1:
+                chain = self
+                for i in range(self.length - max(stop, 0)):
+                    chain = chain.parent
+                return chain
+            return ScopeChain([self.scopechain[x] for x in range(start, stop, step)])
+        if key == -1 and self.length > 0:
+            return self.label
         return self.scopechain[key]
     def __iter__(self):
-        for scope in self.scopechain:
-            yield scope
+        return iter(self.scopechain)
 
-    def pop(self):
-        del self.scopechain[-1]
+    # immutable: copies are the chain itself
+    def __copy__(self):
+        return self
+    def __deepcopy__(self, memo):
+        return self
+    def __reduce__(self):
+        return (ScopeChain, (self.scopechain,))
 
     def getSignalName(self):
-        return str(self.scopechain[-1])
+        return str(self[-1])
@@ -14,6 +14,7 @@ import re
 
 class Node(object):
     '''Abstact class for every element in parser'''
+    __slots__ = ('lineno',)
     
     def children(self):
         pass
@@ -37,12 +38,15 @@ class Node(object):
             c.show(buf, offset + indent, attrnames, showlineno)
             
     def __eq__(self, other):
+        if self is other: return True
         if type(self) != type(other): return False
         self_attrs = tuple( [ getattr(self, a) for a in self.attr_names ] )
         other_attrs = tuple( [ getattr(other, a) for a in other.attr_names ] )
         if self_attrs != other_attrs: return False
+        children = self.children()
         other_children = other.children()
-        for i, c in enumerate(self.children()):
+        if len(children) != len(other_children): return False
+        for i, c in enumerate(children):
             if c != other_children[i]: return False
         return True
     
@@ -54,21 +58,27 @@ class Node(object):
         c = hash(self.children())
         return hash((s, c))
 
-    def getIdentifiers(self, currentlist = []):
-        ret = currentlist
-        if(self.__class__.__name__=='Identifier'):
-            ret.append(self)
-        for c in self.children():
-            if(c.__class__.__name__ == 'Identifier'):
-                ret.append(c)
-            else:
-                ret=c.getIdentifiers(ret)
+    def getIdentifiers(self, currentlist=None):
+        ret = [] if currentlist is None else currentlist
+        ret.extend(self.iterIdentifiers())
         return ret
 
+    def iterIdentifiers(self):
+        ''' Yields the Identifier nodes of the subtree in pre-order
+            without descending into an Identifier '''
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.__class__ is Identifier:
+                yield node
+                continue
+            stack.extend(reversed(node.children()))
+
 
 
 ################################################################################
 class Source(Node):
+    __slots__ = ('name', 'description',)
     attr_names = ('name',)
     def __init__(self, name, description, lineno=0):
         self.lineno = lineno
@@ -80,6 +90,7 @@ class Source(Node):
         return tuple(nodelist)
 
 class Description(Node):
+    __slots__ = ('definitions',)
     attr_names = ()
     def __init__(self, definitions, lineno=0):
         self.lineno = lineno
@@ -90,6 +101,7 @@ class Description(Node):
         return tuple(nodelist)
 
 class ModuleDef(Node):
+    __slots__ = ('name', 'paramlist', 'portlist', 'items', 'default_nettype',)
     attr_names = ('name',)
     def __init__(self, name, paramlist, portlist, items, default_nettype='wire', lineno=0):
         self.lineno = lineno
@@ -106,6 +118,7 @@ class ModuleDef(Node):
         return tuple(nodelist)
 
 class Paramlist(Node):
+    __slots__ = ('params',)
     attr_names = ()
     def __init__(self, params, lineno=0):
         self.lineno = lineno
@@ -116,6 +129,7 @@ class Paramlist(Node):
         return tuple(nodelist)
 
 class Portlist(Node):
+    __slots__ = ('ports',)
     attr_names = ()
     def __init__(self, ports, lineno=0):
         self.lineno = lineno
@@ -126,6 +140,7 @@ class Portlist(Node):
         return tuple(nodelist)
 
 class Port(Node):
+    __slots__ = ('name', 'width', 'type',)
     attr_names = ('name','type',)
     def __init__(self, name, width, type, lineno=0):
         self.lineno = lineno
@@ -138,6 +153,7 @@ class Port(Node):
         return tuple(nodelist)
 
 class Width(Node):
+    __slots__ = ('msb', 'lsb',)
     attr_names = ()
     def __init__(self, msb, lsb, lineno=0):
         self.lineno = lineno
@@ -148,9 +164,10 @@ class Width(Node):
         if self.msb: nodelist.append(self.msb)
         if self.lsb: nodelist.append(self.lsb)
         return tuple(nodelist)
-class Length(Width): pass
+class Length(Width): __slots__ = ()
 
 class Identifier(Node):
+    __slots__ = ('name', 'scope',)
     attr_names = ('name',)
     def __init__(self, name, scope=None, lineno=0):
         self.lineno = lineno
@@ -166,6 +183,7 @@ class Identifier(Node):
         return self.scope.__repr__() + '.' + self.name
 
 class Value(Node):
+    __slots__ = ('value',)
     attr_names = ()
     def __init__(self, value, lineno=0):
         self.lineno = lineno
@@ -176,6 +194,7 @@ class Value(Node):
         return tuple(nodelist)
 
 class Constant(Value):
+    __slots__ = ()
     attr_names = ('value',)
     def __init__(self, value, lineno=0):
         self.lineno = lineno
@@ -186,11 +205,12 @@ class Constant(Value):
     def __repr__(self):
         return str(self.value)
 
-class IntConst(Constant): pass
-class FloatConst(Constant): pass
-class StringConst(Constant): pass
+class IntConst(Constant): __slots__ = ()
+class FloatConst(Constant): __slots__ = ()
+class StringConst(Constant): __slots__ = ()
 
 class Variable(Value):
+    __slots__ = ('name', 'width', 'signed',)
     attr_names = ('name', 'signed')
     def __init__(self, name, width=None, signed=False, lineno=0):
         self.lineno = lineno
@@ -202,13 +222,14 @@ class Variable(Value):
         if self.width: nodelist.append(self.width)
         return tuple(nodelist)
 
-class Input(Variable): pass
-class Output(Variable): pass
-class Inout(Variable): pass
-class Tri(Variable): pass
-class Wire(Variable): pass
-class Reg(Variable): pass
+class Input(Variable): __slots__ = ()
+class Output(Variable): __slots__ = ()
+class Inout(Variable): __slots__ = ()
+class Tri(Variable): __slots__ = ()
+class Wire(Variable): __slots__ = ()
+class Reg(Variable): __slots__ = ()
 class WireArray(Variable):
+    __slots__ = ('length',)
     attr_names = ('name', 'signed')
     def __init__(self, name, width, length, signed=False, lineno=0):
         self.lineno = lineno
@@ -222,6 +243,7 @@ class WireArray(Variable):
         if self.length: nodelist.append(self.length)
         return tuple(nodelist)
 class RegArray(Variable):
+    __slots__ = ('length',)
     attr_names = ('name', 'signed')
     def __init__(self, name, width, length, signed=False, lineno=0):
         self.lineno = lineno
@@ -234,11 +256,12 @@ class RegArray(Variable):
         if self.width: nodelist.append(self.width)
         if self.length: nodelist.append(self.length)
         return tuple(nodelist)
-class Integer(Variable): pass
-class Real(Variable): pass
-class Genvar(Variable): pass
+class Integer(Variable): __slots__ = ()
+class Real(Variable): __slots__ = ()
+class Genvar(Variable): __slots__ = ()
 
 class Ioport(Node):
+    __slots__ = ('first', 'second',)
     attr_names = ()
     def __init__(self, first, second=None, lineno=0):
         self.lineno = lineno
@@ -251,6 +274,7 @@ class Ioport(Node):
         return tuple(nodelist)
 
 class Parameter(Node):
+    __slots__ = ('name', 'value', 'width', 'signed',)
     attr_names = ('name', 'signed')
     def __init__(self, name, value, width=None, signed=False, lineno=0):
         self.lineno = lineno
@@ -263,10 +287,11 @@ class Parameter(Node):
         if self.value: nodelist.append(self.value)
         if self.width: nodelist.append(self.width)
         return tuple(nodelist)
-class Localparam(Parameter): pass
-class Supply(Parameter) : pass
+class Localparam(Parameter): __slots__ = ()
+class Supply(Parameter) : __slots__ = ()
 
 class Decl(Node):
+    __slots__ = ('list',)
     attr_names = ()
     def __init__(self, list, lineno=0):
         self.lineno = lineno
@@ -277,6 +302,7 @@ class Decl(Node):
         return tuple(nodelist)
 
 class Concat(Node):
+    __slots__ = ('list',)
     attr_names = ()
     def __init__(self, list, lineno=0):
         self.lineno = lineno
@@ -285,9 +311,10 @@ class Concat(Node):
         nodelist = []
         if self.list: nodelist.extend(self.list)
         return tuple(nodelist)
-class LConcat(Concat): pass
+class LConcat(Concat): __slots__ = ()
 
 class Repeat(Node):
+    __slots__ = ('value', 'times',)
     attr_names = ()
     def __init__(self, value, times, lineno=0):
         self.lineno = lineno
@@ -300,6 +327,7 @@ class Repeat(Node):
         return tuple(nodelist)
 
 class Partselect(Node):
+    __slots__ = ('var', 'msb', 'lsb',)
     attr_names = ()
     def __init__(self, var, msb, lsb, lineno=0):
         self.lineno = lineno
@@ -314,6 +342,7 @@ class Partselect(Node):
         return tuple(nodelist)
 
 class Pointer(Node):
+    __slots__ = ('var', 'ptr',)
     attr_names = ()
     def __init__(self, var, ptr, lineno=0):
         self.lineno = lineno
@@ -326,6 +355,7 @@ class Pointer(Node):
         return tuple(nodelist)
 
 class Lvalue(Node):
+    __slots__ = ('var',)
     attr_names = ()
     def __init__(self, var, lineno=0):
         self.lineno = lineno
@@ -336,6 +366,7 @@ class Lvalue(Node):
         return tuple(nodelist)
 
 class Rvalue(Node):
+    __slots__ = ('var',)
     attr_names = ()
     def __init__(self, var, lineno=0):
         self.lineno = lineno
@@ -347,6 +378,7 @@ class Rvalue(Node):
 
 ################################################################################
 class Operator(Node):
+    __slots__ = ('left', 'right',)
     attr_names = ()
     def __init__(self, left, right, lineno=0):
         self.lineno = lineno
@@ -364,6 +396,7 @@ class Operator(Node):
         return ret
 
 class UnaryOperator(Operator):
+    __slots__ = ()
     attr_names = ()
     def __init__(self, right, lineno=0):
         self.lineno = lineno
@@ -375,60 +408,61 @@ class UnaryOperator(Operator):
 
 ################################################################################
 # Level 1 (Highest Priority)
-class Uplus(UnaryOperator): pass
-class Uminus(UnaryOperator): pass
-class Ulnot(UnaryOperator): pass
-class Unot(UnaryOperator): pass
-class Uand(UnaryOperator): pass
-class Unand(UnaryOperator): pass
-class Uor(UnaryOperator): pass
-class Unor(UnaryOperator): pass
-class Uxor(UnaryOperator): pass
-class Uxnor(UnaryOperator): pass
+class Uplus(UnaryOperator): __slots__ = ()
+class Uminus(UnaryOperator): __slots__ = ()
+class Ulnot(UnaryOperator): __slots__ = ()
+class Unot(UnaryOperator): __slots__ = ()
+class Uand(UnaryOperator): __slots__ = ()
+class Unand(UnaryOperator): __slots__ = ()
+class Uor(UnaryOperator): __slots__ = ()
+class Unor(UnaryOperator): __slots__ = ()
+class Uxor(UnaryOperator): __slots__ = ()
+class Uxnor(UnaryOperator): __slots__ = ()
 ################################################################################
 # Level 2
-class Power(Operator): pass
-class Times(Operator): pass
-class Divide(Operator): pass
-class Mod(Operator): pass
+class Power(Operator): __slots__ = ()
+class Times(Operator): __slots__ = ()
+class Divide(Operator): __slots__ = ()
+class Mod(Operator): __slots__ = ()
 ################################################################################
 # Level 3
-class Plus(Operator): pass
-class Minus(Operator): pass
+class Plus(Operator): __slots__ = ()
+class Minus(Operator): __slots__ = ()
 ################################################################################
 # Level 4
-class Sll(Operator): pass
-class Srl(Operator): pass
-class Sra(Operator): pass
+class Sll(Operator): __slots__ = ()
+class Srl(Operator): __slots__ = ()
+class Sra(Operator): __slots__ = ()
 ################################################################################
 # Level 5
-class LessThan(Operator): pass
-class GreaterThan(Operator): pass
-class LessEq(Operator): pass
-class GreaterEq(Operator): pass
+class LessThan(Operator): __slots__ = ()
+class GreaterThan(Operator): __slots__ = ()
+class LessEq(Operator): __slots__ = ()
+class GreaterEq(Operator): __slots__ = ()
 ################################################################################
 # Level 6
-class Eq(Operator): pass
-class NotEq(Operator): pass
-class Eql(Operator): pass # ===
-class NotEql(Operator): pass # !==
+class Eq(Operator): __slots__ = ()
+class NotEq(Operator): __slots__ = ()
+class Eql(Operator): __slots__ = () # ===
+class NotEql(Operator): __slots__ = () # !==
 ################################################################################
 # Level 7
-class And(Operator): pass
-class Xor(Operator): pass
-class Xnor(Operator): pass
+class And(Operator): __slots__ = ()
+class Xor(Operator): __slots__ = ()
+class Xnor(Operator): __slots__ = ()
 ################################################################################
 # Level 8
-class Or(Operator): pass
+class Or(Operator): __slots__ = ()
 ################################################################################
 # Level 9
-class Land(Operator): pass
+class Land(Operator): __slots__ = ()
 ################################################################################
 # Level 10
-class Lor(Operator): pass
+class Lor(Operator): __slots__ = ()
 ################################################################################
 # Level 11
 class Cond(Operator):
+    __slots__ = ('cond', 'true_value', 'false_value',)
     attr_names = ()
     def __init__(self, cond, true_value, false_value, lineno=0):
         self.lineno = lineno
@@ -444,6 +478,7 @@ class Cond(Operator):
 
 ################################################################################
 class Assign(Node):
+    __slots__ = ('left', 'right', 'ldelay', 'rdelay',)
     attr_names = ()
     def __init__(self, left, right, ldelay=None, rdelay=None, lineno=0):
         self.lineno = lineno
@@ -460,6 +495,7 @@ class Assign(Node):
         return tuple(nodelist)
 
 class Always(Node):
+    __slots__ = ('sens_list', 'statement',)
     attr_names = ()
     def __init__(self, sens_list, statement, lineno=0):
         self.lineno = lineno
@@ -472,6 +508,7 @@ class Always(Node):
         return tuple(nodelist)
 
 class SensList(Node):
+    __slots__ = ('list',)
     attr_names = ()
     def __init__(self, list, lineno=0):
         self.lineno = lineno
@@ -482,6 +519,7 @@ class SensList(Node):
         return tuple(nodelist)
 
 class Sens(Node):
+    __slots__ = ('sig', 'type',)
     attr_names = ('type',)
     def __init__(self, sig, type='posedge', lineno=0):
         self.lineno = lineno
@@ -493,6 +531,7 @@ class Sens(Node):
         return tuple(nodelist)
 
 class Substitution(Node):
+    __slots__ = ('left', 'right', 'ldelay', 'rdelay',)
     attr_names = ()
     def __init__(self, left, right, ldelay=None, rdelay=None, lineno=0):
         self.lineno = lineno
@@ -507,10 +546,11 @@ class Substitution(Node):
         if self.ldelay: nodelist.append(self.ldelay)
         if self.rdelay: nodelist.append(self.rdelay)
         return tuple(nodelist)
-class BlockingSubstitution(Substitution): pass
-class NonblockingSubstitution(Substitution): pass
+class BlockingSubstitution(Substitution): __slots__ = ()
+class NonblockingSubstitution(Substitution): __slots__ = ()
 
 class IfStatement(Node):
+    __slots__ = ('cond', 'true_statement', 'false_statement',)
     attr_names = ()
     def __init__(self, cond, true_statement, false_statement, lineno=0):
         self.lineno = lineno
@@ -525,6 +565,7 @@ class IfStatement(Node):
         return tuple(nodelist)
 
 class ForStatement(Node):
+    __slots__ = ('pre', 'cond', 'post', 'statement',)
     attr_names = ()
     def __init__(self, pre, cond, post, statement, lineno=0):
         self.lineno = lineno
@@ -541,6 +582,7 @@ class ForStatement(Node):
         return tuple(nodelist)
 
 class WhileStatement(Node):
+    __slots__ = ('cond', 'statement',)
     attr_names = ()
     def __init__(self, cond, statement, lineno=0):
         self.lineno = lineno
@@ -553,6 +595,7 @@ class WhileStatement(Node):
         return tuple(nodelist)
 
 class CaseStatement(Node):
+    __slots__ = ('comp', 'caselist',)
     attr_names = ()
     def __init__(self, comp, caselist, lineno=0):
         self.lineno = lineno
@@ -564,10 +607,11 @@ class CaseStatement(Node):
         if self.caselist: nodelist.extend(self.caselist)
         return tuple(nodelist)
 
-class CasexStatement(CaseStatement): pass
-class CasezStatement(CaseStatement): pass
+class CasexStatement(CaseStatement): __slots__ = ()
+class CasezStatement(CaseStatement): __slots__ = ()
 
 class Case(Node):
+    __slots__ = ('cond', 'statement',)
     attr_names = ()
     def __init__(self, cond, statement, lineno=0):
         self.lineno = lineno
@@ -580,6 +624,7 @@ class Case(Node):
         return tuple(nodelist)
 
 class Block(Node):
+    __slots__ = ('statements', 'scope',)
     attr_names = ('scope',)
     def __init__(self, statements, scope=None, lineno=0):
         self.lineno = lineno
@@ -591,6 +636,7 @@ class Block(Node):
         return tuple(nodelist)
 
 class Initial(Node):
+    __slots__ = ('statement',)
     attr_names = ()
     def __init__(self, statement, lineno=0):
         self.lineno = lineno
@@ -601,6 +647,7 @@ class Initial(Node):
         return tuple(nodelist)
 
 class EventStatement(Node):
+    __slots__ = ('senslist',)
     attr_names = ()
     def __init__(self, senslist, lineno=0):
         self.lineno = lineno
@@ -611,6 +658,7 @@ class EventStatement(Node):
         return tuple(nodelist)
 
 class WaitStatement(Node):
+    __slots__ = ('cond', 'statement',)
     attr_names = ()
     def __init__(self, cond, statement, lineno=0):
         self.lineno = lineno
@@ -623,6 +671,7 @@ class WaitStatement(Node):
         return tuple(nodelist)
 
 class ForeverStatement(Node):
+    __slots__ = ('statement',)
     attr_names = ()
     def __init__(self, statement, lineno=0):
         self.lineno = lineno
@@ -633,6 +682,7 @@ class ForeverStatement(Node):
         return tuple(nodelist)
 
 class DelayStatement(Node):
+    __slots__ = ('delay',)
     attr_names = ()
     def __init__(self, delay, lineno=0):
         self.lineno = lineno
@@ -643,6 +693,7 @@ class DelayStatement(Node):
         return tuple(nodelist)
 
 class InstanceList(Node):
+    __slots__ = ('module', 'parameterlist', 'instances',)
     attr_names = ('module',)
     def __init__(self, module, parameterlist, instances, lineno=0):
         self.lineno = lineno
@@ -656,6 +707,7 @@ class InstanceList(Node):
         return tuple(nodelist)
 
 class Instance(Node):
+    __slots__ = ('module', 'name', 'portlist', 'parameterlist', 'array',)
     attr_names = ('name', 'module')
     def __init__(self, module, name, portlist, parameterlist, array=None, lineno=0):
         self.lineno = lineno
@@ -672,6 +724,7 @@ class Instance(Node):
         return tuple(nodelist)
 
 class ParamArg(Node):
+    __slots__ = ('paramname', 'argname',)
     attr_names = ('paramname',)
     def __init__(self, paramname, argname, lineno=0):
         self.lineno = lineno
@@ -683,6 +736,7 @@ class ParamArg(Node):
         return tuple(nodelist)
 
 class PortArg(Node):
+    __slots__ = ('portname', 'argname',)
     attr_names = ('portname',)
     def __init__(self, portname, argname, lineno=0):
         self.lineno = lineno
@@ -694,6 +748,7 @@ class PortArg(Node):
         return tuple(nodelist)
 
 class Function(Node):
+    __slots__ = ('name', 'retwidth', 'statement',)
     attr_names = ('name',)
     def __init__(self, name, retwidth, statement, lineno=0):
         self.lineno = lineno
@@ -709,6 +764,7 @@ class Function(Node):
         return self.name.__repr__()
 
 class FunctionCall(Node):
+    __slots__ = ('name', 'args',)
     attr_names = ()
     def __init__(self, name, args, lineno=0):
         self.lineno = lineno
@@ -723,6 +779,7 @@ class FunctionCall(Node):
         return self.name.__repr__()
 
 class Task(Node):
+    __slots__ = ('name', 'statement',)
     attr_names = ('name',)
     def __init__(self, name, statement, lineno=0):
         self.lineno = lineno
@@ -734,6 +791,7 @@ class Task(Node):
         return tuple(nodelist)
 
 class TaskCall(Node):
+    __slots__ = ('name', 'args',)
     attr_names = ()
     def __init__(self, name, args, lineno=0):
         self.lineno = lineno
@@ -746,6 +804,7 @@ class TaskCall(Node):
         return tuple(nodelist)
 
 class GenerateStatement(Node):
+    __slots__ = ('items',)
     attr_names = ()
     def __init__(self, items, lineno=0):
         self.lineno = lineno
@@ -756,6 +815,7 @@ class GenerateStatement(Node):
         return tuple(nodelist)
 
 class SystemCall(Node):
+    __slots__ = ('syscall', 'args',)
     attr_names = ('syscall',)
     def __init__(self, syscall, args, lineno=0):
         self.lineno = lineno
@@ -777,6 +837,7 @@ class SystemCall(Node):
         return ''.join(ret)
 
 class IdentifierScopeLabel(Node):
+    __slots__ = ('name', 'loop',)
     attr_names = ('name', 'loop')
     def __init__(self, name, loop=None, lineno=0):
         self.lineno = lineno
@@ -787,6 +848,7 @@ class IdentifierScopeLabel(Node):
         return tuple(nodelist)
 
 class IdentifierScope(Node):
+    __slots__ = ('labellist',)
     attr_names = ()
     def __init__(self, labellist, lineno=0):
         self.lineno = lineno
@@ -797,6 +859,7 @@ class IdentifierScope(Node):
         return tuple(nodelist)
 
 class Pragma(Node):
+    __slots__ = ('entry',)
     attr_names = ()
     def __init__(self, entry, lineno=0):
         self.lineno = lineno
@@ -807,6 +870,7 @@ class Pragma(Node):
         return tuple(nodelist)
 
 class PragmaEntry(Node):
+    __slots__ = ('name', 'value',)
     attr_names = ('name', )
     def __init__(self, name, value=None, lineno=0):
         self.lineno = lineno
@@ -818,6 +882,7 @@ class PragmaEntry(Node):
         return tuple(nodelist)
 
 class Disable(Node):
+    __slots__ = ('dest',)
     attr_names = ('dest',)
     def __init__(self, dest, lineno=0):
         self.lineno = lineno
@@ -827,6 +892,7 @@ class Disable(Node):
         return tuple(nodelist)
 
 class ParallelBlock(Node):
+    __slots__ = ('statements', 'scope',)
     attr_names = ('scope',)
     def __init__(self, statements, scope=None, lineno=0):
         self.lineno = lineno
@@ -838,6 +904,7 @@ class ParallelBlock(Node):
         return tuple(nodelist)
 
 class SingleStatement(Node):
+    __slots__ = ('statement',)
     attr_names = ()
     def __init__(self, statement, lineno=0):
         self.lineno = lineno
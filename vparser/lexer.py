@@ -31,6 +31,10 @@ class VerilogLexer(object):
     def reset_lineno(self):
         self.lexer.lineno = 1
 
+    def reset(self):
+        self.lexer.lineno = 1
+        self.directives = []
+
     def get_directives(self):
         return tuple(self.directives)
 
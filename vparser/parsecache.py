@@ -0,0 +1,100 @@
+#-------------------------------------------------------------------------------
+# parsecache.py
+#
+# Content-addressed on-disk cache of parsed ASTs
+#
+# An entry is keyed on the preprocessed source text, the include/define
+# set and the grammar signature, and stores the pickled AST with the
+# directives of the parse.
+#
+# Copyright (C) 2013, Shinya Takamaeda-Yamazaki
+# License: Apache 2.0
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import hashlib
+import zlib
+import tempfile
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from pyverilog.utils.version import VERSION
+
+# Bump when the layout of a cache entry changes
+CACHE_FORMAT = 2
+
+def parse_key(text, include=None, define=None, signature=''):
+    h = hashlib.sha1()
+    h.update(('%s:%s:%s\n' % (CACHE_FORMAT, VERSION, signature)).encode('utf-8'))
+    for inc in (include or ()):
+        h.update(('I%s\n' % inc).encode('utf-8'))
+    for d in sorted(define or ()):
+        h.update(('D%s\n' % d).encode('utf-8'))
+    h.update(text.encode('utf-8'))
+    return h.hexdigest()
+
+class ParseCache(object):
+    def __init__(self, cachedir):
+        self.cachedir = cachedir
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text, include=None, define=None, signature=''):
+        return parse_key(text, include, define, signature)
+
+    def path(self, key):
+        return os.path.join(self.cachedir, key[:2], key + '.ast')
+
+    def get(self, key):
+        """ Returns (ast, directives) or None """
+        try:
+            f = open(self.path(key), 'rb')
+        except IOError:
+            self.misses += 1
+            return None
+        try:
+            data = f.read()
+        finally:
+            f.close()
+        try:
+            ret = pickle.loads(zlib.decompress(data))
+        except Exception:
+            # broken or incompatible entry: treat as a miss
+            self.misses += 1
+            return None
+        self.hits += 1
+        return ret
+
+    def put(self, key, ast, directives):
+        path = self.path(key)
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            try:
+                os.makedirs(dirname)
+            except OSError:
+                if not os.path.isdir(dirname): raise
+        data = zlib.compress(pickle.dumps((ast, directives), pickle.HIGHEST_PROTOCOL))
+        # write to a temporary file and rename so that concurrent readers
+        # never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=dirname)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            os.remove(tmp)
+
+    def clear(self):
+        if not os.path.isdir(self.cachedir): return
+        for sub in os.listdir(self.cachedir):
+            subdir = os.path.join(self.cachedir, sub)
+            if not os.path.isdir(subdir): continue
+            for name in os.listdir(subdir):
+                if name.endswith('.ast'): os.remove(os.path.join(subdir, name))
@@ -11,13 +11,20 @@ from __future__ import absolute_import
 from __future__ import print_function
 import sys
 import os
+import hashlib
+import importlib
+import multiprocessing
 
-from pyverilog.vparser.ply.yacc import yacc
+from pyverilog.vparser.ply.yacc import yacc, LRTable, LRParser, VersionError
 from pyverilog.vparser.plyparser import PLYParser, Coord, ParseError
-from pyverilog.vparser.preprocessor import VerilogPreprocessor
+from pyverilog.vparser.preprocessor import VerilogPreprocessor, VerilogNativePreprocessor
 from pyverilog.vparser.lexer import VerilogLexer
+from pyverilog.vparser.parsecache import ParseCache, parse_key
 from pyverilog.vparser.ast import *
 
+# Pre-generated LALR tables (see generate_tables())
+TABMODULE = 'pyverilog.vparser.parsetab'
+
 class VerilogParser(PLYParser):
     'Verilog HDL Parser'
 
@@ -40,14 +47,58 @@ class VerilogParser(PLYParser):
         # -> Strong
         )
 
-    def __init__(self):
+    def __init__(self, tabmodule=TABMODULE):
         self.lexer = VerilogLexer(error_func=self._lexer_error_func)
         self.lexer.build()
 
         self.tokens = self.lexer.tokens
-        #self.parser = yacc(module=self)
-        ## Use this if you want to build the parser using LALR(1) instead of SLR
-        self.parser = yacc(module=self, method="LALR")
+        self.origin = None
+        self.parser = None
+        if tabmodule is not None:
+            self.parser = self._load_tables(tabmodule)
+        if self.parser is None:
+            #self.parser = yacc(module=self)
+            ## Use this if you want to build the parser using LALR(1) instead of SLR
+            self.parser = yacc(module=self, method="LALR", write_tables=0, debug=0)
+
+    def signature(self):
+        """ Digest of the token list, the precedence table and every
+            production docstring. The pre-generated tables are only
+            used when they were built for the same digest.
+        """
+        cls = self.__class__
+        if '_signature' in cls.__dict__:
+            return cls._signature
+        sig = hashlib.md5()
+        sig.update(' '.join(self.tokens).encode('latin-1'))
+        for p in self.precedence:
+            sig.update(' '.join(p).encode('latin-1'))
+        for name in sorted(n for n in dir(self.__class__) if n.startswith('p_')):
+            doc = getattr(self.__class__, name).__doc__
+            if doc: sig.update(doc.encode('latin-1'))
+        cls._signature = sig.hexdigest()
+        return cls._signature
+
+    def _load_tables(self, tabmodule):
+        """ Load the LALR tables from an importable table module without
+            running the grammar reflection/validation and table generation
+            of yacc(). Returns None if the tables are missing or stale.
+        """
+        try:
+            parsetab = importlib.import_module(tabmodule)
+        except ImportError:
+            return None
+        if getattr(parsetab, '_grammar_signature', None) != self.signature():
+            return None
+        lr = LRTable()
+        try:
+            lr.read_table(parsetab)
+        except VersionError:
+            return None
+        pdict = dict([ (p.func, getattr(self, p.func))
+                       for p in lr.lr_productions if p.func ])
+        lr.bind_callables(pdict)
+        return LRParser(lr, self.p_error)
 
     def _lexer_error_func(self, msg, line, column):
         self._parse_error(msg, self._coord(line, column))
@@ -59,9 +110,25 @@ class VerilogParser(PLYParser):
         return self.lexer.get_default_nettype()
 
     # Returns AST
-    def parse(self, text, debug=0):
+    def parse(self, text, debug=0, origin=None):
+        """ origin: optional list of (filename, lineno) per line of text,
+            used to report errors at their original location """
+        self.origin = origin
+        self.lexer.reset()
         return self.parser.parse(text, lexer=self.lexer, debug=debug)
 
+    def is_empty(self, text):
+        """ True if text has no token (e.g. a header with only `define) """
+        self.lexer.reset()
+        self.lexer.input(text)
+        return self.lexer.token() is None
+
+    def _coord(self, lineno, column=None):
+        if self.origin and 0 < lineno <= len(self.origin):
+            filename, lineno = self.origin[lineno-1]
+            return Coord(file=filename, line=lineno, column=column)
+        return PLYParser._coord(self, lineno, column)
+
     ######################################################################
     # Parse Rule Definition
     ######################################################################
@@ -2083,36 +2150,222 @@ class VerilogParser(PLYParser):
 
 #-------------------------------------------------------------------------------
 class VerilogCodeParser(object):
+    """ preprocess_engine: 'iverilog' (external Icarus Verilog) or
+        'native' (in-process VerilogNativePreprocessor)
+        parse_cache: cache directory or ParseCache object; the parse is
+        skipped when the preprocessed text was parsed before
+        incremental: preprocess and parse each file separately and keep the
+        ModuleDefs of every file, so that calling parse() again only
+        re-parses the files whose preprocessed text changed; requires the
+        native engine, which carries the macros over to the next file
+        parse_jobs: number of worker processes parsing the files in
+        parallel; more than 1 implies the per-file parse of incremental
+        (and the native engine) """
     def __init__(self, filelist, preprocess_output='preprocess.output',
                  preprocess_include=None,
-                 preprocess_define=None):
+                 preprocess_define=None,
+                 preprocess_engine='iverilog',
+                 parse_cache=None,
+                 incremental=False,
+                 parse_jobs=1):
+        self.filelist = filelist
         self.preprocess_output = preprocess_output
+        self.preprocess_engine = preprocess_engine
+        self.preprocess_include = preprocess_include
+        self.preprocess_define = preprocess_define
+        if parse_cache is not None and not isinstance(parse_cache, ParseCache):
+            parse_cache = ParseCache(parse_cache)
+        self.parse_cache = parse_cache
+        self.incremental = incremental
+        self.parse_jobs = parse_jobs
         self.directives = ()
-        self.preprocessor = VerilogPreprocessor(filelist, preprocess_output,
-                                                preprocess_include,
-                                                preprocess_define)
+        # filename -> (key, definitions, directives) of the last parse
+        self.files = {}
+        self.changed_modules = ()
+        if preprocess_engine == 'native':
+            self.preprocessor = VerilogNativePreprocessor(filelist,
+                                                          preprocess_include,
+                                                          preprocess_define)
+        elif preprocess_engine == 'iverilog':
+            self.preprocessor = VerilogPreprocessor(filelist, preprocess_output,
+                                                    preprocess_include,
+                                                    preprocess_define)
+        else:
+            raise ValueError("Unknown preprocess engine: %s" % preprocess_engine)
+        if incremental and preprocess_engine != 'native':
+            raise ValueError("incremental parse requires preprocess_engine='native'")
+        if parse_jobs > 1 and preprocess_engine != 'native':
+            raise ValueError("parse_jobs > 1 requires preprocess_engine='native'")
         self.parser = VerilogParser()
 
     def preprocess(self):
+        if self.preprocess_engine == 'native':
+            return self.preprocessor.preprocess()
         self.preprocessor.preprocess()
         text = open(self.preprocess_output).read()
         os.remove(self.preprocess_output)
         return text
 
+    def get_origin(self):
+        if self.preprocess_engine == 'native':
+            return self.preprocessor.origin
+        return None
+
+    def preprocess_files(self):
+        """ Returns a list of (filename, text, origin), one per file """
+        if self.preprocess_engine != 'native':
+            # iverilog preprocesses a file list as a whole: a file run alone
+            # would lose the macros defined in the files before it
+            raise ValueError("per-file preprocessing requires preprocess_engine='native'")
+        return self.preprocessor.preprocess_files()
+
     def parse(self, preprocess_output='preprocess.output', debug=0):
+        if self.incremental or self.parse_jobs > 1:
+            return self._parse_per_file(debug)
         text = self.preprocess()
-        ast = self.parser.parse(text, debug=debug)
+        if self.parse_cache is None:
+            return self._parse_text(text, debug)
+        key = self.parse_cache.key(text, self.preprocess_include,
+                                   self.preprocess_define, self.parser.signature())
+        entry = self.parse_cache.get(key)
+        if entry is not None:
+            ast, self.directives = entry
+            return ast
+        ast = self._parse_text(text, debug)
+        self.parse_cache.put(key, ast, self.directives)
+        return ast
+
+    def _parse_text(self, text, debug=0):
+        ast = self.parser.parse(text, debug=debug, origin=self.get_origin())
         self.directives = self.parser.get_directives()
         return ast
 
+    def _parse_per_file(self, debug=0):
+        signature = self.parser.signature()
+        entries = []
+        todo = []
+        changed = set()
+        for filename, text, origin in self.preprocess_files():
+            key = parse_key(text, self.preprocess_include,
+                            self.preprocess_define, signature)
+            entry = self.files.get(filename)
+            if entry is not None and entry[0] == key:
+                entries.append( (filename, entry) )
+                continue
+            if filename in self.files:
+                changed.update(self._modulenames(self.files[filename][1]))
+            cached = self.parse_cache.get(key) if self.parse_cache is not None else None
+            if cached is not None:
+                ast, directives = cached
+                entry = (key, ast.description.definitions, directives)
+            else:
+                entry = None
+                todo.append( (len(entries), key, text, origin) )
+            entries.append( (filename, entry) )
+
+        results = self._parse_texts([ (text, origin) for i, key, text, origin in todo ], debug)
+        for (i, key, text, origin), (ast, directives) in zip(todo, results):
+            if ast is None:
+                definitions = ()
+            else:
+                definitions = ast.description.definitions
+                if self.parse_cache is not None:
+                    self.parse_cache.put(key, ast, directives)
+            entries[i] = (entries[i][0], (key, definitions, directives))
+
+        files = {}
+        definitions = []
+        directives = []
+        for filename, entry in entries:
+            if filename not in self.files or self.files[filename][0] != entry[0]:
+                changed.update(self._modulenames(entry[1]))
+            files[filename] = entry
+            definitions.extend(entry[1])
+            directives.extend(entry[2])
+        for filename, entry in self.files.items():
+            if filename not in files:
+                changed.update(self._modulenames(entry[1]))
+        self.files = files
+        self.changed_modules = tuple(sorted(changed))
+        self.directives = tuple(directives)
+        description = Description(definitions=tuple(definitions), lineno=1)
+        return Source(name='', description=description, lineno=1)
+
+    def _parse_texts(self, texts, debug=0):
+        """ Returns a list of (ast, directives) for (text, origin) pairs;
+            ast is None for a text without any token """
+        if self.parse_jobs <= 1 or len(texts) <= 1:
+            return [ _parse_text(self.parser, text, origin, debug)
+                     for text, origin in texts ]
+        pool = multiprocessing.Pool(min(self.parse_jobs, len(texts)),
+                                    initializer=_init_parse_worker)
+        try:
+            ret = pool.map(_parse_worker, texts, chunksize=1)
+        finally:
+            pool.terminate()
+        return ret
+
+    def _modulenames(self, definitions):
+        return [ d.name for d in definitions if isinstance(d, ModuleDef) ]
+
     def get_directives(self):
         return self.directives
 
+    def get_changed_modules(self):
+        """ Names of the modules added, modified or removed by the last
+            incremental parse(). ModuleDef objects of the other modules are
+            the same objects as in the previous result. """
+        return self.changed_modules
+
 #-------------------------------------------------------------------------------
-def parse(filelist, preprocess_include=None, preprocess_define=None):
+def _parse_text(parser, text, origin=None, debug=0):
+    if parser.is_empty(text):
+        return None, parser.get_directives()
+    ast = parser.parse(text, debug=debug, origin=origin)
+    return ast, parser.get_directives()
+
+# VerilogParser of a parse worker process
+_worker_parser = None
+
+def _init_parse_worker():
+    global _worker_parser
+    _worker_parser = VerilogParser()
+
+def _parse_worker(args):
+    text, origin = args
+    return _parse_text(_worker_parser, text, origin)
+
+#-------------------------------------------------------------------------------
+def generate_tables(outputdir=None, tabmodule=TABMODULE):
+    """ Build the LALR tables once and write them as an importable module
+        (vparser/parsetab.py by default) keyed on VerilogParser.signature().
+    """
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(__file__))
+    parser = VerilogParser(tabmodule=None)
+    modulename = tabmodule.split('.')[-1]
+    yacc(module=parser, method="LALR", tabmodule=modulename,
+         outputdir=outputdir, debug=0)
+    filename = os.path.join(outputdir, modulename) + '.py'
+    f = open(filename, 'a')
+    f.write('\n_grammar_signature = %r\n' % parser.signature())
+    f.close()
+    return filename
+
+#-------------------------------------------------------------------------------
+def parse(filelist, preprocess_include=None, preprocess_define=None,
+          preprocess_engine='iverilog', parse_cache=None, incremental=False,
+          parse_jobs=1):
     codeparser = VerilogCodeParser(filelist,
                                    preprocess_include=preprocess_include,
-                                   preprocess_define=preprocess_define)
+                                   preprocess_define=preprocess_define,
+                                   preprocess_engine=preprocess_engine,
+                                   parse_cache=parse_cache,
+                                   incremental=incremental,
+                                   parse_jobs=parse_jobs)
     ast = codeparser.parse()
     directives = codeparser.get_directives()
     return ast, directives
+
+if __name__ == '__main__':
+    print('Generated: %s' % generate_tables())
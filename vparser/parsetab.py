@@ -0,0 +1,417 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = b'\x802\xd1J\xa1\xa5\xa8\x94\xe3\xa0\xb2\x95\xde\xa5\x11e'
+    
+_lr_action_items = {'MODULE':([0,3,4,5,6,9,79,117,381,],[7,7,-4,-5,-6,-3,-8,-9,-7,]),'LPAREN':([0,3,4,5,6,9,10,11,12,14,15,16,18,20,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,54,55,79,80,81,83,84,85,86,87,88,89,90,91,92,99,101,107,108,109,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,132,135,136,164,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,185,186,187,188,189,191,195,202,203,213,218,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,267,268,269,270,271,272,274,278,280,282,284,285,286,287,289,292,294,298,299,302,304,306,307,315,316,324,325,327,328,329,331,332,333,334,336,341,343,344,347,348,350,353,354,355,364,368,370,379,381,412,413,415,416,419,420,421,425,426,427,431,433,434,436,439,440,442,443,446,458,459,461,462,463,468,471,474,475,477,478,479,489,491,492,510,511,513,514,515,517,518,520,529,535,536,537,540,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,588,591,593,606,628,630,631,632,633,639,652,653,654,658,659,663,664,666,667,668,669,670,671,677,678,682,690,691,693,696,704,705,706,707,708,710,712,713,719,720,721,722,723,724,725,726,727,728,729,731,733,734,735,737,738,739,740,],[8,8,-4,-5,-6,-3,-386,-10,-11,19,21,-13,8,-27,80,8,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,8,203,203,-8,80,-378,80,80,80,80,80,80,80,80,80,80,263,80,-179,-180,-181,-182,-183,-184,-185,-186,-178,-9,-51,8,-319,-321,-322,-323,-324,272,273,80,284,-231,317,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,324,327,328,329,330,331,333,343,355,80,-26,-12,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,415,416,-379,-318,-320,80,-70,-76,80,80,80,-228,-229,-230,-80,-85,-89,80,-92,-314,80,80,80,-188,-223,80,461,80,80,80,80,-279,80,-283,-233,-248,80,263,-384,-385,477,-290,203,80,-291,-24,-25,80,-7,80,80,80,80,80,-258,-259,-71,-77,80,-386,80,80,-81,-90,-91,-93,-94,-386,80,80,80,-386,-386,80,-232,-247,-383,80,582,-284,80,591,-285,80,80,80,80,80,80,80,80,8,80,80,-227,-98,80,80,80,80,80,80,80,80,80,80,80,80,-238,80,80,677,80,-344,-362,80,-328,-329,-330,8,-49,-250,-255,-254,80,-272,80,80,-265,-266,-280,-281,-282,-237,80,263,-343,8,8,8,-99,-252,-224,-226,-267,-271,80,-268,-269,-327,-331,-332,-325,8,-333,-334,-335,-386,-249,-256,-273,-276,-257,-264,8,80,-251,-326,]),'$end':([1,2,3,4,5,6,9,79,117,381,],[0,-1,-2,-4,-5,-6,-3,-8,-9,-7,]),'ID':([7,13,18,19,20,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,73,78,79,80,81,83,84,85,86,87,88,89,90,91,92,101,102,103,107,108,109,110,111,112,113,114,115,118,119,120,121,122,123,124,128,130,132,134,135,136,138,145,146,150,151,156,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,192,193,194,195,198,199,200,203,204,206,208,212,213,215,217,222,223,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,261,262,263,264,269,270,271,272,273,274,275,278,280,282,284,285,286,287,289,290,292,293,294,295,298,299,302,303,304,306,307,315,316,317,318,319,320,321,322,323,324,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,343,344,345,346,347,348,353,355,362,364,367,368,370,372,375,379,381,412,413,415,416,419,420,421,422,425,426,427,431,433,434,436,439,440,442,443,446,450,456,457,458,459,461,462,463,468,471,472,473,474,475,477,479,480,486,489,492,495,496,497,498,499,501,502,503,504,505,507,508,509,510,511,512,513,514,515,516,517,518,520,529,530,532,535,536,537,540,541,542,543,544,545,546,547,549,551,552,553,554,561,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,582,584,586,587,591,593,595,604,605,606,608,628,630,631,632,633,636,637,638,639,652,653,654,655,658,659,663,664,666,667,668,669,670,671,672,677,682,683,684,685,686,687,688,690,691,692,693,696,703,704,705,706,707,708,709,710,711,712,713,714,719,720,721,722,723,724,725,726,727,728,729,730,731,733,734,735,737,738,739,740,],[11,17,54,72,-27,81,54,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,54,133,140,-39,143,148,148,154,81,-386,-386,-386,-386,209,210,-32,-33,-34,-35,-36,-37,-38,-40,-41,72,148,-8,81,-378,81,81,81,81,81,81,81,81,81,81,81,267,269,-179,-180,-181,-182,-183,-184,-185,-186,-178,-51,54,-319,-321,-322,-323,-324,133,-31,81,283,81,-231,140,148,148,148,148,81,81,-386,81,-196,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,81,-386,-386,-386,81,-231,349,350,81,-297,350,365,72,-26,72,72,148,148,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-381,81,81,-380,-379,-318,-320,81,-386,-70,424,-76,81,81,81,-228,-229,-230,-80,140,-85,143,-89,148,81,-92,-314,154,81,81,81,-188,-223,81,-197,-206,-199,-200,-201,-202,81,81,81,81,-386,81,-279,81,-283,-386,-233,473,-235,-236,-386,-248,81,-228,-229,-230,-384,-385,-290,81,491,-291,-386,-24,-25,72,148,81,-7,81,81,81,81,81,-258,-259,81,-71,-77,81,-386,81,81,-81,-90,-91,-93,-94,-386,81,81,81,81,81,81,-386,-386,81,-232,-234,-386,-247,-383,81,-284,350,588,81,-285,-386,-347,-348,-349,424,-386,-365,-366,-367,-368,72,148,148,81,81,-174,81,81,81,-173,81,81,81,54,-386,-261,81,81,-227,-98,81,81,81,81,81,81,81,-189,-198,81,81,-207,-386,81,81,81,81,81,-386,-386,-386,-386,-238,-240,-241,-242,-243,-244,-245,-246,-227,81,-295,-296,81,81,-344,-346,81,424,-362,-364,81,-328,-329,-330,54,-231,81,-260,-49,-250,-255,-254,-386,81,-272,81,81,-265,-266,-280,-281,-282,-237,-239,81,-343,-170,-171,-172,-167,-168,-169,54,54,723,54,-99,-386,-252,-224,-226,-267,-271,-386,81,-386,-268,-269,-386,-327,-331,-332,-325,54,-333,-334,-335,-386,-249,-256,-386,-273,-276,-257,-264,54,81,-251,-326,]),'SENS_OR':([7,18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,81,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,269,270,271,274,278,289,292,294,299,302,315,316,320,321,322,323,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,451,452,454,455,471,474,475,479,492,512,516,529,540,555,556,557,558,572,593,606,630,631,632,633,649,650,651,652,653,654,666,667,668,669,670,671,682,683,684,685,686,687,688,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[12,55,-27,55,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,55,-8,-378,-51,55,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-379,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-199,-200,-201,-202,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,550,552,-195,-205,-232,-247,-383,-284,-285,-174,-173,55,-98,-190,-192,-193,-191,-238,-344,-362,-328,-329,-330,55,-194,-203,-204,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,-170,-171,-172,-167,-168,-169,55,55,55,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,55,-333,-334,-335,-249,-256,-257,-264,55,-251,-326,]),'TIMES':([8,17,81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,164,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,317,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[13,22,-378,225,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,319,379,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,379,-336,-379,379,453,379,-161,-175,-176,379,-154,-130,-129,-131,-132,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,-163,379,379,379,379,379,379,379,379,379,-174,-173,-358,379,379,-166,379,379,379,379,379,379,-154,379,379,379,379,379,379,379,379,-337,-338,379,379,379,379,379,379,379,379,-161,379,-158,-170,-171,-172,-167,-168,-169,379,379,]),'DELAY':([10,11,12,44,46,51,52,53,54,55,58,59,60,61,62,63,64,65,66,81,128,130,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,273,274,289,292,294,299,318,319,320,321,322,323,330,332,334,335,336,338,339,340,341,347,348,367,425,431,436,439,440,442,443,446,462,463,471,472,473,474,475,495,496,497,498,501,502,503,504,505,512,516,530,532,549,551,554,561,568,569,570,571,572,573,574,575,576,577,578,579,595,608,638,639,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,727,728,729,730,734,735,739,],[15,-10,-11,135,-39,135,-386,195,202,202,-32,-33,-34,-35,-36,-37,-38,-40,-41,-378,135,-31,195,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,195,195,195,-379,135,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,135,-279,-283,195,-233,-235,-236,195,-248,-384,-385,-386,-71,135,-81,-90,-91,-93,-94,135,135,135,-232,-234,195,-247,-383,135,-347,-348,-349,135,-365,-366,-367,-368,-174,-173,135,-261,-189,-198,-207,195,135,195,195,195,-238,-240,-241,-242,-243,-244,-245,-246,-346,-364,-260,-49,-250,-255,-254,195,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,195,-252,-224,-226,-267,195,195,-268,-269,195,135,-249,-256,195,-257,-264,-251,]),'SEMICOLON':([10,11,12,14,16,52,53,68,81,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,127,129,131,133,137,139,140,141,142,143,144,147,149,152,153,154,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,190,192,193,194,196,197,198,201,205,207,209,210,211,214,218,250,251,252,253,254,255,256,257,258,259,267,269,273,274,276,277,281,289,291,292,294,296,297,299,300,301,318,319,320,321,322,323,330,332,334,335,336,338,339,340,341,342,344,345,346,347,348,349,351,352,363,365,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,411,418,419,420,421,423,424,425,428,429,435,436,437,438,439,440,441,442,443,444,445,468,471,472,473,474,475,481,488,512,516,519,523,531,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,580,583,619,627,629,641,642,652,653,654,655,656,657,666,667,668,669,670,671,672,673,683,684,685,686,687,688,695,703,704,705,706,707,709,711,712,713,714,715,728,729,730,734,735,739,],[-386,-10,-11,20,-13,-386,-386,213,-378,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,274,278,-73,-74,289,-83,-84,292,-87,-88,294,-96,299,302,-316,-317,-386,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,332,-386,-386,-386,347,348,-196,353,-293,364,366,367,368,370,-12,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-336,-379,421,-70,425,426,-75,-80,436,-85,-89,439,440,-92,442,443,-197,-206,-199,-200,-201,-202,421,-279,-283,-386,-233,-235,-236,-386,-248,475,-161,-175,-176,-384,-385,-382,479,-287,492,493,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-163,-253,532,-258,-259,-72,-74,-71,-78,-118,-82,-81,-86,-95,-90,-91,-97,-93,-94,-315,540,532,-232,-234,-386,-247,-383,-292,-294,-174,-173,-358,-166,638,-189,-198,-207,-386,-386,670,-386,-238,-240,-241,-242,-243,-244,-245,-246,-154,-286,-153,-337,-338,-79,696,-250,-255,-254,-386,705,706,-265,-266,-280,-281,-282,-237,-239,-288,-170,-171,-172,-167,-168,-169,-50,-386,-252,-224,-226,-267,-386,-386,-268,-269,-386,-289,-249,-256,-386,-257,-264,-251,]),'EQUALS':([17,81,133,148,155,157,158,159,160,161,269,283,305,326,449,512,516,533,694,697,698,699,700,701,702,],[23,-378,280,298,304,-114,-115,-116,-117,-106,-379,431,446,462,-107,-174,-173,462,727,-103,-104,-105,-100,-101,-102,]),'ENDMODULE':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,79,118,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,474,475,479,492,540,572,593,606,652,653,654,666,667,668,669,670,671,682,696,704,705,706,707,712,713,728,729,734,735,739,],[-386,-27,117,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-8,-51,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,-98,-238,-344,-362,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,-99,-252,-224,-226,-267,-268,-269,-249,-256,-257,-264,-251,]),'GENERATE':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,79,118,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,474,475,479,492,540,572,593,606,652,653,654,666,667,668,669,670,671,682,696,704,705,706,707,712,713,728,729,734,735,739,],[43,-27,43,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-8,-51,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,-98,-238,-344,-362,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,-99,-252,-224,-226,-267,-268,-269,-249,-256,-257,-264,-251,]),'INTEGER':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,48,49,78,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[45,-27,45,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,45,146,151,223,-8,-51,45,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,45,45,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,45,-247,-383,-284,-285,45,45,-347,-348,-349,45,-365,-366,-367,-368,45,-98,45,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,45,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,45,45,45,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,45,-333,-334,-335,-249,-256,-257,-264,45,-251,-326,]),'REAL':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,473,474,475,479,492,529,540,571,572,573,574,575,576,577,578,579,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[47,-27,47,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,47,-8,-51,47,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,47,-247,-383,-284,-285,47,-98,47,-238,-240,-241,-242,-243,-244,-245,-246,-344,-362,-328,-329,-330,47,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,47,47,47,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,47,-333,-334,-335,-249,-256,-257,-264,47,-251,-326,]),'PARAMETER':([18,20,21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,75,77,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,220,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,375,381,425,426,436,439,440,442,443,471,473,474,475,479,492,508,509,529,540,571,572,573,574,575,576,577,578,579,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[48,-27,78,48,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,48,78,-16,-8,-51,48,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-15,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-18,-7,-71,-77,-81,-90,-91,-93,-94,-232,48,-247,-383,-284,-285,-19,-20,48,-98,48,-238,-240,-241,-242,-243,-244,-245,-246,-344,-362,-328,-329,-330,48,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,48,48,48,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,48,-333,-334,-335,-249,-256,-257,-264,48,-251,-326,]),'LOCALPARAM':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,473,474,475,479,492,529,540,571,572,573,574,575,576,577,578,579,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[49,-27,49,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,49,-8,-51,49,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,49,-247,-383,-284,-285,49,-98,49,-238,-240,-241,-242,-243,-244,-245,-246,-344,-362,-328,-329,-330,49,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,49,49,49,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,49,-333,-334,-335,-249,-256,-257,-264,49,-251,-326,]),'GENVAR':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,474,475,479,492,529,540,572,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[50,-27,50,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,50,-8,-51,50,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,50,-98,-238,-344,-362,-328,-329,-330,50,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,50,50,50,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,50,-333,-334,-335,-249,-256,-257,-264,50,-251,-326,]),'ASSIGN':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,474,475,479,492,529,540,572,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[51,-27,51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,51,-8,-51,51,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,51,-98,-238,-344,-362,-328,-329,-330,51,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,51,51,51,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,51,-333,-334,-335,-249,-256,-257,-264,51,-251,-326,]),'ALWAYS':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,474,475,479,492,529,540,572,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[52,-27,52,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,52,-8,-51,52,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,52,-98,-238,-344,-362,-328,-329,-330,52,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,52,52,52,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,52,-333,-334,-335,-249,-256,-257,-264,52,-251,-326,]),'INITIAL':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,474,475,479,492,529,540,572,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[53,-27,53,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,53,-8,-51,53,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,53,-98,-238,-344,-362,-328,-329,-330,53,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,53,53,53,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,53,-333,-334,-335,-249,-256,-257,-264,53,-251,-326,]),'FUNCTION':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,474,475,479,492,529,540,572,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[56,-27,56,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,56,-8,-51,56,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,56,-98,-238,-344,-362,-328,-329,-330,56,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,56,56,56,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,56,-333,-334,-335,-249,-256,-257,-264,56,-251,-326,]),'TASK':([18,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,118,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,368,370,381,425,426,436,439,440,442,443,471,474,475,479,492,529,540,572,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[57,-27,57,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,57,-8,-51,57,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-24,-25,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,57,-98,-238,-344,-362,-328,-329,-330,57,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,57,57,57,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,57,-333,-334,-335,-249,-256,-257,-264,57,-251,-326,]),'INPUT':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,58,59,60,61,62,63,64,65,66,73,79,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[59,59,-27,59,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,59,59,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,59,-8,-51,59,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,59,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,59,59,-24,-25,59,-7,-71,-77,-81,-90,-91,-93,-94,-232,59,-247,-383,-284,-285,59,59,-347,-348,-349,59,59,-365,-366,-367,-368,59,-98,59,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,59,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,59,59,59,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,59,-333,-334,-335,-249,-256,-257,-264,59,-251,-326,]),'OUTPUT':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,58,59,60,61,62,63,64,65,66,73,79,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[60,60,-27,60,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,60,60,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,60,-8,-51,60,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,60,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,60,60,-24,-25,60,-7,-71,-77,-81,-90,-91,-93,-94,-232,60,-247,-383,-284,-285,60,60,-347,-348,-349,60,60,-365,-366,-367,-368,60,-98,60,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,60,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,60,60,60,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,60,-333,-334,-335,-249,-256,-257,-264,60,-251,-326,]),'INOUT':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,58,59,60,61,62,63,64,65,66,73,79,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[61,61,-27,61,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,61,61,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,61,-8,-51,61,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,61,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,61,61,-24,-25,61,-7,-71,-77,-81,-90,-91,-93,-94,-232,61,-247,-383,-284,-285,61,61,-347,-348,-349,61,61,-365,-366,-367,-368,61,-98,61,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,61,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,61,61,61,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,61,-333,-334,-335,-249,-256,-257,-264,61,-251,-326,]),'TRI':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,58,59,60,61,62,63,64,65,66,73,79,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[62,62,-27,62,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,62,62,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,62,-8,-51,62,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,62,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,62,62,-24,-25,62,-7,-71,-77,-81,-90,-91,-93,-94,-232,62,-247,-383,-284,-285,62,62,-347,-348,-349,62,62,-365,-366,-367,-368,62,-98,62,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,62,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,62,62,62,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,62,-333,-334,-335,-249,-256,-257,-264,62,-251,-326,]),'REG':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,58,59,60,61,62,63,64,65,66,73,79,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[63,63,-27,63,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,63,63,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,63,-8,-51,63,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,63,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,63,63,-24,-25,63,-7,-71,-77,-81,-90,-91,-93,-94,-232,63,-247,-383,-284,-285,63,63,-347,-348,-349,63,63,-365,-366,-367,-368,63,-98,63,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,63,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,63,63,63,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,63,-333,-334,-335,-249,-256,-257,-264,63,-251,-326,]),'WIRE':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,58,59,60,61,62,63,64,65,66,73,79,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[64,64,-27,64,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,64,64,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,64,-8,-51,64,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,64,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,64,64,-24,-25,64,-7,-71,-77,-81,-90,-91,-93,-94,-232,64,-247,-383,-284,-285,64,64,-347,-348,-349,64,64,-365,-366,-367,-368,64,-98,64,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,64,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,64,64,64,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,64,-333,-334,-335,-249,-256,-257,-264,64,-251,-326,]),'SIGNED':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,58,59,60,61,62,63,64,65,66,73,79,102,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[46,46,-27,46,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,46,46,138,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,46,-8,268,-51,46,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,46,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,46,46,-24,-25,46,-7,-71,-77,-81,-90,-91,-93,-94,-232,46,-247,-383,-284,-285,46,46,-347,-348,-349,46,46,-365,-366,-367,-368,46,-98,46,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,46,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,46,46,46,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,46,-333,-334,-335,-249,-256,-257,-264,46,-251,-326,]),'SUPPLY0':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,58,59,60,61,62,63,64,65,66,73,79,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[65,65,-27,65,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,65,65,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,65,-8,-51,65,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,65,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,65,65,-24,-25,65,-7,-71,-77,-81,-90,-91,-93,-94,-232,65,-247,-383,-284,-285,65,65,-347,-348,-349,65,65,-365,-366,-367,-368,65,-98,65,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,65,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,65,65,65,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,65,-333,-334,-335,-249,-256,-257,-264,65,-251,-326,]),'SUPPLY1':([18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,58,59,60,61,62,63,64,65,66,73,79,118,119,120,121,122,123,124,130,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,213,215,270,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,366,367,368,370,372,381,425,426,436,439,440,442,443,471,473,474,475,479,492,493,495,496,497,498,499,501,502,503,504,505,529,540,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,690,691,693,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[66,66,-27,66,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,66,66,-39,-32,-33,-34,-35,-36,-37,-38,-40,-41,66,-8,-51,66,-319,-321,-322,-323,-324,-31,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-26,66,-318,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,66,66,-24,-25,66,-7,-71,-77,-81,-90,-91,-93,-94,-232,66,-247,-383,-284,-285,66,66,-347,-348,-349,66,66,-365,-366,-367,-368,66,-98,66,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,66,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,66,66,66,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,66,-333,-334,-335,-249,-256,-257,-264,66,-251,-326,]),'RPAREN':([19,22,67,69,70,71,72,74,76,81,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,147,216,219,221,224,225,250,251,252,253,254,255,256,257,258,259,263,267,269,320,321,322,323,356,357,358,359,360,361,369,371,373,374,376,377,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,408,409,410,411,415,416,417,418,429,432,438,441,451,452,453,454,455,460,464,465,466,467,469,470,476,482,483,484,485,487,506,512,516,519,523,524,525,526,527,528,530,532,555,556,557,558,562,568,581,589,590,591,618,619,626,627,629,634,635,636,638,649,650,651,665,674,675,676,678,679,680,681,683,684,685,686,687,688,689,716,717,718,736,741,],[68,79,211,214,-29,-43,-30,218,-17,-378,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,-96,-46,-14,-21,378,381,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-386,-336,-379,-199,-200,-201,-202,488,-304,-305,-307,-310,-308,-28,-42,-48,-47,-22,-23,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,519,-360,-361,-163,-386,-386,529,-253,-118,537,-95,-97,549,551,554,-195,-205,561,565,-270,566,567,569,570,580,584,586,-301,-299,-302,-44,-174,-173,-358,-166,627,-340,-341,-342,629,-386,-261,-190,-192,-193,-191,655,-386,673,-306,-309,679,-45,-153,-359,-337,-338,693,-262,-263,-260,-194,-203,-204,714,715,-300,-298,717,-313,718,-158,-170,-171,-172,-167,-168,-169,-339,736,-311,-312,-303,-225,]),'MINUS':([23,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,104,105,106,107,108,109,110,111,112,113,114,115,116,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,262,263,266,267,269,272,279,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,342,343,344,345,346,347,348,355,361,378,379,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,412,413,415,416,418,419,420,421,427,429,430,431,432,433,434,446,447,448,458,459,461,462,463,465,468,471,474,475,476,477,487,489,510,511,512,513,514,515,516,517,518,519,520,521,522,523,527,534,535,536,537,538,539,541,542,543,544,545,546,547,559,560,563,564,565,566,567,572,580,582,587,591,619,620,621,622,623,624,625,626,627,628,629,640,643,644,645,646,647,648,652,653,654,658,659,662,663,664,666,667,668,669,670,671,677,678,680,681,683,684,685,686,687,688,704,705,706,707,708,710,712,713,716,727,728,729,731,732,733,734,735,738,739,],[83,83,-378,230,83,83,83,83,83,83,83,83,83,83,-155,-156,-157,-158,-159,-160,-161,-162,83,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,83,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,83,83,230,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,83,83,83,230,-336,-379,83,230,83,83,83,-228,-229,-230,83,83,83,83,83,83,83,83,83,-279,83,-283,-233,-248,230,83,-161,-175,-176,-384,-385,83,230,-154,83,-130,-129,-131,-132,-133,-134,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,230,-163,83,83,83,83,230,83,-258,-259,83,230,230,-386,230,83,83,-386,230,230,83,83,83,-386,-386,230,83,-232,-247,-383,230,83,230,83,83,83,-174,83,83,83,-173,83,83,-358,83,230,230,-166,230,230,83,83,-227,230,230,83,83,83,83,83,83,83,230,230,83,83,83,83,83,-238,-154,83,83,83,230,230,230,230,230,230,230,230,-337,83,-338,230,230,230,230,230,230,230,-250,-255,-254,83,-272,230,83,83,-265,-266,-280,-281,-282,-237,83,-161,230,-158,-170,-171,-172,-167,-168,-169,-252,-224,-226,-267,-271,83,-268,-269,230,-386,-249,-256,-273,230,-276,-257,-264,83,-251,]),'PLUS':([23,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,104,105,106,107,108,109,110,111,112,113,114,115,116,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,262,263,266,267,269,272,279,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,342,343,344,345,346,347,348,355,361,378,379,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,412,413,415,416,418,419,420,421,427,429,430,431,432,433,434,446,447,448,458,459,461,462,463,465,468,471,474,475,476,477,487,489,510,511,512,513,514,515,516,517,518,519,520,521,522,523,527,534,535,536,537,538,539,541,542,543,544,545,546,547,559,560,563,564,565,566,567,572,580,582,587,591,619,620,621,622,623,624,625,626,627,628,629,640,643,644,645,646,647,648,652,653,654,658,659,662,663,664,666,667,668,669,670,671,677,678,680,681,683,684,685,686,687,688,704,705,706,707,708,710,712,713,716,727,728,729,731,732,733,734,735,738,739,],[84,84,-378,229,84,84,84,84,84,84,84,84,84,84,-155,-156,-157,-158,-159,-160,-161,-162,84,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,84,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,84,84,229,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,84,84,84,229,-336,-379,84,229,84,84,84,-228,-229,-230,84,84,84,84,84,84,84,84,84,-279,84,-283,-233,-248,229,84,-161,-175,-176,-384,-385,84,229,-154,84,-130,-129,-131,-132,-133,-134,229,229,229,229,229,229,229,229,229,229,229,229,229,229,229,229,229,229,229,229,229,229,-163,84,84,84,84,229,84,-258,-259,84,229,229,-386,229,84,84,-386,229,229,84,84,84,-386,-386,229,84,-232,-247,-383,229,84,229,84,84,84,-174,84,84,84,-173,84,84,-358,84,229,229,-166,229,229,84,84,-227,229,229,84,84,84,84,84,84,84,229,229,84,84,84,84,84,-238,-154,84,84,84,229,229,229,229,229,229,229,229,-337,84,-338,229,229,229,229,229,229,229,-250,-255,-254,84,-272,229,84,84,-265,-266,-280,-281,-282,-237,84,-161,229,-158,-170,-171,-172,-167,-168,-169,-252,-224,-226,-267,-271,84,-268,-269,229,-386,-249,-256,-273,229,-276,-257,-264,84,-251,]),'LNOT':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[85,85,-378,85,85,85,85,85,85,85,85,85,85,85,-179,-180,-181,-182,-183,-184,-185,-186,-178,85,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-379,85,85,85,85,-228,-229,-230,85,85,85,85,85,85,85,85,85,-279,85,-283,-233,-248,85,-384,-385,85,85,85,85,85,85,85,-258,-259,85,-386,85,85,-386,85,85,85,-386,-386,85,-232,-247,-383,85,85,85,85,85,85,85,85,85,85,85,85,-227,85,85,85,85,85,85,85,85,85,85,85,85,-238,85,85,85,85,-250,-255,-254,85,-272,85,85,-265,-266,-280,-281,-282,-237,85,-252,-224,-226,-267,-271,85,-268,-269,-386,-249,-256,-273,-276,-257,-264,85,-251,]),'NOT':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[86,86,-378,86,86,86,86,86,86,86,86,86,86,86,-179,-180,-181,-182,-183,-184,-185,-186,-178,86,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-379,86,86,86,86,-228,-229,-230,86,86,86,86,86,86,86,86,86,-279,86,-283,-233,-248,86,-384,-385,86,86,86,86,86,86,86,-258,-259,86,-386,86,86,-386,86,86,86,-386,-386,86,-232,-247,-383,86,86,86,86,86,86,86,86,86,86,86,86,-227,86,86,86,86,86,86,86,86,86,86,86,86,-238,86,86,86,86,-250,-255,-254,86,-272,86,86,-265,-266,-280,-281,-282,-237,86,-252,-224,-226,-267,-271,86,-268,-269,-386,-249,-256,-273,-276,-257,-264,86,-251,]),'AND':([23,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,104,105,106,107,108,109,110,111,112,113,114,115,116,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,262,263,266,267,269,272,279,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,342,343,344,345,346,347,348,355,361,378,379,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,412,413,415,416,418,419,420,421,427,429,430,431,432,433,434,446,447,448,458,459,461,462,463,465,468,471,474,475,476,477,487,489,510,511,512,513,514,515,516,517,518,519,520,521,522,523,527,534,535,536,537,538,539,541,542,543,544,545,546,547,559,560,563,564,565,566,567,572,580,582,587,591,619,620,621,622,623,624,625,626,627,628,629,640,643,644,645,646,647,648,652,653,654,658,659,662,663,664,666,667,668,669,670,671,677,678,680,681,683,684,685,686,687,688,704,705,706,707,708,710,712,713,716,727,728,729,731,732,733,734,735,738,739,],[87,87,-378,243,87,87,87,87,87,87,87,87,87,87,-155,-156,-157,-158,-159,-160,-161,-162,87,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,87,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,87,87,243,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,87,87,87,243,-336,-379,87,243,87,87,87,-228,-229,-230,87,87,87,87,87,87,87,87,87,-279,87,-283,-233,-248,243,87,-161,-175,-176,-384,-385,87,243,-154,87,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,243,243,243,243,243,243,243,-163,87,87,87,87,243,87,-258,-259,87,243,243,-386,243,87,87,-386,243,243,87,87,87,-386,-386,243,87,-232,-247,-383,243,87,243,87,87,87,-174,87,87,87,-173,87,87,-358,87,243,243,-166,243,243,87,87,-227,243,243,87,87,87,87,87,87,87,243,243,87,87,87,87,87,-238,-154,87,87,87,243,243,243,243,243,243,243,243,-337,87,-338,243,243,243,243,243,243,243,-250,-255,-254,87,-272,243,87,87,-265,-266,-280,-281,-282,-237,87,-161,243,-158,-170,-171,-172,-167,-168,-169,-252,-224,-226,-267,-271,87,-268,-269,243,-386,-249,-256,-273,243,-276,-257,-264,87,-251,]),'NAND':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[88,88,-378,88,88,88,88,88,88,88,88,88,88,88,-179,-180,-181,-182,-183,-184,-185,-186,-178,88,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-379,88,88,88,88,-228,-229,-230,88,88,88,88,88,88,88,88,88,-279,88,-283,-233,-248,88,-384,-385,88,88,88,88,88,88,88,-258,-259,88,-386,88,88,-386,88,88,88,-386,-386,88,-232,-247,-383,88,88,88,88,88,88,88,88,88,88,88,88,-227,88,88,88,88,88,88,88,88,88,88,88,88,-238,88,88,88,88,-250,-255,-254,88,-272,88,88,-265,-266,-280,-281,-282,-237,88,-252,-224,-226,-267,-271,88,-268,-269,-386,-249,-256,-273,-276,-257,-264,88,-251,]),'NOR':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[89,89,-378,89,89,89,89,89,89,89,89,89,89,89,-179,-180,-181,-182,-183,-184,-185,-186,-178,89,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-379,89,89,89,89,-228,-229,-230,89,89,89,89,89,89,89,89,89,-279,89,-283,-233,-248,89,-384,-385,89,89,89,89,89,89,89,-258,-259,89,-386,89,89,-386,89,89,89,-386,-386,89,-232,-247,-383,89,89,89,89,89,89,89,89,89,89,89,89,-227,89,89,89,89,89,89,89,89,89,89,89,89,-238,89,89,89,89,-250,-255,-254,89,-272,89,89,-265,-266,-280,-281,-282,-237,89,-252,-224,-226,-267,-271,89,-268,-269,-386,-249,-256,-273,-276,-257,-264,89,-251,]),'OR':([23,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,104,105,106,107,108,109,110,111,112,113,114,115,116,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,262,263,266,267,269,272,279,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,342,343,344,345,346,347,348,355,361,378,379,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,412,413,415,416,418,419,420,421,427,429,430,431,432,433,434,446,447,448,458,459,461,462,463,465,468,471,474,475,476,477,487,489,510,511,512,513,514,515,516,517,518,519,520,521,522,523,527,534,535,536,537,538,539,541,542,543,544,545,546,547,559,560,563,564,565,566,567,572,580,582,587,591,619,620,621,622,623,624,625,626,627,628,629,640,643,644,645,646,647,648,652,653,654,658,659,662,663,664,666,667,668,669,670,671,677,678,680,681,683,684,685,686,687,688,704,705,706,707,708,710,712,713,716,727,728,729,731,732,733,734,735,738,739,],[90,90,-378,246,90,90,90,90,90,90,90,90,90,90,-155,-156,-157,-158,-159,-160,-161,-162,90,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,90,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,90,90,246,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,90,90,90,246,-336,-379,90,246,90,90,90,-228,-229,-230,90,90,90,90,90,90,90,90,90,-279,90,-283,-233,-248,246,90,-161,-175,-176,-384,-385,90,246,-154,90,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,246,246,246,246,246,246,-163,90,90,90,90,246,90,-258,-259,90,246,246,-386,246,90,90,-386,246,246,90,90,90,-386,-386,246,90,-232,-247,-383,246,90,246,90,90,90,-174,90,90,90,-173,90,90,-358,90,246,246,-166,246,246,90,90,-227,246,246,90,90,90,90,90,90,90,246,246,90,90,90,90,90,-238,-154,90,90,90,246,246,246,246,246,246,246,246,-337,90,-338,246,246,246,246,246,246,246,-250,-255,-254,90,-272,246,90,90,-265,-266,-280,-281,-282,-237,90,-161,246,-158,-170,-171,-172,-167,-168,-169,-252,-224,-226,-267,-271,90,-268,-269,246,-386,-249,-256,-273,246,-276,-257,-264,90,-251,]),'XOR':([23,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,104,105,106,107,108,109,110,111,112,113,114,115,116,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,262,263,266,267,269,272,279,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,342,343,344,345,346,347,348,355,361,378,379,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,412,413,415,416,418,419,420,421,427,429,430,431,432,433,434,446,447,448,458,459,461,462,463,465,468,471,474,475,476,477,487,489,510,511,512,513,514,515,516,517,518,519,520,521,522,523,527,534,535,536,537,538,539,541,542,543,544,545,546,547,559,560,563,564,565,566,567,572,580,582,587,591,619,620,621,622,623,624,625,626,627,628,629,640,643,644,645,646,647,648,652,653,654,658,659,662,663,664,666,667,668,669,670,671,677,678,680,681,683,684,685,686,687,688,704,705,706,707,708,710,712,713,716,727,728,729,731,732,733,734,735,738,739,],[91,91,-378,244,91,91,91,91,91,91,91,91,91,91,-155,-156,-157,-158,-159,-160,-161,-162,91,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,91,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,91,91,244,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,91,91,91,244,-336,-379,91,244,91,91,91,-228,-229,-230,91,91,91,91,91,91,91,91,91,-279,91,-283,-233,-248,244,91,-161,-175,-176,-384,-385,91,244,-154,91,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,244,244,244,244,244,244,244,-163,91,91,91,91,244,91,-258,-259,91,244,244,-386,244,91,91,-386,244,244,91,91,91,-386,-386,244,91,-232,-247,-383,244,91,244,91,91,91,-174,91,91,91,-173,91,91,-358,91,244,244,-166,244,244,91,91,-227,244,244,91,91,91,91,91,91,91,244,244,91,91,91,91,91,-238,-154,91,91,91,244,244,244,244,244,244,244,244,-337,91,-338,244,244,244,244,244,244,244,-250,-255,-254,91,-272,244,91,91,-265,-266,-280,-281,-282,-237,91,-161,244,-158,-170,-171,-172,-167,-168,-169,-252,-224,-226,-267,-271,91,-268,-269,244,-386,-249,-256,-273,244,-276,-257,-264,91,-251,]),'XNOR':([23,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,104,105,106,107,108,109,110,111,112,113,114,115,116,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,262,263,266,267,269,272,279,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,342,343,344,345,346,347,348,355,361,378,379,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,412,413,415,416,418,419,420,421,427,429,430,431,432,433,434,446,447,448,458,459,461,462,463,465,468,471,474,475,476,477,487,489,510,511,512,513,514,515,516,517,518,519,520,521,522,523,527,534,535,536,537,538,539,541,542,543,544,545,546,547,559,560,563,564,565,566,567,572,580,582,587,591,619,620,621,622,623,624,625,626,627,628,629,640,643,644,645,646,647,648,652,653,654,658,659,662,663,664,666,667,668,669,670,671,677,678,680,681,683,684,685,686,687,688,704,705,706,707,708,710,712,713,716,727,728,729,731,732,733,734,735,738,739,],[92,92,-378,245,92,92,92,92,92,92,92,92,92,92,-155,-156,-157,-158,-159,-160,-161,-162,92,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,92,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,92,92,245,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,92,92,92,245,-336,-379,92,245,92,92,92,-228,-229,-230,92,92,92,92,92,92,92,92,92,-279,92,-283,-233,-248,245,92,-161,-175,-176,-384,-385,92,245,-154,92,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,245,245,245,245,245,245,245,-163,92,92,92,92,245,92,-258,-259,92,245,245,-386,245,92,92,-386,245,245,92,92,92,-386,-386,245,92,-232,-247,-383,245,92,245,92,92,92,-174,92,92,92,-173,92,92,-358,92,245,245,-166,245,245,92,92,-227,245,245,92,92,92,92,92,92,92,245,245,92,92,92,92,92,-238,-154,92,92,92,245,245,245,245,245,245,245,245,-337,92,-338,245,245,245,245,245,245,245,-250,-255,-254,92,-272,245,92,92,-265,-266,-280,-281,-282,-237,92,-161,245,-158,-170,-171,-172,-167,-168,-169,-252,-224,-226,-267,-271,92,-268,-269,245,-386,-249,-256,-273,245,-276,-257,-264,92,-251,]),'LBRACE':([23,51,52,53,80,81,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,104,105,106,107,108,109,110,111,112,113,114,115,116,132,136,156,162,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,192,193,194,195,198,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,262,263,266,267,269,272,273,274,280,282,284,285,286,287,289,292,294,298,299,304,306,307,318,319,320,321,322,323,324,327,328,329,330,331,332,333,334,335,336,338,339,340,341,343,344,345,346,347,348,355,367,378,379,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,411,412,413,415,416,419,420,421,422,425,427,431,433,434,436,439,440,442,443,446,450,458,459,461,462,463,468,471,472,473,474,475,477,489,495,496,497,498,501,502,503,504,505,510,511,512,513,514,515,516,517,518,519,520,523,530,532,535,536,537,541,542,543,544,545,546,547,549,551,554,561,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,582,587,591,595,604,608,619,627,628,629,636,637,638,652,653,654,655,658,659,663,664,666,667,668,669,670,671,672,677,683,684,685,686,687,688,703,704,705,706,707,708,709,710,711,712,713,714,727,728,729,730,731,733,734,735,738,739,],[101,162,-386,-386,101,-378,101,101,101,101,101,101,101,101,101,101,-155,-156,-157,-158,-159,-160,-161,-162,101,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,101,-231,162,162,-386,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,162,-386,-386,-386,101,-231,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,101,101,101,413,-336,-379,101,-386,-70,101,101,101,-228,-229,-230,-80,-85,-89,101,-92,101,101,101,-197,-206,-199,-200,-201,-202,101,101,101,101,-386,101,-279,101,-283,-386,-233,-235,-236,-386,-248,101,-228,-229,-230,-384,-385,101,-386,-154,101,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-163,101,101,101,101,101,-258,-259,162,-71,101,-386,101,101,-81,-90,-91,-93,-94,-386,162,101,101,101,-386,-386,101,-232,-234,-386,-247,-383,101,101,-386,-347,-348,-349,-386,-365,-366,-367,-368,101,101,-174,101,101,101,-173,101,101,-358,101,-166,-386,-261,101,101,-227,101,101,101,101,101,101,101,-189,-198,-207,-386,101,101,101,101,101,-386,-386,-386,-386,-238,-240,-241,-242,-243,-244,-245,-246,-227,101,101,101,-346,162,-364,-153,-337,101,-338,-231,162,-260,-250,-255,-254,-386,101,-272,101,101,-265,-266,-280,-281,-282,-237,-239,101,-170,-171,-172,-167,-168,-169,-386,-252,-224,-226,-267,-271,-386,101,-386,-268,-269,-386,-386,-249,-256,-386,-273,-276,-257,-264,101,-251,]),'DOLLER':([23,52,53,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,136,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,274,280,282,284,285,286,287,289,292,294,298,299,304,306,307,318,319,320,321,322,323,324,327,328,329,331,332,333,334,335,336,338,339,340,341,343,347,348,355,379,412,413,415,416,419,420,421,425,427,431,433,434,436,439,440,442,443,446,458,459,461,462,463,468,471,472,473,474,475,477,489,510,511,512,513,514,515,516,517,518,520,535,536,537,541,542,543,544,545,546,547,549,551,554,561,563,564,565,566,567,569,570,571,572,573,574,575,576,577,578,579,582,587,591,628,652,653,654,655,658,659,663,664,666,667,668,669,670,671,672,677,683,684,685,686,687,688,703,704,705,706,707,708,709,710,711,712,713,714,727,728,729,730,731,733,734,735,738,739,],[102,-386,102,102,-378,102,102,102,102,102,102,102,102,102,102,102,-179,-180,-181,-182,-183,-184,-185,-186,-178,102,-231,102,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-379,102,-70,102,102,102,-228,-229,-230,-80,-85,-89,102,-92,102,102,102,-197,-206,-199,-200,-201,-202,102,102,102,102,102,-279,102,-283,102,-233,-235,-236,102,-248,102,-384,-385,102,102,102,102,102,102,102,-258,-259,-71,102,-386,102,102,-81,-90,-91,-93,-94,-386,102,102,102,-386,-386,102,-232,-234,102,-247,-383,102,102,102,102,-174,102,102,102,-173,102,102,102,102,102,-227,102,102,102,102,102,102,102,-189,-198,-207,102,102,102,102,102,102,102,102,102,-238,-240,-241,-242,-243,-244,-245,-246,102,102,102,102,-250,-255,-254,102,102,-272,102,102,-265,-266,-280,-281,-282,-237,-239,102,-170,-171,-172,-167,-168,-169,102,-252,-224,-226,-267,-271,102,102,102,-268,-269,102,-386,-249,-256,102,-273,-276,-257,-264,102,-251,]),'INTNUMBER_DEC':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[107,107,-378,107,107,107,107,107,107,107,107,107,107,107,-179,-180,-181,-182,-183,-184,-185,-186,-178,107,107,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-379,107,107,107,107,-228,-229,-230,107,107,107,107,107,107,107,107,107,-279,107,-283,-233,-248,107,-384,-385,107,107,107,107,107,107,107,-258,-259,107,-386,107,107,-386,107,107,107,-386,-386,107,-232,-247,-383,107,107,107,107,107,107,107,107,107,107,107,107,-227,107,107,107,107,107,107,107,107,107,107,107,107,-238,107,107,107,107,-250,-255,-254,107,-272,107,107,-265,-266,-280,-281,-282,-237,107,-252,-224,-226,-267,-271,107,-268,-269,-386,-249,-256,-273,-276,-257,-264,107,-251,]),'SIGNED_INTNUMBER_DEC':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[108,108,-378,108,108,108,108,108,108,108,108,108,108,108,-179,-180,-181,-182,-183,-184,-185,-186,-178,108,108,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-379,108,108,108,108,-228,-229,-230,108,108,108,108,108,108,108,108,108,-279,108,-283,-233,-248,108,-384,-385,108,108,108,108,108,108,108,-258,-259,108,-386,108,108,-386,108,108,108,-386,-386,108,-232,-247,-383,108,108,108,108,108,108,108,108,108,108,108,108,-227,108,108,108,108,108,108,108,108,108,108,108,108,-238,108,108,108,108,-250,-255,-254,108,-272,108,108,-265,-266,-280,-281,-282,-237,108,-252,-224,-226,-267,-271,108,-268,-269,-386,-249,-256,-273,-276,-257,-264,108,-251,]),'INTNUMBER_BIN':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[109,109,-378,109,109,109,109,109,109,109,109,109,109,109,-179,-180,-181,-182,-183,-184,-185,-186,-178,109,109,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-379,109,109,109,109,-228,-229,-230,109,109,109,109,109,109,109,109,109,-279,109,-283,-233,-248,109,-384,-385,109,109,109,109,109,109,109,-258,-259,109,-386,109,109,-386,109,109,109,-386,-386,109,-232,-247,-383,109,109,109,109,109,109,109,109,109,109,109,109,-227,109,109,109,109,109,109,109,109,109,109,109,109,-238,109,109,109,109,-250,-255,-254,109,-272,109,109,-265,-266,-280,-281,-282,-237,109,-252,-224,-226,-267,-271,109,-268,-269,-386,-249,-256,-273,-276,-257,-264,109,-251,]),'SIGNED_INTNUMBER_BIN':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[110,110,-378,110,110,110,110,110,110,110,110,110,110,110,-179,-180,-181,-182,-183,-184,-185,-186,-178,110,110,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-379,110,110,110,110,-228,-229,-230,110,110,110,110,110,110,110,110,110,-279,110,-283,-233,-248,110,-384,-385,110,110,110,110,110,110,110,-258,-259,110,-386,110,110,-386,110,110,110,-386,-386,110,-232,-247,-383,110,110,110,110,110,110,110,110,110,110,110,110,-227,110,110,110,110,110,110,110,110,110,110,110,110,-238,110,110,110,110,-250,-255,-254,110,-272,110,110,-265,-266,-280,-281,-282,-237,110,-252,-224,-226,-267,-271,110,-268,-269,-386,-249,-256,-273,-276,-257,-264,110,-251,]),'INTNUMBER_OCT':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[111,111,-378,111,111,111,111,111,111,111,111,111,111,111,-179,-180,-181,-182,-183,-184,-185,-186,-178,111,111,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-379,111,111,111,111,-228,-229,-230,111,111,111,111,111,111,111,111,111,-279,111,-283,-233,-248,111,-384,-385,111,111,111,111,111,111,111,-258,-259,111,-386,111,111,-386,111,111,111,-386,-386,111,-232,-247,-383,111,111,111,111,111,111,111,111,111,111,111,111,-227,111,111,111,111,111,111,111,111,111,111,111,111,-238,111,111,111,111,-250,-255,-254,111,-272,111,111,-265,-266,-280,-281,-282,-237,111,-252,-224,-226,-267,-271,111,-268,-269,-386,-249,-256,-273,-276,-257,-264,111,-251,]),'SIGNED_INTNUMBER_OCT':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[112,112,-378,112,112,112,112,112,112,112,112,112,112,112,-179,-180,-181,-182,-183,-184,-185,-186,-178,112,112,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,-379,112,112,112,112,-228,-229,-230,112,112,112,112,112,112,112,112,112,-279,112,-283,-233,-248,112,-384,-385,112,112,112,112,112,112,112,-258,-259,112,-386,112,112,-386,112,112,112,-386,-386,112,-232,-247,-383,112,112,112,112,112,112,112,112,112,112,112,112,-227,112,112,112,112,112,112,112,112,112,112,112,112,-238,112,112,112,112,-250,-255,-254,112,-272,112,112,-265,-266,-280,-281,-282,-237,112,-252,-224,-226,-267,-271,112,-268,-269,-386,-249,-256,-273,-276,-257,-264,112,-251,]),'INTNUMBER_HEX':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[113,113,-378,113,113,113,113,113,113,113,113,113,113,113,-179,-180,-181,-182,-183,-184,-185,-186,-178,113,113,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-379,113,113,113,113,-228,-229,-230,113,113,113,113,113,113,113,113,113,-279,113,-283,-233,-248,113,-384,-385,113,113,113,113,113,113,113,-258,-259,113,-386,113,113,-386,113,113,113,-386,-386,113,-232,-247,-383,113,113,113,113,113,113,113,113,113,113,113,113,-227,113,113,113,113,113,113,113,113,113,113,113,113,-238,113,113,113,113,-250,-255,-254,113,-272,113,113,-265,-266,-280,-281,-282,-237,113,-252,-224,-226,-267,-271,113,-268,-269,-386,-249,-256,-273,-276,-257,-264,113,-251,]),'SIGNED_INTNUMBER_HEX':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[114,114,-378,114,114,114,114,114,114,114,114,114,114,114,-179,-180,-181,-182,-183,-184,-185,-186,-178,114,114,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-379,114,114,114,114,-228,-229,-230,114,114,114,114,114,114,114,114,114,-279,114,-283,-233,-248,114,-384,-385,114,114,114,114,114,114,114,-258,-259,114,-386,114,114,-386,114,114,114,-386,-386,114,-232,-247,-383,114,114,114,114,114,114,114,114,114,114,114,114,-227,114,114,114,114,114,114,114,114,114,114,114,114,-238,114,114,114,114,-250,-255,-254,114,-272,114,114,-265,-266,-280,-281,-282,-237,114,-252,-224,-226,-267,-271,114,-268,-269,-386,-249,-256,-273,-276,-257,-264,114,-251,]),'FLOATNUMBER':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,135,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[115,115,-378,115,115,115,115,115,115,115,115,115,115,115,-179,-180,-181,-182,-183,-184,-185,-186,-178,115,115,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-379,115,115,115,115,-228,-229,-230,115,115,115,115,115,115,115,115,115,-279,115,-283,-233,-248,115,-384,-385,115,115,115,115,115,115,115,-258,-259,115,-386,115,115,-386,115,115,115,-386,-386,115,-232,-247,-383,115,115,115,115,115,115,115,115,115,115,115,115,-227,115,115,115,115,115,115,115,115,115,115,115,115,-238,115,115,115,115,-250,-255,-254,115,-272,115,115,-265,-266,-280,-281,-282,-237,115,-252,-224,-226,-267,-271,115,-268,-269,-386,-249,-256,-273,-276,-257,-264,115,-251,]),'STRING_LITERAL':([23,80,81,83,84,85,86,87,88,89,90,91,92,101,107,108,109,110,111,112,113,114,115,132,136,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,269,272,280,282,284,285,286,287,298,304,306,307,324,327,328,329,331,332,333,334,336,341,343,347,348,355,379,412,413,415,416,419,420,421,427,431,433,434,446,458,459,461,462,463,468,471,474,475,477,489,510,511,513,514,515,517,518,520,535,536,537,541,542,543,544,545,546,547,563,564,565,566,567,572,582,587,591,628,652,653,654,658,659,663,664,666,667,668,669,670,671,677,704,705,706,707,708,710,712,713,727,728,729,731,733,734,735,738,739,],[116,116,-378,116,116,116,116,116,116,116,116,116,116,116,-179,-180,-181,-182,-183,-184,-185,-186,-178,116,-231,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-379,116,116,116,116,-228,-229,-230,116,116,116,116,116,116,116,116,116,-279,116,-283,-233,-248,116,-384,-385,116,116,116,116,116,116,116,-258,-259,116,-386,116,116,-386,116,116,116,-386,-386,116,-232,-247,-383,116,116,116,116,116,116,116,116,116,116,116,116,-227,116,116,116,116,116,116,116,116,116,116,116,116,-238,116,116,116,116,-250,-255,-254,116,-272,116,116,-265,-266,-280,-281,-282,-237,116,-252,-224,-226,-267,-271,116,-268,-269,-386,-249,-256,-273,-276,-257,-264,116,-251,]),'ENDGENERATE':([29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,79,119,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,271,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,381,425,426,436,439,440,442,443,471,474,475,479,492,540,572,593,606,630,631,632,652,653,654,666,667,668,669,670,671,682,696,704,705,706,707,712,713,719,720,721,722,724,725,726,728,729,734,735,739,740,],[-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-386,-8,270,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,-98,-238,-344,-362,-328,-329,-330,-250,-255,-254,-265,-266,-280,-281,-282,-237,-343,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,-333,-334,-335,-249,-256,-257,-264,-251,-326,]),'IF':([29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,52,53,79,81,107,108,109,110,111,112,113,114,115,119,120,121,122,123,124,136,163,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,192,193,194,198,269,271,274,278,285,286,287,289,292,294,299,302,315,316,318,319,320,321,322,323,332,334,335,336,338,339,340,341,344,345,346,347,348,353,364,367,381,425,426,436,439,440,442,443,471,472,473,474,475,479,492,495,496,497,498,501,502,503,504,505,512,516,529,537,540,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,580,593,595,604,606,608,630,631,632,633,652,653,654,655,666,667,668,669,670,671,672,682,683,684,685,686,687,688,690,691,693,696,703,704,705,706,707,709,711,712,713,714,719,720,721,722,723,724,725,726,728,729,730,734,735,737,739,740,],[-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,125,-386,183,-8,-378,-179,-180,-181,-182,-183,-184,-185,-186,-178,125,-319,-321,-322,-323,-324,-231,183,-196,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,325,183,183,183,-231,-379,-320,-70,-76,-228,-229,-230,-80,-85,-89,-92,-314,-188,-223,-197,-206,-199,-200,-201,-202,-279,-283,183,-233,-235,-236,183,-248,-228,-229,-230,-384,-385,-290,-291,-386,-7,-71,-77,-81,-90,-91,-93,-94,-232,-234,183,-247,-383,-284,-285,183,-347,-348,-349,183,-365,-366,-367,-368,-174,-173,125,-227,-98,-189,-198,-207,183,183,183,183,-238,-240,-241,-242,-243,-244,-245,-246,-227,-344,-346,325,-362,-364,-328,-329,-330,125,-250,-255,-254,183,-265,-266,-280,-281,-282,-237,-239,-343,-170,-171,-172,-167,-168,-169,125,125,125,-99,183,-252,-224,-226,-267,183,183,-268,-269,183,-327,-331,-332,-325,125,-333,-334,-335,-249,-256,183,-257,-264,125,-251,-326,]),'FOR':([29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,52,53,79,81,119,120,121,122,123,124,163,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,271,274,278,289,292,294,299,302,315,316,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,353,364,367,381,425,426,436,439,440,442,443,471,472,473,474,475,479,492,495,496,497,498,501,502,503,504,505,512,516,529,540,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,593,595,606,608,630,631,632,633,652,653,654,655,666,667,668,669,670,671,672,682,683,684,685,686,687,688,690,691,693,696,703,704,705,706,707,709,711,712,713,714,719,720,721,722,723,724,725,726,728,729,730,734,735,737,739,740,],[-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,126,-386,188,-8,-378,126,-319,-321,-322,-323,-324,188,-196,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,188,188,188,-379,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-197,-206,-199,-200,-201,-202,-279,-283,188,-233,-235,-236,188,-248,-384,-385,-290,-291,-386,-7,-71,-77,-81,-90,-91,-93,-94,-232,-234,188,-247,-383,-284,-285,188,-347,-348,-349,188,-365,-366,-367,-368,-174,-173,126,-98,-189,-198,-207,188,188,188,188,-238,-240,-241,-242,-243,-244,-245,-246,-344,-346,-362,-364,-328,-329,-330,126,-250,-255,-254,188,-265,-266,-280,-281,-282,-237,-239,-343,-170,-171,-172,-167,-168,-169,126,126,126,-99,188,-252,-224,-226,-267,188,188,-268,-269,188,-327,-331,-332,-325,126,-333,-334,-335,-249,-256,188,-257,-264,126,-251,-326,]),'ELSE':([29,30,31,32,33,34,35,36,37,38,39,40,41,42,79,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,274,278,289,292,294,299,302,315,316,332,334,336,341,347,348,353,364,381,425,426,436,439,440,442,443,471,474,475,479,492,540,572,593,606,630,631,632,652,653,654,666,667,668,669,670,671,682,696,704,705,706,707,712,713,719,720,721,722,724,725,726,728,729,734,735,739,740,],[-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-8,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,-233,-248,-384,-385,-290,-291,-7,-71,-77,-81,-90,-91,-93,-94,-232,-247,-383,-284,-285,-98,-238,-344,-362,690,-329,-330,703,-255,-254,-265,-266,-280,-281,-282,-237,-343,-99,730,-224,-226,-267,-268,-269,-327,-331,-332,-325,-333,-334,-335,-249,-256,-257,-264,-251,-326,]),'END':([29,30,31,32,33,34,35,36,37,38,39,40,41,42,79,120,121,122,123,124,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,193,271,274,278,289,292,294,299,302,315,316,332,334,335,336,338,339,341,347,348,353,364,381,425,426,436,439,440,442,443,471,472,473,474,475,479,492,540,571,572,573,574,575,576,577,578,579,593,606,630,631,632,633,652,653,654,666,667,668,669,670,671,672,682,691,696,704,705,706,707,712,713,719,720,721,722,723,724,725,726,728,729,734,735,737,739,740,],[-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-8,-319,-321,-322,-323,-324,-277,-278,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,336,-320,-70,-76,-80,-85,-89,-92,-314,-188,-223,-279,-283,471,-233,-235,-236,-248,-384,-385,-290,-291,-7,-71,-77,-81,-90,-91,-93,-94,-232,-234,572,-247,-383,-284,-285,-98,671,-238,-240,-241,-242,-243,-244,-245,-246,-344,-362,-328,-329,-330,-386,-250,-255,-254,-265,-266,-280,-281,-282,-237,-239,-343,722,-99,-252,-224,-226,-267,-268,-269,-327,-331,-332,-325,-386,-333,-334,-335,-249,-256,-257,-264,740,-251,-326,]),'LBRACKET':([44,46,48,49,56,58,59,60,61,62,63,64,65,66,73,78,81,96,99,130,133,160,161,269,285,288,310,314,321,322,344,350,372,424,499,512,516,556,557,678,681,],[132,-39,132,132,132,-32,-33,-34,-35,-36,-37,-38,-40,-41,132,132,-378,260,262,-31,282,306,307,-379,433,434,306,307,458,459,262,132,132,282,132,-174,-173,433,434,262,260,]),'AT':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,425,436,439,440,442,443,471,472,473,474,475,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[164,164,-378,164,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,164,164,164,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,164,-233,-235,-236,164,-248,-384,-385,-71,-81,-90,-91,-93,-94,-232,-234,164,-247,-383,-174,-173,-189,-198,-207,164,164,164,164,-238,-240,-241,-242,-243,-244,-245,-246,-250,-255,-254,164,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,164,-252,-224,-226,-267,164,164,-268,-269,164,-249,-256,164,-257,-264,-251,]),'CASE':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,367,425,436,439,440,442,443,471,472,473,474,475,495,496,497,498,501,502,503,504,505,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,595,608,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,185,-378,185,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,185,185,185,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,185,-233,-235,-236,185,-248,-384,-385,-386,-71,-81,-90,-91,-93,-94,-232,-234,185,-247,-383,185,-347,-348,-349,185,-365,-366,-367,-368,-174,-173,-189,-198,-207,185,185,185,185,-238,-240,-241,-242,-243,-244,-245,-246,-346,-364,-250,-255,-254,185,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,185,-252,-224,-226,-267,185,185,-268,-269,185,-249,-256,185,-257,-264,-251,]),'CASEX':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,367,425,436,439,440,442,443,471,472,473,474,475,495,496,497,498,501,502,503,504,505,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,595,608,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,186,-378,186,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,186,186,186,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,186,-233,-235,-236,186,-248,-384,-385,-386,-71,-81,-90,-91,-93,-94,-232,-234,186,-247,-383,186,-347,-348,-349,186,-365,-366,-367,-368,-174,-173,-189,-198,-207,186,186,186,186,-238,-240,-241,-242,-243,-244,-245,-246,-346,-364,-250,-255,-254,186,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,186,-252,-224,-226,-267,186,186,-268,-269,186,-249,-256,186,-257,-264,-251,]),'CASEZ':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,367,425,436,439,440,442,443,471,472,473,474,475,501,502,503,504,505,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,608,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,187,-378,187,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,187,187,187,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,187,-233,-235,-236,187,-248,-384,-385,-386,-71,-81,-90,-91,-93,-94,-232,-234,187,-247,-383,187,-365,-366,-367,-368,-174,-173,-189,-198,-207,187,187,187,187,-238,-240,-241,-242,-243,-244,-245,-246,-364,-250,-255,-254,187,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,187,-252,-224,-226,-267,187,187,-268,-269,187,-249,-256,187,-257,-264,-251,]),'WHILE':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,367,425,436,439,440,442,443,471,472,473,474,475,495,496,497,498,501,502,503,504,505,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,595,608,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,189,-378,189,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,189,189,189,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,189,-233,-235,-236,189,-248,-384,-385,-386,-71,-81,-90,-91,-93,-94,-232,-234,189,-247,-383,189,-347,-348,-349,189,-365,-366,-367,-368,-174,-173,-189,-198,-207,189,189,189,189,-238,-240,-241,-242,-243,-244,-245,-246,-346,-364,-250,-255,-254,189,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,189,-252,-224,-226,-267,189,189,-268,-269,189,-249,-256,189,-257,-264,-251,]),'WAIT':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,425,436,439,440,442,443,471,472,473,474,475,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,191,-378,191,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,191,191,191,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,191,-233,-235,-236,191,-248,-384,-385,-71,-81,-90,-91,-93,-94,-232,-234,191,-247,-383,-174,-173,-189,-198,-207,191,191,191,191,-238,-240,-241,-242,-243,-244,-245,-246,-250,-255,-254,191,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,191,-252,-224,-226,-267,191,191,-268,-269,191,-249,-256,191,-257,-264,-251,]),'FOREVER':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,425,436,439,440,442,443,471,472,473,474,475,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,192,-378,192,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,192,192,192,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,192,-233,-235,-236,192,-248,-384,-385,-71,-81,-90,-91,-93,-94,-232,-234,192,-247,-383,-174,-173,-189,-198,-207,192,192,192,192,-238,-240,-241,-242,-243,-244,-245,-246,-250,-255,-254,192,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,192,-252,-224,-226,-267,192,192,-268,-269,192,-249,-256,192,-257,-264,-251,]),'BEGIN':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,367,425,436,439,440,442,443,471,472,473,474,475,495,496,497,498,501,502,503,504,505,512,516,529,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,595,608,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,690,693,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,193,-378,193,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,193,193,193,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,193,-233,-235,-236,193,-248,-384,-385,-386,-71,-81,-90,-91,-93,-94,-232,-234,193,-247,-383,193,-347,-348,-349,193,-365,-366,-367,-368,-174,-173,633,-189,-198,-207,193,193,193,193,-238,-240,-241,-242,-243,-244,-245,-246,-346,-364,-250,-255,-254,193,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,633,633,193,-252,-224,-226,-267,193,193,-268,-269,193,-249,-256,193,-257,-264,-251,]),'FORK':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,425,436,439,440,442,443,471,472,473,474,475,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,194,-378,194,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,194,194,194,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,194,-233,-235,-236,194,-248,-384,-385,-71,-81,-90,-91,-93,-94,-232,-234,194,-247,-383,-174,-173,-189,-198,-207,194,194,194,194,-238,-240,-241,-242,-243,-244,-245,-246,-250,-255,-254,194,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,194,-252,-224,-226,-267,194,194,-268,-269,194,-249,-256,194,-257,-264,-251,]),'DISABLE':([52,53,81,163,165,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,192,193,194,269,274,289,292,294,299,318,319,320,321,322,323,332,334,335,336,338,339,340,341,347,348,425,436,439,440,442,443,471,472,473,474,475,512,516,549,551,554,561,569,570,571,572,573,574,575,576,577,578,579,652,653,654,655,666,667,668,669,670,671,672,683,684,685,686,687,688,703,704,705,706,707,709,711,712,713,714,728,729,730,734,735,739,],[-386,199,-378,199,-196,-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,199,199,199,-379,-70,-80,-85,-89,-92,-197,-206,-199,-200,-201,-202,-279,-283,199,-233,-235,-236,199,-248,-384,-385,-71,-81,-90,-91,-93,-94,-232,-234,199,-247,-383,-174,-173,-189,-198,-207,199,199,199,199,-238,-240,-241,-242,-243,-244,-245,-246,-250,-255,-254,199,-265,-266,-280,-281,-282,-237,-239,-170,-171,-172,-167,-168,-169,199,-252,-224,-226,-267,199,199,-268,-269,199,-249,-256,199,-257,-264,-251,]),'COMMA':([67,69,70,71,72,81,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,127,131,133,137,139,140,141,142,143,144,147,149,152,153,154,201,205,207,216,221,250,251,252,253,254,255,256,257,258,259,263,265,266,267,269,276,281,291,296,297,300,301,308,309,310,311,312,313,314,320,321,322,323,351,352,357,358,359,360,361,363,369,371,373,374,376,377,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,408,409,410,411,415,416,423,424,429,435,437,438,441,444,449,452,455,481,482,483,484,485,487,488,506,512,516,519,521,522,523,524,525,526,527,528,548,583,589,590,618,619,626,627,629,650,651,660,662,673,675,676,679,683,684,685,686,687,688,689,695,697,698,699,700,701,702,715,717,718,732,736,],[212,215,-29,-43,-30,-378,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,275,-73,-74,290,-83,-84,293,-87,-88,295,-96,295,303,-316,-317,354,-293,354,-46,375,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-386,412,-165,-336,-379,275,-75,290,295,295,295,295,450,-109,-110,-111,-112,-113,-106,-199,-200,-201,-202,480,-287,489,490,-307,-310,-308,480,-28,-42,-48,-47,508,509,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,520,-360,-361,-163,-386,-386,-72,-74,-118,-82,-86,-95,-97,-315,-107,553,-205,-292,585,587,-301,-299,-302,-294,-44,-174,-173,-358,-164,-165,-166,628,-340,-341,-342,628,-108,-286,-306,-309,-45,-153,-359,-337,-338,-203,-204,710,-275,-288,-300,-298,-313,-170,-171,-172,-167,-168,-169,-339,-50,-103,-104,-105,-100,-101,-102,-289,-311,-312,-274,-303,]),'DOT':([81,96,99,160,161,203,269,285,288,310,314,321,322,344,355,477,490,512,516,556,557,582,585,678,681,],[-378,261,264,264,261,362,-379,264,261,264,261,264,261,264,486,362,362,-174,-173,264,261,362,486,264,261,]),'POWER':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,226,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,226,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,226,-336,-379,226,226,-161,-175,-176,226,-154,226,-129,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,-163,226,226,226,226,226,226,226,226,226,-174,-173,-358,226,226,-166,226,226,226,226,226,226,-154,226,226,226,226,226,226,226,226,-337,-338,226,226,226,226,226,226,226,226,-161,226,-158,-170,-171,-172,-167,-168,-169,226,226,]),'DIVIDE':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,227,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,227,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,227,-336,-379,227,227,-161,-175,-176,227,-154,-130,-129,-131,-132,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,227,-163,227,227,227,227,227,227,227,227,227,-174,-173,-358,227,227,-166,227,227,227,227,227,227,-154,227,227,227,227,227,227,227,227,-337,-338,227,227,227,227,227,227,227,227,-161,227,-158,-170,-171,-172,-167,-168,-169,227,227,]),'MOD':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,228,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,228,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,228,-336,-379,228,228,-161,-175,-176,228,-154,-130,-129,-131,-132,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,228,-163,228,228,228,228,228,228,228,228,228,-174,-173,-358,228,228,-166,228,228,228,228,228,228,-154,228,228,228,228,228,228,228,228,-337,-338,228,228,228,228,228,228,228,228,-161,228,-158,-170,-171,-172,-167,-168,-169,228,228,]),'LSHIFT':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,231,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,231,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,231,-336,-379,231,231,-161,-175,-176,231,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,231,231,231,231,231,231,231,231,231,231,231,231,231,231,231,231,231,231,-163,231,231,231,231,231,231,231,231,231,-174,-173,-358,231,231,-166,231,231,231,231,231,231,-154,231,231,231,231,231,231,231,231,-337,-338,231,231,231,231,231,231,231,231,-161,231,-158,-170,-171,-172,-167,-168,-169,231,231,]),'RSHIFT':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,232,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,232,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,232,-336,-379,232,232,-161,-175,-176,232,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,232,232,232,232,232,232,232,232,232,232,232,232,232,232,232,232,232,232,-163,232,232,232,232,232,232,232,232,232,-174,-173,-358,232,232,-166,232,232,232,232,232,232,-154,232,232,232,232,232,232,232,232,-337,-338,232,232,232,232,232,232,232,232,-161,232,-158,-170,-171,-172,-167,-168,-169,232,232,]),'LSHIFTA':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,233,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,233,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,233,-336,-379,233,233,-161,-175,-176,233,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,233,233,233,233,233,233,233,233,233,233,233,233,233,233,233,233,233,233,-163,233,233,233,233,233,233,233,233,233,-174,-173,-358,233,233,-166,233,233,233,233,233,233,-154,233,233,233,233,233,233,233,233,-337,-338,233,233,233,233,233,233,233,233,-161,233,-158,-170,-171,-172,-167,-168,-169,233,233,]),'RSHIFTA':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,234,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,234,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,234,-336,-379,234,234,-161,-175,-176,234,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,234,234,234,234,234,234,234,234,234,234,234,234,234,234,234,234,234,234,-163,234,234,234,234,234,234,234,234,234,-174,-173,-358,234,234,-166,234,234,234,234,234,234,-154,234,234,234,234,234,234,234,234,-337,-338,234,234,234,234,234,234,234,234,-161,234,-158,-170,-171,-172,-167,-168,-169,234,234,]),'LT':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,235,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,235,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,235,-336,-379,235,235,-161,-175,-176,235,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,235,235,235,235,235,235,235,235,235,235,235,235,235,235,-163,235,235,235,235,235,235,235,235,235,-174,-173,-358,235,235,-166,235,235,235,235,235,235,-154,235,235,235,235,235,235,235,235,-337,-338,235,235,235,235,235,235,235,235,-161,235,-158,-170,-171,-172,-167,-168,-169,235,235,]),'GT':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,236,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,236,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,236,-336,-379,236,236,-161,-175,-176,236,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,236,236,236,236,236,236,236,236,236,236,236,236,236,236,-163,236,236,236,236,236,236,236,236,236,-174,-173,-358,236,236,-166,236,236,236,236,236,236,-154,236,236,236,236,236,236,236,236,-337,-338,236,236,236,236,236,236,236,236,-161,236,-158,-170,-171,-172,-167,-168,-169,236,236,]),'LE':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,157,158,159,160,161,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,326,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,449,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,697,698,699,700,701,702,716,732,],[-378,237,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,-114,-115,-116,-117,-106,237,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,237,-336,-379,237,463,237,-161,-175,-176,237,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,237,237,237,237,237,237,237,237,237,237,237,237,237,237,-163,237,237,237,237,237,237,-107,237,237,237,-174,-173,-358,237,237,-166,237,237,237,237,237,237,-154,237,237,237,237,237,237,237,237,-337,-338,237,237,237,237,237,237,237,237,-161,237,-158,-170,-171,-172,-167,-168,-169,-103,-104,-105,-100,-101,-102,237,237,]),'GE':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,238,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,238,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,238,-336,-379,238,238,-161,-175,-176,238,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,238,238,238,238,238,238,238,238,238,238,238,238,238,238,-163,238,238,238,238,238,238,238,238,238,-174,-173,-358,238,238,-166,238,238,238,238,238,238,-154,238,238,238,238,238,238,238,238,-337,-338,238,238,238,238,238,238,238,238,-161,238,-158,-170,-171,-172,-167,-168,-169,238,238,]),'EQ':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,239,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,239,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,239,-336,-379,239,239,-161,-175,-176,239,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,239,239,239,239,239,239,239,239,239,239,-163,239,239,239,239,239,239,239,239,239,-174,-173,-358,239,239,-166,239,239,239,239,239,239,-154,239,239,239,239,239,239,239,239,-337,-338,239,239,239,239,239,239,239,239,-161,239,-158,-170,-171,-172,-167,-168,-169,239,239,]),'NE':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,240,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,240,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,240,-336,-379,240,240,-161,-175,-176,240,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,240,240,240,240,240,240,240,240,240,240,-163,240,240,240,240,240,240,240,240,240,-174,-173,-358,240,240,-166,240,240,240,240,240,240,-154,240,240,240,240,240,240,240,240,-337,-338,240,240,240,240,240,240,240,240,-161,240,-158,-170,-171,-172,-167,-168,-169,240,240,]),'EQL':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,241,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,241,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,241,-336,-379,241,241,-161,-175,-176,241,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,241,241,241,241,241,241,241,241,241,241,-163,241,241,241,241,241,241,241,241,241,-174,-173,-358,241,241,-166,241,241,241,241,241,241,-154,241,241,241,241,241,241,241,241,-337,-338,241,241,241,241,241,241,241,241,-161,241,-158,-170,-171,-172,-167,-168,-169,241,241,]),'NEL':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,242,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,242,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,242,-336,-379,242,242,-161,-175,-176,242,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,242,242,242,242,242,242,242,242,242,242,-163,242,242,242,242,242,242,242,242,242,-174,-173,-358,242,242,-166,242,242,242,242,242,242,-154,242,242,242,242,242,242,242,242,-337,-338,242,242,242,242,242,242,242,242,-161,242,-158,-170,-171,-172,-167,-168,-169,242,242,]),'LAND':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,247,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,247,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,247,-336,-379,247,247,-161,-175,-176,247,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,247,247,247,247,247,-163,247,247,247,247,247,247,247,247,247,-174,-173,-358,247,247,-166,247,247,247,247,247,247,-154,247,247,247,247,247,247,247,247,-337,-338,247,247,247,247,247,247,247,247,-161,247,-158,-170,-171,-172,-167,-168,-169,247,247,]),'LOR':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,248,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,248,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,248,-336,-379,248,248,-161,-175,-176,248,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,248,248,248,248,-163,248,248,248,248,248,248,248,248,248,-174,-173,-358,248,248,-166,248,248,248,248,248,248,-154,248,248,248,248,248,248,248,248,-337,-338,248,248,248,248,248,248,248,248,-161,248,-158,-170,-171,-172,-167,-168,-169,248,248,]),'COND':([81,82,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,224,250,251,252,253,254,255,256,257,258,259,266,267,269,279,342,344,345,346,361,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,411,418,429,430,432,447,448,465,476,487,512,516,519,521,522,523,527,534,538,539,559,560,580,619,620,621,622,623,624,625,626,627,629,640,643,644,645,646,647,648,662,678,680,681,683,684,685,686,687,688,716,732,],[-378,249,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,249,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,249,-336,-379,249,249,-161,-175,-176,249,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,249,249,249,249,-163,249,249,249,249,249,249,249,249,249,-174,-173,-358,249,249,-166,249,249,249,249,249,249,-154,249,249,249,249,249,249,249,249,-337,-338,249,249,249,249,249,249,249,249,-161,249,-158,-170,-171,-172,-167,-168,-169,249,249,]),'RBRACE':([81,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,250,251,252,253,254,255,256,257,258,259,265,266,267,269,308,309,310,311,312,313,314,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,411,414,449,512,516,519,521,522,523,548,619,627,629,683,684,685,686,687,688,697,698,699,700,701,702,],[-378,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,411,-165,-336,-379,449,-109,-110,-111,-112,-113,-106,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-163,523,-107,-174,-173,-358,-164,-165,-166,-108,-153,-337,-338,-170,-171,-172,-167,-168,-169,-103,-104,-105,-100,-101,-102,]),'COLON':([81,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,193,250,251,252,253,254,255,256,257,258,259,267,269,279,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,411,430,447,448,512,516,519,523,559,560,619,627,629,633,660,661,662,683,684,685,686,687,688,732,],[-378,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,337,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-336,-379,427,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,510,511,515,-163,535,542,545,-174,-173,-358,-166,515,511,-153,-337,-338,692,709,711,-275,-170,-171,-172,-167,-168,-169,-274,]),'PLUSCOLON':([81,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,250,251,252,253,254,255,256,257,258,259,267,269,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,406,407,411,447,448,512,516,519,523,559,560,619,627,629,683,684,685,686,687,688,],[-378,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-336,-379,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,513,517,-163,543,546,-174,-173,-358,-166,517,513,-153,-337,-338,-170,-171,-172,-167,-168,-169,]),'MINUSCOLON':([81,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,250,251,252,253,254,255,256,257,258,259,267,269,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,406,407,411,447,448,512,516,519,523,559,560,619,627,629,683,684,685,686,687,688,],[-378,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-336,-379,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,514,518,-163,544,547,-174,-173,-358,-166,518,514,-153,-337,-338,-170,-171,-172,-167,-168,-169,]),'RBRACKET':([81,93,94,95,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,115,116,250,251,252,253,254,255,256,257,258,259,267,269,378,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,406,407,411,447,448,512,516,519,523,534,538,539,559,560,619,620,621,622,623,624,625,627,629,640,643,644,645,646,647,648,683,684,685,686,687,688,],[-378,-155,-156,-157,-158,-159,-160,-161,-162,-175,-176,-177,-179,-180,-181,-182,-183,-184,-185,-186,-178,-187,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-336,-379,-154,-130,-129,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,512,516,-163,516,512,-174,-173,-358,-166,639,516,512,516,512,-153,683,684,685,686,687,688,-337,-338,695,697,698,699,700,701,702,-170,-171,-172,-167,-168,-169,]),'JOIN':([168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,194,332,334,336,338,339,340,341,347,348,471,472,474,475,572,652,653,654,666,667,668,669,670,671,704,705,706,707,712,713,728,729,734,735,739,],[-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,341,-279,-283,-233,-235,-236,474,-248,-384,-385,-232,-234,-247,-383,-238,-250,-255,-254,-265,-266,-280,-281,-282,-237,-252,-224,-226,-267,-268,-269,-249,-256,-257,-264,-251,]),'ENDFUNCTION':([168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,332,334,336,341,347,348,471,474,475,494,572,592,594,596,597,598,599,600,601,602,603,652,653,654,666,667,668,669,670,671,704,705,706,707,712,713,728,729,734,735,739,],[-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-279,-283,-233,-248,-384,-385,-232,-247,-383,593,-238,682,-345,-350,-351,-352,-353,-354,-355,-356,-357,-250,-255,-254,-265,-266,-280,-281,-282,-237,-252,-224,-226,-267,-268,-269,-249,-256,-257,-264,-251,]),'ENDTASK':([168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,332,334,336,341,347,348,471,474,475,500,572,607,609,610,611,612,613,614,615,616,617,652,653,654,666,667,668,669,670,671,704,705,706,707,712,713,728,729,734,735,739,],[-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-279,-283,-233,-248,-384,-385,-232,-247,-383,606,-238,-363,-369,-370,-371,-372,-373,-374,-375,-376,-377,-250,-255,-254,-265,-266,-280,-281,-282,-237,-252,-224,-226,-267,-268,-269,-249,-256,-257,-264,-251,]),'ENDCASE':([168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,332,334,336,341,347,348,471,474,475,572,652,653,654,658,659,663,664,666,667,668,669,670,671,704,705,706,707,708,712,713,728,729,731,733,734,735,739,],[-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-279,-283,-233,-248,-384,-385,-232,-247,-383,-238,-250,-255,-254,707,-272,712,713,-265,-266,-280,-281,-282,-237,-252,-224,-226,-267,-271,-268,-269,-249,-256,-273,-276,-257,-264,-251,]),'DEFAULT':([168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,332,334,336,341,347,348,471,474,475,565,566,567,572,652,653,654,658,659,663,664,666,667,668,669,670,671,704,705,706,707,708,712,713,728,729,731,733,734,735,739,],[-208,-209,-210,-211,-212,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-279,-283,-233,-248,-384,-385,-232,-247,-383,661,661,661,-238,-250,-255,-254,661,-272,661,661,-265,-266,-280,-281,-282,-237,-252,-224,-226,-267,-271,-268,-269,-249,-256,-273,-276,-257,-264,-251,]),'POSEDGE':([317,550,],[456,456,]),'NEGEDGE':([317,550,],[457,457,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'source_text':([0,],[1,]),'description':([0,],[2,]),'definitions':([0,],[3,]),'definition':([0,3,],[4,9,]),'moduledef':([0,3,],[5,5,]),'pragma':([0,3,18,24,43,119,529,633,690,691,693,723,737,],[6,6,42,42,42,42,42,42,42,42,42,42,42,]),'modulename':([7,],[10,]),'paramlist':([10,],[14,]),'empty':([10,18,43,44,51,52,53,54,55,128,163,192,193,194,263,273,330,335,340,367,415,416,431,446,462,463,473,495,501,530,561,568,569,570,571,633,655,703,709,711,714,723,727,730,],[16,26,120,136,136,165,198,204,204,136,198,198,198,198,410,136,136,198,198,503,526,526,136,136,136,136,198,136,136,636,198,636,198,198,198,120,198,198,198,198,198,120,136,198,]),'portlist':([14,],[18,]),'items':([18,],[24,]),'item':([18,24,],[25,118,]),'standard_item':([18,24,43,119,529,633,690,691,693,723,737,],[27,27,122,122,122,122,122,122,122,122,122,]),'generate':([18,24,],[28,28,]),'decl':([18,24,43,119,366,367,473,493,495,501,529,571,633,690,691,693,723,737,],[29,29,29,29,497,504,575,497,497,504,29,575,29,29,29,29,29,29,]),'integerdecl':([18,24,43,119,366,367,473,493,495,501,529,571,633,690,691,693,723,737,],[30,30,30,30,498,505,576,498,498,505,30,576,30,30,30,30,30,30,]),'realdecl':([18,24,43,119,473,529,571,633,690,691,693,723,737,],[31,31,31,31,577,31,577,31,31,31,31,31,31,]),'declassign':([18,24,43,119,529,633,690,691,693,723,737,],[32,32,32,32,32,32,32,32,32,32,32,]),'parameterdecl':([18,24,43,119,473,529,571,633,690,691,693,723,737,],[33,33,33,33,578,33,578,33,33,33,33,33,33,]),'localparamdecl':([18,24,43,119,473,529,571,633,690,691,693,723,737,],[34,34,34,34,579,34,579,34,34,34,34,34,34,]),'genvardecl':([18,24,43,119,529,633,690,691,693,723,737,],[35,35,35,35,35,35,35,35,35,35,35,]),'assignment':([18,24,43,119,529,633,690,691,693,723,737,],[36,36,36,36,36,36,36,36,36,36,36,]),'always':([18,24,43,119,529,633,690,691,693,723,737,],[37,37,37,37,37,37,37,37,37,37,37,]),'initial':([18,24,43,119,529,633,690,691,693,723,737,],[38,38,38,38,38,38,38,38,38,38,38,]),'instance':([18,24,43,119,529,633,690,691,693,723,737,],[39,39,39,39,39,39,39,39,39,39,39,]),'function':([18,24,43,119,529,633,690,691,693,723,737,],[40,40,40,40,40,40,40,40,40,40,40,]),'task':([18,24,43,119,529,633,690,691,693,723,737,],[41,41,41,41,41,41,41,41,41,41,41,]),'sigtypes':([18,19,24,43,119,215,366,367,473,493,495,501,529,571,633,690,691,693,723,737,],[44,73,44,44,44,372,499,499,499,499,499,499,44,499,44,44,44,44,44,44,]),'sigtype':([18,19,24,43,44,73,119,215,366,367,372,473,493,495,499,501,529,571,633,690,691,693,723,737,],[58,58,58,58,130,130,58,58,58,58,130,58,58,58,130,58,58,58,58,58,58,58,58,58,]),'ports':([19,],[67,]),'ioports':([19,],[69,]),'portname':([19,73,212,215,217,372,507,],[70,216,369,373,374,506,618,]),'ioport_head':([19,],[71,]),'params':([21,],[74,]),'params_begin':([21,],[75,]),'param_end':([21,75,],[76,219,]),'param':([21,75,],[77,220,]),'expression':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[82,224,250,251,252,253,254,255,256,257,258,259,266,279,342,361,380,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,409,418,429,430,432,429,429,447,448,418,465,465,465,418,418,476,487,380,521,522,527,527,418,534,538,539,559,560,418,418,361,361,619,620,621,622,623,624,625,626,640,429,429,643,644,645,646,647,648,429,429,662,662,662,361,487,680,527,662,662,662,716,732,429,]),'concat':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,266,272,280,282,284,298,304,306,307,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,414,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'repeat':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,]),'partselect':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,164,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,317,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,552,553,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[95,95,95,95,95,95,95,95,95,95,95,95,95,95,323,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,323,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,323,323,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'pointer':([23,51,80,83,84,85,86,87,88,89,90,91,92,101,132,135,156,162,164,184,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,317,324,327,328,329,331,333,343,355,379,412,413,415,416,419,422,427,433,434,450,456,457,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,552,553,563,564,565,566,567,582,587,591,604,628,637,658,663,664,677,710,738,],[96,161,96,96,96,96,96,96,96,96,96,96,96,96,96,288,161,314,322,161,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,322,96,96,96,96,96,96,96,96,96,96,96,96,96,96,161,96,96,96,314,557,557,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,322,322,96,96,96,96,96,96,96,681,161,96,161,96,96,96,96,96,96,]),'functioncall':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'systemcall':([23,53,80,83,84,85,86,87,88,89,90,91,92,101,132,163,192,193,194,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,324,327,328,329,331,333,335,340,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,473,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,561,563,564,565,566,567,569,570,571,582,587,591,628,655,658,663,664,677,703,709,710,711,714,730,738,],[98,196,98,98,98,98,98,98,98,98,98,98,98,98,98,196,196,196,196,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,196,196,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,196,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,196,98,98,98,98,98,196,196,196,98,98,98,98,196,98,98,98,98,196,196,98,196,196,196,98,]),'identifier':([23,51,80,83,84,85,86,87,88,89,90,91,92,101,132,135,156,162,164,184,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,317,324,327,328,329,331,333,343,355,379,412,413,415,416,419,422,427,433,434,450,456,457,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,552,553,563,564,565,566,567,582,587,591,604,628,637,658,663,664,677,710,738,],[99,160,99,99,99,99,99,99,99,99,99,99,99,99,99,285,160,310,321,160,344,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,321,99,99,99,99,99,99,99,99,99,99,99,99,99,99,160,99,99,99,310,556,556,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,321,321,99,99,99,99,99,99,99,678,160,99,160,99,99,99,99,99,99,]),'const_expression':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,]),'scope':([23,51,80,83,84,85,86,87,88,89,90,91,92,101,132,135,156,162,164,184,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,317,324,327,328,329,331,333,343,355,379,412,413,415,416,419,422,427,433,434,450,456,457,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,552,553,563,564,565,566,567,582,587,591,604,628,637,658,663,664,677,710,738,],[103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,]),'intnumber':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,135,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[104,104,104,104,104,104,104,104,104,104,104,104,104,104,286,345,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'floatnumber':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,135,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,287,346,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'stringliteral':([23,80,83,84,85,86,87,88,89,90,91,92,101,132,195,203,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,260,262,263,272,280,282,284,298,304,306,307,324,327,328,329,331,333,343,355,379,412,413,415,416,419,427,433,434,458,459,461,468,477,489,510,511,513,514,515,517,518,520,535,536,541,542,543,544,545,546,547,563,564,565,566,567,582,587,591,628,658,663,664,677,710,738,],[106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'generate_items':([43,633,723,],[119,691,737,]),'generate_item':([43,119,529,633,690,691,693,723,737,],[121,271,631,121,720,271,725,121,271,]),'generate_if':([43,119,529,633,690,691,693,723,737,],[123,123,123,123,123,123,123,123,123,]),'generate_for':([43,119,529,633,690,691,693,723,737,],[124,124,124,124,124,124,124,124,124,]),'declnamelist':([44,128,499,605,],[127,276,127,276,]),'width':([44,48,49,56,73,78,350,372,499,],[128,145,150,208,217,222,478,507,605,]),'declassign_element':([44,128,],[129,277,]),'declname':([44,128,275,499,605,],[131,131,423,131,131,]),'delays':([44,51,53,128,163,192,193,194,273,330,335,340,431,446,462,463,473,495,501,530,561,568,569,570,571,655,703,709,711,714,727,730,],[134,156,184,134,184,184,184,184,422,422,184,184,536,541,563,564,184,604,604,637,184,637,184,184,184,184,184,184,184,184,738,184,]),'integernamelist':([45,138,],[137,291,]),'integername':([45,138,290,],[139,139,435,]),'realnamelist':([47,],[141,]),'realname':([47,293,],[142,437,]),'param_substitution_list':([48,49,78,145,146,150,151,222,223,],[144,149,221,296,297,300,301,376,377,]),'param_substitution':([48,49,78,145,146,150,151,222,223,295,375,508,509,],[147,147,147,147,147,147,147,147,147,438,438,438,438,]),'genvarlist':([50,],[152,]),'genvar':([50,303,],[153,444,]),'lvalue':([51,156,184,422,604,637,],[155,305,326,533,533,694,]),'lpartselect':([51,156,162,184,422,450,604,637,],[157,157,311,157,157,311,157,157,]),'lpointer':([51,156,162,184,422,450,604,637,],[158,158,312,158,158,312,158,158,]),'lconcat':([51,156,162,184,422,450,604,637,],[159,159,313,159,159,313,159,159,]),'senslist':([52,53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[163,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,]),'initial_statement':([53,],[166,]),'basic_statement':([53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[167,316,334,339,339,339,339,574,654,667,669,574,654,654,731,733,735,654,]),'if_statement':([53,163,192,193,194,335,340,473,495,501,561,569,570,571,655,703,709,711,714,730,],[168,168,168,168,168,168,168,168,597,610,168,168,168,168,168,168,168,168,168,168,]),'case_statement':([53,163,192,193,194,335,340,473,495,501,561,569,570,571,655,703,709,711,714,730,],[169,169,169,169,169,169,169,169,600,613,169,169,169,169,169,169,169,169,169,169,]),'casex_statement':([53,163,192,193,194,335,340,473,495,501,561,569,570,571,655,703,709,711,714,730,],[170,170,170,170,170,170,170,170,601,614,170,170,170,170,170,170,170,170,170,170,]),'casez_statement':([53,163,192,193,194,335,340,473,501,561,569,570,571,655,703,709,711,714,730,],[171,171,171,171,171,171,171,171,615,171,171,171,171,171,171,171,171,171,171,]),'for_statement':([53,163,192,193,194,335,340,473,495,501,561,569,570,571,655,703,709,711,714,730,],[172,172,172,172,172,172,172,172,598,611,172,172,172,172,172,172,172,172,172,172,]),'while_statement':([53,163,192,193,194,335,340,473,495,501,561,569,570,571,655,703,709,711,714,730,],[173,173,173,173,173,173,173,173,599,612,173,173,173,173,173,173,173,173,173,173,]),'event_statement':([53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,]),'wait_statement':([53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,]),'forever_statement':([53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,]),'block':([53,163,192,193,194,335,340,473,495,501,561,569,570,571,655,703,709,711,714,730,],[177,177,177,177,177,177,177,177,602,616,177,177,177,177,177,177,177,177,177,177,]),'namedblock':([53,163,192,193,194,335,340,473,495,501,561,569,570,571,655,703,709,711,714,730,],[178,178,178,178,178,178,178,178,603,617,178,178,178,178,178,178,178,178,178,178,]),'parallelblock':([53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,]),'blocking_substitution':([53,163,192,193,194,273,330,335,340,473,495,501,561,569,570,571,655,703,709,711,714,730,],[180,180,180,180,180,420,420,180,180,180,596,609,180,180,180,180,180,180,180,180,180,180,]),'nonblocking_substitution':([53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,]),'single_statement':([53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,]),'disable':([53,163,192,193,194,335,340,473,561,569,570,571,655,703,709,711,714,730,],[197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,]),'parameterlist':([54,55,],[200,206,]),'instance_bodylist_noname':([54,55,],[201,207,]),'instance_body_noname':([54,55,354,],[205,205,481,]),'concatlist':([101,413,],[265,265,]),'length':([133,424,],[281,281,]),'lconcatlist':([162,],[308,]),'lconcat_one':([162,450,],[309,548,]),'always_statement':([163,],[315,]),'levelsig':([164,317,552,553,],[318,455,650,651,]),'levelsig_base':([164,317,552,553,],[320,320,320,320,]),'block_statements':([193,194,],[335,340,]),'block_statement':([193,194,335,340,],[338,338,472,472,]),'instance_bodylist':([200,206,],[351,363,]),'instance_body':([200,206,480,],[352,352,583,]),'instance_ports':([203,477,582,],[356,581,674,]),'instance_ports_list':([203,477,582,],[357,357,357,]),'instance_ports_arg':([203,477,582,],[358,358,358,]),'instance_port_list':([203,477,489,582,],[359,359,589,359,]),'instance_port_arg':([203,477,490,582,],[360,360,590,360,]),'ioport':([215,],[371,]),'func_args':([263,],[408,]),'cond':([272,324,331,333,419,461,468,],[417,460,469,470,531,562,531,]),'forpre':([273,330,],[419,468,]),'rvalue':([280,298,304,536,541,563,564,738,],[428,441,445,641,642,656,657,741,]),'edgesigs':([317,],[451,]),'levelsigs':([317,],[452,]),'edgesig':([317,550,],[454,649,]),'case_comp':([327,328,329,],[464,466,467,]),'param_args':([355,],[482,]),'param_args_noname':([355,],[483,]),'param_arg':([355,585,],[484,675,]),'param_arg_noname':([355,587,],[485,676,]),'function_statement':([366,493,],[494,592,]),'funcvardecls':([366,493,],[495,495,]),'funcvardecl':([366,493,495,],[496,496,595,]),'task_statement':([367,],[500,]),'taskvardecls':([367,],[501,]),'taskvardecl':([367,501,],[502,608,]),'sysargs':([415,416,],[524,528,]),'sysarg':([415,416,628,],[525,525,689,]),'forcond':([419,468,],[530,568,]),'edgesig_base':([456,457,],[555,558,]),'namedblock_statements':([473,],[571,]),'namedblock_statement':([473,571,],[573,672,]),'function_calc':([495,],[594,]),'task_calc':([501,],[607,]),'gif_true_item':([529,],[630,]),'generate_block':([529,690,693,],[632,721,726,]),'forpost':([530,568,],[634,665,]),'blocking_substitution_base':([530,568,],[635,635,]),'true_statement':([561,655,],[652,704,]),'ifcontent_statement':([561,655,703,730,],[653,653,729,729,]),'casecontent_statements':([565,566,567,],[658,663,664,]),'casecontent_statement':([565,566,567,658,663,664,],[659,659,659,708,708,708,]),'casecontent_condition':([565,566,567,658,663,664,],[660,660,660,660,660,660,]),'whilecontent_statement':([569,],[666,]),'waitcontent_statement':([570,],[668,]),'gif_false_item':([690,],[719,]),'generate_forcontent':([693,],[724,]),'else_statement':([703,730,],[728,739,]),'forcontent_statement':([714,],[734,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> source_text","S'",1,None,None,None),
+  ('source_text -> description','source_text',1,'p_source_text','/tmp/pv/pyverilog/vparser/parser.py',113),
+  ('description -> definitions','description',1,'p_description','/tmp/pv/pyverilog/vparser/parser.py',118),
+  ('definitions -> definitions definition','definitions',2,'p_definitions','/tmp/pv/pyverilog/vparser/parser.py',123),
+  ('definitions -> definition','definitions',1,'p_definitions_one','/tmp/pv/pyverilog/vparser/parser.py',128),
+  ('definition -> moduledef','definition',1,'p_definition','/tmp/pv/pyverilog/vparser/parser.py',133),
+  ('definition -> pragma','definition',1,'p_definition_pragma','/tmp/pv/pyverilog/vparser/parser.py',138),
+  ('pragma -> LPAREN TIMES ID EQUALS expression TIMES RPAREN','pragma',7,'p_pragma_assign','/tmp/pv/pyverilog/vparser/parser.py',144),
+  ('pragma -> LPAREN TIMES ID TIMES RPAREN','pragma',5,'p_pragma','/tmp/pv/pyverilog/vparser/parser.py',149),
+  ('moduledef -> MODULE modulename paramlist portlist items ENDMODULE','moduledef',6,'p_moduledef','/tmp/pv/pyverilog/vparser/parser.py',155),
+  ('modulename -> ID','modulename',1,'p_modulename','/tmp/pv/pyverilog/vparser/parser.py',161),
+  ('modulename -> SENS_OR','modulename',1,'p_modulename_or','/tmp/pv/pyverilog/vparser/parser.py',166),
+  ('paramlist -> DELAY LPAREN params RPAREN','paramlist',4,'p_paramlist','/tmp/pv/pyverilog/vparser/parser.py',171),
+  ('paramlist -> empty','paramlist',1,'p_paramlist_empty','/tmp/pv/pyverilog/vparser/parser.py',176),
+  ('params -> params_begin param_end','params',2,'p_params','/tmp/pv/pyverilog/vparser/parser.py',180),
+  ('params_begin -> params_begin param','params_begin',2,'p_params_begin','/tmp/pv/pyverilog/vparser/parser.py',185),
+  ('params_begin -> param','params_begin',1,'p_params_begin_one','/tmp/pv/pyverilog/vparser/parser.py',190),
+  ('params -> param_end','params',1,'p_params_one','/tmp/pv/pyverilog/vparser/parser.py',195),
+  ('param -> PARAMETER param_substitution_list COMMA','param',3,'p_param','/tmp/pv/pyverilog/vparser/parser.py',200),
+  ('param -> PARAMETER width param_substitution_list COMMA','param',4,'p_param_width','/tmp/pv/pyverilog/vparser/parser.py',206),
+  ('param -> PARAMETER INTEGER param_substitution_list COMMA','param',4,'p_param_integer','/tmp/pv/pyverilog/vparser/parser.py',212),
+  ('param_end -> PARAMETER param_substitution_list','param_end',2,'p_param_end','/tmp/pv/pyverilog/vparser/parser.py',218),
+  ('param_end -> PARAMETER width param_substitution_list','param_end',3,'p_param_end_width','/tmp/pv/pyverilog/vparser/parser.py',224),
+  ('param_end -> PARAMETER INTEGER param_substitution_list','param_end',3,'p_param_end_integer','/tmp/pv/pyverilog/vparser/parser.py',230),
+  ('portlist -> LPAREN ports RPAREN SEMICOLON','portlist',4,'p_portlist','/tmp/pv/pyverilog/vparser/parser.py',236),
+  ('portlist -> LPAREN ioports RPAREN SEMICOLON','portlist',4,'p_portlist_io','/tmp/pv/pyverilog/vparser/parser.py',241),
+  ('portlist -> LPAREN RPAREN SEMICOLON','portlist',3,'p_portlist_paren_empty','/tmp/pv/pyverilog/vparser/parser.py',246),
+  ('portlist -> SEMICOLON','portlist',1,'p_portlist_empty','/tmp/pv/pyverilog/vparser/parser.py',251),
+  ('ports -> ports COMMA portname','ports',3,'p_ports','/tmp/pv/pyverilog/vparser/parser.py',256),
+  ('ports -> portname','ports',1,'p_ports_one','/tmp/pv/pyverilog/vparser/parser.py',263),
+  ('portname -> ID','portname',1,'p_portname','/tmp/pv/pyverilog/vparser/parser.py',270),
+  ('sigtypes -> sigtypes sigtype','sigtypes',2,'p_sigtypes','/tmp/pv/pyverilog/vparser/parser.py',275),
+  ('sigtypes -> sigtype','sigtypes',1,'p_sigtypes_one','/tmp/pv/pyverilog/vparser/parser.py',280),
+  ('sigtype -> INPUT','sigtype',1,'p_sigtype_input','/tmp/pv/pyverilog/vparser/parser.py',285),
+  ('sigtype -> OUTPUT','sigtype',1,'p_sigtype_output','/tmp/pv/pyverilog/vparser/parser.py',290),
+  ('sigtype -> INOUT','sigtype',1,'p_sigtype_inout','/tmp/pv/pyverilog/vparser/parser.py',295),
+  ('sigtype -> TRI','sigtype',1,'p_sigtype_tri','/tmp/pv/pyverilog/vparser/parser.py',300),
+  ('sigtype -> REG','sigtype',1,'p_sigtype_reg','/tmp/pv/pyverilog/vparser/parser.py',305),
+  ('sigtype -> WIRE','sigtype',1,'p_sigtype_wire','/tmp/pv/pyverilog/vparser/parser.py',310),
+  ('sigtype -> SIGNED','sigtype',1,'p_sigtype_signed','/tmp/pv/pyverilog/vparser/parser.py',315),
+  ('sigtype -> SUPPLY0','sigtype',1,'p_sigtype_supply0','/tmp/pv/pyverilog/vparser/parser.py',320),
+  ('sigtype -> SUPPLY1','sigtype',1,'p_sigtype_supply1','/tmp/pv/pyverilog/vparser/parser.py',325),
+  ('ioports -> ioports COMMA ioport','ioports',3,'p_ioports','/tmp/pv/pyverilog/vparser/parser.py',330),
+  ('ioports -> ioport_head','ioports',1,'p_ioports_one','/tmp/pv/pyverilog/vparser/parser.py',357),
+  ('ioport -> sigtypes portname','ioport',2,'p_ioport','/tmp/pv/pyverilog/vparser/parser.py',401),
+  ('ioport -> sigtypes width portname','ioport',3,'p_ioport_width','/tmp/pv/pyverilog/vparser/parser.py',406),
+  ('ioport_head -> sigtypes portname','ioport_head',2,'p_ioport_head','/tmp/pv/pyverilog/vparser/parser.py',411),
+  ('ioport_head -> sigtypes width portname','ioport_head',3,'p_ioport_head_width','/tmp/pv/pyverilog/vparser/parser.py',416),
+  ('ioport -> portname','ioport',1,'p_ioport_portname','/tmp/pv/pyverilog/vparser/parser.py',421),
+  ('width -> LBRACKET expression COLON expression RBRACKET','width',5,'p_width','/tmp/pv/pyverilog/vparser/parser.py',426),
+  ('length -> LBRACKET expression COLON expression RBRACKET','length',5,'p_length','/tmp/pv/pyverilog/vparser/parser.py',431),
+  ('items -> items item','items',2,'p_items','/tmp/pv/pyverilog/vparser/parser.py',436),
+  ('items -> item','items',1,'p_items_one','/tmp/pv/pyverilog/vparser/parser.py',441),
+  ('items -> empty','items',1,'p_items_empty','/tmp/pv/pyverilog/vparser/parser.py',446),
+  ('item -> standard_item','item',1,'p_item','/tmp/pv/pyverilog/vparser/parser.py',450),
+  ('item -> generate','item',1,'p_item','/tmp/pv/pyverilog/vparser/parser.py',451),
+  ('standard_item -> decl','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',457),
+  ('standard_item -> integerdecl','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',458),
+  ('standard_item -> realdecl','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',459),
+  ('standard_item -> declassign','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',460),
+  ('standard_item -> parameterdecl','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',461),
+  ('standard_item -> localparamdecl','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',462),
+  ('standard_item -> genvardecl','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',463),
+  ('standard_item -> assignment','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',464),
+  ('standard_item -> always','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',465),
+  ('standard_item -> initial','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',466),
+  ('standard_item -> instance','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',467),
+  ('standard_item -> function','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',468),
+  ('standard_item -> task','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',469),
+  ('standard_item -> pragma','standard_item',1,'p_standard_item','/tmp/pv/pyverilog/vparser/parser.py',470),
+  ('decl -> sigtypes declnamelist SEMICOLON','decl',3,'p_decl','/tmp/pv/pyverilog/vparser/parser.py',535),
+  ('decl -> sigtypes width declnamelist SEMICOLON','decl',4,'p_decl_width','/tmp/pv/pyverilog/vparser/parser.py',544),
+  ('declnamelist -> declnamelist COMMA declname','declnamelist',3,'p_declnamelist','/tmp/pv/pyverilog/vparser/parser.py',553),
+  ('declnamelist -> declname','declnamelist',1,'p_declnamelist_one','/tmp/pv/pyverilog/vparser/parser.py',558),
+  ('declname -> ID','declname',1,'p_declname','/tmp/pv/pyverilog/vparser/parser.py',563),
+  ('declname -> ID length','declname',2,'p_declarray','/tmp/pv/pyverilog/vparser/parser.py',568),
+  ('declassign -> sigtypes declassign_element SEMICOLON','declassign',3,'p_declassign','/tmp/pv/pyverilog/vparser/parser.py',613),
+  ('declassign -> sigtypes width declassign_element SEMICOLON','declassign',4,'p_declassign_width','/tmp/pv/pyverilog/vparser/parser.py',619),
+  ('declassign_element -> ID EQUALS rvalue','declassign_element',3,'p_declassign_element','/tmp/pv/pyverilog/vparser/parser.py',625),
+  ('declassign_element -> delays ID EQUALS delays rvalue','declassign_element',5,'p_declassign_element_delay','/tmp/pv/pyverilog/vparser/parser.py',632),
+  ('integerdecl -> INTEGER integernamelist SEMICOLON','integerdecl',3,'p_integerdecl','/tmp/pv/pyverilog/vparser/parser.py',640),
+  ('integerdecl -> INTEGER SIGNED integernamelist SEMICOLON','integerdecl',4,'p_integerdecl_signed','/tmp/pv/pyverilog/vparser/parser.py',650),
+  ('integernamelist -> integernamelist COMMA integername','integernamelist',3,'p_integernamelist','/tmp/pv/pyverilog/vparser/parser.py',660),
+  ('integernamelist -> integername','integernamelist',1,'p_integernamelist_one','/tmp/pv/pyverilog/vparser/parser.py',665),
+  ('integername -> ID','integername',1,'p_integername','/tmp/pv/pyverilog/vparser/parser.py',670),
+  ('realdecl -> REAL realnamelist SEMICOLON','realdecl',3,'p_realdecl','/tmp/pv/pyverilog/vparser/parser.py',676),
+  ('realnamelist -> realnamelist COMMA realname','realnamelist',3,'p_realnamelist','/tmp/pv/pyverilog/vparser/parser.py',686),
+  ('realnamelist -> realname','realnamelist',1,'p_realnamelist_one','/tmp/pv/pyverilog/vparser/parser.py',691),
+  ('realname -> ID','realname',1,'p_realname','/tmp/pv/pyverilog/vparser/parser.py',696),
+  ('parameterdecl -> PARAMETER param_substitution_list SEMICOLON','parameterdecl',3,'p_parameterdecl','/tmp/pv/pyverilog/vparser/parser.py',702),
+  ('parameterdecl -> PARAMETER width param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_width','/tmp/pv/pyverilog/vparser/parser.py',708),
+  ('parameterdecl -> PARAMETER INTEGER param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_integer','/tmp/pv/pyverilog/vparser/parser.py',714),
+  ('localparamdecl -> LOCALPARAM param_substitution_list SEMICOLON','localparamdecl',3,'p_localparamdecl','/tmp/pv/pyverilog/vparser/parser.py',720),
+  ('localparamdecl -> LOCALPARAM width param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_width','/tmp/pv/pyverilog/vparser/parser.py',726),
+  ('localparamdecl -> LOCALPARAM INTEGER param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_integer','/tmp/pv/pyverilog/vparser/parser.py',732),
+  ('param_substitution_list -> param_substitution_list COMMA param_substitution','param_substitution_list',3,'p_param_substitution_list','/tmp/pv/pyverilog/vparser/parser.py',738),
+  ('param_substitution_list -> param_substitution','param_substitution_list',1,'p_param_substitution_list_one','/tmp/pv/pyverilog/vparser/parser.py',743),
+  ('param_substitution -> ID EQUALS rvalue','param_substitution',3,'p_param_substitution','/tmp/pv/pyverilog/vparser/parser.py',748),
+  ('assignment -> ASSIGN lvalue EQUALS rvalue SEMICOLON','assignment',5,'p_assignment','/tmp/pv/pyverilog/vparser/parser.py',753),
+  ('assignment -> ASSIGN delays lvalue EQUALS delays rvalue SEMICOLON','assignment',7,'p_assignment_delay','/tmp/pv/pyverilog/vparser/parser.py',758),
+  ('lpartselect -> pointer LBRACKET expression COLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer','/tmp/pv/pyverilog/vparser/parser.py',764),
+  ('lpartselect -> pointer LBRACKET expression PLUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer_plus','/tmp/pv/pyverilog/vparser/parser.py',769),
+  ('lpartselect -> pointer LBRACKET expression MINUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer_minus','/tmp/pv/pyverilog/vparser/parser.py',774),
+  ('lpartselect -> identifier LBRACKET expression COLON expression RBRACKET','lpartselect',6,'p_lpartselect','/tmp/pv/pyverilog/vparser/parser.py',779),
+  ('lpartselect -> identifier LBRACKET expression PLUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_plus','/tmp/pv/pyverilog/vparser/parser.py',784),
+  ('lpartselect -> identifier LBRACKET expression MINUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_minus','/tmp/pv/pyverilog/vparser/parser.py',789),
+  ('lpointer -> pointer','lpointer',1,'p_lpointer','/tmp/pv/pyverilog/vparser/parser.py',794),
+  ('lconcat -> LBRACE lconcatlist RBRACE','lconcat',3,'p_lconcat','/tmp/pv/pyverilog/vparser/parser.py',799),
+  ('lconcatlist -> lconcatlist COMMA lconcat_one','lconcatlist',3,'p_lconcatlist','/tmp/pv/pyverilog/vparser/parser.py',804),
+  ('lconcatlist -> lconcat_one','lconcatlist',1,'p_lconcatlist_one','/tmp/pv/pyverilog/vparser/parser.py',809),
+  ('lconcat_one -> identifier','lconcat_one',1,'p_lconcat_one_identifier','/tmp/pv/pyverilog/vparser/parser.py',814),
+  ('lconcat_one -> lpartselect','lconcat_one',1,'p_lconcat_one_lpartselect','/tmp/pv/pyverilog/vparser/parser.py',819),
+  ('lconcat_one -> lpointer','lconcat_one',1,'p_lconcat_one_lpointer','/tmp/pv/pyverilog/vparser/parser.py',824),
+  ('lconcat_one -> lconcat','lconcat_one',1,'p_lconcat_one_lconcat','/tmp/pv/pyverilog/vparser/parser.py',829),
+  ('lvalue -> lpartselect','lvalue',1,'p_lvalue_partselect','/tmp/pv/pyverilog/vparser/parser.py',834),
+  ('lvalue -> lpointer','lvalue',1,'p_lvalue_pointer','/tmp/pv/pyverilog/vparser/parser.py',839),
+  ('lvalue -> lconcat','lvalue',1,'p_lvalue_concat','/tmp/pv/pyverilog/vparser/parser.py',844),
+  ('lvalue -> identifier','lvalue',1,'p_lvalue_one','/tmp/pv/pyverilog/vparser/parser.py',849),
+  ('rvalue -> expression','rvalue',1,'p_rvalue','/tmp/pv/pyverilog/vparser/parser.py',854),
+  ('expression -> MINUS expression','expression',2,'p_expression_uminus','/tmp/pv/pyverilog/vparser/parser.py',861),
+  ('expression -> PLUS expression','expression',2,'p_expression_uplus','/tmp/pv/pyverilog/vparser/parser.py',866),
+  ('expression -> LNOT expression','expression',2,'p_expression_ulnot','/tmp/pv/pyverilog/vparser/parser.py',871),
+  ('expression -> NOT expression','expression',2,'p_expression_unot','/tmp/pv/pyverilog/vparser/parser.py',876),
+  ('expression -> AND expression','expression',2,'p_expression_uand','/tmp/pv/pyverilog/vparser/parser.py',881),
+  ('expression -> NAND expression','expression',2,'p_expression_unand','/tmp/pv/pyverilog/vparser/parser.py',886),
+  ('expression -> NOR expression','expression',2,'p_expression_unor','/tmp/pv/pyverilog/vparser/parser.py',891),
+  ('expression -> OR expression','expression',2,'p_expression_uor','/tmp/pv/pyverilog/vparser/parser.py',896),
+  ('expression -> XOR expression','expression',2,'p_expression_uxor','/tmp/pv/pyverilog/vparser/parser.py',901),
+  ('expression -> XNOR expression','expression',2,'p_expression_uxnor','/tmp/pv/pyverilog/vparser/parser.py',906),
+  ('expression -> expression POWER expression','expression',3,'p_expression_power','/tmp/pv/pyverilog/vparser/parser.py',913),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_times','/tmp/pv/pyverilog/vparser/parser.py',920),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_div','/tmp/pv/pyverilog/vparser/parser.py',925),
+  ('expression -> expression MOD expression','expression',3,'p_expression_mod','/tmp/pv/pyverilog/vparser/parser.py',930),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_plus','/tmp/pv/pyverilog/vparser/parser.py',937),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_minus','/tmp/pv/pyverilog/vparser/parser.py',942),
+  ('expression -> expression LSHIFT expression','expression',3,'p_expression_sll','/tmp/pv/pyverilog/vparser/parser.py',949),
+  ('expression -> expression RSHIFT expression','expression',3,'p_expression_srl','/tmp/pv/pyverilog/vparser/parser.py',954),
+  ('expression -> expression LSHIFTA expression','expression',3,'p_expression_sla','/tmp/pv/pyverilog/vparser/parser.py',959),
+  ('expression -> expression RSHIFTA expression','expression',3,'p_expression_sra','/tmp/pv/pyverilog/vparser/parser.py',964),
+  ('expression -> expression LT expression','expression',3,'p_expression_lessthan','/tmp/pv/pyverilog/vparser/parser.py',971),
+  ('expression -> expression GT expression','expression',3,'p_expression_greaterthan','/tmp/pv/pyverilog/vparser/parser.py',976),
+  ('expression -> expression LE expression','expression',3,'p_expression_lesseq','/tmp/pv/pyverilog/vparser/parser.py',981),
+  ('expression -> expression GE expression','expression',3,'p_expression_greatereq','/tmp/pv/pyverilog/vparser/parser.py',986),
+  ('expression -> expression EQ expression','expression',3,'p_expression_eq','/tmp/pv/pyverilog/vparser/parser.py',993),
+  ('expression -> expression NE expression','expression',3,'p_expression_noteq','/tmp/pv/pyverilog/vparser/parser.py',998),
+  ('expression -> expression EQL expression','expression',3,'p_expression_eql','/tmp/pv/pyverilog/vparser/parser.py',1003),
+  ('expression -> expression NEL expression','expression',3,'p_expression_noteql','/tmp/pv/pyverilog/vparser/parser.py',1008),
+  ('expression -> expression AND expression','expression',3,'p_expression_And','/tmp/pv/pyverilog/vparser/parser.py',1015),
+  ('expression -> expression XOR expression','expression',3,'p_expression_Xor','/tmp/pv/pyverilog/vparser/parser.py',1020),
+  ('expression -> expression XNOR expression','expression',3,'p_expression_Xnor','/tmp/pv/pyverilog/vparser/parser.py',1025),
+  ('expression -> expression OR expression','expression',3,'p_expression_Or','/tmp/pv/pyverilog/vparser/parser.py',1032),
+  ('expression -> expression LAND expression','expression',3,'p_expression_land','/tmp/pv/pyverilog/vparser/parser.py',1039),
+  ('expression -> expression LOR expression','expression',3,'p_expression_lor','/tmp/pv/pyverilog/vparser/parser.py',1046),
+  ('expression -> expression COND expression COLON expression','expression',5,'p_expression_cond','/tmp/pv/pyverilog/vparser/parser.py',1053),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_expr','/tmp/pv/pyverilog/vparser/parser.py',1059),
+  ('expression -> concat','expression',1,'p_expression_concat','/tmp/pv/pyverilog/vparser/parser.py',1065),
+  ('expression -> repeat','expression',1,'p_expression_repeat','/tmp/pv/pyverilog/vparser/parser.py',1070),
+  ('expression -> partselect','expression',1,'p_expression_partselect','/tmp/pv/pyverilog/vparser/parser.py',1075),
+  ('expression -> pointer','expression',1,'p_expression_pointer','/tmp/pv/pyverilog/vparser/parser.py',1080),
+  ('expression -> functioncall','expression',1,'p_expression_functioncall','/tmp/pv/pyverilog/vparser/parser.py',1085),
+  ('expression -> systemcall','expression',1,'p_expression_systemcall','/tmp/pv/pyverilog/vparser/parser.py',1090),
+  ('expression -> identifier','expression',1,'p_expression_id','/tmp/pv/pyverilog/vparser/parser.py',1095),
+  ('expression -> const_expression','expression',1,'p_expression_const','/tmp/pv/pyverilog/vparser/parser.py',1100),
+  ('concat -> LBRACE concatlist RBRACE','concat',3,'p_concat','/tmp/pv/pyverilog/vparser/parser.py',1105),
+  ('concatlist -> concatlist COMMA expression','concatlist',3,'p_concatlist','/tmp/pv/pyverilog/vparser/parser.py',1110),
+  ('concatlist -> expression','concatlist',1,'p_concatlist_one','/tmp/pv/pyverilog/vparser/parser.py',1115),
+  ('repeat -> LBRACE expression concat RBRACE','repeat',4,'p_repeat','/tmp/pv/pyverilog/vparser/parser.py',1120),
+  ('partselect -> identifier LBRACKET expression COLON expression RBRACKET','partselect',6,'p_partselect','/tmp/pv/pyverilog/vparser/parser.py',1125),
+  ('partselect -> identifier LBRACKET expression PLUSCOLON expression RBRACKET','partselect',6,'p_partselect_plus','/tmp/pv/pyverilog/vparser/parser.py',1130),
+  ('partselect -> identifier LBRACKET expression MINUSCOLON expression RBRACKET','partselect',6,'p_partselect_minus','/tmp/pv/pyverilog/vparser/parser.py',1135),
+  ('partselect -> pointer LBRACKET expression COLON expression RBRACKET','partselect',6,'p_partselect_pointer','/tmp/pv/pyverilog/vparser/parser.py',1140),
+  ('partselect -> pointer LBRACKET expression PLUSCOLON expression RBRACKET','partselect',6,'p_partselect_pointer_plus','/tmp/pv/pyverilog/vparser/parser.py',1145),
+  ('partselect -> pointer LBRACKET expression MINUSCOLON expression RBRACKET','partselect',6,'p_partselect_pointer_minus','/tmp/pv/pyverilog/vparser/parser.py',1150),
+  ('pointer -> identifier LBRACKET expression RBRACKET','pointer',4,'p_pointer','/tmp/pv/pyverilog/vparser/parser.py',1155),
+  ('pointer -> pointer LBRACKET expression RBRACKET','pointer',4,'p_pointer_pointer','/tmp/pv/pyverilog/vparser/parser.py',1160),
+  ('const_expression -> intnumber','const_expression',1,'p_const_expression_intnum','/tmp/pv/pyverilog/vparser/parser.py',1166),
+  ('const_expression -> floatnumber','const_expression',1,'p_const_expression_floatnum','/tmp/pv/pyverilog/vparser/parser.py',1171),
+  ('const_expression -> stringliteral','const_expression',1,'p_const_expression_stringliteral','/tmp/pv/pyverilog/vparser/parser.py',1176),
+  ('floatnumber -> FLOATNUMBER','floatnumber',1,'p_floatnumber','/tmp/pv/pyverilog/vparser/parser.py',1181),
+  ('intnumber -> INTNUMBER_DEC','intnumber',1,'p_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1186),
+  ('intnumber -> SIGNED_INTNUMBER_DEC','intnumber',1,'p_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1187),
+  ('intnumber -> INTNUMBER_BIN','intnumber',1,'p_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1188),
+  ('intnumber -> SIGNED_INTNUMBER_BIN','intnumber',1,'p_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1189),
+  ('intnumber -> INTNUMBER_OCT','intnumber',1,'p_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1190),
+  ('intnumber -> SIGNED_INTNUMBER_OCT','intnumber',1,'p_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1191),
+  ('intnumber -> INTNUMBER_HEX','intnumber',1,'p_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1192),
+  ('intnumber -> SIGNED_INTNUMBER_HEX','intnumber',1,'p_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1193),
+  ('stringliteral -> STRING_LITERAL','stringliteral',1,'p_stringliteral','/tmp/pv/pyverilog/vparser/parser.py',1201),
+  ('always -> ALWAYS senslist always_statement','always',3,'p_always','/tmp/pv/pyverilog/vparser/parser.py',1208),
+  ('senslist -> AT LPAREN edgesigs RPAREN','senslist',4,'p_sens_egde_paren','/tmp/pv/pyverilog/vparser/parser.py',1213),
+  ('edgesig -> POSEDGE edgesig_base','edgesig',2,'p_posedgesig','/tmp/pv/pyverilog/vparser/parser.py',1218),
+  ('edgesig -> NEGEDGE edgesig_base','edgesig',2,'p_negedgesig','/tmp/pv/pyverilog/vparser/parser.py',1223),
+  ('edgesig_base -> identifier','edgesig_base',1,'p_edgesig_base_identifier','/tmp/pv/pyverilog/vparser/parser.py',1228),
+  ('edgesig_base -> pointer','edgesig_base',1,'p_edgesig_base_pointer','/tmp/pv/pyverilog/vparser/parser.py',1233),
+  ('edgesigs -> edgesigs SENS_OR edgesig','edgesigs',3,'p_edgesigs','/tmp/pv/pyverilog/vparser/parser.py',1238),
+  ('edgesigs -> edgesig','edgesigs',1,'p_edgesigs_one','/tmp/pv/pyverilog/vparser/parser.py',1243),
+  ('senslist -> empty','senslist',1,'p_sens_empty','/tmp/pv/pyverilog/vparser/parser.py',1248),
+  ('senslist -> AT levelsig','senslist',2,'p_sens_level','/tmp/pv/pyverilog/vparser/parser.py',1253),
+  ('senslist -> AT LPAREN levelsigs RPAREN','senslist',4,'p_sens_level_paren','/tmp/pv/pyverilog/vparser/parser.py',1258),
+  ('levelsig -> levelsig_base','levelsig',1,'p_levelsig','/tmp/pv/pyverilog/vparser/parser.py',1263),
+  ('levelsig_base -> identifier','levelsig_base',1,'p_levelsig_base_identifier','/tmp/pv/pyverilog/vparser/parser.py',1268),
+  ('levelsig_base -> pointer','levelsig_base',1,'p_levelsig_base_pointer','/tmp/pv/pyverilog/vparser/parser.py',1273),
+  ('levelsig_base -> partselect','levelsig_base',1,'p_levelsig_base_partselect','/tmp/pv/pyverilog/vparser/parser.py',1278),
+  ('levelsigs -> levelsigs SENS_OR levelsig','levelsigs',3,'p_levelsigs','/tmp/pv/pyverilog/vparser/parser.py',1283),
+  ('levelsigs -> levelsigs COMMA levelsig','levelsigs',3,'p_levelsigs_comma','/tmp/pv/pyverilog/vparser/parser.py',1288),
+  ('levelsigs -> levelsig','levelsigs',1,'p_levelsigs_one','/tmp/pv/pyverilog/vparser/parser.py',1293),
+  ('senslist -> AT TIMES','senslist',2,'p_sens_all','/tmp/pv/pyverilog/vparser/parser.py',1298),
+  ('senslist -> AT LPAREN TIMES RPAREN','senslist',4,'p_sens_all_paren','/tmp/pv/pyverilog/vparser/parser.py',1303),
+  ('basic_statement -> if_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1308),
+  ('basic_statement -> case_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1309),
+  ('basic_statement -> casex_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1310),
+  ('basic_statement -> casez_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1311),
+  ('basic_statement -> for_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1312),
+  ('basic_statement -> while_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1313),
+  ('basic_statement -> event_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1314),
+  ('basic_statement -> wait_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1315),
+  ('basic_statement -> forever_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1316),
+  ('basic_statement -> block','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1317),
+  ('basic_statement -> namedblock','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1318),
+  ('basic_statement -> parallelblock','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1319),
+  ('basic_statement -> blocking_substitution','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1320),
+  ('basic_statement -> nonblocking_substitution','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1321),
+  ('basic_statement -> single_statement','basic_statement',1,'p_basic_statement','/tmp/pv/pyverilog/vparser/parser.py',1322),
+  ('always_statement -> basic_statement','always_statement',1,'p_always_statement','/tmp/pv/pyverilog/vparser/parser.py',1328),
+  ('blocking_substitution -> delays lvalue EQUALS delays rvalue SEMICOLON','blocking_substitution',6,'p_blocking_substitution','/tmp/pv/pyverilog/vparser/parser.py',1334),
+  ('blocking_substitution_base -> delays lvalue EQUALS delays rvalue','blocking_substitution_base',5,'p_blocking_substitution_base','/tmp/pv/pyverilog/vparser/parser.py',1339),
+  ('nonblocking_substitution -> delays lvalue LE delays rvalue SEMICOLON','nonblocking_substitution',6,'p_nonblocking_substitution','/tmp/pv/pyverilog/vparser/parser.py',1344),
+  ('delays -> DELAY LPAREN expression RPAREN','delays',4,'p_delays','/tmp/pv/pyverilog/vparser/parser.py',1350),
+  ('delays -> DELAY identifier','delays',2,'p_delays_identifier','/tmp/pv/pyverilog/vparser/parser.py',1355),
+  ('delays -> DELAY intnumber','delays',2,'p_delays_intnumber','/tmp/pv/pyverilog/vparser/parser.py',1360),
+  ('delays -> DELAY floatnumber','delays',2,'p_delays_floatnumber','/tmp/pv/pyverilog/vparser/parser.py',1365),
+  ('delays -> empty','delays',1,'p_delays_empty','/tmp/pv/pyverilog/vparser/parser.py',1370),
+  ('block -> BEGIN block_statements END','block',3,'p_block','/tmp/pv/pyverilog/vparser/parser.py',1375),
+  ('block -> BEGIN END','block',2,'p_block_empty','/tmp/pv/pyverilog/vparser/parser.py',1380),
+  ('block_statements -> block_statements block_statement','block_statements',2,'p_block_statements','/tmp/pv/pyverilog/vparser/parser.py',1385),
+  ('block_statements -> block_statement','block_statements',1,'p_block_statements_one','/tmp/pv/pyverilog/vparser/parser.py',1390),
+  ('block_statement -> basic_statement','block_statement',1,'p_block_statement','/tmp/pv/pyverilog/vparser/parser.py',1395),
+  ('namedblock -> BEGIN COLON ID namedblock_statements END','namedblock',5,'p_namedblock','/tmp/pv/pyverilog/vparser/parser.py',1401),
+  ('namedblock -> BEGIN COLON ID END','namedblock',4,'p_namedblock_empty','/tmp/pv/pyverilog/vparser/parser.py',1406),
+  ('namedblock_statements -> namedblock_statements namedblock_statement','namedblock_statements',2,'p_namedblock_statements','/tmp/pv/pyverilog/vparser/parser.py',1411),
+  ('namedblock_statements -> namedblock_statement','namedblock_statements',1,'p_namedblock_statements_one','/tmp/pv/pyverilog/vparser/parser.py',1416),
+  ('namedblock_statement -> basic_statement','namedblock_statement',1,'p_namedblock_statement','/tmp/pv/pyverilog/vparser/parser.py',1421),
+  ('namedblock_statement -> decl','namedblock_statement',1,'p_namedblock_statement','/tmp/pv/pyverilog/vparser/parser.py',1422),
+  ('namedblock_statement -> integerdecl','namedblock_statement',1,'p_namedblock_statement','/tmp/pv/pyverilog/vparser/parser.py',1423),
+  ('namedblock_statement -> realdecl','namedblock_statement',1,'p_namedblock_statement','/tmp/pv/pyverilog/vparser/parser.py',1424),
+  ('namedblock_statement -> parameterdecl','namedblock_statement',1,'p_namedblock_statement','/tmp/pv/pyverilog/vparser/parser.py',1425),
+  ('namedblock_statement -> localparamdecl','namedblock_statement',1,'p_namedblock_statement','/tmp/pv/pyverilog/vparser/parser.py',1426),
+  ('parallelblock -> FORK block_statements JOIN','parallelblock',3,'p_parallelblock','/tmp/pv/pyverilog/vparser/parser.py',1439),
+  ('parallelblock -> FORK JOIN','parallelblock',2,'p_parallelblock_empty','/tmp/pv/pyverilog/vparser/parser.py',1444),
+  ('if_statement -> IF LPAREN cond RPAREN true_statement ELSE else_statement','if_statement',7,'p_if_statement','/tmp/pv/pyverilog/vparser/parser.py',1450),
+  ('if_statement -> IF LPAREN cond RPAREN true_statement','if_statement',5,'p_if_statement_woelse','/tmp/pv/pyverilog/vparser/parser.py',1455),
+  ('if_statement -> delays IF LPAREN cond RPAREN true_statement ELSE else_statement','if_statement',8,'p_if_statement_delay','/tmp/pv/pyverilog/vparser/parser.py',1460),
+  ('if_statement -> delays IF LPAREN cond RPAREN true_statement','if_statement',6,'p_if_statement_woelse_delay','/tmp/pv/pyverilog/vparser/parser.py',1465),
+  ('cond -> expression','cond',1,'p_cond','/tmp/pv/pyverilog/vparser/parser.py',1470),
+  ('ifcontent_statement -> basic_statement','ifcontent_statement',1,'p_ifcontent_statement','/tmp/pv/pyverilog/vparser/parser.py',1475),
+  ('true_statement -> ifcontent_statement','true_statement',1,'p_true_statement','/tmp/pv/pyverilog/vparser/parser.py',1480),
+  ('else_statement -> ifcontent_statement','else_statement',1,'p_else_statement','/tmp/pv/pyverilog/vparser/parser.py',1485),
+  ('for_statement -> FOR LPAREN forpre forcond forpost RPAREN forcontent_statement','for_statement',7,'p_for_statement','/tmp/pv/pyverilog/vparser/parser.py',1491),
+  ('forpre -> blocking_substitution','forpre',1,'p_forpre','/tmp/pv/pyverilog/vparser/parser.py',1496),
+  ('forpre -> SEMICOLON','forpre',1,'p_forpre_empty','/tmp/pv/pyverilog/vparser/parser.py',1501),
+  ('forcond -> cond SEMICOLON','forcond',2,'p_forcond','/tmp/pv/pyverilog/vparser/parser.py',1506),
+  ('forcond -> SEMICOLON','forcond',1,'p_forcond_empty','/tmp/pv/pyverilog/vparser/parser.py',1511),
+  ('forpost -> blocking_substitution_base','forpost',1,'p_forpost','/tmp/pv/pyverilog/vparser/parser.py',1516),
+  ('forpost -> empty','forpost',1,'p_forpost_empty','/tmp/pv/pyverilog/vparser/parser.py',1521),
+  ('forcontent_statement -> basic_statement','forcontent_statement',1,'p_forcontent_statement','/tmp/pv/pyverilog/vparser/parser.py',1525),
+  ('while_statement -> WHILE LPAREN cond RPAREN whilecontent_statement','while_statement',5,'p_while_statement','/tmp/pv/pyverilog/vparser/parser.py',1531),
+  ('whilecontent_statement -> basic_statement','whilecontent_statement',1,'p_whilecontent_statement','/tmp/pv/pyverilog/vparser/parser.py',1536),
+  ('case_statement -> CASE LPAREN case_comp RPAREN casecontent_statements ENDCASE','case_statement',6,'p_case_statement','/tmp/pv/pyverilog/vparser/parser.py',1542),
+  ('casex_statement -> CASEX LPAREN case_comp RPAREN casecontent_statements ENDCASE','casex_statement',6,'p_casex_statement','/tmp/pv/pyverilog/vparser/parser.py',1547),
+  ('casez_statement -> CASEZ LPAREN case_comp RPAREN casecontent_statements ENDCASE','casez_statement',6,'p_casez_statement','/tmp/pv/pyverilog/vparser/parser.py',1551),
+  ('case_comp -> expression','case_comp',1,'p_case_comp','/tmp/pv/pyverilog/vparser/parser.py',1556),
+  ('casecontent_statements -> casecontent_statements casecontent_statement','casecontent_statements',2,'p_casecontent_statements','/tmp/pv/pyverilog/vparser/parser.py',1561),
+  ('casecontent_statements -> casecontent_statement','casecontent_statements',1,'p_casecontent_statements_one','/tmp/pv/pyverilog/vparser/parser.py',1566),
+  ('casecontent_statement -> casecontent_condition COLON basic_statement','casecontent_statement',3,'p_casecontent_statement','/tmp/pv/pyverilog/vparser/parser.py',1571),
+  ('casecontent_condition -> casecontent_condition COMMA expression','casecontent_condition',3,'p_casecontent_condition_single','/tmp/pv/pyverilog/vparser/parser.py',1576),
+  ('casecontent_condition -> expression','casecontent_condition',1,'p_casecontent_condition_one','/tmp/pv/pyverilog/vparser/parser.py',1581),
+  ('casecontent_statement -> DEFAULT COLON basic_statement','casecontent_statement',3,'p_casecontent_statement_default','/tmp/pv/pyverilog/vparser/parser.py',1586),
+  ('initial -> INITIAL initial_statement','initial',2,'p_initial','/tmp/pv/pyverilog/vparser/parser.py',1592),
+  ('initial_statement -> basic_statement','initial_statement',1,'p_initial_statement','/tmp/pv/pyverilog/vparser/parser.py',1597),
+  ('event_statement -> senslist SEMICOLON','event_statement',2,'p_event_statement','/tmp/pv/pyverilog/vparser/parser.py',1603),
+  ('wait_statement -> WAIT LPAREN cond RPAREN waitcontent_statement','wait_statement',5,'p_wait_statement','/tmp/pv/pyverilog/vparser/parser.py',1609),
+  ('waitcontent_statement -> basic_statement','waitcontent_statement',1,'p_waitcontent_statement','/tmp/pv/pyverilog/vparser/parser.py',1614),
+  ('waitcontent_statement -> SEMICOLON','waitcontent_statement',1,'p_waitcontent_statement_empty','/tmp/pv/pyverilog/vparser/parser.py',1619),
+  ('forever_statement -> FOREVER basic_statement','forever_statement',2,'p_forever_statement','/tmp/pv/pyverilog/vparser/parser.py',1625),
+  ('instance -> ID parameterlist instance_bodylist SEMICOLON','instance',4,'p_instance','/tmp/pv/pyverilog/vparser/parser.py',1631),
+  ('instance -> SENS_OR parameterlist instance_bodylist SEMICOLON','instance',4,'p_instance_or','/tmp/pv/pyverilog/vparser/parser.py',1640),
+  ('instance_bodylist -> instance_bodylist COMMA instance_body','instance_bodylist',3,'p_instance_bodylist','/tmp/pv/pyverilog/vparser/parser.py',1649),
+  ('instance_bodylist -> instance_body','instance_bodylist',1,'p_instance_bodylist_one','/tmp/pv/pyverilog/vparser/parser.py',1654),
+  ('instance_body -> ID LPAREN instance_ports RPAREN','instance_body',4,'p_instance_body','/tmp/pv/pyverilog/vparser/parser.py',1659),
+  ('instance_body -> ID width LPAREN instance_ports RPAREN','instance_body',5,'p_instance_body_array','/tmp/pv/pyverilog/vparser/parser.py',1664),
+  ('instance -> ID instance_bodylist_noname SEMICOLON','instance',3,'p_instance_noname','/tmp/pv/pyverilog/vparser/parser.py',1669),
+  ('instance -> SENS_OR instance_bodylist_noname SEMICOLON','instance',3,'p_instance_or_noname','/tmp/pv/pyverilog/vparser/parser.py',1678),
+  ('instance_bodylist_noname -> instance_bodylist_noname COMMA instance_body_noname','instance_bodylist_noname',3,'p_instance_bodylist_noname','/tmp/pv/pyverilog/vparser/parser.py',1687),
+  ('instance_bodylist_noname -> instance_body_noname','instance_bodylist_noname',1,'p_instance_bodylist_one_noname','/tmp/pv/pyverilog/vparser/parser.py',1692),
+  ('instance_body_noname -> LPAREN instance_ports RPAREN','instance_body_noname',3,'p_instance_body_noname','/tmp/pv/pyverilog/vparser/parser.py',1697),
+  ('parameterlist -> DELAY LPAREN param_args RPAREN','parameterlist',4,'p_parameterlist','/tmp/pv/pyverilog/vparser/parser.py',1702),
+  ('parameterlist -> DELAY LPAREN param_args_noname RPAREN','parameterlist',4,'p_parameterlist_noname','/tmp/pv/pyverilog/vparser/parser.py',1707),
+  ('parameterlist -> empty','parameterlist',1,'p_parameterlist_empty','/tmp/pv/pyverilog/vparser/parser.py',1712),
+  ('param_args_noname -> param_args_noname COMMA param_arg_noname','param_args_noname',3,'p_param_args_noname','/tmp/pv/pyverilog/vparser/parser.py',1716),
+  ('param_args_noname -> param_arg_noname','param_args_noname',1,'p_param_args_noname_one','/tmp/pv/pyverilog/vparser/parser.py',1721),
+  ('param_args -> param_args COMMA param_arg','param_args',3,'p_param_args','/tmp/pv/pyverilog/vparser/parser.py',1726),
+  ('param_args -> param_arg','param_args',1,'p_param_args_one','/tmp/pv/pyverilog/vparser/parser.py',1731),
+  ('param_arg_noname -> expression','param_arg_noname',1,'p_param_arg_noname_exp','/tmp/pv/pyverilog/vparser/parser.py',1736),
+  ('param_arg -> DOT ID LPAREN expression RPAREN','param_arg',5,'p_param_arg_exp','/tmp/pv/pyverilog/vparser/parser.py',1741),
+  ('instance_ports -> instance_ports_list','instance_ports',1,'p_instance_ports','/tmp/pv/pyverilog/vparser/parser.py',1746),
+  ('instance_ports -> instance_ports_arg','instance_ports',1,'p_instance_ports','/tmp/pv/pyverilog/vparser/parser.py',1747),
+  ('instance_ports_list -> instance_ports_list COMMA instance_port_list','instance_ports_list',3,'p_instance_ports_list','/tmp/pv/pyverilog/vparser/parser.py',1753),
+  ('instance_ports_list -> instance_port_list','instance_ports_list',1,'p_instance_ports_list_one','/tmp/pv/pyverilog/vparser/parser.py',1758),
+  ('instance_port_list -> expression','instance_port_list',1,'p_instance_port_list','/tmp/pv/pyverilog/vparser/parser.py',1763),
+  ('instance_ports_arg -> instance_ports_arg COMMA instance_port_arg','instance_ports_arg',3,'p_instance_ports_arg','/tmp/pv/pyverilog/vparser/parser.py',1768),
+  ('instance_ports_arg -> instance_port_arg','instance_ports_arg',1,'p_instance_ports_arg_one','/tmp/pv/pyverilog/vparser/parser.py',1773),
+  ('instance_port_arg -> DOT ID LPAREN identifier RPAREN','instance_port_arg',5,'p_instance_port_arg','/tmp/pv/pyverilog/vparser/parser.py',1778),
+  ('instance_port_arg -> DOT ID LPAREN expression RPAREN','instance_port_arg',5,'p_instance_port_arg_exp','/tmp/pv/pyverilog/vparser/parser.py',1783),
+  ('instance_port_arg -> DOT ID LPAREN RPAREN','instance_port_arg',4,'p_instance_port_arg_none','/tmp/pv/pyverilog/vparser/parser.py',1788),
+  ('genvardecl -> GENVAR genvarlist SEMICOLON','genvardecl',3,'p_genvardecl','/tmp/pv/pyverilog/vparser/parser.py',1794),
+  ('genvarlist -> genvarlist COMMA genvar','genvarlist',3,'p_genvarlist','/tmp/pv/pyverilog/vparser/parser.py',1799),
+  ('genvarlist -> genvar','genvarlist',1,'p_genvarlist_one','/tmp/pv/pyverilog/vparser/parser.py',1804),
+  ('genvar -> ID','genvar',1,'p_genvar','/tmp/pv/pyverilog/vparser/parser.py',1809),
+  ('generate -> GENERATE generate_items ENDGENERATE','generate',3,'p_generate','/tmp/pv/pyverilog/vparser/parser.py',1818),
+  ('generate_items -> empty','generate_items',1,'p_generate_items_empty','/tmp/pv/pyverilog/vparser/parser.py',1823),
+  ('generate_items -> generate_items generate_item','generate_items',2,'p_generate_items','/tmp/pv/pyverilog/vparser/parser.py',1828),
+  ('generate_items -> generate_item','generate_items',1,'p_generate_items_one','/tmp/pv/pyverilog/vparser/parser.py',1833),
+  ('generate_item -> standard_item','generate_item',1,'p_generate_item','/tmp/pv/pyverilog/vparser/parser.py',1838),
+  ('generate_item -> generate_if','generate_item',1,'p_generate_item','/tmp/pv/pyverilog/vparser/parser.py',1839),
+  ('generate_item -> generate_for','generate_item',1,'p_generate_item','/tmp/pv/pyverilog/vparser/parser.py',1840),
+  ('generate_block -> BEGIN generate_items END','generate_block',3,'p_generate_block','/tmp/pv/pyverilog/vparser/parser.py',1846),
+  ('generate_block -> BEGIN COLON ID generate_items END','generate_block',5,'p_generate_named_block','/tmp/pv/pyverilog/vparser/parser.py',1851),
+  ('generate_if -> IF LPAREN cond RPAREN gif_true_item ELSE gif_false_item','generate_if',7,'p_generate_if','/tmp/pv/pyverilog/vparser/parser.py',1856),
+  ('generate_if -> IF LPAREN cond RPAREN gif_true_item','generate_if',5,'p_generate_if_woelse','/tmp/pv/pyverilog/vparser/parser.py',1861),
+  ('gif_true_item -> generate_item','gif_true_item',1,'p_generate_if_true_item','/tmp/pv/pyverilog/vparser/parser.py',1866),
+  ('gif_true_item -> generate_block','gif_true_item',1,'p_generate_if_true_item','/tmp/pv/pyverilog/vparser/parser.py',1867),
+  ('gif_false_item -> generate_item','gif_false_item',1,'p_generate_if_false_item','/tmp/pv/pyverilog/vparser/parser.py',1873),
+  ('gif_false_item -> generate_block','gif_false_item',1,'p_generate_if_false_item','/tmp/pv/pyverilog/vparser/parser.py',1874),
+  ('generate_for -> FOR LPAREN forpre forcond forpost RPAREN generate_forcontent','generate_for',7,'p_generate_for','/tmp/pv/pyverilog/vparser/parser.py',1880),
+  ('generate_forcontent -> generate_item','generate_forcontent',1,'p_generate_forcontent','/tmp/pv/pyverilog/vparser/parser.py',1885),
+  ('generate_forcontent -> generate_block','generate_forcontent',1,'p_generate_forcontent','/tmp/pv/pyverilog/vparser/parser.py',1886),
+  ('systemcall -> DOLLER ID','systemcall',2,'p_systemcall_noargs','/tmp/pv/pyverilog/vparser/parser.py',1893),
+  ('systemcall -> DOLLER ID LPAREN sysargs RPAREN','systemcall',5,'p_systemcall','/tmp/pv/pyverilog/vparser/parser.py',1898),
+  ('systemcall -> DOLLER SIGNED LPAREN sysargs RPAREN','systemcall',5,'p_systemcall_signed','/tmp/pv/pyverilog/vparser/parser.py',1903),
+  ('sysargs -> sysargs COMMA sysarg','sysargs',3,'p_sysargs','/tmp/pv/pyverilog/vparser/parser.py',1908),
+  ('sysargs -> sysarg','sysargs',1,'p_sysargs_one','/tmp/pv/pyverilog/vparser/parser.py',1913),
+  ('sysargs -> empty','sysargs',1,'p_sysargs_empty','/tmp/pv/pyverilog/vparser/parser.py',1918),
+  ('sysarg -> expression','sysarg',1,'p_sysarg','/tmp/pv/pyverilog/vparser/parser.py',1922),
+  ('function -> FUNCTION width ID SEMICOLON function_statement ENDFUNCTION','function',6,'p_function','/tmp/pv/pyverilog/vparser/parser.py',1928),
+  ('function -> FUNCTION ID SEMICOLON function_statement ENDFUNCTION','function',5,'p_function_nowidth','/tmp/pv/pyverilog/vparser/parser.py',1933),
+  ('function_statement -> funcvardecls function_calc','function_statement',2,'p_function_statement','/tmp/pv/pyverilog/vparser/parser.py',1942),
+  ('funcvardecls -> funcvardecls funcvardecl','funcvardecls',2,'p_funcvardecls','/tmp/pv/pyverilog/vparser/parser.py',1947),
+  ('funcvardecls -> funcvardecl','funcvardecls',1,'p_funcvardecls_one','/tmp/pv/pyverilog/vparser/parser.py',1952),
+  ('funcvardecl -> decl','funcvardecl',1,'p_funcvardecl','/tmp/pv/pyverilog/vparser/parser.py',1957),
+  ('funcvardecl -> integerdecl','funcvardecl',1,'p_funcvardecl','/tmp/pv/pyverilog/vparser/parser.py',1958),
+  ('function_calc -> blocking_substitution','function_calc',1,'p_function_calc','/tmp/pv/pyverilog/vparser/parser.py',1969),
+  ('function_calc -> if_statement','function_calc',1,'p_function_calc','/tmp/pv/pyverilog/vparser/parser.py',1970),
+  ('function_calc -> for_statement','function_calc',1,'p_function_calc','/tmp/pv/pyverilog/vparser/parser.py',1971),
+  ('function_calc -> while_statement','function_calc',1,'p_function_calc','/tmp/pv/pyverilog/vparser/parser.py',1972),
+  ('function_calc -> case_statement','function_calc',1,'p_function_calc','/tmp/pv/pyverilog/vparser/parser.py',1973),
+  ('function_calc -> casex_statement','function_calc',1,'p_function_calc','/tmp/pv/pyverilog/vparser/parser.py',1974),
+  ('function_calc -> block','function_calc',1,'p_function_calc','/tmp/pv/pyverilog/vparser/parser.py',1975),
+  ('function_calc -> namedblock','function_calc',1,'p_function_calc','/tmp/pv/pyverilog/vparser/parser.py',1976),
+  ('functioncall -> identifier LPAREN func_args RPAREN','functioncall',4,'p_functioncall','/tmp/pv/pyverilog/vparser/parser.py',1982),
+  ('func_args -> func_args COMMA expression','func_args',3,'p_func_args','/tmp/pv/pyverilog/vparser/parser.py',1987),
+  ('func_args -> expression','func_args',1,'p_func_args_one','/tmp/pv/pyverilog/vparser/parser.py',1992),
+  ('func_args -> empty','func_args',1,'p_func_args_empty','/tmp/pv/pyverilog/vparser/parser.py',1997),
+  ('task -> TASK ID SEMICOLON task_statement ENDTASK','task',5,'p_task','/tmp/pv/pyverilog/vparser/parser.py',2002),
+  ('task_statement -> taskvardecls task_calc','task_statement',2,'p_task_statement','/tmp/pv/pyverilog/vparser/parser.py',2007),
+  ('taskvardecls -> taskvardecls taskvardecl','taskvardecls',2,'p_taskvardecls','/tmp/pv/pyverilog/vparser/parser.py',2012),
+  ('taskvardecls -> taskvardecl','taskvardecls',1,'p_taskvardecls_one','/tmp/pv/pyverilog/vparser/parser.py',2017),
+  ('taskvardecls -> empty','taskvardecls',1,'p_taskvardecls_empty','/tmp/pv/pyverilog/vparser/parser.py',2022),
+  ('taskvardecl -> decl','taskvardecl',1,'p_taskvardecl','/tmp/pv/pyverilog/vparser/parser.py',2026),
+  ('taskvardecl -> integerdecl','taskvardecl',1,'p_taskvardecl','/tmp/pv/pyverilog/vparser/parser.py',2027),
+  ('task_calc -> blocking_substitution','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2038),
+  ('task_calc -> if_statement','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2039),
+  ('task_calc -> for_statement','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2040),
+  ('task_calc -> while_statement','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2041),
+  ('task_calc -> case_statement','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2042),
+  ('task_calc -> casex_statement','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2043),
+  ('task_calc -> casez_statement','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2044),
+  ('task_calc -> block','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2045),
+  ('task_calc -> namedblock','task_calc',1,'p_task_calc','/tmp/pv/pyverilog/vparser/parser.py',2046),
+  ('identifier -> ID','identifier',1,'p_identifier','/tmp/pv/pyverilog/vparser/parser.py',2053),
+  ('identifier -> scope ID','identifier',2,'p_scope_identifier','/tmp/pv/pyverilog/vparser/parser.py',2058),
+  ('scope -> identifier DOT','scope',2,'p_scope','/tmp/pv/pyverilog/vparser/parser.py',2064),
+  ('scope -> pointer DOT','scope',2,'p_scope_pointer','/tmp/pv/pyverilog/vparser/parser.py',2070),
+  ('disable -> DISABLE ID','disable',2,'p_disable','/tmp/pv/pyverilog/vparser/parser.py',2077),
+  ('single_statement -> DELAY expression SEMICOLON','single_statement',3,'p_single_statement_delays','/tmp/pv/pyverilog/vparser/parser.py',2083),
+  ('single_statement -> systemcall SEMICOLON','single_statement',2,'p_single_statement_systemcall','/tmp/pv/pyverilog/vparser/parser.py',2088),
+  ('single_statement -> disable SEMICOLON','single_statement',2,'p_single_statement_disable','/tmp/pv/pyverilog/vparser/parser.py',2093),
+  ('empty -> <empty>','empty',0,'p_empty','/tmp/pv/pyverilog/vparser/parser.py',2115),
+]
+
+_grammar_signature = 'a37590c894fa5ffcca725fc658198967'
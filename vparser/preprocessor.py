@@ -3,7 +3,8 @@
 # 
 # Verilog Preprocessor
 # 
-# Icarus Verilog is used as a preprocessor via command-line.
+# Icarus Verilog is used as a preprocessor via command-line,
+# or VerilogNativePreprocessor runs the preprocessing in-process.
 # Please install Icarus Verilog on your environment.
 #
 # Copyright (C) 2013, Shinya Takamaeda-Yamazaki
@@ -13,6 +14,7 @@ from __future__ import absolute_import
 from __future__ import print_function
 import sys
 import os
+import re
 import subprocess
 
 class VerilogPreprocessor(object):
@@ -47,3 +49,297 @@ def preprocess(filelist,
     text = open(output).read()
     os.remove(output)
     return text
+
+#-------------------------------------------------------------------------------
+class PreprocessorError(Exception): pass
+
+class VerilogNativePreprocessor(object):
+    """ In-process Verilog preprocessor:
+        `define (with arguments), `undef, `ifdef, `ifndef, `elsif, `else,
+        `endif and `include. Other directives (`timescale, `default_nettype,
+        ...) are passed through to the lexer.
+        Line structure is kept; origin[i] is the (filename, lineno) of
+        output line i+1.
+    """
+    passthrough = ('timescale', 'default_nettype', 'celldefine', 'endcelldefine',
+                   'resetall', 'unconnected_drive', 'nounconnected_drive',
+                   'line', 'pragma', 'begin_keywords', 'end_keywords')
+    conditionals = ('ifdef', 'ifndef', 'elsif', 'else', 'endif')
+
+    token = re.compile(r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"'
+                       r'|`[A-Za-z_][A-Za-z0-9_$]*|[^`/"\n]+|\n|.', re.DOTALL)
+    identifier = re.compile(r'[A-Za-z_][A-Za-z0-9_$]*')
+    macro_name = re.compile(r'[ \t]*([A-Za-z_][A-Za-z0-9_$]*)')
+    define_head = re.compile(r'[ \t]*([A-Za-z_][A-Za-z0-9_$]*)(\([^)]*\))?')
+    include_name = re.compile(r'[ \t]*(?:"([^"\n]*)"|<([^>\n]*)>|(`[A-Za-z_][A-Za-z0-9_$]*))')
+    builtins = ('__FILE__', '__LINE__')
+    max_depth = 64
+
+    def __init__(self, filelist, include=None, define=None):
+        self.filelist = filelist
+        self.include = list(include) if include else []
+        self.define = list(define) if define else []
+        self.macros = {}
+        self.origin = []
+        self.dependencies = []
+
+    def preprocess(self):
+        self._reset()
+        out = []
+        for f in self.filelist:
+            self._process_file(f, out, 0)
+        return ''.join(out)
+
+    def preprocess_files(self):
+        """ Preprocesses each file of filelist separately.
+            Macros defined in a file stay visible in the following files.
+            Returns a list of (filename, text, origin), one per file.
+        """
+        self._reset()
+        ret = []
+        for f in self.filelist:
+            out = []
+            start = len(self.origin)
+            self._process_file(f, out, 0)
+            ret.append( (f, ''.join(out), self.origin[start:]) )
+        return ret
+
+    def _reset(self):
+        self.macros = {}
+        for d in self.define:
+            name, eq, value = d.partition('=')
+            self.macros[name] = (None, value if eq else '1')
+        self.origin = []
+        self.dependencies = []
+
+    def get_origin(self, lineno):
+        if 0 < lineno <= len(self.origin):
+            return self.origin[lineno-1]
+        return (None, lineno)
+
+    def _error(self, msg, filename, lineno):
+        raise PreprocessorError("%s:%s: %s" % (filename, lineno, msg))
+
+    def _find_include(self, name, curdir, filename, lineno):
+        for d in [curdir] + self.include:
+            path = os.path.join(d, name)
+            if os.path.isfile(path): return path
+        self._error("Include file not found: %s" % name, filename, lineno)
+
+    def _process_file(self, filename, out, depth):
+        if depth > self.max_depth:
+            self._error("Include nested too deeply", filename, 0)
+        f = open(filename)
+        text = f.read()
+        f.close()
+        self.dependencies.append(filename)
+        if text and not text.endswith('\n'): text += '\n'
+
+        curdir = os.path.dirname(filename)
+        # condition stack: [active, taken, parent_active]
+        cond = []
+        active = True
+        lineno = 1
+        pos = 0
+        while pos < len(text):
+            m = self.token.match(text, pos)
+            tok = m.group(0)
+            pos = m.end()
+
+            if tok == '\n':
+                out.append(tok)
+                self.origin.append((filename, lineno))
+                lineno += 1
+                continue
+
+            if tok.startswith('/*'):
+                n = tok.count('\n')
+                if active: out.append(tok if n == 0 else ' ' + '\n' * n)
+                for i in range(n):
+                    self.origin.append((filename, lineno))
+                    lineno += 1
+                continue
+
+            if not tok.startswith('`'):
+                if active: out.append(tok)
+                continue
+
+            name = tok[1:]
+            if name in self.conditionals:
+                if name in ('ifdef', 'ifndef', 'elsif'):
+                    m = self.macro_name.match(text, pos)
+                    if not m: self._error("Missing macro name after `%s" % name, filename, lineno)
+                    pos = m.end()
+                    defined = m.group(1) in self.macros
+                    if name == 'ifndef': defined = not defined
+                if name in ('ifdef', 'ifndef'):
+                    cond.append([active and defined, defined, active])
+                elif not cond:
+                    self._error("`%s without `ifdef" % name, filename, lineno)
+                elif name == 'elsif':
+                    c = cond[-1]
+                    c[0] = c[2] and not c[1] and defined
+                    c[1] = c[1] or defined
+                elif name == 'else':
+                    c = cond[-1]
+                    c[0] = c[2] and not c[1]
+                    c[1] = True
+                else:
+                    cond.pop()
+                active = cond[-1][0] if cond else True
+                continue
+
+            if not active:
+                continue
+
+            if name == 'define':
+                pos, lineno = self._define(text, pos, out, filename, lineno)
+                continue
+
+            if name == 'undef':
+                m = self.macro_name.match(text, pos)
+                if not m: self._error("Missing macro name after `undef", filename, lineno)
+                pos = m.end()
+                self.macros.pop(m.group(1), None)
+                continue
+
+            if name == 'include':
+                m = self.include_name.match(text, pos)
+                if not m: self._error("Malformed `include", filename, lineno)
+                pos = m.end()
+                incname = m.group(1) or m.group(2)
+                if incname is None:
+                    incname = self._expand(m.group(3), filename, lineno, 0).strip().strip('"')
+                path = self._find_include(incname, curdir, filename, lineno)
+                self._process_file(path, out, depth+1)
+                continue
+
+            if name in self.passthrough:
+                out.append(tok)
+                continue
+
+            text_, pos = self._macro_call(text, pos, tok, filename, lineno)
+            out.append(self._expand(text_, filename, lineno, 0))
+
+        if cond:
+            self._error("Unterminated `ifdef", filename, lineno)
+
+    def _define(self, text, pos, out, filename, lineno):
+        m = self.define_head.match(text, pos)
+        if not m: self._error("Missing macro name after `define", filename, lineno)
+        name = m.group(1)
+        params = None
+        if m.group(2) is not None:
+            params = tuple([ p.strip() for p in m.group(2)[1:-1].split(',') if p.strip() ])
+        pos = m.end()
+        body = []
+        while True:
+            end = text.find('\n', pos)
+            if end < 0: end = len(text)
+            line = text[pos:end]
+            pos = end
+            if line.endswith('\\'):
+                body.append(line[:-1])
+                out.append('\n')
+                self.origin.append((filename, lineno))
+                lineno += 1
+                pos += 1
+                continue
+            body.append(line)
+            break
+        value = self._strip_comment(' '.join(body)).strip()
+        self.macros[name] = (params, value)
+        return pos, lineno
+
+    def _strip_comment(self, s):
+        ret = []
+        for m in self.token.finditer(s):
+            tok = m.group(0)
+            if tok.startswith('//'): break
+            if tok.startswith('/*'): tok = ' '
+            ret.append(tok)
+        return ''.join(ret)
+
+    def _macro_call(self, text, pos, tok, filename, lineno):
+        """ Returns the macro call text (`NAME or `NAME(args)) and the new position """
+        name = tok[1:]
+        if name in self.builtins:
+            return tok, pos
+        if name not in self.macros:
+            self._error("Macro not defined: %s" % name, filename, lineno)
+        if self.macros[name][0] is None:
+            return tok, pos
+        p = pos
+        while p < len(text) and text[p] in ' \t': p += 1
+        if p >= len(text) or text[p] != '(':
+            self._error("Macro %s requires arguments" % name, filename, lineno)
+        level = 0
+        instr = False
+        start = p
+        while p < len(text):
+            c = text[p]
+            if instr:
+                if c == '\\': p += 1
+                elif c == '"': instr = False
+            elif c == '"': instr = True
+            elif c in '([{': level += 1
+            elif c in ')]}':
+                level -= 1
+                if level == 0: break
+            elif c == '\n':
+                self._error("Macro %s arguments must be on one line" % name, filename, lineno)
+            p += 1
+        if p >= len(text):
+            self._error("Unterminated arguments of macro %s" % name, filename, lineno)
+        return tok + text[start:p+1], p+1
+
+    def _split_args(self, s):
+        args = []
+        level = 0
+        instr = False
+        cur = []
+        for c in s:
+            if instr:
+                if c == '"': instr = False
+            elif c == '"': instr = True
+            elif c in '([{': level += 1
+            elif c in ')]}': level -= 1
+            elif c == ',' and level == 0:
+                args.append(''.join(cur).strip())
+                cur = []
+                continue
+            cur.append(c)
+        args.append(''.join(cur).strip())
+        return args
+
+    def _expand(self, s, filename, lineno, depth):
+        """ Expands all macro calls in s """
+        if depth > self.max_depth:
+            self._error("Macro expansion nested too deeply", filename, lineno)
+        if '`' not in s: return s
+        ret = []
+        pos = 0
+        while pos < len(s):
+            m = self.token.match(s, pos)
+            tok = m.group(0)
+            pos = m.end()
+            if not tok.startswith('`') or tok[1:] in self.passthrough:
+                ret.append(tok)
+                continue
+            if tok == '`__FILE__':
+                ret.append('"%s"' % filename)
+                continue
+            if tok == '`__LINE__':
+                ret.append(str(lineno))
+                continue
+            call, pos = self._macro_call(s, pos, tok, filename, lineno)
+            params, body = self.macros[tok[1:]]
+            if params is not None:
+                args = self._split_args(call[call.index('(')+1:-1])
+                if len(args) != len(params):
+                    self._error("Macro %s expects %d arguments, got %d" %
+                                (tok[1:], len(params), len(args)), filename, lineno)
+                argmap = dict(zip(params, args))
+                body = self.identifier.sub(lambda a: argmap.get(a.group(0), a.group(0)), body)
+            ret.append(self._expand(body, filename, lineno, depth+1))
+        return ''.join(ret)